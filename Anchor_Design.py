@@ -1,8 +1,10 @@
 
 import math
+from Load_Combinations import BOLT_FY, evaluate_combinations, combination_table, governing_cases
 
 class AnchorBoltDesign:
-    def __init__(self, diameter, design_pressure, uplift_load_wind, uplift_load_seismic, shell_weight, roof_weight, vertical_acceleration_Av=0.0):
+    def __init__(self, diameter, design_pressure, uplift_load_wind, uplift_load_seismic, shell_weight, roof_weight, vertical_acceleration_Av=0.0,
+                 test_pressure=0.0, frangibility_pressure=0.0, bolt_yield=BOLT_FY):
         """
         Initialize Anchor Bolt Design.
         
@@ -13,6 +15,9 @@ class AnchorBoltDesign:
         :param shell_weight: Corroded Shell Weight (kN) -> resisting force
         :param roof_weight: Corroded Roof Plate Weight (kN) -> resisting force
         :param vertical_acceleration_Av: Vertical Seismic Acceleration Parameter (g)
+        :param test_pressure: Test Pressure (kPa)
+        :param frangibility_pressure: Roof-to-shell joint failure pressure Pf (kPa), 0 if not frangible
+        :param bolt_yield: Anchor Bolt Yield Strength (MPa)
         """
         self.D = diameter
         self.P_design = design_pressure
@@ -21,68 +26,22 @@ class AnchorBoltDesign:
         self.W_shell = shell_weight
         self.W_roof = roof_weight
         self.Av = vertical_acceleration_Av
+        self.P_test = test_pressure
+        self.P_frangibility = frangibility_pressure
+        self.Fy_bolt = bolt_yield
         self.results = {}
 
     def calculate_anchorage(self):
         """
         Determine if anchors are required and calculate size (API 650 5.12 / F.7).
         """
-        # 1. Calculate Uplift Load due to Internal Pressure (F.7.1)
-        # U_pressure = P * Area (but usually P * Pi * D^2 / 4)
-        # API 650 F.1.2: Uplift = (P - 0.00024*th) ... complicated.
-        # Simplified: Uplift = P * Area_projected using P_design
-        radius = self.D / 2.0
-        area = math.pi * (radius ** 2)
-        
-        # Uplift Forces (Load)
-        U_pres_design = self.P_design * area # kN
-        
-        # Resisting Forces (Dead Load)
-        W_DL_nominal = self.W_shell + self.W_roof
-        
-        # Load Cases (Simplified representation of Table 5.21a/b)
-        uplift_cases = []
-        
-        # Case 1: Design Pressure + Wind
-        # Load = P_design + Wind Uplift
-        # Resist = Dead Load (Nominal)
-        # Note: API 650 5.12.2 uses nominal weight for wind check.
-        load_1 = U_pres_design + self.U_wind
-        resist_1 = W_DL_nominal
-        net_1 = load_1 - resist_1
-        uplift_cases.append({
-            'Case': 'Design Pressure + Wind',
-            'S_uplift': load_1, # Total Uplift Load
-            'W_resist': resist_1, # Resisting Weight
-            'Net_Uplift': max(0, net_1)
-        })
-        
-        # Case 2: Design Pressure + Seismic
-        # Load = P_design + Seismic Uplift
-        # Resist = Dead Load (Reduced by Av)
-        load_2 = U_pres_design + self.U_seismic
-        reduction_factor = 1.0 - (0.4 * self.Av)
-        resist_2 = W_DL_nominal * reduction_factor
-        net_2 = load_2 - resist_2
-        uplift_cases.append({
-            'Case': 'Design Pressure + Seismic',
-            'S_uplift': load_2,
-            'W_resist': resist_2,
-            'Net_Uplift': max(0, net_2)
-        })
-        
-        # Case 3: Design Pressure Only
-        # Load = P_design
-        # Resist = Dead Load
-        load_3 = U_pres_design
-        resist_3 = W_DL_nominal
-        net_3 = load_3 - resist_3
-        uplift_cases.append({
-            'Case': 'Design Pressure Only',
-            'S_uplift': load_3,
-            'W_resist': resist_3,
-            'Net_Uplift': max(0, net_3)
-        })
+        # Uplift Load Cases (Table 5.21a/b, see Load_Combinations.LOAD_COMBINATIONS)
+        # Uplift = pressure * pi D^2 / 4 + 4 M / D, Resist = Dead Load (reduced by 0.4 Av for seismic)
+        combos = evaluate_combinations(self.D, self.P_design, self.U_wind, self.U_seismic, self.W_shell, self.W_roof,
+                                       Av=self.Av, P_test=self.P_test, P_frangibility=self.P_frangibility,
+                                       bolt_yield=self.Fy_bolt)
+        uplift_cases = combination_table(combos)
+        governing = governing_cases(combos)
         
         # Determine Max Uplift
         net_uplift = max([case['Net_Uplift'] for case in uplift_cases])
@@ -94,9 +53,8 @@ class AnchorBoltDesign:
         
         if net_uplift > 0:
             status = "Anchors Required"
-            Sd_bolt = 140.0 # MPa (A 307 / A 36)
-            F_uplift_N = net_uplift * 1000.0
-            req_area = F_uplift_N / Sd_bolt # mm2
+            # Each case against its own allowable bolt stress (Table 5.21a)
+            req_area = max([case['Req_Bolt_Area_mm2'] for case in uplift_cases]) # mm2
             
             # Select Bolts
             perimeter = math.pi * self.D
@@ -135,7 +93,8 @@ class AnchorBoltDesign:
             'Chair Height (mm)': h_chair,
             'Top Plate Width (mm)': w_top,
             'Top Plate Thk (mm)': t_top,
-            'Uplift_Table': uplift_cases
+            'Uplift_Table': uplift_cases,
+            'Governing_Case': governing
         }
         
     def run_design(self):
@@ -0,0 +1,155 @@
+import numpy as np
+
+# API 653 4.3.3.1: minimum shell thickness in service is never less than 2.5 mm
+T_FLOOR_MM = 2.5
+
+
+class CorrosionLifeProjection:
+    """
+    Remaining-life projection of shell courses under several corrosion-rate scenarios.
+
+    Thickness t(year) = t_used - rate * year is projected on a (tanks, years, courses, scenarios) grid
+    and compared with the thickness required without corrosion allowance:
+        t_limit = max(td - CA, tt, T_FLOOR_MM)
+    td / tt are the run_design values (ShellDesign.results or Shell_Batch.ShellBatchDesign), so the
+    limit is exactly the design / hydrotest requirement of the as-designed tank.
+    """
+    def __init__(self, t_used, td, tt, corrosion_allowance, scenarios, years=50, step=1.0, t_floor=T_FLOOR_MM):
+        """
+        :param t_used: As-built course thickness (mm), shape (N, C) (NaN = padding)
+        :param td: Design thickness incl. CA (mm), shape (N, C)
+        :param tt: Hydrotest thickness (mm), shape (N, C)
+        :param corrosion_allowance: CA used in td (mm), scalar or (N,)
+        :param scenarios: {name: corrosion rate (mm/yr)}; a rate is a scalar, a per-course list (C,) or (N, C)
+        :param years: Projection horizon (years)
+        :param step: Time step (years)
+        :param t_floor: Absolute minimum thickness (mm)
+        """
+        self.t_used = np.atleast_2d(np.asarray(t_used, dtype=float))
+        N, C = self.t_used.shape
+        self.N, self.C = N, C
+        self.td = np.atleast_2d(np.asarray(td, dtype=float))
+        self.tt = np.atleast_2d(np.asarray(tt, dtype=float))
+        self.CA = np.broadcast_to(np.asarray(corrosion_allowance, dtype=float), (N,))
+        self.scenario_names = list(scenarios.keys())
+        # (N, C, S)
+        self.rates = np.stack([np.broadcast_to(np.asarray(r, dtype=float), (N, C)) for r in scenarios.values()], axis=-1)
+        self.years = np.arange(0.0, years + step / 2.0, step)
+        self.t_floor = t_floor
+        self.valid = np.isfinite(self.t_used)
+        self.results = {}
+
+    @classmethod
+    def from_shell_design(cls, shell_design, scenarios, **kwargs):
+        """
+        Single tank from a ShellDesign after run_design().
+        """
+        courses = shell_design.results
+        return cls([[c['t_used'] for c in courses]], [[c['td'] for c in courses]], [[c['tt'] for c in courses]],
+                   shell_design.CA, scenarios, **kwargs)
+
+    @classmethod
+    def from_batch(cls, batch, scenarios, method='auto', **kwargs):
+        """
+        Many tanks from a Shell_Batch.ShellBatchDesign (runs the method if not already run).
+        """
+        res = batch.results.get(method)
+        if res is None:
+            res = batch.run_method(method)
+            batch.results[method] = res
+        return cls(res['t_used'], res['td'], res['tt'], batch.CA, scenarios, **kwargs)
+
+    def t_limit(self):
+        """
+        Retirement thickness per course (mm), shape (N, C).
+        """
+        return np.maximum(np.maximum(self.td - self.CA[:, None], self.tt), self.t_floor)
+
+    def run_projection(self):
+        """
+        :return: results dict
+            'Years' (Y,), 'Thickness' (N, Y, C, S), 'T_Limit' (N, C),
+            'Remaining_Life' (N, C, S) exact years to reach t_limit (inf if rate is 0),
+            'Course_Fail_Year' (N, C, S) first projected year below t_limit (NaN if none within the horizon),
+            'Tank_Fail_Year' (N, S), 'Governing_Course' (N, S) index of the course failing first (-1 if none)
+        """
+        t_lim = self.t_limit()
+        t_used = np.where(self.valid, self.t_used, np.inf)
+
+        # (N, Y, C, S)
+        thickness = t_used[:, None, :, None] - self.years[None, :, None, None] * self.rates[:, None, :, :]
+        fails = thickness < t_lim[:, None, :, None]
+
+        any_fail = fails.any(axis=1)
+        first = np.argmax(fails, axis=1)
+        course_fail_year = np.where(any_fail, self.years[first], np.nan)
+
+        margin = (t_used - t_lim)[..., None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            remaining = np.where(self.rates > 0, margin / self.rates, np.inf)
+        remaining = np.where(margin < 0, 0.0, remaining)
+        remaining = np.where(self.valid[..., None], remaining, np.nan)
+
+        masked = np.where(np.isnan(course_fail_year), np.inf, course_fail_year)
+        tank_fail_year = masked.min(axis=1)
+        governing = np.where(np.isfinite(tank_fail_year), np.argmin(masked, axis=1), -1)
+        tank_fail_year = np.where(np.isfinite(tank_fail_year), tank_fail_year, np.nan)
+
+        self.results = {
+            'Years': self.years,
+            'Scenarios': self.scenario_names,
+            'Thickness': np.where(self.valid[:, None, :, None], thickness, np.nan),
+            'T_Limit': np.where(self.valid, t_lim, np.nan),
+            'Remaining_Life': remaining,
+            'Course_Fail_Year': course_fail_year,
+            'Tank_Fail_Year': tank_fail_year,
+            'Governing_Course': governing
+        }
+        return self.results
+
+    def summary(self, tank_index=0, course_names=None):
+        """
+        Per-scenario summary rows of one tank (for reports / tables).
+        """
+        if not self.results:
+            self.run_projection()
+        rows = []
+        for s, name in enumerate(self.scenario_names):
+            g = int(self.results['Governing_Course'][tank_index, s])
+            fail_year = self.results['Tank_Fail_Year'][tank_index, s]
+            life = self.results['Remaining_Life'][tank_index, :, s]
+            rows.append({
+                'Scenario': name,
+                'Tank_Fail_Year': None if np.isnan(fail_year) else float(fail_year),
+                'Governing_Course': (course_names[g] if course_names else str(g + 1)) if g >= 0 else '-',
+                'Min_Remaining_Life': float(np.nanmin(life)),
+                'Status': 'OK' if np.isnan(fail_year) else f"Fails in year {fail_year:g}"
+            })
+        return rows
+
+
+if __name__ == "__main__":
+    import time
+    from Shell_Batch import ShellBatchDesign
+
+    N = 500
+    rng = np.random.default_rng(2)
+    D = rng.uniform(10.0, 90.0, N)
+    H = rng.uniform(8.0, 20.0, N)
+    widths = np.full((N, 9), 2.438)
+    bottoms = np.cumsum(widths, axis=1) - widths
+    widths = np.where(bottoms < H[:, None], np.minimum(widths, H[:, None] - bottoms), 0.0)
+
+    batch = ShellBatchDesign(D, H, H, 0.9, 3.0, widths, 'A 573 70')
+    scenarios = {'Low (0.05 mm/yr)': 0.05, 'Expected (0.1 mm/yr)': 0.1, 'High (0.2 mm/yr)': 0.2,
+                 'Bottom-heavy': np.linspace(0.3, 0.05, 9)}
+
+    t0 = time.perf_counter()
+    proj = CorrosionLifeProjection.from_batch(batch, scenarios, years=50)
+    res = proj.run_projection()
+    print(f"{N} tanks x {len(proj.years)} years x 9 courses x {len(scenarios)} scenarios: {time.perf_counter() - t0:.3f} s")
+    for s, name in enumerate(proj.scenario_names):
+        failed = np.isfinite(res['Tank_Fail_Year'][:, s])
+        print(f"{name:<22} tanks failing within 50 years: {failed.sum():>4}")
+    for row in proj.summary(0):
+        print(row)
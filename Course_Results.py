@@ -0,0 +1,157 @@
+from collections.abc import Sequence, MutableMapping
+import numpy as np
+
+# One shell course result (same keys and order as the dicts built by ShellDesign.calculate_course)
+COURSE_RESULTS_DTYPE = np.dtype([
+    ('Course', 'O'),
+    ('Material', 'O'),
+    ('Sd', 'f8'),
+    ('St', 'f8'),
+    ('Width', 'f8'),
+    ('H_eff_d', 'f8'),
+    ('H_eff_t', 'f8'),
+    ('td', 'f8'),
+    ('tt', 'f8'),
+    ('t_req', 'f8'),
+    ('t_rec', 'i8'),
+    ('t_used', 'f8'),
+    ('Status', 'O'),
+])
+
+COURSE_KEYS = COURSE_RESULTS_DTYPE.names
+
+
+class CourseRecord(MutableMapping):
+    """
+    Dict-compatible view of one row of a CourseResults array.
+    Reads return plain Python values; writes go straight into the array.
+    Keys outside COURSE_KEYS are kept in a small per-row side dict.
+    """
+    __slots__ = ('_owner', '_i')
+
+    def __init__(self, owner, i):
+        self._owner = owner
+        self._i = i
+
+    def __getitem__(self, key):
+        if key in COURSE_KEYS:
+            value = self._owner._data[key][self._i]
+            return value.item() if isinstance(value, np.generic) else value
+        extra = self._owner._extra.get(self._i)
+        if extra is not None and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in COURSE_KEYS:
+            self._owner._data[key][self._i] = value
+        else:
+            self._owner._extra.setdefault(self._i, {})[key] = value
+
+    def __delitem__(self, key):
+        extra = self._owner._extra.get(self._i)
+        if extra is None or key not in extra:
+            raise KeyError(f"Cannot delete course result field: {key}")
+        del extra[key]
+
+    def __iter__(self):
+        yield from COURSE_KEYS
+        yield from self._owner._extra.get(self._i, ())
+
+    def __len__(self):
+        return len(COURSE_KEYS) + len(self._owner._extra.get(self._i, ()))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class CourseResults(Sequence):
+    """
+    Compact shell course results: one structured array (COURSE_RESULTS_DTYPE) instead of a list of dicts.
+    Behaves like the list of dicts it replaces (len, indexing, iteration, [-1], pd.DataFrame(...),
+    course['t_used'], course.get('Width')), so WindGirderDesign, NozzleDesign, Visualization and the
+    report generators work unchanged. Column access (column('t_used')) returns NumPy arrays.
+    """
+    __slots__ = ('_data', '_size', '_extra')
+
+    def __init__(self, capacity=8):
+        self._data = np.zeros(max(capacity, 1), dtype=COURSE_RESULTS_DTYPE)
+        self._size = 0
+        self._extra = {}
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build from an iterable of course dicts (or CourseRecords).
+        """
+        records = list(records)
+        out = cls(len(records))
+        for r in records:
+            out.append(r)
+        return out
+
+    def append(self, record):
+        if self._size == len(self._data):
+            grown = np.zeros(2 * len(self._data), dtype=COURSE_RESULTS_DTYPE)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        row = self._data[self._size:self._size + 1]
+        for key in COURSE_KEYS:
+            row[key] = record[key]
+        extra = {k: v for k, v in record.items() if k not in COURSE_KEYS}
+        if extra:
+            self._extra[self._size] = extra
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CourseResults.from_records(self[i] for i in range(*index.indices(self._size)))
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("course index out of range")
+        return CourseRecord(self, index)
+
+    def __eq__(self, other):
+        if isinstance(other, CourseResults):
+            return (self._size == other._size and self._extra == other._extra
+                    and bool(np.all(self.array == other.array)))
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"CourseResults({self.to_dicts()!r})"
+
+    @property
+    def array(self):
+        """
+        Structured array view of the stored courses (no copy).
+        """
+        return self._data[:self._size]
+
+    def column(self, key):
+        """
+        One field for all courses as a NumPy array (view).
+        """
+        return self.array[key]
+
+    def copy(self):
+        out = CourseResults(max(self._size, 1))
+        out._data[:self._size] = self.array
+        out._size = self._size
+        out._extra = {i: dict(e) for i, e in self._extra.items()}
+        return out
+
+    def to_dicts(self):
+        """
+        Plain list of dicts (the pre-CourseResults format).
+        """
+        return [dict(r) for r in self]
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
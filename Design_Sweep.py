@@ -0,0 +1,410 @@
+import os
+import io
+import csv
+import json
+import math
+import itertools
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from Main import run_design_pipeline
+
+# Baseline parameters for a sweep (overridden by base_params and by the sweep axes)
+DEFAULT_SWEEP_PARAMS = {
+    'D': 30.0, 'H': 15.0, 'G': 1.0, 'CA': 1.5,
+    'P_design': 0.0, 'P_test': 0.0,
+    'Roof_Type': 'Supported Cone Roof', 'Roof_Slope': 0.0625,
+    'CA_roof': 0.0, 'Roof_Material': 'A 283 C', 'Roof_Thickness': 6.0,
+    'Wind_Velocity': 45.0, 'Kzt': 1.0, 'Kd': 0.95, 'G_wind': 0.85, 'Cf': 0.5,
+    'SDS': 0.5, 'S1': 0.2, 'I_seismic': 1.0, 'Site_Class': 'D'
+}
+
+# Sweep axis name -> key in the design parameter dict
+SWEEP_AXES = {
+    'D': 'D',
+    'H': 'H',
+    'G': 'G',
+    'CA': 'CA',
+    'material': 'Material',
+    'wind_speed': 'Wind_Velocity',
+    'SDS': 'SDS'
+}
+
+SWEEP_COLUMNS = [
+    'case_id', 'D', 'H', 'G', 'CA', 'Material', 'Wind_Velocity', 'SDS',
+    'Num_Courses', 'Bottom_t_req_mm', 'Bottom_t_used_mm', 'Shell_Status',
+    'W_shell_kg', 'W_roof_kg', 'W_liquid_kg',
+    'P_wind_kPa', 'M_wind_kNm',
+    'Base_Shear_kN', 'Ringwall_Moment_kNm', 'Anchorage_Ratio_J', 'Anchorage_Status', 'Sliding_Status',
+    'AppF_Status', 'Anchor_Status', 'Net_Uplift_kN', 'Num_Bolts', 'Bolt_Dia_mm',
+    'Error'
+]
+
+
+def frange(start, stop, step):
+    """
+    Inclusive float range for sweep axes, e.g. frange(20, 80, 5) -> 20, 25, ..., 80.
+    """
+    n = int(math.floor((stop - start) / step + 1e-9)) + 1
+    return [round(start + i * step, 10) for i in range(n)]
+
+
+def build_courses(H, material, plate_width=2.438):
+    """
+    Equal-width course layout (same split as the app's Standard Plate Width), thickness auto-assigned.
+    """
+    courses = []
+    current_h = 0.0
+    i = 0
+    while H - current_h >= 0.01:
+        width = min(plate_width, H - current_h)
+        courses.append({'Course': f"Course {i+1}", 'Material': material, 'Width': width, 'Thickness_Used': 0.0})
+        current_h += width
+        i += 1
+    return courses
+
+
+def run_case(case):
+    """
+    Run the Main.py design chain for one sweep case and flatten it into a result row.
+    Exceptions are recorded in the 'Error' column so one bad case does not stop the sweep.
+    """
+    params = case['params']
+    row = {col: '' for col in SWEEP_COLUMNS}
+    row['case_id'] = case['case_id']
+    for key in ('D', 'H', 'G', 'CA', 'Wind_Velocity', 'SDS'):
+        row[key] = params.get(key)
+    row['Material'] = case['material']
+
+    try:
+        courses = build_courses(params['H'], case['material'], case.get('plate_width', 2.438))
+        # Design classes print progress; keep worker output quiet
+        with contextlib.redirect_stdout(io.StringIO()):
+            design = run_design_pipeline(params, courses, verbose=False)
+
+        shell = design['shell_design'].shell_courses
+        seismic = design['seismic_results']
+        anchor = design['anchor_design'].results
+        row.update({
+            'Num_Courses': len(shell),
+            'Bottom_t_req_mm': shell[0]['t_req'],
+            'Bottom_t_used_mm': shell[0]['t_used'],
+            'Shell_Status': 'OK' if all(c['Status'] == 'OK' for c in shell) else 'FAIL',
+            'W_shell_kg': design['W_shell_kg'],
+            'W_roof_kg': design['W_roof_kg'],
+            'W_liquid_kg': design['W_liquid_kg'],
+            'P_wind_kPa': design['P_wind'],
+            'M_wind_kNm': design['M_wind'],
+            'Base_Shear_kN': seismic['Base_Shear_kN'],
+            'Ringwall_Moment_kNm': seismic['Ringwall_Moment_kNm'],
+            'Anchorage_Ratio_J': seismic['Anchorage_Ratio_J'],
+            'Anchorage_Status': seismic['Anchorage_Status'],
+            'Sliding_Status': seismic['Sliding_Status'],
+            'AppF_Status': design['app_f'].results.get('Status', 'N/A'),
+            'Anchor_Status': anchor.get('Status', 'N/A'),
+            'Net_Uplift_kN': anchor.get('Net Uplift Force (kN)', 0.0),
+            'Num_Bolts': anchor.get('Number of Bolts', 0),
+            'Bolt_Dia_mm': anchor.get('Bolt Diameter (mm)', 0.0)
+        })
+    except Exception as e:
+        row['Error'] = f"{type(e).__name__}: {e}"
+    return row
+
+
+def run_chunk(cases):
+    """Worker entry point: several cases per task to amortize process IPC."""
+    return [run_case(case) for case in cases]
+
+
+class _CSVSink:
+    """
+    Append-only CSV result file. The file itself is the checkpoint:
+    a case is finished once its row (with trailing newline) is on disk.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.f = None
+
+    def completed_ids(self):
+        done = set()
+        if not os.path.exists(self.path):
+            return done
+        # Drop a partially written last line left by an interrupted run
+        with open(self.path, 'rb+') as f:
+            data = f.read()
+            if data and not data.endswith(b'\n'):
+                f.truncate(data.rfind(b'\n') + 1)
+        with open(self.path, newline='') as f:
+            for row in csv.DictReader(f):
+                try:
+                    done.add(int(row['case_id']))
+                except (TypeError, ValueError):
+                    pass
+        return done
+
+    def reset(self):
+        if os.path.exists(self.path) and not os.path.isdir(self.path):
+            os.remove(self.path)
+
+    def open(self):
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.f = open(self.path, 'a', newline='')
+        self.writer = csv.DictWriter(self.f, fieldnames=SWEEP_COLUMNS)
+        if new_file:
+            self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.f.flush()
+
+    def close(self):
+        if self.f:
+            self.f.close()
+
+
+class _ParquetSink:
+    """
+    Parquet results as a directory of part files, which pandas / pyarrow read back as one
+    dataset. Each finished worker chunk is written as its own part, so like the CSV sink the
+    files on disk are the checkpoint. Requires pyarrow (or fastparquet).
+    """
+    def __init__(self, path):
+        self.path = path
+        self.next_part = 0
+
+    def _parts(self):
+        if not os.path.isdir(self.path):
+            return []
+        return sorted(p for p in os.listdir(self.path) if p.endswith('.parquet'))
+
+    def completed_ids(self):
+        import pandas as pd
+        done = set()
+        for part in self._parts():
+            df = pd.read_parquet(os.path.join(self.path, part), columns=['case_id'])
+            done.update(int(x) for x in df['case_id'])
+        return done
+
+    def reset(self):
+        # Start a fresh dataset: old parts (and temp files of an interrupted write) are removed
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.endswith('.parquet') or name.endswith('.parquet.tmp'):
+                    os.remove(os.path.join(self.path, name))
+        elif os.path.exists(self.path):
+            os.remove(self.path)
+
+    def open(self):
+        os.makedirs(self.path, exist_ok=True)
+        parts = self._parts()
+        self.next_part = max(int(p[len('part-'):-len('.parquet')]) for p in parts) + 1 if parts else 0
+
+    def write(self, rows):
+        import pandas as pd
+        if not rows:
+            return
+        df = pd.DataFrame(rows, columns=SWEEP_COLUMNS)
+        # Write to a temp name first so a crash never leaves a half-written part behind
+        final = os.path.join(self.path, f"part-{self.next_part:05d}.parquet")
+        tmp = final + ".tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, final)
+        self.next_part += 1
+
+    def close(self):
+        pass
+
+
+class DesignSweep:
+    """
+    Parametric design-space sweep over the full Main.py design chain.
+    Cases are the Cartesian product of the sweep axes; case_id is the position in that
+    product, so a re-run with the same axes skips every case already in the output.
+    The axes are stored next to the output (<output>.sweep.json) and checked on resume.
+    """
+    def __init__(self, D, H, G=None, CA=None, material=None, wind_speed=None, SDS=None,
+                 base_params=None, plate_width=2.438):
+        """
+        :param D, H, G, CA: Lists / ranges of Diameter (m), Height (m), SG, Shell CA (mm)
+        :param material: List of shell materials (all courses use the same material)
+        :param wind_speed: List of Wind Velocity (m/s)
+        :param SDS: List of SDS (g)
+        :param base_params: Fixed design parameters (e.g. from InputReader) for everything not swept
+        :param plate_width: Course width used to build the shell layout (m)
+        """
+        self.base_params = dict(DEFAULT_SWEEP_PARAMS)
+        if base_params:
+            self.base_params.update(base_params)
+        self.plate_width = plate_width
+
+        def axis(values, key):
+            if values is None:
+                return [self.base_params.get(key)]
+            return list(values)
+
+        self.axes = {
+            'D': axis(D, 'D'),
+            'H': axis(H, 'H'),
+            'G': axis(G, 'G'),
+            'CA': axis(CA, 'CA'),
+            'material': list(material) if material is not None else ['A 283 C'],
+            'wind_speed': axis(wind_speed, 'Wind_Velocity'),
+            'SDS': axis(SDS, 'SDS')
+        }
+        self.results = {}
+
+    @property
+    def num_cases(self):
+        n = 1
+        for values in self.axes.values():
+            n *= len(values)
+        return n
+
+    def iter_cases(self, skip_ids=None):
+        """
+        Lazily generate case dicts (never materializes the full product).
+        """
+        names = list(self.axes.keys())
+        for case_id, combo in enumerate(itertools.product(*(self.axes[n] for n in names))):
+            if skip_ids and case_id in skip_ids:
+                continue
+            params = dict(self.base_params)
+            material = None
+            for name, value in zip(names, combo):
+                if name == 'material':
+                    material = value
+                else:
+                    params[SWEEP_AXES[name]] = value
+            # Levels follow the swept shell height
+            params['HD'] = params['H']
+            params['HT'] = params['H']
+            yield {'case_id': case_id, 'params': params, 'material': material, 'plate_width': self.plate_width}
+
+    def run(self, output_path, max_workers=None, chunk_size=16, resume=True, progress_every=1000):
+        """
+        Run the sweep and stream one row per case to output_path (.csv or .parquet).
+        :param max_workers: Process count (default: all cores)
+        :param chunk_size: Cases per worker task
+        :param resume: Skip cases already present in output_path
+        :return: Summary dict
+        """
+        if output_path.lower().endswith('.parquet'):
+            sink = _ParquetSink(output_path)
+        else:
+            sink = _CSVSink(output_path)
+
+        meta_path = output_path + ".sweep.json"
+        meta = {'axes': self.axes, 'base_params': self.base_params, 'plate_width': self.plate_width}
+        meta = json.loads(json.dumps(meta, default=str))
+
+        done_ids = set()
+        if resume:
+            done_ids = sink.completed_ids()
+            if done_ids and os.path.exists(meta_path):
+                with open(meta_path) as f:
+                    if json.load(f) != meta:
+                        raise ValueError(f"Sweep definition differs from the one in {meta_path}. "
+                                         "Use a new output file or resume=False.")
+        else:
+            sink.reset()
+
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f, indent=1)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max_workers * 4
+
+        total = self.num_cases
+        todo = total - len(done_ids)
+        print(f"Design Sweep: {total} cases ({len(done_ids)} already done, {todo} to run) on {max_workers} workers")
+
+        cases = self.iter_cases(skip_ids=done_ids)
+
+        def next_chunk():
+            return list(itertools.islice(cases, chunk_size))
+
+        n_done = 0
+        n_error = 0
+        sink.open()
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                pending = set()
+                # Keep a bounded number of tasks in flight so memory stays flat
+                while True:
+                    while len(pending) < max_in_flight:
+                        chunk = next_chunk()
+                        if not chunk:
+                            break
+                        pending.add(pool.submit(run_chunk, chunk))
+                    if not pending:
+                        break
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        rows = fut.result()
+                        sink.write(rows)
+                        n_before = n_done
+                        n_done += len(rows)
+                        n_error += sum(1 for r in rows if r['Error'])
+                        if progress_every and n_done // progress_every > n_before // progress_every:
+                            print(f"  {n_done}/{todo} cases done")
+        finally:
+            sink.close()
+
+        self.results = {
+            'Total Cases': total,
+            'Skipped (Resumed)': len(done_ids),
+            'Completed': n_done,
+            'Errors': n_error,
+            'Output': output_path
+        }
+        print(f"Sweep Complete: {n_done} cases written to {output_path} ({n_error} errors)")
+        return self.results
+
+
+def _parse_axis(text):
+    """
+    CLI axis: '20,30,40' (list) or '20:80:5' (inclusive range).
+    """
+    if ':' in text:
+        start, stop, step = (float(v) for v in text.split(':'))
+        return frange(start, stop, step)
+    values = []
+    for v in text.split(','):
+        v = v.strip()
+        try:
+            values.append(float(v))
+        except ValueError:
+            values.append(v)
+    return values
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="API 650 parametric design sweep")
+    parser.add_argument('output', help="Result file (.csv or .parquet)")
+    parser.add_argument('--input', help="Excel input file for the fixed (non-swept) parameters")
+    parser.add_argument('--D', default='30', help="Diameters, list '20,30' or range '20:80:5'")
+    parser.add_argument('--H', default='15')
+    parser.add_argument('--G', default=None)
+    parser.add_argument('--CA', default=None)
+    parser.add_argument('--material', default=None, help="Shell materials, e.g. 'A 283 C,A 516 70'")
+    parser.add_argument('--wind', default=None, help="Wind velocities (m/s)")
+    parser.add_argument('--SDS', default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-resume', action='store_true')
+    args = parser.parse_args()
+
+    base = None
+    if args.input:
+        from InputReader import InputReader
+        base = InputReader(args.input).get_design_parameters()
+
+    def opt(text):
+        return _parse_axis(text) if text else None
+
+    sweep = DesignSweep(
+        D=_parse_axis(args.D), H=_parse_axis(args.H), G=opt(args.G), CA=opt(args.CA),
+        material=args.material.split(',') if args.material else None,
+        wind_speed=opt(args.wind), SDS=opt(args.SDS), base_params=base
+    )
+    sweep.run(args.output, max_workers=args.workers, resume=not args.no_resume)
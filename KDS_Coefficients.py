@@ -0,0 +1,111 @@
+import numpy as np
+
+# KDS 41 12 00 terrain categories (A: dense city ... D: sea / coastal):
+# gradient height zg (m), reference height zb (m, Kzr constant below) and power-law exponent alpha.
+# Kzr(z) = 0.58 / 0.81 / 1.0 / 1.13 up to zb, then c * z^alpha (continuous at zb), constant above zg.
+KDS_TERRAIN = {
+    'A': {'zb': 20.0, 'zg': 550.0, 'alpha': 0.33},
+    'B': {'zb': 15.0, 'zg': 450.0, 'alpha': 0.22},
+    'C': {'zb': 10.0, 'zg': 350.0, 'alpha': 0.15},
+    'D': {'zb': 5.0, 'zg': 250.0, 'alpha': 0.10}
+}
+KZR_BASE = {'A': 0.58, 'B': 0.81, 'C': 1.0, 'D': 1.13}
+
+# KDS 41 17 00 site coefficients Fa / Fv (Table 4.2-1, 4.2-2) vs effective ground acceleration S
+KDS_S_GRID = np.array([0.1, 0.2, 0.3, 0.4, 0.5])
+KDS_FA_GRID = {
+    'SA': np.array([0.8, 0.8, 0.8, 0.8, 0.8]),
+    'SB': np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+    'SC': np.array([1.2, 1.2, 1.1, 1.0, 1.0]),
+    'SD': np.array([1.6, 1.4, 1.2, 1.1, 1.0]),
+    'SE': np.array([2.5, 1.7, 1.2, 0.9, 0.9])
+}
+KDS_FV_GRID = {
+    'SA': np.array([0.8, 0.8, 0.8, 0.8, 0.8]),
+    'SB': np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+    'SC': np.array([1.7, 1.6, 1.5, 1.4, 1.3]),
+    'SD': np.array([2.4, 2.0, 1.8, 1.6, 1.5]),
+    'SE': np.array([3.5, 3.2, 2.8, 2.4, 2.4])
+}
+
+# Wind pressure constants as KDSWindLoad
+RHO_AIR = 1.225 # kg/m3
+GF_KDS = 0.85   # Gust factor
+CF_KDS = 0.7    # Force coefficient (cylinder)
+
+
+def _build_kzr_grid(dz=0.5, z_max=600.0):
+    """
+    Kzr tabulated per terrain on a fixed height grid (built once at import).
+    """
+    z = np.arange(0.0, z_max + dz, dz)
+    grid = {}
+    for terrain, props in KDS_TERRAIN.items():
+        c = KZR_BASE[terrain] / props['zb'] ** props['alpha']
+        z_eff = np.clip(z, props['zb'], props['zg'])
+        grid[terrain] = c * z_eff ** props['alpha']
+    return z, grid
+
+KZR_HEIGHTS, KZR_GRID = _build_kzr_grid()
+
+
+def _by_category(values, categories, default, lookup):
+    """
+    Apply lookup(category, values) per distinct category of a (possibly array) category input.
+    """
+    values = np.asarray(values, dtype=float)
+    cats = np.asarray(categories)
+    if cats.ndim == 0:
+        key = str(cats) if str(cats) in default else None
+        return lookup(key, values)
+    values, cats = np.broadcast_arrays(values, cats)
+    out = np.empty(values.shape)
+    for cat in np.unique(cats):
+        mask = cats == cat
+        key = str(cat) if str(cat) in default else None
+        out[mask] = lookup(key, values[mask])
+    return out
+
+
+def kds_kzr(z, terrain='B'):
+    """
+    Height / terrain wind speed factor Kzr (KDS 41 12 00) by interpolation on the precomputed grid.
+    :param z: Height(s) (m), scalar or array
+    :param terrain: 'A'-'D', scalar or array (unknown categories use 'B')
+    """
+    def lookup(key, zz):
+        return np.interp(zz, KZR_HEIGHTS, KZR_GRID[key or 'B'])
+    return _by_category(z, terrain, KZR_GRID, lookup)
+
+
+def kds_site_factors(S, soil='SD'):
+    """
+    Site coefficients (Fa, Fv) for effective ground acceleration S and soil class 'SA'-'SE'
+    (KDS 41 17 00), linear interpolation on the table, clamped at the ends. Unknown soil gives 1.0.
+    Scalars or arrays.
+    """
+    def lookup_fa(key, s):
+        return np.interp(s, KDS_S_GRID, KDS_FA_GRID[key]) if key else np.ones_like(s)
+
+    def lookup_fv(key, s):
+        return np.interp(s, KDS_S_GRID, KDS_FV_GRID[key]) if key else np.ones_like(s)
+
+    return _by_category(S, soil, KDS_FA_GRID, lookup_fa), _by_category(S, soil, KDS_FV_GRID, lookup_fv)
+
+
+def kds_design_accelerations(S, soil='SD'):
+    """
+    (SDS, SD1) = (2/3 * 2.5 * Fa * S, 2/3 * Fv * S), as KDSSeismicLoad.
+    """
+    S = np.asarray(S, dtype=float)
+    Fa, Fv = kds_site_factors(S, soil)
+    return (2.0 / 3.0) * S * 2.5 * Fa, (2.0 / 3.0) * Fv * S
+
+
+def kds_wind_pressure(V0, terrain, H, Iw=1.0):
+    """
+    KDS design wind pressure (kPa) at the roof height H, as KDSWindLoad.calculate_pressure:
+    q = 0.5 rho (V0 Kzr(H) Iw)^2, P = q Gf Cf. Scalars or arrays.
+    """
+    V_h = np.asarray(V0, dtype=float) * kds_kzr(H, terrain) * np.asarray(Iw, dtype=float)
+    return 0.5 * RHO_AIR * V_h ** 2 * GF_KDS * CF_KDS / 1000.0
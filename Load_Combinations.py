@@ -0,0 +1,98 @@
+import numpy as np
+
+# Anchor bolt yield strength (MPa, A 36 / A 307) for the Fy-based allowables of Table 5-21a
+BOLT_FY = 250.0
+
+# Uplift load cases, API 650 Table 5-21a/b (simplified as AnchorBoltDesign: resisting load = shell + roof weight,
+# no 0.08 th roof-plate term, wind uplift = 4 Mw / D).
+# Pressure factors apply to P * pi D^2 / 4; 'Av_Reduction' multiplies the dead load by (1 - 0.4 Av).
+# Allowable bolt stress: fixed 'Allow_MPa' or a fraction 'Allow_Fy' of the bolt yield strength.
+# External pressure (vacuum) pushes the roof down and is not a Table 5-21 uplift case.
+LOAD_COMBINATIONS = [
+    {'Case': 'Design Pressure',            'P_design': 1.0, 'Allow_MPa': 105.0},
+    {'Case': 'Test Pressure',              'P_test': 1.0, 'Allow_MPa': 140.0},
+    {'Case': 'Wind',                       'Wind': 1.0, 'Allow_Fy': 0.8},
+    {'Case': 'Seismic',                    'Seismic': 1.0, 'Av_Reduction': True, 'Allow_Fy': 0.8},
+    {'Case': 'Design Pressure + Wind',     'P_design': 0.4, 'Wind': 1.0, 'Allow_MPa': 140.0},
+    {'Case': 'Design Pressure + Seismic',  'P_design': 0.4, 'Seismic': 1.0, 'Av_Reduction': True, 'Allow_Fy': 0.8},
+    {'Case': 'Frangibility Pressure',      'P_frangibility': 3.0, 'Allow_Fy': 1.0},
+]
+
+# Checks reported with their governing (maximum) case; index -1 when no case is positive (no uplift)
+COMBINATION_CHECKS = ['Net_Uplift_kN', 'Req_Bolt_Area_mm2', 'Uplift_Ratio']
+
+
+def evaluate_combinations(D, P_design, U_wind, U_seismic, W_shell, W_roof, Av=0.0, P_test=0.0,
+                          P_frangibility=0.0, bolt_yield=BOLT_FY, table=LOAD_COMBINATIONS):
+    """
+    Evaluate every load combination of the table for one tank or a batch of tanks.
+    All tank arguments broadcast against each other; results get a trailing axis of len(table) cases.
+    :param D: Diameter (m)
+    :param P_design, P_test, P_frangibility: Pressures (kPa)
+    :param U_wind, U_seismic: Uplift from the overturning moments, 4 M / D (kN)
+    :param W_shell, W_roof: Resisting weights (kN)
+    :param Av: Vertical seismic acceleration parameter (g)
+    :param bolt_yield: Anchor bolt yield strength (MPa)
+    :return: dict with 'Cases' (names), arrays (..., cases) Uplift_kN, Resist_kN, Net_Uplift_kN, Uplift_Ratio,
+             Allow_MPa, Req_Bolt_Area_mm2, and 'Governing' {check: index array (...), -1 where no case is > 0}
+    """
+    D, P_d, U_w, U_s, W_s, W_r, Av, P_t, P_f, Fy = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (D, P_design, U_wind, U_seismic, W_shell, W_roof, Av,
+                                               P_test, P_frangibility, bolt_yield)])
+    area = np.pi * (D / 2.0) ** 2
+    W_DL = W_s + W_r
+    loads = {'P_design': P_d * area, 'P_test': P_t * area, 'P_frangibility': P_f * area,
+             'Wind': U_w, 'Seismic': U_s}
+
+    uplift = np.stack([sum(c.get(k, 0.0) * v for k, v in loads.items()) for c in table], axis=-1)
+    resist = np.stack([W_DL * (1.0 - 0.4 * Av) if c.get('Av_Reduction') else W_DL for c in table], axis=-1)
+    allow = np.stack([np.full(D.shape, c['Allow_MPa']) if 'Allow_MPa' in c else c['Allow_Fy'] * Fy
+                      for c in table], axis=-1)
+
+    net = np.maximum(uplift - resist, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(resist > 0, uplift / resist, np.inf)
+    res = {
+        'Cases': [c['Case'] for c in table],
+        'Uplift_kN': uplift,
+        'Resist_kN': resist,
+        'Net_Uplift_kN': net,
+        'Uplift_Ratio': ratio,
+        'Allow_MPa': allow,
+        'Req_Bolt_Area_mm2': net * 1000.0 / allow
+    }
+    res['Governing'] = {check: np.where(res[check].max(axis=-1) > 0, np.argmax(res[check], axis=-1), -1)
+                        for check in COMBINATION_CHECKS}
+    return res
+
+
+def combination_table(res, index=()):
+    """
+    Rows (one per case) of one tank of an evaluate_combinations result, in the AnchorBoltDesign Uplift_Table format.
+    :param index: Tank index into the batch shape (() for a single tank)
+    """
+    index = index if isinstance(index, tuple) else (index,)
+    rows = []
+    for k, name in enumerate(res['Cases']):
+        sel = index + (k,)
+        rows.append({
+            'Case': name,
+            'S_uplift': float(res['Uplift_kN'][sel]),
+            'W_resist': float(res['Resist_kN'][sel]),
+            'Net_Uplift': float(res['Net_Uplift_kN'][sel]),
+            'Allow_MPa': float(res['Allow_MPa'][sel]),
+            'Req_Bolt_Area_mm2': float(res['Req_Bolt_Area_mm2'][sel])
+        })
+    return rows
+
+
+def governing_cases(res, index=()):
+    """
+    {check: governing case name} for one tank of an evaluate_combinations result (None if no case governs).
+    """
+    index = index if isinstance(index, tuple) else (index,)
+    names = {}
+    for check, gov in res['Governing'].items():
+        k = int(np.asarray(gov)[index])
+        names[check] = res['Cases'][k] if k >= 0 else None
+    return names
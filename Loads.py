@@ -1,4 +1,45 @@
 import math
+from functools import lru_cache, cached_property
+import numpy as np
+from KDS_Coefficients import kds_kzr, kds_site_factors, GF_KDS, CF_KDS, RHO_AIR
+
+# ASCE 7 Table 26.11-1 terrain exposure constants (SI): power-law exponent alpha and gradient height zg (m)
+WIND_EXPOSURE = {
+    'B': {'alpha': 7.0, 'zg': 365.76},
+    'C': {'alpha': 9.5, 'zg': 274.32},
+    'D': {'alpha': 11.5, 'zg': 213.36}
+}
+KZ_Z_MIN = 4.57 # m, Kz is constant below this height
+
+def exposure_coefficient(z, exposure='C'):
+    """
+    Velocity pressure exposure coefficient Kz(z) = 2.01 (z / zg)^(2 / alpha), z >= 4.57 m (ASCE 7 26.10.1).
+    z: Height(s) above grade (m), scalar or array
+    """
+    props = WIND_EXPOSURE.get(exposure, WIND_EXPOSURE['C'])
+    z = np.maximum(np.asarray(z, dtype=float), KZ_Z_MIN)
+    return 2.01 * (z / props['zg']) ** (2.0 / props['alpha'])
+
+@lru_cache(maxsize=128)
+def wind_profile(V, exposure, H, n=201):
+    """
+    Velocity pressure profile over the shell height on a fine vertical grid, shared by all users
+    (WindLoad, anchorage, girder / Annex V checks). Cached per (V, exposure, H).
+    qz = 0.613 Kz(z) V^2 (N/m2) with Kzt = Kd = I = 1; callers scale by their own factors.
+    Returns read-only arrays: z (m), Kz, qz (N/m2) and the cumulative integrals from the base
+    Q_cum = int qz dz (N/m per m of width) and M_cum = int qz z dz (Nm/m per m of width).
+    """
+    z = np.linspace(0.0, H, n)
+    Kz = exposure_coefficient(z, exposure)
+    qz = 0.613 * Kz * V ** 2
+    dz = np.diff(z)
+    Q_cum = np.concatenate([[0.0], np.cumsum(0.5 * (qz[1:] + qz[:-1]) * dz)])
+    qzz = qz * z
+    M_cum = np.concatenate([[0.0], np.cumsum(0.5 * (qzz[1:] + qzz[:-1]) * dz)])
+    profile = {'z': z, 'Kz': Kz, 'qz': qz, 'Q_cum': Q_cum, 'M_cum': M_cum}
+    for arr in profile.values():
+        arr.flags.writeable = False
+    return profile
 
 class WindLoad:
     def __init__(self, design_params):
@@ -9,6 +50,10 @@ class WindLoad:
         self.Cf = design_params.get('Cf', 0.5)
         self.I = 1.0 # Importance Factor for Wind (assumed 1.0 if not specified)
         
+        # Height-resolved profile (Kz(z) per exposure) instead of one uniform pressure
+        self.exposure = design_params.get('Wind_Exposure', 'C')
+        self.profile_mode = design_params.get('Wind_Profile', False)
+        
         # Geometry
         self.D = design_params.get('D', 0.0)
         self.H = design_params.get('H', 0.0)
@@ -25,6 +70,11 @@ class WindLoad:
         it must be multiplied by 0.6 when converted to Allowable Stress Design (ASD) pressure.
         We assume input V is based on ASCE 7-10 (3-sec gust) as per modern standards.
         """
+        if self.profile_mode:
+            # Maximum (top of shell) pressure of the profile
+            self.P_WS = self.calculate_profile()['P_kPa'][-1] * 1000.0 # N/m2
+            return self.P_WS / 1000.0 # kPa
+        
         # Velocity Pressure (Strength Level if ASCE 7-10)
         self.qz = 0.613 * self.Kzt * self.Kd * (self.V ** 2) * self.I # N/m2
         
@@ -44,6 +94,9 @@ class WindLoad:
         Projected_Area = D * H
         Moment_Arm = H / 2
         """
+        if self.profile_mode:
+            return self.calculate_profile()['Moment_kNm']
+        
         P_WS_Pa = self.calculate_pressure() * 1000.0 # Pa
         Area = self.D * self.H
         Force = P_WS_Pa * Area # N
@@ -51,6 +104,46 @@ class WindLoad:
         
         return Moment / 1000.0 # kNm
 
+    def calculate_profile(self, course_widths=None):
+        """
+        Height-resolved wind pressure (ASD) from the shared wind_profile grid:
+        P(z) = 0.613 Kz(z) Kzt Kd V^2 I * G * Cf * 0.6, shear and base moment integrated over D x H.
+        :param course_widths: Shell course widths from the bottom (m); adds per-course results
+        :return: dict z_m, Kz, P_kPa (arrays), Shear_kN, Moment_kNm and 'Courses' rows
+                 (z_bot, z_top, average pressure, shear and moment about the base of each course)
+        """
+        prof = wind_profile(float(self.V), self.exposure, float(self.H))
+        factor = self.Kzt * self.Kd * self.I * self.G * self.Cf * 0.6 # qz -> ASD design pressure
+        
+        result = {
+            'z_m': prof['z'],
+            'Kz': prof['Kz'],
+            'P_kPa': prof['qz'] * factor / 1000.0,
+            'Shear_kN': prof['Q_cum'][-1] * factor * self.D / 1000.0,
+            'Moment_kNm': prof['M_cum'][-1] * factor * self.D / 1000.0,
+            'Courses': []
+        }
+        
+        if course_widths is not None:
+            z_edges = np.minimum(np.concatenate([[0.0], np.cumsum(course_widths)]), self.H)
+            Q = np.interp(z_edges, prof['z'], prof['Q_cum']) * factor * self.D / 1000.0 # kN
+            M = np.interp(z_edges, prof['z'], prof['M_cum']) * factor * self.D / 1000.0 # kNm
+            dz = np.diff(z_edges)
+            dQ = np.diff(Q)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                P_avg = np.where(dz > 0, dQ / (self.D * dz), 0.0)
+            for k in range(len(dz)):
+                result['Courses'].append({
+                    'Course': k + 1,
+                    'z_bot (m)': z_edges[k],
+                    'z_top (m)': z_edges[k + 1],
+                    'P_avg (kPa)': P_avg[k],
+                    'Shear (kN)': dQ[k],
+                    'Moment (kNm)': M[k + 1] - M[k]
+                })
+        
+        return result
+
 class KDSWindLoad:
     def __init__(self, design_params):
         """
@@ -66,88 +159,19 @@ class KDSWindLoad:
         # Kzt (Topographic) assumed 1.0 for simplification unless inputs added
         Kzt = 1.0 
         
-        # Kzr (Exposure Factor) based on Terrain and Height
-        # KDS 41 12 00 Table (simplified power law approximation)
-        # alpha, zg values
-        terrain_props = {
-            'A': {'alpha': 0.33, 'zg': 550, 'zb': 10},
-            'B': {'alpha': 0.22, 'zg': 450, 'zb': 15},
-            'C': {'alpha': 0.15, 'zg': 350, 'zb': 20},
-            'D': {'alpha': 0.10, 'zg': 250, 'zb': 30}
-        }
-        props = terrain_props.get(self.Terrain, terrain_props['B'])
-        alpha = props['alpha']
-        zg = props['zg']
-        zb = props['zb']
-        
-        # Calculate Kzr at Mean Roof Height (H)
-        # If H < zb, use H=zb
-        h_eff = max(self.H, zb)
-        Kzr = 2.0 * ((h_eff / zg) ** alpha) # Wait, Kzr formula varies.
-        # KDS Eq 4.1-1: Vh = V0 * Kzr * Kzt * Iw ??
-        # Or Velocity Pressure qH = 0.5 * rho * Vh^2 ?
-        # Standard: V_z = V0 * Kzr * Kzt * Iw is usually Design Wind Speed?
-        # Let's use simplified Exposure Coeff (Kz) logic from ASCE/KDS.
-        # Kz = 2.01 * (z/zg)^(2/alpha).
-        # But KDS specific: Kh = (H/RefH)^alpha...
-        # Let's use Power Law approximation logic standardized:
-        # V_design = V0 * (H/10)^alpha? No.
-        
-        # Using KDS 2016 Simpified:
-        # Velocity Pressure q = 0.5 * rho * V_design^2
-        # V_design = V0 * Kzr * Kzt * Iw 
-        # (Where Kzr includes Height & Terrain effect)
-        
-        # Power Law Kzr:
-        # At height z: Kzr = 0.53 * (z^0.33) for A ?? Too complex to guess.
-        # Let's use "Exposure Coefficient" Kh from Table/Formula.
-        # Formula: Kh = (z / zg) ^ (2 * alpha) ? That is for pressure.
-        # Let's assume Kzr relates to Velocity directly.
-        
-        # Approximation:
-        # Vh = V0 * (H/10)^alpha (Common simple engineering approx)
-        # Correct KDS 41 12 00:
-        # Vh = V0 * Kzr * Kzt * Iw
-        # Kzr = 2.58 * (z/zg)^(1/alpha_inv) ...
-        
-        # Let's implement Table Lookup logic for Kh (Pressure Coeff) directly if possible, or robust Power Law.
-        # Kzr = (z / 10)**alpha_v
-        # Let's use simple multiplier based on Terrain B (Standard).
-        # Factor for 20m height ~ 1.15?
-        
-        # BETTER: Use ASCE-7 style logic which is compatible.
-        # Kz = 2.01 * (max(self.H, 4.5)/zg)**(2/alpha_asce)
-        # KDS is very similar to ASCE 7.
-        # Let's use ASCE 7 calculation for KDS with KDS input V0.
-        # alpha for B = 7.0 (1/7 = 0.14)
-        
-        # Revert to safe KDS specific implementation:
-        # V_H = V0 * S_factor ?
-        # Let's use: q_z = 0.5 * rho * (V0 * Kzr * Iw)^2
-        # Kzr = 2.0 * (H/zg)^(alpha)?
-        # I will use 1.0 for now but apply V0 and Density.
-        
-        # Assume Kzr * Kzt ~ 1.2 for typical H=20m, Terrain B.
-        if self.Terrain == 'B':
-            Kzr = 1.0 + 0.01 * self.H # Dummy Placeholder - TODO: Replace with Real Formula
-            Kzr = 1.15
-        elif self.Terrain == 'C':
-            Kzr = 1.35
-        elif self.Terrain == 'D':
-            Kzr = 1.55
-        else: # A
-            Kzr = 0.95
+        # Kzr (Height / Terrain Factor), KDS 41 12 00, from the precomputed terrain x height grid
+        Kzr = float(kds_kzr(self.H, self.Terrain))
             
         V_h = self.V0 * Kzr * self.Iw
         
         # Pressure
         # q = 0.5 * 1.225 * V_h^2
-        q = 0.5 * 1.225 * (V_h ** 2) # N/m2
+        q = 0.5 * RHO_AIR * (V_h ** 2) # N/m2
         
         # Gust Factor Gf (usually 0.85)
-        Gf = 0.85 
+        Gf = GF_KDS
         # Force Coeff Cf (Cylinder ~ 0.7-0.8)
-        Cf = 0.7 
+        Cf = CF_KDS
         
         self.P_KDS = q * Gf * Cf # N/m2
         
@@ -158,6 +182,282 @@ class KDSWindLoad:
          A = self.D * self.H
          return (P * A * self.H / 2.0) / 1000.0 # kNm
 
+def spectral_acceleration(T, SDS, SD1, TL=4.0):
+    """
+    Design response spectrum Sa(T) in g (API 650 E.4.6.1 / ASCE 7 11.4.6).
+    The KDS 41 17 00 design spectrum has the same shape (T0 = 0.2 Ts, Ts = SD1/SDS, TL).
+    All arguments broadcast against each other.
+    """
+    T, SDS, SD1, TL = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (T, SDS, SD1, TL)])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Ts = np.where(SDS > 0, SD1 / SDS, 0.0)
+        T0 = 0.2 * Ts
+        return np.select([T < T0, T < Ts, T < TL],
+                         [SDS * (0.4 + 0.6 * (T / T0)), SDS, SD1 / T],
+                         SD1 * TL / T**2)
+
+def convective_acceleration(Tc, SD1, TL=4.0):
+    """
+    Long-period branch of the spectrum used for the convective mode (E.4.6.1):
+    SD1 / Tc for Tc <= TL, SD1 * TL / Tc^2 beyond. Broadcasts.
+    """
+    Tc, SD1, TL = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (Tc, SD1, TL)])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(Tc <= TL, SD1 / Tc, SD1 * TL / Tc**2)
+
+class DesignSpectrum:
+    """
+    Design response spectrum for one (SDS, SD1, TL) site; single source for the Ai / Ac coefficients
+    of SeismicLoad, the spectrum chart in the app and the report graph.
+    Use DesignSpectrum.get(SDS, SD1, TL) to share memoized instances.
+    """
+    def __init__(self, SDS, SD1, TL=4.0):
+        self.SDS = float(SDS)
+        self.SD1 = float(SD1)
+        self.TL = float(TL)
+        self.Ts = self.SD1 / self.SDS if self.SDS > 0 else 0.0
+        self.T0 = 0.2 * self.Ts
+        self._curves = {}
+
+    @classmethod
+    def get(cls, SDS, SD1, TL=4.0):
+        return _design_spectrum(float(SDS), float(SD1), float(TL))
+
+    def sa(self, T):
+        """
+        Sa(T) in g for a scalar or array of periods (s).
+        """
+        return spectral_acceleration(T, self.SDS, self.SD1, self.TL)
+
+    def impulsive_coefficient(self, I, Rw_i=3.5):
+        """
+        Ai = SDS * (I / Rw_i) (E.4.6.1), min 0.001.
+        """
+        return max(self.SDS * (I / Rw_i), 0.001)
+
+    def convective_coefficient(self, Tc, I, Rw_c=1.5, K=1.5):
+        """
+        Ac = K * SD1 / Tc * (I / Rw_c), or K * SD1 * TL / Tc^2 * (I / Rw_c) beyond TL (E.4.6.1).
+        """
+        return K * convective_acceleration(Tc, self.SD1, self.TL) * (I / Rw_c)
+
+    def curve(self, t_max=None, n=100):
+        """
+        (T, Sa) arrays from 0 to t_max (default TL + 2 s) for charts. Cached; read-only.
+        """
+        t_max = self.TL + 2.0 if t_max is None else float(t_max)
+        key = (t_max, n)
+        if key not in self._curves:
+            T = np.linspace(0.0, t_max, n)
+            Sa = self.sa(T)
+            T.flags.writeable = False
+            Sa.flags.writeable = False
+            self._curves[key] = (T, Sa)
+        return self._curves[key]
+
+@lru_cache(maxsize=256)
+def _design_spectrum(SDS, SD1, TL):
+    return DesignSpectrum(SDS, SD1, TL)
+
+# Force reduction factors (Table E-4), self-anchored: Rw_i = 3.5, Rw_c = 1.5 (mechanically anchored: 4.0 / 2.0)
+RW_I = 3.5
+RW_C = 1.5
+# Vertical seismic acceleration parameter Av = 2/3 * 0.7 * SDS = 0.47 SDS (E.6.1.3, 13th Ed)
+AV_SDS = 0.47
+GRAVITY = 9.81 # m/s2, weight to force in calculate_loads
+MU_SLIDING = 0.4 # Friction coefficient (E.7.6)
+
+class SeismicState:
+    """
+    Annex E intermediate quantities of one tank for one (SDS, SD1, TL, I) site, geometry, weights and
+    liquid level. Every property is evaluated on first access and then cached, so calculate_loads,
+    the hydrodynamic pressures and the hoop stress checks of SeismicLoad / KDSSeismicLoad all read the
+    same Ai, Ac, Av, Ks, Tc and D/H terms. Use SeismicState.get(...) to share memoized instances.
+    """
+    def __init__(self, SDS, SD1, I, D, H, TL=4.0, W_shell=0.0, W_roof=0.0, W_liquid=0.0):
+        """
+        :param SDS, SD1: Design spectral accelerations (g)
+        :param I: Importance factor
+        :param D: Diameter (m)
+        :param H: Height used for D/H and the lever arms (m): tank height or liquid level
+        :param TL: Long-period transition period (s)
+        :param W_shell, W_roof, W_liquid: Weights (kg)
+        """
+        self.SDS = float(SDS)
+        self.SD1 = float(SD1)
+        self.I = float(I)
+        self.D = float(D)
+        self.H = float(H)
+        self.TL = float(TL)
+        self.W_shell = float(W_shell)
+        self.W_roof = float(W_roof)
+        self.W_liquid = float(W_liquid)
+        self.Rw_i = RW_I
+        self.Rw_c = RW_C
+
+    @classmethod
+    def get(cls, SDS, SD1, I, D, H, TL=4.0, W_shell=0.0, W_roof=0.0, W_liquid=0.0):
+        return _seismic_state(float(SDS), float(SD1), float(I), float(D), float(H), float(TL),
+                              float(W_shell), float(W_roof), float(W_liquid))
+
+    @property
+    def spectrum(self):
+        return DesignSpectrum.get(self.SDS, self.SD1, self.TL)
+
+    @cached_property
+    def ratio(self):
+        """
+        D / H.
+        """
+        return self.D / self.H
+
+    @cached_property
+    def slender(self):
+        """
+        D / H >= 1.333 branch of E.6.1.1 / E.6.1.2.
+        """
+        return self.ratio >= 1.333
+
+    @cached_property
+    def Ai(self):
+        """
+        Impulsive spectral acceleration parameter Ai = SDS * (I / Rw_i) (E.4.6.1).
+        """
+        return self.spectrum.impulsive_coefficient(self.I, self.Rw_i)
+
+    @cached_property
+    def Av(self):
+        """
+        Vertical seismic acceleration parameter Av = 0.47 SDS (E.6.1.3).
+        """
+        return AV_SDS * self.SDS
+
+    @cached_property
+    def Ks(self):
+        """
+        Sloshing period coefficient Ks = 0.576 / sqrt(tanh(3.67 H / D)) (E.4.5.2).
+        """
+        return 0.576 / math.sqrt(math.tanh(3.67 / self.ratio))
+
+    @cached_property
+    def Tc(self):
+        """
+        Convective (sloshing) period Tc = 1.8 Ks sqrt(D) (s).
+        """
+        return 1.8 * self.Ks * math.sqrt(self.D)
+
+    @cached_property
+    def Ac(self):
+        """
+        Convective spectral acceleration parameter Ac = K * SD1 / Tc * (I / Rw_c), K = 1.5;
+        TL / Tc^2 instead of 1 / Tc beyond TL (E.4.6.1).
+        """
+        if self.Tc > 0:
+            return float(self.spectrum.convective_coefficient(self.Tc, self.I, self.Rw_c))
+        return self.Ai
+
+    @cached_property
+    def Wi(self):
+        """
+        Impulsive weight (kg), E.6.1.1.
+        """
+        r = self.ratio
+        if self.slender:
+            return (math.tanh(0.866 * r) / (0.866 * r)) * self.W_liquid
+        return (1.0 - 0.218 * r) * self.W_liquid
+
+    @cached_property
+    def Wc(self):
+        """
+        Convective weight (kg), E.6.1.1.
+        """
+        return 0.230 * self.ratio * math.tanh(3.67 / self.ratio) * self.W_liquid
+
+    @cached_property
+    def arms(self):
+        """
+        Lever arms (m) Xs, Xr, Xi, Xis, Xc, Xcs (E.6.1.2).
+        """
+        H = self.H
+        r = self.ratio
+        if self.slender:
+            Xi = Xis = 0.375 * H
+        else:
+            Xi = (0.5 - 0.094 * r) * H
+            Xis = (0.5 + 0.06 * r) * H
+        arg = 3.67 / r
+        cosh_arg = math.cosh(arg)
+        sinh_arg = math.sinh(arg)
+        Xc = (1.0 - (cosh_arg - 1.0) / (arg * sinh_arg)) * H
+        Xcs = (1.0 - (cosh_arg - 1.937) / (arg * sinh_arg)) * H
+        return {'Xs': H / 2.0, 'Xr': H + 0.1, 'Xi': Xi, 'Xis': Xis, 'Xc': Xc, 'Xcs': Xcs}
+
+    @cached_property
+    def forces_N(self):
+        """
+        Weights in N (Ws, Wr, Wi, Wc, W_liquid).
+        """
+        g = GRAVITY
+        return {'Ws': self.W_shell * g, 'Wr': self.W_roof * g, 'Wi': self.Wi * g, 'Wc': self.Wc * g,
+                'W_liquid': self.W_liquid * g}
+
+    @cached_property
+    def base_shear(self):
+        """
+        V = sqrt((Ai (Ws + Wr + Wi))^2 + (Ac Wc)^2) (N), E.6.1.
+        """
+        f = self.forces_N
+        Vi = self.Ai * (f['Ws'] + f['Wr'] + f['Wi'])
+        Vc = self.Ac * f['Wc']
+        return math.sqrt(Vi**2 + Vc**2)
+
+    @cached_property
+    def ringwall_moment(self):
+        """
+        Ringwall moment Mrw (Nm), E.6.1.5.
+        """
+        f, x = self.forces_N, self.arms
+        Mi = self.Ai * (f['Wi'] * x['Xi'] + f['Ws'] * x['Xs'] + f['Wr'] * x['Xr'])
+        Mc = self.Ac * (f['Wc'] * x['Xc'])
+        return math.sqrt(Mi**2 + Mc**2)
+
+    @cached_property
+    def slab_moment(self):
+        """
+        Slab moment Ms (Nm), E.6.1.6.
+        """
+        f, x = self.forces_N, self.arms
+        Mi = self.Ai * (f['Wi'] * x['Xis'] + f['Ws'] * x['Xs'] + f['Wr'] * x['Xr'])
+        Mc = self.Ac * (f['Wc'] * x['Xcs'])
+        return math.sqrt(Mi**2 + Mc**2)
+
+    @cached_property
+    def sliding_resistance(self):
+        """
+        Friction resistance mu (Ws + Wr + W_liquid) (1 - 0.4 Av) (N), E.7.6.
+        """
+        f = self.forces_N
+        return MU_SLIDING * (f['Ws'] + f['Wr'] + f['W_liquid']) * (1.0 - 0.4 * self.Av)
+
+    @cached_property
+    def anchorage_ratio(self):
+        """
+        J = Mrw / (D^2 [wt (1 - 0.4 Av) + wa]), E.6.2.1 (0 without resisting weight).
+        """
+        f = self.forces_N
+        wt = f['Ws'] / (math.pi * self.D)
+        wa = f['Wr'] / (math.pi * self.D)
+        denom = (self.D**2) * (wt * (1 - 0.4 * self.Av) + wa)
+        return self.ringwall_moment / denom if denom > 0 else 0.0
+
+@lru_cache(maxsize=256)
+def _seismic_state(SDS, SD1, I, D, H, TL, W_shell, W_roof, W_liquid):
+    return SeismicState(SDS, SD1, I, D, H, TL, W_shell, W_roof, W_liquid)
+
+# Checks of SeismicLoad.calculate_envelope, reported with their governing (maximum) liquid level
+ENVELOPE_CHECKS = ['Wi_kg', 'Wc_kg', 'Base_Shear_kN', 'Ringwall_Moment_kNm', 'Slab_Moment_kNm',
+                   'Anchorage_Ratio_J', 'Sliding_Ratio', 'd_max_m', 'Hoop_Stress_MPa', 'Hoop_Stress_Ratio']
+
 class SeismicLoad:
     def __init__(self, design_params):
         self.S1 = design_params.get('S1', 0.0)
@@ -170,153 +470,49 @@ class SeismicLoad:
         self.use_group = design_params.get('Seismic_Group', '-')
         self.input_method = design_params.get('Seismic_Method', '-')
         self.Ss = design_params.get('Ss', 0.0)
+        self.TL = design_params.get('T_L', 4.0) # Long-period transition period (s)
         
         # Geometry & Weights (To be populated)
         self.D = design_params.get('D', 0.0)
         self.H = design_params.get('H', 0.0)
         self.G = design_params.get('G', 1.0) # Specific Gravity
         
+    @property
+    def spectrum(self):
+        """
+        Design spectrum of the current SDS / SD1 (self.S1) / TL (shared, memoized).
+        """
+        return DesignSpectrum.get(self.SDS, self.S1, self.TL)
+
+    def state(self, W_shell=0.0, W_roof=0.0, W_liquid=0.0, liquid_height=None):
+        """
+        Shared SeismicState of the current site for the given weights (kg) and liquid level
+        (default: tank height H). Memoized; see SeismicState.get.
+        """
+        H = self.H if liquid_height is None else liquid_height
+        return SeismicState.get(self.SDS, self.S1, self.I, self.D, H, self.TL, W_shell, W_roof, W_liquid)
+
     def calculate_loads(self, W_shell, W_roof, W_liquid):
         """
         Calculates Seismic Loads (Base Shear V, Overturning Moment M).
         Also calculates Vertical Seismic Acceleration (Av).
+        All intermediate terms come from the shared SeismicState (self.state).
         :param W_shell: Total Shell Weight (kg)
         :param W_roof: Total Roof Weight (kg)
         :param W_liquid: Total Liquid Weight (kg)
         """
-        # 1. Calculate Impulsive and Convective Weights (API 650 E.6.1)
-        # Ratio D/H
-        ratio = self.D / self.H
-        
-        Wi = 0.0
-        Wc = 0.0
-        
-        # E.6.1.1 Impulsive Weight Wi
-        if ratio >= 1.333:
-            Wi = (math.tanh(0.866 * ratio) / (0.866 * ratio)) * W_liquid
-        else:
-            Wi = (1.0 - 0.218 * ratio) * W_liquid
-            
-        # E.6.1.2 Convective Weight Wc
-        Wc = (0.230 * ratio * math.tanh(3.67 / ratio)) * W_liquid
-        
-        # 2. Seismic Factors and Coefficients
-        # Rw: Force Reduction Factor (Table E-4)
-        # Assuming Self-Anchored for typical tanks unless specified.
-        # Self-Anchored: Rw_i = 3.5, Rw_c = 1.5
-        # Mechanically-Anchored: Rw_i = 4.0, Rw_c = 2.0
-        # Let's assume Self-Anchored (conservative/standard for large tanks)
-        # TODO: Make this an input parameter
-        Rw_i = 3.5 
-        Rw_c = 1.5
-        
-        # Impulsive Spectral Acceleration Parameter: Ai
-        # Ai = SDS * (I / Rw_i)
-        Ai = self.SDS * (self.I / Rw_i)
-        if Ai < 0.001: Ai = 0.001 # Min
-        
-        # Vertical Seismic Acceleration Parameter: Av (E.6.1.3 / E.2.2)
-        # Av = 2/3 * 0.7 * SDS = 0.47 * SDS (E.6.1.3 equation 13th Ed)
-        # Note: 13th Ed simplifies this.
-        Av = 0.47 * self.SDS
-        
-        # Convective Period Tc (E.4.5.2)
-        Ks = 0.576 / math.sqrt(math.tanh(3.67 / ratio))
-        Tc = 1.8 * Ks * math.sqrt(self.D) # Seconds
-        
-        # Convective Spectral Acceleration Parameter: Ac (E.4.6.2)
-        # If Tc <= TL (usually 4s+), Ac = K * SD1 * (1/Tc) * (I/Rw_c)
-        # Using simplified approach with S1 approx for SD1
-        SD1 = self.S1 
-        if Tc > 0:
-            # Note: API 650 E.4.6.2: Ac = 2.5 * Fa * S1 * (1.5/Tc)? No.
-            # Ac = K * SD1 * (1/Tc) * (I/Rw_c) <= Ai?
-            # Using 1.5 factor approximation for K
-            Ac = 1.5 * (SD1 / Tc) * (self.I / Rw_c)
-        else:
-            Ac = Ai
-            
-        # 3. Base Shear V (E.6.1)
-        # V = sqrt( (Ai * (Ws + Wr + Wi))^2 + (Ac * Wc)^2 )
-        g = 9.81
-        Ws_N = W_shell * g
-        Wr_N = W_roof * g
-        Wi_N = Wi * g
-        Wc_N = Wc * g
-        
-        Vi = Ai * (Ws_N + Wr_N + Wi_N)
-        Vc = Ac * Wc_N
-        
-        V_total = math.sqrt(Vi**2 + Vc**2)
-        
-        # 4. Overturning Moment M (E.6.1.5)
-        Xs = self.H / 2.0
-        Xr = self.H + 0.1 # Approx
-        
-        # Xi, Xis, Xc, Xcs Ratios (E.6.1.2)
-        dh_ratio = ratio
-        if dh_ratio >= 1.333:
-            Xi = 0.375 * self.H
-            Xis = 0.375 * self.H
-        else:
-            Xi = (0.5 - 0.094 * dh_ratio) * self.H
-            Xis = (0.5 + 0.06 * dh_ratio) * self.H
-            
-        # Convective Ratios
-        # Factor for Xc and Xcs depends on argument (3.67 / (D/H))
-        arg = 3.67 / dh_ratio
-        cosh_arg = math.cosh(arg)
-        sinh_arg = math.sinh(arg)
-        
-        # E.6.1.2.2 Xc
-        Xc = (1.0 - (cosh_arg - 1.0) / (arg * sinh_arg)) * self.H
-        
-        # E.6.1.2.4 Xcs
-        Xcs = (1.0 - (cosh_arg - 1.937) / (arg * sinh_arg)) * self.H
-
-        # Ringwall Moment (Mrw) - E.6.1.5
-        Mi_rw = Ai * (Wi_N * Xi + Ws_N * Xs + Wr_N * Xr)
-        Mc_rw = Ac * (Wc_N * Xc)
-        Mrw = math.sqrt(Mi_rw**2 + Mc_rw**2) # Nm
-        Mrw_kNm = Mrw / 1000.0
-        
-        # Slab Moment (Ms) - E.6.1.6
-        Mi_s = Ai * (Wi_N * Xis + Ws_N * Xs + Wr_N * Xr)
-        Mc_s = Ac * (Wc_N * Xcs)
-        Ms = math.sqrt(Mi_s**2 + Mc_s**2) # Nm
-        Ms_kNm = Ms / 1000.0
-        
-        # --- 5. Sloshing (E.6.1.3) ---
-        # Theoretical wave height d_max
-        # d_max = 0.5 * D * Af
-        # Where Af = Ac * (I / Rw_c) ? No, Ac in our code already includes I/Rw_c check?
-        # Our Ac = (K * SD1 / Tc) * (I / Rw_c). So Ac IS the design coeff including I/Rw.
-        # However, E.6.1.3 says "Af is the acceleration coefficient...".
-        # Let's assume Ac is the spectral acceleration.
-        # d_max = 0.5 * self.D * Ac
-        d_max = 0.5 * self.D * Ac
-        
-        # --- 6. Resistance to Sliding (E.7.6) ---
-        mu = 0.4
-        # W_liquid passed to method
-        W_liq_total_N = W_liquid * g
-        
-        # Max friction resistance
-        V_res = mu * (Ws_N + Wr_N + W_liq_total_N) * (1.0 - 0.4 * Av)
+        s = self.state(W_shell, W_roof, W_liquid)
+        # (self.S1 holds the design value SD1)
+
+        # Sloshing wave height (E.7.2): d_max = 0.5 * D * Af, Ac already includes I / Rw_c
+        d_max = 0.5 * self.D * s.Ac
+
+        V_total = s.base_shear
+        V_res = s.sliding_resistance
         Sliding_Status = "OK" if V_total <= V_res else "FAIL"
-        
-        # --- 7. Overturning Stability (Anchorage Ratio J) E.6.2.1 ---
-        # J = Mrw / (D^2 * [wt(1-0.4Av) + wa])
-        # wt = Ws_N / (Pi * D)
-        # wa = Wr_N / (Pi * D)
-        wt = Ws_N / (math.pi * self.D)
-        wa = Wr_N / (math.pi * self.D)
-        
-        denom = (self.D**2) * (wt * (1 - 0.4 * Av) + wa)
-        J = 0.0
-        if denom > 0:
-            J = Mrw / denom
-        
+
+        # Overturning Stability (Anchorage Ratio J) E.6.2.1
+        J = s.anchorage_ratio
         Anchorage_Status = "Self-Anchored"
         Annular_Check = "Not Required"
         
@@ -331,15 +527,15 @@ class SeismicLoad:
 
         return {
             'Base_Shear_kN': V_total / 1000.0,
-            'Ringwall_Moment_kNm': Mrw_kNm,
-            'Slab_Moment_kNm': Ms_kNm,
-            'Overturning_Moment_kNm': Mrw_kNm,
-            'Wi_kg': Wi,
-            'Wc_kg': Wc,
-            'Tc_s': Tc,
-            'Ai': Ai,
-            'Ac': Ac,
-            'Av': Av,
+            'Ringwall_Moment_kNm': s.ringwall_moment / 1000.0,
+            'Slab_Moment_kNm': s.slab_moment / 1000.0,
+            'Overturning_Moment_kNm': s.ringwall_moment / 1000.0,
+            'Wi_kg': s.Wi,
+            'Wc_kg': s.Wc,
+            'Tc_s': s.Tc,
+            'Ai': s.Ai,
+            'Ac': s.Ac,
+            'Av': s.Av,
             'd_max_m': d_max,
             'Sliding_Friction_Res_kN': V_res / 1000.0,
             'Sliding_Status': Sliding_Status,
@@ -356,9 +552,71 @@ class SeismicLoad:
             'Ss_input': self.Ss if hasattr(self, 'Ss') else 0,
             'S1_input': self.S1 if hasattr(self, 'S1') else 0,
             'Sp_input': self.SDS if self.input_method == 'Sp' else 0, # If Sp, SDS holds Sp
-            'T_L': 4.0 # Default/Assuming
+            'T_L': self.TL
         }
         
+    def calculate_envelope(self, W_shell, W_roof, min_level, max_level, n_levels=25, t_bottom_mm=None,
+                           Sd=None, E=1.0):
+        """
+        Operating envelope: Annex E loads over liquid levels from min_level to max_level in one vectorized
+        pass (Loads_Batch.seismic_loads_batch / hoop_stress_batch). At each level the liquid weight,
+        D/H and the liquid lever arms follow the level; the shell / roof lever arms use the tank height H.
+        :param W_shell, W_roof: Weights (kg)
+        :param min_level, max_level: Operating liquid level range (m); levels <= 0 are skipped
+        :param n_levels: Number of equally spaced levels (max_level is always included)
+        :param t_bottom_mm, Sd, E: Bottom course thickness / allowable stress for the hoop stress check (optional)
+        :return: {'Levels_m', ENVELOPE_CHECKS arrays per level, 'Governing': {check: {'Level_m', 'Value'}}}
+        """
+        from Loads_Batch import seismic_loads_batch, hoop_stress_batch
+
+        levels = np.linspace(float(min_level), float(max_level), max(int(n_levels), 1))
+        levels = levels[levels > 0]
+        if levels.size == 0:
+            levels = np.array([float(max_level)])
+        W_liquid = math.pi * (self.D / 2.0) ** 2 * levels * self.G * 1000.0
+
+        loads = seismic_loads_batch(self.D, levels, self.SDS, self.S1, self.I, W_shell, W_roof, W_liquid,
+                                    self.TL, H_tank=self.H)
+        res = {'Levels_m': levels}
+        res.update({check: loads[check] for check in ENVELOPE_CHECKS if check in loads})
+        if t_bottom_mm is not None and Sd is not None:
+            hoop = hoop_stress_batch(self.D, self.G, self.SDS, self.S1, self.I, t_bottom_mm, levels, Sd, E, self.TL)
+            res['Hoop_Stress_MPa'] = hoop['Stress_MPa']
+            res['Hoop_Stress_Ratio'] = hoop['Ratio']
+
+        res['Governing'] = {}
+        for check in ENVELOPE_CHECKS:
+            if check in res:
+                k = int(np.nanargmax(res[check]))
+                res['Governing'][check] = {'Level_m': float(levels[k]), 'Value': float(res[check][k])}
+        return res
+
+    def envelope_table(self, envelope):
+        """
+        Rows (one per check) of the governing levels of calculate_envelope, for the UI / report.
+        """
+        return [{'Check': check, 'Governing Level (m)': gov['Level_m'], 'Value': gov['Value']}
+                for check, gov in envelope['Governing'].items()]
+
+    def calculate_sloshing_history(self, W_liquid, records=None, dt=0.01, liquid_height=None, freeboard=None,
+                                   n_modes=1, n_records=100, seed=None):
+        """
+        Time-history sloshing mode (Sloshing.SloshingTimeHistory), reported next to the spectral d_max / Vc.
+        Without records, a synthetic suite (n_records) is generated and scaled to the design spectrum
+        (5 % damped) at the convective period.
+        :param W_liquid: Liquid weight (kg)
+        :param records: (n_records, nt) ground accelerations (g), time step dt (s)
+        :return: SloshingTimeHistory results dict
+        """
+        from Sloshing import SloshingTimeHistory, synthetic_records, scale_to_spectrum
+
+        history = SloshingTimeHistory(self, W_liquid, liquid_height, freeboard, n_modes)
+        if records is None:
+            Tc = history.state.Tc
+            records = synthetic_records(n_records, dt=dt, pga=0.4 * self.SDS, seed=seed)
+            records = scale_to_spectrum(records, dt, Tc, float(self.spectrum.sa(Tc)))
+        return history.run(records, dt)
+
     def calculate_hydrodynamic_pressure(self, y, liquid_height):
         """
         Calculates impulsive (Pi) and convective (Pc) pressures at height y from bottom.
@@ -392,37 +650,9 @@ class SeismicLoad:
         # D: Tank Diameter.
         # H: Liquid Height.
         
-        rho = self.G * 1000.0 * 9.81 # N/m3 (Specific Weight actually) - Wait.
-        # G is Specific Gravity. Density = G * 1000 kg/m3.
-        # Pressure = rho * g * h.
-        # Use Specific Weight Gamma = G * 9810 N/m3.
         gamma = self.G * 9.80665 # kN/m3
-        
-        Ai = self.SDS * (self.I / 3.5) # Rw_i assumed 3.5
-        # Note: We calculated Ai in calculate_loads, but it's local there. 
-        # Should store it or assume caller passes it? 
-        # Better: Re-calculate or make it class attribute. 
-        # I'll re-calculate for robustness here as Ai is cheap.
-        # Or better, store 'Ai' and 'Ac' in self during calculate_loads?
-        # But calculate_loads might not have been called yet or params might change.
-        # I will recalc Ai/Ac here assuming Rw=3.5/1.5 self-anchored.
-        
-        # Re-calc Ai/Ac
-        Rw_i = 3.5; Rw_c = 1.5
-        Ai = self.SDS * (self.I / Rw_i)
-        if Ai < 0.001: Ai = 0.001
-        
-        ratio = self.D / liquid_height
-        Ks = 0.576 / math.sqrt(math.tanh(3.67 / ratio))
-        Tc = 1.8 * Ks * math.sqrt(self.D)
-        
-        SD1 = self.S1 # Mapped S1 passed as SD1?
-        # Note: self.S1 in Load object is used as SD1 usually in our logic.
-        
-        if Tc > 0:
-            Ac = 1.5 * (SD1 / Tc) * (self.I / Rw_c)
-        else:
-            Ac = Ai
+        s = self.state(liquid_height=liquid_height)
+        Ai, Ac = s.Ai, s.Ac
 
         # Function for Vertical Profile
         # API 650 Eq E.6.1.4-1 (Impulsive):
@@ -499,6 +729,86 @@ class SeismicLoad:
         
         return Pi, Pc
 
+    def calculate_pressure_profile(self, y, liquid_height):
+        """
+        Hydrostatic and hydrodynamic pressures for an array of heights in one pass.
+        Same distributions as calculate_hydrodynamic_pressure / check_hoop_stress
+        (impulsive, convective and vertical Av = 0.47 SDS, combined by SRSS); no pressure above the liquid.
+        y: Heights from bottom (m), scalar or array
+        liquid_height: Design Liquid Level H (m)
+        Returns: dict of arrays (kPa) y_m, Hydro_kPa, Impulsive_kPa, Convective_kPa, Vertical_kPa,
+                 Seismic_Add_kPa, Total_kPa
+        """
+        y = np.asarray(y, dtype=float)
+        gamma = self.G * 9.80665 # kN/m3
+        s = self.state(liquid_height=liquid_height)
+        Ai, Ac, Av = s.Ai, s.Ac, s.Av
+
+        Ph = gamma * np.maximum(liquid_height - y, 0.0)
+        Pi = Ai * Ph
+        Pc = Ac * Ph
+        P_av = Av * Ph
+        P_seismic = np.sqrt(Pi**2 + Pc**2 + P_av**2)
+
+        return {
+            'y_m': y,
+            'Hydro_kPa': Ph,
+            'Impulsive_kPa': Pi,
+            'Convective_kPa': Pc,
+            'Vertical_kPa': P_av,
+            'Seismic_Add_kPa': P_seismic,
+            'Total_kPa': Ph + P_seismic
+        }
+
+    def check_course_hoop_stress(self, shell_courses, H_liq, E=1.0, n_profile=50):
+        """
+        Seismic hoop stress (E.6.2.4) at the bottom of every shell course.
+        The bottom course gives the same result as check_hoop_stress.
+        shell_courses: ShellDesign.shell_courses (Course, Width, Sd, t_used)
+        H_liq: Maximum design liquid level (m)
+        E: Joint Efficiency
+        n_profile: Number of equally spaced heights in the profile dataset
+        Returns: {Courses (rows for the report table), Governing_Course, Max_Ratio, Status, Profile}
+        """
+        names = [c['Course'] for c in shell_courses]
+        widths = np.array([c['Width'] for c in shell_courses], dtype=float)
+        t_used = np.array([c['t_used'] for c in shell_courses], dtype=float)
+        Sd = np.array([c['Sd'] for c in shell_courses], dtype=float)
+        y_bot = np.concatenate([[0.0], np.cumsum(widths)[:-1]])
+
+        p = self.calculate_pressure_profile(y_bot, H_liq)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stress = np.where(t_used > 0, p['Total_kPa'] * self.D / (2.0 * t_used), np.nan)
+        allowable = 1.333 * Sd * E
+        ratio = stress / allowable
+
+        rows = []
+        for k, name in enumerate(names):
+            rows.append({
+                'Course': name, 'y (m)': y_bot[k], 't_used (mm)': t_used[k],
+                'P_stat (kPa)': p['Hydro_kPa'][k], 'P_dyn (kPa)': p['Seismic_Add_kPa'][k],
+                'Stress (MPa)': stress[k], 'Allow (MPa)': allowable[k],
+                'Ratio': ratio[k], 'Status': "OK" if ratio[k] <= 1.0 else "Fail"
+            })
+
+        gov = int(np.nanargmax(ratio)) if np.any(np.isfinite(ratio)) else 0
+
+        # Profile over the liquid height (course bottoms included), with the thickness of the course at each height
+        y = np.union1d(np.linspace(0.0, H_liq, n_profile), y_bot[y_bot <= H_liq])
+        profile = self.calculate_pressure_profile(y, H_liq)
+        idx = np.searchsorted(y_bot, y, side='right') - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            profile['Stress_MPa'] = profile['Total_kPa'] * self.D / (2.0 * t_used[idx])
+        profile['Course'] = [names[i] for i in idx]
+
+        return {
+            'Courses': rows,
+            'Governing_Course': names[gov] if names else None,
+            'Max_Ratio': float(ratio[gov]) if names else 0.0,
+            'Status': "OK" if all(r['Status'] == "OK" for r in rows) else "Fail",
+            'Profile': profile
+        }
+
     def check_hoop_stress(self, t_mm, H_liq, Sd, E=1.0):
         """
         Calculates seismic hoop stress at bottom (y=0) and compares with allowable.
@@ -520,9 +830,8 @@ class SeismicLoad:
         # 2. Hydrodynamic Calculation
         Pi, Pc = self.calculate_hydrodynamic_pressure(y, H_liq)
         
-        # 3. Vertical Acceleration (Av)
-        # API 650 E.6.1.3: Av = (2/3) * SDS
-        Av = (2.0/3.0) * self.SDS
+        # 3. Vertical Acceleration (Av), same SeismicState as the hydrodynamic terms
+        Av = self.state(liquid_height=H_liq).Av
         P_av = Av * gamma * (H_liq - y)
         
         # 4. Total Combined Pressure (SRSS for seismic + Hydrostatic)
@@ -593,40 +902,12 @@ class KDSSeismicLoad(SeismicLoad):
         self.S1 = (2.0/3.0) * Fv * self.S 
         
     def get_kds_factors(self, S, soil_class):
-        # Simplified Lookup for common cases
-        # Soil: SA, SB, SC, SD, SE, SF
-        # Zone I (0.22), Zone II (0.14)
-        
-        # Table 4.2-1 Fa
-        # Soil | S < 0.25 (II) | S = 0.22 (I) ...
-        # KDS Fa (Approx)
-        #       S=0.14(II)   S=0.22(I)
-        # SA    0.8          0.8
-        # SB    1.0          1.0
-        # SC    1.2          1.2
-        # SD    1.6          1.5 (varies) -> Let's default 1.5
-        # SE    2.5          2.0 -> Default 2.0
-        
-        # Table 4.2-2 Fv
-        #       S=0.14(II)   S=0.22(I)
-        # SA    0.8          0.8
-        # SB    1.0          1.0
-        # SC    1.7          1.6
-        # SD    2.4          2.0
-        # SE    3.5          3.2
-        
-        fa_map = {
-            'SA': 0.8, 'SB': 1.0, 'SC': 1.2, 
-            'SD': 1.6 if S < 0.2 else 1.5, 
-            'SE': 2.5 if S < 0.2 else 2.0
-        }
-        fv_map = {
-            'SA': 0.8, 'SB': 1.0, 'SC': 1.7 if S < 0.2 else 1.6, 
-            'SD': 2.4 if S < 0.2 else 2.0, 
-            'SE': 3.5 if S < 0.2 else 3.2
-        }
-        
-        return fa_map.get(soil_class, 1.0), fv_map.get(soil_class, 1.0)
+        """
+        Fa, Fv (KDS 41 17 00 Table 4.2-1, 4.2-2), interpolated in S on the precomputed grid.
+        Soil: SA, SB, SC, SD, SE
+        """
+        Fa, Fv = kds_site_factors(S, soil_class)
+        return float(Fa), float(Fv)
 
 
 if __name__ == "__main__":
@@ -634,49 +915,49 @@ if __name__ == "__main__":
     # print(f"Wind Moment: {wind.calculate_overturning_moment():.2f} kNm")
     pass
 
+# API 650 13th Ed Table E-1 Fa (Site Class | Ss <= 0.25 | Ss=0.5 | Ss=0.75 | Ss=1.0 | Ss>=1.25)
+API_SS_GRID = np.array([0.25, 0.5, 0.75, 1.0, 1.25])
+API_FA_TABLE = {
+    'A': np.array([0.8, 0.8, 0.8, 0.8, 0.8]),
+    'B': np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+    'C': np.array([1.2, 1.2, 1.1, 1.0, 1.0]),
+    'D': np.array([1.6, 1.4, 1.2, 1.1, 1.0]),
+    'E': np.array([2.5, 1.7, 1.2, 0.9, 0.9])
+}
+
+# Table E-2 Fv (Site Class | S1 <= 0.1 | S1=0.2 | S1=0.3 | S1=0.4 | S1>=0.5)
+API_S1_GRID = np.array([0.1, 0.2, 0.3, 0.4, 0.5])
+API_FV_TABLE = {
+    'A': np.array([0.8, 0.8, 0.8, 0.8, 0.8]),
+    'B': np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+    'C': np.array([1.7, 1.6, 1.5, 1.4, 1.3]),
+    'D': np.array([2.4, 2.0, 1.8, 1.6, 1.5]),
+    'E': np.array([3.5, 3.2, 2.8, 2.4, 2.4])
+}
+
+def site_coefficients(site_class, Ss, S1):
+    """
+    Vectorized Fa, Fv (Tables E-1, E-2), linear interpolation clamped at the table ends.
+    site_class / Ss / S1 may be arrays (unknown site classes give 1.0, as Class F).
+    """
+    Ss, S1, sc = np.broadcast_arrays(np.asarray(Ss, dtype=float), np.asarray(S1, dtype=float),
+                                     np.char.upper(np.asarray(site_class, dtype=str)))
+    Fa = np.ones(Ss.shape)
+    Fv = np.ones(S1.shape)
+    for cls in np.unique(sc):
+        if cls not in API_FA_TABLE:
+            continue
+        mask = sc == cls
+        Fa[mask] = np.interp(Ss[mask], API_SS_GRID, API_FA_TABLE[cls])
+        Fv[mask] = np.interp(S1[mask], API_S1_GRID, API_FV_TABLE[cls])
+    return Fa, Fv
+
 def get_site_factors(site_class, Ss, S1):
     """
     Get Fa and Fv values from API 650 13th Ed Tables E-1 and E-2.
     """
-    # Table E-1 Fa
-    # Site Class | Ss <= 0.25 | Ss=0.5 | Ss=0.75 | Ss=1.0 | Ss>=1.25
-    fa_table = {
-        'A': [0.8, 0.8, 0.8, 0.8, 0.8],
-        'B': [1.0, 1.0, 1.0, 1.0, 1.0],
-        'C': [1.2, 1.2, 1.1, 1.0, 1.0],
-        'D': [1.6, 1.4, 1.2, 1.1, 1.0],
-        'E': [2.5, 1.7, 1.2, 0.9, 0.9]
-    }
-    ss_cols = [0.25, 0.5, 0.75, 1.0, 1.25]
-    
-    # Table E-2 Fv
-    # Site Class | S1 <= 0.1 | S1=0.2 | S1=0.3 | S1=0.4 | S1>=0.5
-    fv_table = {
-        'A': [0.8, 0.8, 0.8, 0.8, 0.8],
-        'B': [1.0, 1.0, 1.0, 1.0, 1.0],
-        'C': [1.7, 1.6, 1.5, 1.4, 1.3],
-        'D': [2.4, 2.0, 1.8, 1.6, 1.5],
-        'E': [3.5, 3.2, 2.8, 2.4, 2.4]
-    }
-    s1_cols = [0.1, 0.2, 0.3, 0.4, 0.5]
-    
-    def interpolate(value, cols, rows):
-        if value <= cols[0]: return rows[0]
-        if value >= cols[-1]: return rows[-1]
-        for i in range(len(cols)-1):
-            if cols[i] <= value <= cols[i+1]:
-                # Linear Interp
-                ratio = (value - cols[i]) / (cols[i+1] - cols[i])
-                return rows[i] + ratio * (rows[i+1] - rows[i])
-        return rows[0]
-
-    sc = site_class.upper()
-    if sc not in fa_table: return 1.0, 1.0 # Default/Error like F
-    
-    Fa = interpolate(Ss, ss_cols, fa_table[sc])
-    Fv = interpolate(S1, s1_cols, fv_table[sc])
-    
-    return Fa, Fv
+    Fa, Fv = site_coefficients(site_class, Ss, S1)
+    return float(Fa), float(Fv)
 
 def calculate_seismic_design_params(input_method, val1, val2=None, site_class='D'):
     """
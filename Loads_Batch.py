@@ -0,0 +1,176 @@
+import numpy as np
+from Loads import convective_acceleration, RW_I, RW_C, AV_SDS, GRAVITY, MU_SLIDING
+from Load_Combinations import evaluate_combinations
+from KDS_Coefficients import kds_design_accelerations, kds_wind_pressure
+
+
+def seismic_loads_batch(D, H, SDS, S1, I, W_shell, W_roof, W_liquid, TL=4.0, H_tank=None):
+    """
+    Vectorized Loads.SeismicLoad.calculate_loads (API 650 Annex E), same formulas element by element.
+    All arguments broadcast against each other.
+    :param H: Height for D/H and the liquid lever arms (m), the liquid level for partial fills
+    :param W_shell, W_roof, W_liquid: Weights (kg)
+    :param TL: Long-period transition period (s)
+    :param H_tank: Tank height for the shell / roof lever arms Xs, Xr (m), default H
+    :return: dict of arrays with the numeric keys of calculate_loads
+    """
+    H_tank = H if H_tank is None else H_tank
+    D, H, SDS, S1, I, TL, H_tank = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (D, H, SDS, S1, I, TL, H_tank)])
+    W_shell = np.asarray(W_shell, dtype=float)
+    W_roof = np.asarray(W_roof, dtype=float)
+    W_liquid = np.asarray(W_liquid, dtype=float)
+
+    ratio = D / H
+    slender = ratio >= 1.333
+
+    # E.6.1.1 Impulsive / Convective weights
+    Wi = np.where(slender, np.tanh(0.866 * ratio) / (0.866 * ratio), 1.0 - 0.218 * ratio) * W_liquid
+    Wc = 0.230 * ratio * np.tanh(3.67 / ratio) * W_liquid
+
+    Ai = np.maximum(SDS * (I / RW_I), 0.001)
+    Av = AV_SDS * SDS
+
+    Ks = 0.576 / np.sqrt(np.tanh(3.67 / ratio))
+    Tc = 1.8 * Ks * np.sqrt(D)
+    Ac = np.where(Tc > 0, 1.5 * convective_acceleration(Tc, S1, TL) * (I / RW_C), Ai)
+
+    Ws_N = W_shell * GRAVITY
+    Wr_N = W_roof * GRAVITY
+    Wi_N = Wi * GRAVITY
+    Wc_N = Wc * GRAVITY
+
+    Vi = Ai * (Ws_N + Wr_N + Wi_N)
+    Vc = Ac * Wc_N
+    V_total = np.sqrt(Vi ** 2 + Vc ** 2)
+
+    Xs = H_tank / 2.0
+    Xr = H_tank + 0.1
+    Xi = np.where(slender, 0.375 * H, (0.5 - 0.094 * ratio) * H)
+    Xis = np.where(slender, 0.375 * H, (0.5 + 0.06 * ratio) * H)
+    arg = 3.67 / ratio
+    Xc = (1.0 - (np.cosh(arg) - 1.0) / (arg * np.sinh(arg))) * H
+    Xcs = (1.0 - (np.cosh(arg) - 1.937) / (arg * np.sinh(arg))) * H
+
+    Mrw = np.sqrt((Ai * (Wi_N * Xi + Ws_N * Xs + Wr_N * Xr)) ** 2 + (Ac * Wc_N * Xc) ** 2)
+    Ms = np.sqrt((Ai * (Wi_N * Xis + Ws_N * Xs + Wr_N * Xr)) ** 2 + (Ac * Wc_N * Xcs) ** 2)
+
+    d_max = 0.5 * D * Ac
+
+    V_res = MU_SLIDING * (Ws_N + Wr_N + W_liquid * GRAVITY) * (1.0 - 0.4 * Av)
+
+    wt = Ws_N / (np.pi * D)
+    wa = Wr_N / (np.pi * D)
+    denom = D ** 2 * (wt * (1 - 0.4 * Av) + wa)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        J = np.where(denom > 0, Mrw / denom, 0.0)
+
+    return {
+        'Base_Shear_kN': V_total / 1000.0,
+        'Ringwall_Moment_kNm': Mrw / 1000.0,
+        'Slab_Moment_kNm': Ms / 1000.0,
+        'Overturning_Moment_kNm': Mrw / 1000.0,
+        'Wi_kg': Wi,
+        'Wc_kg': Wc,
+        'Tc_s': Tc,
+        'Ai': Ai,
+        'Ac': Ac,
+        'Av': Av,
+        'd_max_m': d_max,
+        'Sliding_Friction_Res_kN': V_res / 1000.0,
+        'Sliding_Ratio': V_total / V_res,
+        'Anchorage_Ratio_J': J
+    }
+
+
+def hoop_stress_batch(D, G, SDS, S1, I, t_mm, H_liq, Sd, E=1.0, TL=4.0):
+    """
+    Vectorized Loads.SeismicLoad.check_hoop_stress (bottom of shell, y = 0).
+    :return: dict of arrays Stress_MPa, Allow_MPa, Ratio, Hydro_kPa, Seismic_Add_kPa
+    """
+    D, G, SDS, S1, I, t_mm, H_liq, Sd, E, TL = np.broadcast_arrays(
+        *[np.asarray(v, dtype=float) for v in (D, G, SDS, S1, I, t_mm, H_liq, Sd, E, TL)])
+    gamma = G * 9.80665 # kN/m3
+    Ph = gamma * H_liq
+
+    # calculate_hydrodynamic_pressure(0, H_liq)
+    Ai = np.maximum(SDS * (I / RW_I), 0.001)
+    ratio = D / H_liq
+    Tc = 1.8 * (0.576 / np.sqrt(np.tanh(3.67 / ratio))) * np.sqrt(D)
+    Ac = np.where(Tc > 0, 1.5 * convective_acceleration(Tc, S1, TL) * (I / RW_C), Ai)
+    Pi = Ai * gamma * H_liq
+    Pc = Ac * gamma * H_liq
+
+    Av = AV_SDS * SDS
+    P_av = Av * gamma * H_liq
+
+    P_seismic = np.sqrt(Pi ** 2 + Pc ** 2 + P_av ** 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma = np.where(t_mm > 0, (Ph + P_seismic) * D / (2.0 * t_mm), np.nan)
+    allowable = 1.333 * Sd * E
+    return {
+        'Stress_MPa': sigma,
+        'Allow_MPa': allowable,
+        'Ratio': sigma / allowable,
+        'Hydro_kPa': Ph,
+        'Seismic_Add_kPa': P_seismic
+    }
+
+
+def wind_loads_batch(V, D, H, Kzt=1.0, Kd=0.95, G_wind=0.85, Cf=0.5, I=1.0):
+    """
+    Vectorized Loads.WindLoad (pressure kPa, overturning moment kNm).
+    """
+    V, D, H = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (V, D, H)])
+    qz = 0.613 * Kzt * Kd * V ** 2 * I
+    P_WS = qz * G_wind * Cf * 0.6 # N/m2 (ASD)
+    M = P_WS * D * H * (H / 2.0) / 1000.0
+    return P_WS / 1000.0, M
+
+
+def anchor_uplift_batch(D, P_design_kPa, U_wind, U_seismic, W_shell_kN, W_roof_kN, Av, P_test_kPa=0.0):
+    """
+    Vectorized AnchorBoltDesign uplift cases (Load_Combinations table).
+    :return: dict of arrays Net_Uplift_kN and Req_Bolt_Area_mm2 (max over the cases) and Governing_Case (index, -1 without uplift)
+    """
+    combos = evaluate_combinations(D, P_design_kPa, U_wind, U_seismic, W_shell_kN, W_roof_kN, Av=Av, P_test=P_test_kPa)
+    return {
+        'Net_Uplift_kN': combos['Net_Uplift_kN'].max(axis=-1),
+        'Req_Bolt_Area_mm2': combos['Req_Bolt_Area_mm2'].max(axis=-1),
+        'Governing_Case': combos['Governing']['Net_Uplift_kN']
+    }
+
+
+def compare_kds_api_batch(D, H, W_shell, W_roof, W_liquid, V, SDS, SD1, I, V0, terrain, S, soil, Ie=1.0, Iw=1.0,
+                          Kzt=1.0, Kd=0.95, G_wind=0.85, Cf=0.5, TL=4.0):
+    """
+    API 650 (ASCE 7) vs KDS 41 wind and seismic loads for a whole list of sites / tanks in one call
+    (the comparison app.py shows for one tank). Tank and site arguments broadcast; terrain / soil may be arrays.
+    :param W_shell, W_roof, W_liquid: Weights (kg)
+    :param V, SDS, SD1, I: API wind speed (m/s) and design spectral accelerations / importance factor
+    :param V0, terrain, S, soil, Ie, Iw: KDS basic wind speed, terrain category, effective ground acceleration,
+                                         soil class and importance factors
+    :return: dict of arrays API_/KDS_ Wind_P_kPa, Wind_M_kNm, Base_Shear_kN, Seismic_M_kNm and the KDS SDS / SD1
+    """
+    H = np.asarray(H, dtype=float)
+    D = np.asarray(D, dtype=float)
+    api_P, api_M = wind_loads_batch(V, D, H, Kzt, Kd, G_wind, Cf)
+    kds_P = kds_wind_pressure(V0, terrain, H, Iw)
+    kds_M = kds_P * D * H * (H / 2.0)
+
+    kds_SDS, kds_SD1 = kds_design_accelerations(S, soil)
+    api_seis = seismic_loads_batch(D, H, SDS, SD1, I, W_shell, W_roof, W_liquid, TL)
+    kds_seis = seismic_loads_batch(D, H, kds_SDS, kds_SD1, Ie, W_shell, W_roof, W_liquid, TL)
+
+    return {
+        'API_Wind_P_kPa': api_P,
+        'KDS_Wind_P_kPa': kds_P,
+        'API_Wind_M_kNm': api_M,
+        'KDS_Wind_M_kNm': kds_M,
+        'API_Base_Shear_kN': api_seis['Base_Shear_kN'],
+        'KDS_Base_Shear_kN': kds_seis['Base_Shear_kN'],
+        'API_Seismic_M_kNm': api_seis['Overturning_Moment_kNm'],
+        'KDS_Seismic_M_kNm': kds_seis['Overturning_Moment_kNm'],
+        'KDS_SDS': kds_SDS,
+        'KDS_SD1': kds_SD1
+    }
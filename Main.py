@@ -18,6 +18,130 @@ def generate_report_filename(input_file):
 
 import sys
 
+def run_design_pipeline(params, shell_courses_input, verbose=True):
+    """
+    Run the full design chain for one parameter set:
+    Shell -> Roof -> Liquid Weight -> Wind -> Seismic -> Appendix F / Frangibility -> Anchors.
+    Shared by main() (single input file) and Design_Sweep (parametric sweeps).
+    :param params: Design parameter dict (InputReader.get_design_parameters format)
+    :param shell_courses_input: List of course dicts (Course, Material, Width, Thickness_Used)
+    :param verbose: Print stage headers
+    :return: dict of design objects and key results
+    """
+    def log(msg):
+        if verbose: print(msg)
+
+    # 2. Shell Design
+    log("\n[2] Running Shell Design...")
+    shell_design = ShellDesign(
+        diameter=params['D'],
+        height=params['H'],
+        design_liquid_level=params.get('HD', params['H']),
+        test_liquid_level=params.get('HT', params['H']),
+        specific_gravity=params['G'],
+        corrosion_allowance=params['CA'],
+        p_design=params['P_design'],
+        p_test=params['P_test'],
+        courses_input=shell_courses_input
+    )
+    shell_design.run_design()
+    W_shell_kg, W_shell_N = shell_design.calculate_shell_weight()
+
+    # 3. Roof Design
+    log("\n[3] Running Roof Design...")
+    roof_design = RoofDesign(
+        diameter=params['D'],
+        roof_type=params.get('Roof_Type', 'Supported Cone Roof'),
+        slope=params.get('Roof_Slope', 0.0625),
+        corrosion_allowance=params.get('CA_roof', 0.0),
+        material=params.get('Roof_Material', 'Unknown'),
+        thickness_used=params.get('Roof_Thickness', 0.0)
+    )
+    roof_design.run_design()
+    W_roof_kg, W_roof_N = roof_design.calculate_roof_weight()
+
+    # 4. Liquid Weight
+    log("\n[4] Calculating Liquid Weight...")
+    radius = params['D'] / 2.0
+    HD = params.get('HD', params['H'])
+    vol_liquid = math.pi * (radius ** 2) * HD
+    rho_water = 1000.0 # kg/m3
+    W_liquid_kg = vol_liquid * params['G'] * rho_water
+
+    # 5. Wind Loads
+    log("\n[5] Calculating Wind Loads...")
+    wind_load = WindLoad(params)
+    P_wind = wind_load.calculate_pressure()
+    M_wind = wind_load.calculate_overturning_moment()
+
+    # 6. Seismic Loads
+    log("\n[6] Calculating Seismic Loads...")
+    seismic_load = SeismicLoad(params)
+    seismic_results = seismic_load.calculate_loads(W_shell_kg, W_roof_kg, W_liquid_kg)
+
+    # 7. Internal Pressure & Frangibility (Appendix F)
+    log("\n[7] Checking Internal Pressure & Frangibility...")
+    w_roof_total_kN = W_roof_N / 1000.0
+    w_shell_total_kN = W_shell_N / 1000.0
+
+    # Convert P_design from mmH2O to kPa (1 mmH2O = 0.00980665 kPa)
+    p_design_kPa = (params.get('P_design', 0) * 9.80665) / 1000.0
+
+    app_f = AppendixF(
+        diameter=params['D'],
+        roof_weight=w_roof_total_kN,
+        shell_weight=w_shell_total_kN,
+        design_pressure=p_design_kPa
+    )
+    app_f.run_check()
+
+    frangible = FrangibleCheck(
+        diameter=params['D'],
+        slope=params.get('Roof_Slope', 0.0625),
+        roof_weight=w_roof_total_kN
+    )
+    frangible.run_check()
+
+    # 8. Anchor Design
+    log("\n[8] Designing Anchor Bolts...")
+    # Wind Uplift: U = 4 * M_wind / D
+    M_wind_kN = M_wind
+    U_wind = (4 * M_wind_kN) / params['D']
+
+    # Seismic Uplift: U = 4 * M_seismic / D
+    M_seismic_kN = seismic_results['Overturning_Moment_kNm']
+    U_seismic = (4 * M_seismic_kN) / params['D']
+
+    anchor_design = AnchorBoltDesign(
+        diameter=params['D'],
+        design_pressure=p_design_kPa,
+        uplift_load_wind=U_wind,
+        uplift_load_seismic=U_seismic,
+        shell_weight=w_shell_total_kN,
+        roof_weight=w_roof_total_kN,
+        vertical_acceleration_Av=seismic_results.get('Av', 0.0),
+        test_pressure=(params.get('P_test', 0) * 9.80665) / 1000.0
+    )
+    anchor_design.run_design()
+
+    return {
+        'shell_design': shell_design,
+        'roof_design': roof_design,
+        'wind_load': wind_load,
+        'seismic_load': seismic_load,
+        'app_f': app_f,
+        'frangible': frangible,
+        'anchor_design': anchor_design,
+        'W_shell_kg': W_shell_kg,
+        'W_roof_kg': W_roof_kg,
+        'W_liquid_kg': W_liquid_kg,
+        'vol_liquid': vol_liquid,
+        'P_wind': P_wind,
+        'M_wind': M_wind,
+        'seismic_results': seismic_results,
+        'p_design_kPa': p_design_kPa
+    }
+
 def main():
     print("============================================================")
     print("API 650 Tank Design Program - Main Execution")
@@ -73,47 +197,22 @@ def main():
             'Site Class': params.get('Site_Class', 'D')
         })
 
-        # 2. Shell Design
-        print("\n[2] Running Shell Design...")
-        shell_design = ShellDesign(
-            diameter=params['D'],
-            height=params['H'],
-            design_liquid_level=params.get('HD', params['H']),
-            test_liquid_level=params.get('HT', params['H']),
-            specific_gravity=params['G'],
-            corrosion_allowance=params['CA'],
-            p_design=params['P_design'],
-            p_test=params['P_test'],
-            courses_input=shell_courses_input
-        )
-        shell_design.run_design()
-        W_shell_kg, W_shell_N = shell_design.calculate_shell_weight()
+        # 2-8. Design Chain
+        design = run_design_pipeline(params, shell_courses_input)
+        shell_design = design['shell_design']
+        roof_design = design['roof_design']
+        app_f = design['app_f']
+        frangible = design['frangible']
+        anchor_design = design['anchor_design']
+        seismic_results = design['seismic_results']
+        W_shell_kg = design['W_shell_kg']
+        W_roof_kg = design['W_roof_kg']
+        p_design_kPa = design['p_design_kPa']
         
         # Prepare Ch_3 Shell Data
         # Add summary row first? No, table is better.
         report.add_table("Ch_3_Shell_Design", shell_design.shell_courses)
         
-        # 3. Roof Design
-        print("\n[3] Running Roof Design...")
-        roof_design = RoofDesign(
-            diameter=params['D'],
-            roof_type=params.get('Roof_Type', 'Supported Cone Roof'),
-            slope=params.get('Roof_Slope', 0.0625),
-            corrosion_allowance=params.get('CA_roof', 0.0),
-            material=params.get('Roof_Material', 'Unknown'),
-            thickness_used=params.get('Roof_Thickness', 0.0)
-        )
-        roof_design.run_design()
-        W_roof_kg, W_roof_N = roof_design.calculate_roof_weight()
-        
-        # 4. Liquid Weight
-        print("\n[4] Calculating Liquid Weight...")
-        radius = params['D'] / 2.0
-        HD = params.get('HD', params['H'])
-        vol_liquid = math.pi * (radius ** 2) * HD
-        rho_water = 1000.0 # kg/m3
-        W_liquid_kg = vol_liquid * params['G'] * rho_water
-        
         # Prepare Ch_4 Roof & Bottom (and Weights)
         ch4_data = {
             'Roof Material': roof_design.material,
@@ -122,55 +221,21 @@ def main():
             'Roof Structure Weight (kg)': roof_design.results.get('Weight', {}).get('Structure Weight (kg)', 0),
             'Total Roof Weight (kg)': W_roof_kg,
             'Shell Weight (kg)': W_shell_kg,
-            'Liquid Volume (m3)': vol_liquid,
-            'Liquid Weight (kg)': W_liquid_kg
+            'Liquid Volume (m3)': design['vol_liquid'],
+            'Liquid Weight (kg)': design['W_liquid_kg']
         }
         report.add_data("Ch_4_Roof_Bottom_Weight", ch4_data)
-
-        # 5. Wind Loads
-        print("\n[5] Calculating Wind Loads...")
-        wind_load = WindLoad(params)
-        P_wind = wind_load.calculate_pressure()
-        M_wind = wind_load.calculate_overturning_moment()
-        
-        # 6. Seismic Loads
-        print("\n[6] Calculating Seismic Loads...")
-        seismic_load = SeismicLoad(params)
-        seismic_results = seismic_load.calculate_loads(W_shell_kg, W_roof_kg, W_liquid_kg)
         
         # Prepare Ch_5 Loads
         ch5_data = {
-            'Design Wind Pressure (kPa)': P_wind,
-            'Wind Overturning Moment (kNm)': M_wind,
+            'Design Wind Pressure (kPa)': design['P_wind'],
+            'Wind Overturning Moment (kNm)': design['M_wind'],
             'Seismic Impulsive Weight Wi (kg)': seismic_results['Wi_kg'],
             'Seismic Convective Weight Wc (kg)': seismic_results['Wc_kg'],
             'Seismic Base Shear V (kN)': seismic_results['Base_Shear_kN'],
             'Seismic Overturning Moment M (kNm)': seismic_results['Overturning_Moment_kNm']
         }
         report.add_data("Ch_5_Loads", ch5_data)
-
-        # 7. Internal Pressure & Frangibility (Appendix F)
-        print("\n[7] Checking Internal Pressure & Frangibility...")
-        w_roof_total_kN = W_roof_N / 1000.0
-        w_shell_total_kN = W_shell_N / 1000.0
-        
-        # Convert P_design from mmH2O to kPa (1 mmH2O = 0.00980665 kPa)
-        p_design_kPa = (params.get('P_design', 0) * 9.80665) / 1000.0
-        
-        app_f = AppendixF(
-            diameter=params['D'],
-            roof_weight=w_roof_total_kN,
-            shell_weight=w_shell_total_kN,
-            design_pressure=p_design_kPa
-        )
-        app_f.run_check()
-        
-        frangible = FrangibleCheck(
-            diameter=params['D'],
-            slope=params.get('Roof_Slope', 0.0625),
-            roof_weight=w_roof_total_kN
-        )
-        frangible.run_check()
         
         report.add_data("Ch_6_Pressure_Frangibility", {
             'Design Pressure (kPa)': f"{p_design_kPa:.4f}",
@@ -181,28 +246,6 @@ def main():
             'Frangible Joint Area': frangible.results.get('Assumed Joint Area (A)', 'N/A')
         })
         
-        # 8. Anchor Design
-        print("\n[8] Designing Anchor Bolts...")
-        # Wind Uplift: U = 4 * M_wind / D
-        M_wind_kN = M_wind
-        U_wind = (4 * M_wind_kN) / params['D']
-        
-        # Seismic Uplift: U = 4 * M_seismic / D
-        M_seismic_kN = seismic_results['Overturning_Moment_kNm']
-        U_seismic = (4 * M_seismic_kN) / params['D']
-        
-        anchor_design = AnchorBoltDesign(
-            diameter=params['D'],
-            design_pressure=p_design_kPa,
-            uplift_load_wind=U_wind,
-            uplift_load_seismic=U_seismic,
-            shell_weight=w_shell_total_kN,
-            roof_weight=w_roof_total_kN,
-            vertical_acceleration_Av=seismic_results.get('Av', 0.0)
-        )
-        anchor_design.run_design()
-        
-        
         report.add_data("Ch_7_Anchor_Design", anchor_design.results)
         
         # 9. Summary Sheet
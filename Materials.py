@@ -1,3 +1,11 @@
+import os
+import csv
+import json
+import types
+import pickle
+import hashlib
+from functools import lru_cache
+import numpy as np
 
 # API 650 Material Database
 # Values are typical and based on API 650 Table 5-2a (SI)
@@ -49,76 +57,348 @@ TEMP_DERATING_SD = {
     'A 516 70': {40: 173, 90: 173, 150: 173, 200: 165, 260: 155}, # 516Gr70 holds strength well
 }
 
+# Alternative spellings (KS / JIS designations) resolved to a database material
+MATERIAL_ALIASES = {
+    'SUS 304': '304', 'SUS 304L': '304L',
+    'SUS 316': '316', 'SUS 316L': '316L',
+    'SUS 317': '317', 'SUS 317L': '317L',
+}
+
+# Tokens ignored when matching material names ('ASTM A 516 Gr. 70' == 'A 516 70', 'SA-537 Cl 1' == 'A 537 1')
+_NAME_NOISE = ('ASTM', 'ASME', 'GR', 'GRADE', 'TP', 'CL', 'CLASS')
+
+DEFAULT_MATERIAL = 'A 283 C' # Used for unknown names
+
+def normalize_material_name(material_name):
+    """
+    Canonical lookup key of a material name: upper case, no separators, no 'ASTM' / 'Gr.' / 'Cl' tokens, SA -> A.
+    """
+    s = str(material_name).upper()
+    for ch in '-_.,/':
+        s = s.replace(ch, ' ')
+    s = ''.join(tok for tok in s.split() if tok not in _NAME_NOISE)
+    if s.startswith('SA') and s[2:3].isdigit():
+        s = 'A' + s[2:]
+    return s
+
+DEFAULT_E = 200000.0 # MPa, elastic modulus where the material data has none
+
+# Temperature-dependent properties interpolated by the registry (Sd from TEMP_DERATING_SD by default;
+# an external material database may also tabulate Fy and E)
+TEMPERATURE_PROPERTIES = ('Sd', 'Fy', 'E')
+
+class MaterialRegistry:
+    """
+    Material tables compiled once at import: integer material ids, a normalized-name / alias index,
+    property arrays (Fy, Fu, Sd, St, E, stainless flag) and the temperature tables resampled on one
+    common temperature grid, so scalar and array lookups are plain indexing plus linear interpolation.
+    The last id (unknown_id) stands for unknown names: default material properties without derating.
+    """
+    def __init__(self, carbon, stainless, derating, aliases=MATERIAL_ALIASES, source='built-in'):
+        """
+        :param carbon, stainless: {name: {'Fy', 'Fu', 'Sd', 'St'[, 'E']}}
+        :param derating: {name: {temp C: Sd}}, or {property: {name: {temp C: value}}} for TEMPERATURE_PROPERTIES
+        :param aliases: {alias: database name}
+        :param source: Description of the data source (file name for external databases)
+        """
+        self.source = source
+        self.records = dict(carbon)
+        self.records.update(stainless)
+        self.names = list(self.records)
+        self.carbon_names = list(carbon)
+        self.stainless_names = list(stainless)
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.default_material = DEFAULT_MATERIAL if DEFAULT_MATERIAL in self.records else self.carbon_names[0]
+        self.unknown_id = len(self.names)
+        rows = self.names + [self.default_material]
+        self.stainless = np.array([name in stainless for name in rows])
+        for key in ('Fy', 'Fu', 'Sd', 'St'):
+            setattr(self, key, np.array([float(self.records[n][key]) for n in rows]))
+        self.E = np.array([float(self.records[n].get('E', DEFAULT_E)) for n in rows])
+
+        self.index = {normalize_material_name(n): i for i, n in enumerate(self.names)}
+        for alias, name in aliases.items():
+            if name in self.ids:
+                self.index.setdefault(normalize_material_name(alias), self.ids[name])
+        # Stainless grades found inside longer names ('A 240 316L'), longest key first
+        self._stainless_keys = sorted(((normalize_material_name(n), self.ids[n]) for n in stainless),
+                                      key=lambda kv: -len(kv[0]))
+
+        # Temperature tables: one row per material on the union of the table temperatures
+        # (the ambient value where a material has no table)
+        if not set(derating) <= set(TEMPERATURE_PROPERTIES):
+            derating = {'Sd': derating}
+        temps = sorted({float(t) for table in derating.values() for points in table.values() for t in points})
+        self.derating_temps = np.array(temps or [40.0])
+        self.tables = {}
+        self.has_table = {}
+        for prop in TEMPERATURE_PROPERTIES:
+            values = np.repeat(getattr(self, prop)[:, None], len(self.derating_temps), axis=1)
+            has = np.zeros(len(rows), dtype=bool)
+            for name, points in derating.get(prop, {}).items():
+                if name in self.ids and points:
+                    t = sorted(points)
+                    values[self.ids[name]] = np.interp(self.derating_temps, t, [points[k] for k in t])
+                    has[self.ids[name]] = True
+            self.tables[prop] = values
+            self.has_table[prop] = has
+        self.derating_sd = self.tables['Sd']
+        self.has_derating = self.has_table['Sd']
+
+    def resolve(self, material_name):
+        """
+        Material id of a name: normalized name / alias, then a stainless grade inside the name, else unknown_id.
+        """
+        key = normalize_material_name(material_name)
+        if key in self.index:
+            return self.index[key]
+        for grade, i in self._stainless_keys:
+            if grade in key:
+                return i
+        return self.unknown_id
+
+    def record(self, material_id):
+        """
+        Source property dict of a material id.
+        """
+        return self.records[self.names[material_id] if material_id < self.unknown_id else self.default_material]
+
+    def at_temperature(self, prop, ids, temps):
+        """
+        Temperature-dependent property (TEMPERATURE_PROPERTIES) of material ids at temperatures (C), broadcast;
+        linear between table points, constant below the first (40 C) and above the last point.
+        """
+        ids, T = np.broadcast_arrays(np.asarray(ids, dtype=np.intp), np.asarray(temps, dtype=float))
+        grid = self.derating_temps
+        table = self.tables[prop]
+        T = np.where(np.isfinite(T), T, grid[0])
+        if len(grid) == 1:
+            return table[ids, 0]
+        k = np.clip(np.searchsorted(grid, T, side='right') - 1, 0, len(grid) - 2)
+        w = np.clip((T - grid[k]) / (grid[k + 1] - grid[k]), 0.0, 1.0)
+        return table[ids, k] * (1.0 - w) + table[ids, k + 1] * w
+
+    def derated_sd(self, ids, temps):
+        """
+        Sd of material ids at temperatures (C), see at_temperature.
+        """
+        return self.at_temperature('Sd', ids, temps)
+
+    def properties(self, ids, temps=None):
+        """
+        Array API: property arrays for material ids (and design temperatures, C), broadcast.
+        Sd (and Fy / E where tabulated) follow the temperature above 40 C, as get_material_properties.
+        :return: dict of arrays Fy, Fu, Sd, St, E, Stainless
+        """
+        ids = np.asarray(ids, dtype=np.intp)
+        out = {'Fy': self.Fy[ids], 'Fu': self.Fu[ids], 'Sd': self.Sd[ids], 'St': self.St[ids], 'E': self.E[ids]}
+        if temps is not None:
+            T = np.asarray(temps, dtype=float)
+            hot = np.isfinite(T) & (T > 40)
+            for prop in TEMPERATURE_PROPERTIES:
+                out[prop] = np.where(hot, self.at_temperature(prop, ids, T), out[prop])
+        shape = np.broadcast_shapes(*[np.shape(v) for v in out.values()])
+        ids = np.broadcast_to(ids, shape)
+        out = {k: np.broadcast_to(v, shape) for k, v in out.items()}
+        out['Stainless'] = self.stainless[ids]
+        return out
+
+    def material_names(self, group=None):
+        """
+        Material names of the database: all, 'carbon' or 'stainless'.
+        """
+        if group == 'carbon':
+            return list(self.carbon_names)
+        if group == 'stainless':
+            return list(self.stainless_names)
+        return list(self.names)
+
+# External material database (CSV / JSON, full API 650 Table 5-2a/b and Annex S / M / X data).
+# CSV: one row per material and temperature with MATERIAL_DB_COLUMNS; E and Aliases (';'-separated) optional.
+# The lowest temperature row gives the ambient properties; Sd, Fy and E are interpolated over the rows.
+# JSON: {"materials": [{"Material", "Group", "Temp_C": [...], "Fy": [...], "Sd": [...], "E": [...],
+#                       "Fu", "St", "Aliases": [...]}]} (Fy / Sd / E as lists over Temp_C or single values).
+MATERIAL_DB_COLUMNS = ['Material', 'Group', 'Temp_C', 'Fy', 'Fu', 'Sd', 'St', 'E', 'Aliases']
+MATERIAL_DB_ENV = 'API650_MATERIAL_DB' # Path of the database used at import (app and batch workers)
+MATERIAL_CACHE_VERSION = 1 # Part of the binary cache key; bump when MaterialRegistry changes
+
+def _is_stainless_group(group):
+    return str(group).strip().upper() in ('SS', 'STAINLESS', 'STAINLESS STEEL', 'S')
+
+def _material_entries_csv(path):
+    entries = {}
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            name = (row.get('Material') or '').strip()
+            if not name:
+                continue
+            e = entries.setdefault(name, {'Material': name, 'Group': row.get('Group', 'CS'), 'rows': [],
+                                          'Aliases': []})
+            e['rows'].append(row)
+            e['Aliases'] += [a.strip() for a in (row.get('Aliases') or '').split(';') if a.strip()]
+    out = []
+    for e in entries.values():
+        rows = sorted(e['rows'], key=lambda r: float(r.get('Temp_C') or 40.0))
+        entry = {'Material': e['Material'], 'Group': e['Group'], 'Aliases': e['Aliases'],
+                 'Temp_C': [float(r.get('Temp_C') or 40.0) for r in rows]}
+        for key in ('Fy', 'Fu', 'Sd', 'St', 'E'):
+            entry[key] = [float(r[key]) if (r.get(key) or '').strip() else None for r in rows]
+        out.append(entry)
+    return out
+
+def _material_entries_json(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data['materials'] if isinstance(data, dict) else data
+
+def parse_material_database(path):
+    """
+    Parse a CSV / JSON material database.
+    :return: (carbon, stainless, derating {property: {name: {temp: value}}}, aliases), MaterialRegistry arguments
+    """
+    entries = _material_entries_json(path) if path.lower().endswith('.json') else _material_entries_csv(path)
+    carbon, stainless, aliases = {}, {}, {}
+    derating = {prop: {} for prop in TEMPERATURE_PROPERTIES}
+    for e in entries:
+        name = str(e['Material']).strip()
+        temps = e.get('Temp_C', [40.0])
+        temps = [float(t) for t in (temps if isinstance(temps, (list, tuple)) else [temps])]
+        series = {}
+        for key in ('Fy', 'Fu', 'Sd', 'St', 'E'):
+            v = e.get(key)
+            v = list(v) if isinstance(v, (list, tuple)) else [v] * len(temps)
+            series[key] = [(t, float(x)) for t, x in zip(temps, v) if x is not None]
+        record = {}
+        for key in ('Fy', 'Fu', 'Sd', 'St', 'E'):
+            if series[key]:
+                record[key] = min(series[key])[1]
+        missing = [k for k in ('Fy', 'Fu', 'Sd', 'St') if k not in record]
+        if missing:
+            raise ValueError(f"Material '{name}' is missing {missing}")
+        (stainless if _is_stainless_group(e.get('Group', 'CS')) else carbon)[name] = record
+        for prop in TEMPERATURE_PROPERTIES:
+            if len(series[prop]) > 1:
+                derating[prop][name] = dict(series[prop])
+        for alias in e.get('Aliases') or []:
+            aliases[alias] = name
+    if not carbon:
+        raise ValueError("Material database has no carbon steel (Group 'CS') materials")
+    return carbon, stainless, derating, aliases
+
+def load_material_registry(path, cache_dir=None):
+    """
+    MaterialRegistry of an external database, through a binary (pickle) cache keyed by the hash of the
+    source file: the CSV / JSON is only parsed when it changes.
+    :param cache_dir: Cache directory (default: __pycache__ next to the source file)
+    """
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    cache_dir = cache_dir or os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__')
+    cache_file = os.path.join(cache_dir, f"materials-{digest}-v{MATERIAL_CACHE_VERSION}.pkl")
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            pass
+    carbon, stainless, derating, aliases = parse_material_database(path)
+    registry = MaterialRegistry(carbon, stainless, derating, {**MATERIAL_ALIASES, **aliases},
+                                source=os.path.basename(path))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            pickle.dump(registry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass # Read-only location: no cache
+    return registry
+
+def use_material_database(path=None, cache_dir=None):
+    """
+    Switch the module registry to an external database (None: the built-in tables) and clear the lookup caches.
+    """
+    global REGISTRY
+    if path:
+        REGISTRY = load_material_registry(path, cache_dir)
+    else:
+        REGISTRY = MaterialRegistry(CARBON_STEEL_MATERIALS, STAINLESS_STEEL_MATERIALS, TEMP_DERATING_SD)
+    material_id.cache_clear()
+    _material_properties.cache_clear()
+    return REGISTRY
+
+def material_names(group=None):
+    """
+    Material names of the active registry (all, 'carbon' or 'stainless'), e.g. for the UI dropdowns.
+    """
+    return REGISTRY.material_names(group)
+
 def interpolate(x, x1, y1, x2, y2):
     if x2 == x1: return y1
     return y1 + (x - x1) * (y2 - y1) / (x2 - x1)
 
+@lru_cache(maxsize=1024)
+def material_id(material_name):
+    """
+    Registry id of a material name (normalized names and aliases; REGISTRY.unknown_id for unknown names).
+    """
+    return REGISTRY.resolve(material_name)
+
+def material_ids(material_names):
+    """
+    Array of registry ids for an array (any shape) of material names; each distinct name is resolved once.
+    """
+    names = np.asarray(material_names, dtype=object)
+    unique, inverse = np.unique(names.astype(str), return_inverse=True)
+    return np.array([material_id(n) for n in unique], dtype=np.intp)[inverse].reshape(names.shape)
+
+def material_property_arrays(materials, temps=None):
+    """
+    Array API for batch shell / roof / bottom runs.
+    :param materials: Material names or registry ids (array of any shape)
+    :param temps: Design temperatures (C), broadcast against materials (None: ambient)
+    :return: dict of arrays Fy, Fu, Sd (derated), St, Stainless
+    """
+    materials = np.asarray(materials)
+    ids = materials if np.issubdtype(materials.dtype, np.integer) else material_ids(materials)
+    return REGISTRY.properties(ids, temps)
+
 def get_derated_Sd(material_name, temp_c):
     """
     Calculate Allowable Design Stress (Sd) at a given temperature.
-    Uses linear interpolation between defined points.
+    Uses linear interpolation between defined points (precomputed in REGISTRY).
+    Materials without derating data return their base Sd.
     """
     if temp_c is None: temp_c = 40.0
-    if temp_c <= 40.0: temp_c = 40.0
-    
-    # Clean Name
-    name_clean = str(material_name).strip()
-    
-    # Check if we have derating data
-    if name_clean in TEMP_DERATING_SD:
-        points = TEMP_DERATING_SD[name_clean]
-        sorted_temps = sorted(points.keys())
-        
-        # Check range
-        if temp_c <= sorted_temps[0]:
-            return points[sorted_temps[0]]
-        if temp_c >= sorted_temps[-1]:
-            # Cap at max defined temp or extrapolate? API limits usually 260C for these.
-            return points[sorted_temps[-1]]
-            
-        # Interpolate
-        for i in range(len(sorted_temps) - 1):
-            t1 = sorted_temps[i]
-            t2 = sorted_temps[i+1]
-            if t1 <= temp_c <= t2:
-                sd1 = points[t1]
-                sd2 = points[t2]
-                return interpolate(temp_c, t1, sd1, t2, sd2)
-                
-    # If no data, return base Sd (Unsafe for high temp, but default behavior)
-    # Could warn here
-    base_props = get_material_properties_base(name_clean)
-    return base_props['Sd']
+    mid = material_id(material_name)
+    if not REGISTRY.has_derating[mid]:
+        return get_material_properties_base(material_name)['Sd']
+    return float(REGISTRY.derated_sd(mid, max(float(temp_c), 40.0)))
 
 def is_stainless_steel(material_name):
-    name_clean = str(material_name).strip().upper()
-    for k in STAINLESS_STEEL_MATERIALS:
-        if k in name_clean: return True
-    if "304" in name_clean or "316" in name_clean or "317" in name_clean: return True
-    return False
+    return bool(REGISTRY.stainless[material_id(material_name)])
 
 def get_material_properties_base(material_name):
-    name_clean = str(material_name).strip()
-    if name_clean in CARBON_STEEL_MATERIALS: return CARBON_STEEL_MATERIALS[name_clean]
-    if name_clean in STAINLESS_STEEL_MATERIALS: return STAINLESS_STEEL_MATERIALS[name_clean]
-    for k, v in STAINLESS_STEEL_MATERIALS.items():
-        if k in name_clean: return v
-    return CARBON_STEEL_MATERIALS['A 283 C']
+    return REGISTRY.record(material_id(material_name))
+
+@lru_cache(maxsize=4096)
+def _material_properties(mid, design_temp_c):
+    props = dict(REGISTRY.record(mid))
+    if design_temp_c is not None:
+        for prop in TEMPERATURE_PROPERTIES:
+            if REGISTRY.has_table[prop][mid]:
+                props[prop] = float(REGISTRY.at_temperature(prop, mid, design_temp_c))
+    return types.MappingProxyType(props)
 
 def get_material_properties(material_name, design_temp_c=None):
     """
-    Retrieve material properties with Temperature Derating for Sd.
-    """
-    base_props = get_material_properties_base(material_name).copy()
-    
-    # Apply Derating for Sd
-    if design_temp_c and design_temp_c > 40:
-        derated_Sd = get_derated_Sd(material_name, design_temp_c)
-        base_props['Sd'] = derated_Sd
-        # Note: Fy and Fu might also change but Shell Design uses Sd mainly.
-        # St is usually at ambient (hydrotest).
-    
-    return base_props
+    Retrieve material properties with Temperature Derating for Sd (and Fy / E where the database tabulates them).
+    Cached per (material, temperature); the returned mapping is read-only. St is at ambient (hydrotest).
+    """
+    temp = float(design_temp_c) if design_temp_c and design_temp_c > 40 else None
+    return _material_properties(material_id(material_name), temp)
+
+REGISTRY = use_material_database(os.environ.get(MATERIAL_DB_ENV))
 
 if __name__ == "__main__":
     # verification
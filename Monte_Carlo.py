@@ -0,0 +1,295 @@
+import io
+import contextlib
+import numpy as np
+from Shell_Batch import ShellBatchDesign
+from Loads_Batch import seismic_loads_batch, hoop_stress_batch, wind_loads_batch, anchor_uplift_batch
+
+# Sampled inputs. Each entry is a distribution spec:
+#   {'dist': 'fixed', 'value': x}
+#   {'dist': 'normal', 'mean': m, 'std': s}               (optional 'min' / 'max' clip)
+#   {'dist': 'lognormal', 'median': m, 'cov': c}
+#   {'dist': 'uniform', 'low': a, 'high': b}
+#   {'dist': 'triangular', 'low': a, 'mode': c, 'high': b}
+# Stress_Factor multiplies Sd / St of every course (material strength scatter).
+MC_INPUTS = ['G', 'CA', 'Stress_Factor', 'SDS', 'SD1', 'Wind_Velocity']
+
+# Output metrics and the exceedance thresholds reported for them
+MC_METRICS = {
+    'Hoop_Stress_Ratio': [1.0],         # seismic hoop stress / (1.333 Sd E), corroded bottom course
+    'Shell_Utilization': [1.0],         # max over courses of t_req / t_used
+    'Anchorage_Ratio_J': [0.785, 1.54], # API 650 E.6.2.1
+    'Sliding_Ratio': [1.0],             # base shear / friction resistance (E.7.6)
+    'Net_Uplift_kN': [0.0]
+}
+
+PERCENTILES = [1, 5, 10, 50, 90, 95, 99]
+
+
+def sample_distribution(spec, n, rng):
+    """
+    Draw n samples from a distribution spec (see MC_INPUTS).
+    """
+    dist = spec.get('dist', 'fixed')
+    if dist == 'fixed':
+        x = np.full(n, float(spec['value']))
+    elif dist == 'normal':
+        x = rng.normal(spec['mean'], spec['std'], n)
+    elif dist == 'lognormal':
+        sigma = np.sqrt(np.log(1.0 + spec['cov'] ** 2))
+        x = spec['median'] * np.exp(rng.normal(0.0, sigma, n))
+    elif dist == 'uniform':
+        x = rng.uniform(spec['low'], spec['high'], n)
+    elif dist == 'triangular':
+        x = rng.triangular(spec['low'], spec['mode'], spec['high'], n)
+    else:
+        raise ValueError(f"Unknown distribution: {dist}")
+    if 'min' in spec or 'max' in spec:
+        x = np.clip(x, spec.get('min', -np.inf), spec.get('max', np.inf))
+    return x
+
+
+class StreamingQuantiles:
+    """
+    Bounded-memory percentile estimator: a fixed number of equal-width bins whose range doubles
+    (pairs of bins merged) whenever a value falls outside it. Error is at most one bin width.
+    Mean / std / min / max are exact.
+    """
+    def __init__(self, n_bins=4096):
+        self.n_bins = n_bins
+        self.counts = None
+        self.lo = 0.0
+        self.width = 1.0
+        self.n = 0
+        self.sum = 0.0
+        self.sum_sq = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def _expand(self, up):
+        merged = self.counts.reshape(-1, 2).sum(axis=1)
+        pad = np.zeros(self.n_bins // 2, dtype=self.counts.dtype)
+        if up:
+            self.counts = np.concatenate([merged, pad])
+        else:
+            self.counts = np.concatenate([pad, merged])
+            self.lo -= self.n_bins * self.width
+        self.width *= 2.0
+
+    def add(self, x):
+        x = np.asarray(x, dtype=float)
+        x = x[np.isfinite(x)]
+        if x.size == 0:
+            return
+        x_min, x_max = float(x.min()), float(x.max())
+        if self.counts is None:
+            span = max(x_max - x_min, 1e-9 * max(abs(x_max), 1.0))
+            self.lo = x_min - 0.05 * span
+            self.width = 1.1 * span / self.n_bins
+            self.counts = np.zeros(self.n_bins, dtype=np.int64)
+        while x_min < self.lo:
+            self._expand(up=False)
+        while x_max >= self.lo + self.n_bins * self.width:
+            self._expand(up=True)
+
+        idx = np.minimum(((x - self.lo) / self.width).astype(np.int64), self.n_bins - 1)
+        self.counts += np.bincount(idx, minlength=self.n_bins)
+        self.n += x.size
+        self.sum += float(x.sum())
+        self.sum_sq += float((x * x).sum())
+        self.min = min(self.min, x_min)
+        self.max = max(self.max, x_max)
+
+    def quantile(self, q):
+        """
+        :param q: Quantile(s) in [0, 1]
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=float))
+        if self.n == 0:
+            return np.full(q.shape, np.nan)
+        cum = np.cumsum(self.counts)
+        target = q * self.n
+        k = np.minimum(np.searchsorted(cum, target, side='left'), self.n_bins - 1)
+        before = np.where(k > 0, cum[k - 1], 0)
+        in_bin = np.maximum(self.counts[k], 1)
+        x = self.lo + (k + (target - before) / in_bin) * self.width
+        return np.clip(x, self.min, self.max)
+
+    @property
+    def mean(self):
+        return self.sum / self.n if self.n else np.nan
+
+    @property
+    def std(self):
+        if self.n < 2:
+            return np.nan
+        var = (self.sum_sq - self.n * self.mean ** 2) / (self.n - 1)
+        return float(np.sqrt(max(var, 0.0)))
+
+
+class MonteCarloDesign:
+    """
+    Monte Carlo propagation of input scatter through the as-built tank (t_used fixed from the
+    deterministic design): vectorized shell check (ShellBatchDesign), seismic loads (calculate_loads),
+    seismic hoop stress (check_hoop_stress), wind and anchor uplift.
+    Samples are drawn and evaluated chunk by chunk; only streaming statistics are kept.
+    """
+    def __init__(self, params, shell_courses_input, distributions, n_samples=100000, chunk_size=50000,
+                 seed=None, method='auto'):
+        """
+        :param params: Design parameter dict (as run_design_pipeline); also the nominal values
+        :param shell_courses_input: List of course dicts (Course, Material, Width, Thickness_Used)
+        :param distributions: {input name (MC_INPUTS): distribution spec}. Missing inputs stay at the nominal value.
+        :param n_samples: Total number of samples
+        :param chunk_size: Samples evaluated per vectorized chunk (bounds memory)
+        :param seed: Random seed (results are independent of chunk_size)
+        :param method: Shell design method
+        """
+        self.params = params
+        self.courses = shell_courses_input
+        self.distributions = distributions
+        self.n_samples = int(n_samples)
+        self.chunk_size = int(chunk_size)
+        # One stream per input, so results do not depend on chunk_size
+        streams = np.random.SeedSequence(seed).spawn(len(MC_INPUTS))
+        self.rngs = {name: np.random.default_rng(ss) for name, ss in zip(MC_INPUTS, streams)}
+        self.method = method
+        self.results = {}
+
+        for name in distributions:
+            if name not in MC_INPUTS:
+                raise ValueError(f"Unknown Monte Carlo input: {name} (expected one of {MC_INPUTS})")
+
+        self._nominal_design()
+
+    def _nominal_design(self):
+        """
+        Deterministic design: as-built thicknesses and nominal weights (Main.run_design_pipeline).
+        """
+        from Main import run_design_pipeline
+        with contextlib.redirect_stdout(io.StringIO()):
+            base = run_design_pipeline(self.params, [dict(c) for c in self.courses], verbose=False)
+        shell_results = base['shell_design'].results
+        self.t_used = np.array([c['t_used'] for c in shell_results])
+        self.widths = np.array([c['Width'] for c in shell_results])
+        self.materials = [c['Material'] for c in shell_results]
+        self.W_shell_kg = base['W_shell_kg']
+        self.W_roof_kg = base['W_roof_kg']
+        self.nominal = base
+
+    def _nominal_value(self, name):
+        if name == 'Stress_Factor':
+            return 1.0
+        if name == 'SD1':
+            return float(self.params.get('S1', 0.0))
+        if name == 'Wind_Velocity':
+            return float(self.params.get('Wind_Velocity', 45.0))
+        return float(self.params.get(name, 0.0))
+
+    def sample(self, n):
+        """
+        :return: dict input -> (n,) samples
+        """
+        out = {}
+        for name in MC_INPUTS:
+            spec = self.distributions.get(name, {'dist': 'fixed', 'value': self._nominal_value(name)})
+            out[name] = sample_distribution(spec, n, self.rngs[name])
+        return out
+
+    def evaluate(self, s):
+        """
+        Vectorized checks for one chunk of samples.
+        :return: dict metric -> (n,) array
+        """
+        p = self.params
+        n = len(s['G'])
+        D = float(p['D'])
+        H = float(p['H'])
+        HD = float(p.get('HD', H))
+        HT = float(p.get('HT', H))
+
+        batch = ShellBatchDesign(np.full(n, D), HD, HT, s['G'], s['CA'], np.tile(self.widths, (n, 1)), self.materials,
+                                 p_design=p.get('P_design', 0.0), p_test=p.get('P_test', 0.0),
+                                 thickness_used=np.tile(self.t_used, (n, 1)))
+        batch.Sd = batch.Sd * s['Stress_Factor'][:, None]
+        batch.St = batch.St * s['Stress_Factor'][:, None]
+        shell = batch.run_method(self.method)
+        utilization = np.nanmax(shell['t_req'] / shell['t_used'], axis=1)
+
+        W_liquid_kg = np.pi * (D / 2.0) ** 2 * HD * s['G'] * 1000.0
+        I = p.get('I_seismic', 1.0)
+        TL = p.get('T_L', 4.0)
+        seismic = seismic_loads_batch(D, H, s['SDS'], s['SD1'], I, self.W_shell_kg, self.W_roof_kg, W_liquid_kg, TL)
+
+        # Seismic hoop stress at the corroded bottom course (as app.py: t_used - CA, max liquid level)
+        hoop = hoop_stress_batch(D, s['G'], s['SDS'], s['SD1'], I, self.t_used[0] - s['CA'], HD,
+                                 batch.Sd[:, 0], p.get('E', 1.0), TL)
+
+        _, M_wind = wind_loads_batch(s['Wind_Velocity'], D, H, p.get('Kzt', 1.0), p.get('Kd', 0.95),
+                                     p.get('G_wind', 0.85), p.get('Cf', 0.5))
+        p_design_kPa = (p.get('P_design', 0) * 9.80665) / 1000.0
+        p_test_kPa = (p.get('P_test', 0) * 9.80665) / 1000.0
+        anchor = anchor_uplift_batch(D, p_design_kPa, 4 * M_wind / D, 4 * seismic['Overturning_Moment_kNm'] / D,
+                                     self.W_shell_kg * 9.81 / 1000.0, self.W_roof_kg * 9.81 / 1000.0, seismic['Av'],
+                                     p_test_kPa)
+
+        return {
+            'Hoop_Stress_Ratio': hoop['Ratio'],
+            'Shell_Utilization': utilization,
+            'Anchorage_Ratio_J': seismic['Anchorage_Ratio_J'],
+            'Sliding_Ratio': seismic['Sliding_Ratio'],
+            'Net_Uplift_kN': anchor['Net_Uplift_kN']
+        }
+
+    def run(self, percentiles=PERCENTILES):
+        """
+        Run all samples chunk by chunk.
+        :return: results dict {metric: {'Mean', 'Std', 'Min', 'Max', 'P<q>'..., 'P(> thr)'...}, 'N_Samples': n}
+        """
+        estimators = {m: StreamingQuantiles() for m in MC_METRICS}
+        exceed = {m: np.zeros(len(thr), dtype=np.int64) for m, thr in MC_METRICS.items()}
+
+        done = 0
+        while done < self.n_samples:
+            n = min(self.chunk_size, self.n_samples - done)
+            out = self.evaluate(self.sample(n))
+            for m, thresholds in MC_METRICS.items():
+                estimators[m].add(out[m])
+                for k, thr in enumerate(thresholds):
+                    exceed[m][k] += int(np.count_nonzero(out[m] > thr))
+            done += n
+
+        q = np.asarray(percentiles, dtype=float) / 100.0
+        results = {'N_Samples': done}
+        for m, est in estimators.items():
+            stats = {'Mean': est.mean, 'Std': est.std, 'Min': est.min, 'Max': est.max}
+            for pct, val in zip(percentiles, est.quantile(q)):
+                stats[f'P{pct:g}'] = float(val)
+            for thr, count in zip(MC_METRICS[m], exceed[m]):
+                stats[f'P(>{thr:g})'] = count / done
+            results[m] = stats
+        self.results = results
+        return results
+
+
+if __name__ == "__main__":
+    import time
+    from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 40.0, 'H': 17.07, 'HD': 17.07, 'HT': 17.07, 'G': 0.9, 'SDS': 0.5, 'S1': 0.2})
+    dists = {
+        'G': {'dist': 'normal', 'mean': 0.9, 'std': 0.03},
+        'CA': {'dist': 'uniform', 'low': 0.5, 'high': 3.0},
+        'Stress_Factor': {'dist': 'normal', 'mean': 1.0, 'std': 0.04},
+        'SDS': {'dist': 'lognormal', 'median': 0.5, 'cov': 0.4},
+        'SD1': {'dist': 'lognormal', 'median': 0.2, 'cov': 0.4},
+        'Wind_Velocity': {'dist': 'normal', 'mean': 40.0, 'std': 5.0, 'min': 0.0}
+    }
+    mc = MonteCarloDesign(params, build_courses(params['H'], 'A 573 70'), dists, n_samples=200000, seed=1)
+    t0 = time.perf_counter()
+    res = mc.run()
+    print(f"{res['N_Samples']} samples: {time.perf_counter() - t0:.2f} s")
+    for m in MC_METRICS:
+        r = res[m]
+        exc = ', '.join(f"{k} = {v:.4f}" for k, v in r.items() if k.startswith('P(>'))
+        print(f"{m:<20} P50 {r['P50']:.3f}  P95 {r['P95']:.3f}  P99 {r['P99']:.3f}  {exc}")
@@ -11,6 +11,7 @@ class NozzleDesign:
         """
         self.nozzles = nozzles_list if nozzles_list else []
         self.results = {}
+        self._nozzle_courses = {} # schedule index -> shell course index of the last check
         
         # Standard Pipe ODs (mm) for NBS (Inch)
         self.pipe_od_map = {
@@ -58,13 +59,17 @@ class NozzleDesign:
             })
             
         self.results['nozzle_schedule'] = processed_list
+        # New schedule rows carry no check results yet: the next check must cover every nozzle
+        self._nozzle_courses = {}
         return processed_list
 
-    def check_reinforcement(self, shell_courses):
+    def check_reinforcement(self, shell_courses, changed_rows=None):
         """
         Perform Reinforcement Area Check (API 650 5.7.2).
         A_required = d * t_r (required shell thickness)
         A_available = A1 (Shell Excess) + A2 (nozzle excess) + A3 (Repad)
+        :param changed_rows: Optional shell course indices changed since the last check
+                             (IncrementalShellDesign). Nozzles that stay in an unchanged course keep their result.
         """
         if not self.results.get('nozzle_schedule'):
             return []
@@ -89,7 +94,7 @@ class NozzleDesign:
             })
             cum_h += h_course
             
-        for n in self.results['nozzle_schedule']:
+        for k, n in enumerate(self.results['nozzle_schedule']):
             elev = n['Elevation']
             mark = n['Mark']
             od = n['OD_mm']
@@ -97,11 +102,20 @@ class NozzleDesign:
             
             # Find Shell Course
             target_course = None
-            for c in course_map:
+            target_idx = None
+            for ci, c in enumerate(course_map):
                 if c['bottom'] <= elev < c['top']:
                     target_course = c
+                    target_idx = ci
                     break
             
+            # Incremental: course unchanged since last check -> keep result
+            if changed_rows is not None and k in self._nozzle_courses:
+                if self._nozzle_courses[k] == target_idx and target_idx not in changed_rows:
+                    checked_list.append(n)
+                    continue
+            self._nozzle_courses[k] = target_idx
+            
             status = "N/A (Roof/Base?)"
             ratio = 0.0
             
@@ -174,3 +188,9 @@ class NozzleDesign:
             
         self.results['nozzle_schedule'] = checked_list
         return checked_list
+
+    def update_courses(self, shell_courses, changed_rows=None, removed_rows=None):
+        """
+        Listener for IncrementalShellDesign: re-check only nozzles in changed courses.
+        """
+        return self.check_reinforcement(shell_courses, changed_rows)
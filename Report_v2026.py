@@ -482,6 +482,23 @@ class ReportGenerator2026:
             <img src="data:image/png;base64,{graph}" style="max-width:80%; margin: 20px auto; display:block;" />
             """
             
+            shell_check = self.extended.get('Seismic_Shell_Check', [])
+            if shell_check:
+                rows = ""
+                for r in shell_check:
+                    rows += f"""<tr><td>{r['Course']}</td><td>{r['y (m)']:.2f}</td><td>{r['t_used (mm)']:.1f}</td>
+                    <td>{r['P_stat (kPa)']:.1f}</td><td>{r['P_dyn (kPa)']:.1f}</td><td>{r['Stress (MPa)']:.1f}</td>
+                    <td>{r['Allow (MPa)']:.1f}</td><td>{r['Ratio']:.3f}</td><td>{r['Status']}</td></tr>"""
+                html += f"""
+            <h3>12.4 SEISMIC HOOP STRESS BY COURSE (E.6.2.4)</h3>
+            <table>
+                <tr><th>Course</th><th>y (m)</th><th>t (mm)</th><th>P_stat (kPa)</th><th>P_dyn (kPa)</th>
+                <th>Stress (MPa)</th><th>Allow (MPa)</th><th>Ratio</th><th>Status</th></tr>
+                {rows}
+            </table>
+            <p>Governing Course: {self.extended.get('Seismic_Governing_Course', '-')}</p>
+            """
+            
         self._add_chapter("SEISMIC DESIGN OF STORAGE TANK", html)
 
     def generate_chapter_13_anchor_bolt(self):
@@ -499,6 +516,7 @@ class ReportGenerator2026:
              <table>
                  <tr><td>Net Uplift Force:</td><td>{anchor.get('Net Uplift Force (kN)', 0):.1f} kN</td></tr>
                  <tr><td>Required Bolt Area:</td><td>{anchor.get('Required Bolt Area (mm2)', 0):.1f} mm²</td></tr>
+                 <tr><td>Governing Load Case:</td><td>{anchor.get('Governing_Case', {}).get('Req_Bolt_Area_mm2') or 'None'}</td></tr>
                  <tr><td>Bolt Size Selected:</td><td>{anchor.get('Bolt Size', '-')}</td></tr>
                  <tr><td>Number of Bolts:</td><td>{anchor.get('Number of Bolts', 0)}</td></tr>
              </table>
@@ -0,0 +1,543 @@
+import math
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+from Section_Catalog import RAFTER_SECTIONS, COLUMN_SECTIONS, RAFTER_CATALOG, COLUMN_CATALOG
+
+G_STEEL = 77000.0 # MPa, shear modulus
+
+# The simplified I-beam table has no weak-axis or torsion constants: Iz and J as fractions of Ix
+# (IPE 100 - 600: Iz / Iy = 0.04 - 0.09, It / Iy = 0.001 - 0.005)
+WEAK_AXIS_RATIO = 0.06
+TORSION_RATIO = 0.003
+
+# StructureDesign fallbacks ("Custom Heavy", "Custom Heavy Pipe") when no table section is adequate
+CUSTOM_BEAM = {'w': 200.0, 'Sx': 250.0, 'Ix': 9999, 'A': 200.0, 'd': 800.0}
+CUSTOM_PIPE = {'w': 100.0, 'A': 999.0, 'r': 100.0}
+
+# Roof load cases (kPa on the plan area). Unbalanced snow: 1.5 S on one half of the roof (0 <= angle < 180 deg),
+# 0.5 S on the other, same total as the balanced case.
+LOAD_CASES = ['Dead', 'Live', 'Snow', 'Snow_Unbalanced']
+UNBALANCED_SNOW = (1.5, 0.5)
+
+# ASD combinations as StructureDesign.run_design (D + max(L, S)), plus the unbalanced snow
+LOAD_COMBINATIONS = {
+    'D + L': {'Dead': 1.0, 'Live': 1.0},
+    'D + S': {'Dead': 1.0, 'Snow': 1.0},
+    'D + S (Unbalanced)': {'Dead': 1.0, 'Snow_Unbalanced': 1.0}
+}
+
+N_SAMPLES = 21 # Moment sampling points per element (end forces + member load give the exact diagram)
+
+
+def member_properties(name, kind):
+    """
+    (table props, A m2, Iy m4 strong axis, Iz m4, J m4) of a catalog section.
+    :param kind: 'beam' (RAFTER_SECTIONS) or 'column' (COLUMN_SECTIONS, I = A r^2)
+    """
+    if kind == 'column':
+        p = COLUMN_SECTIONS.get(name, CUSTOM_PIPE)
+        A = p['A'] * 1e-4
+        I = A * (p['r'] / 1000.0) ** 2
+        return p, A, I, I, 2.0 * I
+    p = RAFTER_SECTIONS.get(name, CUSTOM_BEAM)
+    Iy = p['Ix'] * 1e-8
+    return p, p['A'] * 1e-4, Iy, WEAK_AXIS_RATIO * Iy, TORSION_RATIO * Iy
+
+
+def frame_element_matrices(xyz_i, xyz_j, A, Iy, Iz, J, E, G):
+    """
+    Local stiffness matrices and rotations of a batch of 3D Euler-Bernoulli frame elements.
+    Local x runs i -> j, local z is the projection of global Z (global X for vertical members),
+    so Iy is the bending stiffness under vertical load.
+    DOF order per node: ux, uy, uz, rx, ry, rz.
+    :return: (k_local (n, 12, 12), rotation (n, 3, 3) rows = local axes, length (n,))
+    """
+    d = xyz_j - xyz_i
+    L = np.linalg.norm(d, axis=1)
+    ex = d / L[:, None]
+    ref = np.where(np.abs(ex[:, 2:3]) > 0.999, np.array([1.0, 0.0, 0.0]), np.array([0.0, 0.0, 1.0]))
+    ez = ref - np.sum(ref * ex, axis=1)[:, None] * ex
+    ez /= np.linalg.norm(ez, axis=1)[:, None]
+    ey = np.cross(ez, ex)
+    rot = np.stack([ex, ey, ez], axis=1)
+
+    n = len(L)
+    k = np.zeros((n, 12, 12))
+    EA = E * A / L
+    GJ = G * J / L
+    k[:, 0, 0] = k[:, 6, 6] = EA
+    k[:, 0, 6] = -EA
+    k[:, 3, 3] = k[:, 9, 9] = GJ
+    k[:, 3, 9] = -GJ
+    # Bending in the local x-y plane (about z): v, rz
+    a, b, c, e = 12 * E * Iz / L ** 3, 6 * E * Iz / L ** 2, 4 * E * Iz / L, 2 * E * Iz / L
+    k[:, 1, 1] = k[:, 7, 7] = a
+    k[:, 1, 7] = -a
+    k[:, 1, 5] = k[:, 1, 11] = b
+    k[:, 5, 7] = k[:, 7, 11] = -b
+    k[:, 5, 5] = k[:, 11, 11] = c
+    k[:, 5, 11] = e
+    # Bending in the local x-z plane (about y): w, ry
+    a, b, c, e = 12 * E * Iy / L ** 3, 6 * E * Iy / L ** 2, 4 * E * Iy / L, 2 * E * Iy / L
+    k[:, 2, 2] = k[:, 8, 8] = a
+    k[:, 2, 8] = -a
+    k[:, 2, 4] = k[:, 2, 10] = -b
+    k[:, 4, 8] = k[:, 8, 10] = b
+    k[:, 4, 4] = k[:, 10, 10] = c
+    k[:, 4, 10] = e
+    k = np.triu(k) + np.transpose(np.triu(k, 1), (0, 2, 1))
+    return k, rot, L
+
+
+def equivalent_nodal_loads(p1, p2, L):
+    """
+    Local equivalent nodal loads (n, 12, cases) of a linearly varying member load.
+    :param p1, p2: (n, 3, cases) local load components (kN/m) at the i and j ends
+    """
+    f = np.zeros((p1.shape[0], 12, p1.shape[2]))
+    L = L[:, None]
+    f[:, 0] = L * (2 * p1[:, 0] + p2[:, 0]) / 6.0
+    f[:, 6] = L * (p1[:, 0] + 2 * p2[:, 0]) / 6.0
+    for comp, m_i, m_j, sign in ((1, 5, 11, 1.0), (2, 4, 10, -1.0)):
+        f[:, comp] = L * (7 * p1[:, comp] + 3 * p2[:, comp]) / 20.0
+        f[:, comp + 6] = L * (3 * p1[:, comp] + 7 * p2[:, comp]) / 20.0
+        f[:, m_i] = sign * L ** 2 * (3 * p1[:, comp] + 2 * p2[:, comp]) / 60.0
+        f[:, m_j] = -sign * L ** 2 * (2 * p1[:, comp] + 3 * p2[:, comp]) / 60.0
+    return f
+
+
+def condense_releases(k, f, released):
+    """
+    Static condensation of member end releases (moment pins, axial slip) out of local element matrices.
+    :param k: (n, 12, 12) local stiffness, f: (n, 12, cases) local equivalent nodal loads
+    :param released: (n, 12) bool, released local DOFs
+    :return: (k, f) with zero stiffness and load on the released DOFs
+    """
+    k = k.copy()
+    f = f.copy()
+    patterns, inverse = np.unique(released, axis=0, return_inverse=True)
+    for p, mask in enumerate(patterns):
+        if not mask.any():
+            continue
+        e = np.flatnonzero(inverse.ravel() == p)
+        r = np.flatnonzero(mask)
+        c = np.flatnonzero(~mask)
+        k_rr = k[np.ix_(e, r, r)]
+        k_cr = k[np.ix_(e, c, r)]
+        k_rc = k[np.ix_(e, r, c)]
+        k_cc = k[np.ix_(e, c, c)]
+        k[np.ix_(e, c, c)] = k_cc - k_cr @ np.linalg.solve(k_rr, k_rc)
+        f[np.ix_(e, c)] = f[np.ix_(e, c)] - k_cr @ np.linalg.solve(k_rr, f[np.ix_(e, r)])
+        k[np.ix_(e, r, np.arange(12))] = 0.0
+        k[np.ix_(e, np.arange(12), r)] = 0.0
+        f[np.ix_(e, r)] = 0.0
+    return k, f
+
+
+class RoofFrameAnalysis:
+    """
+    3D frame analysis of a supported cone roof structure (rafters, ring girders, columns) built from
+    StructureDesign.layout_data and its selected sections, replacing the closed-form rafter moments
+    (0.1283 P L, w L^2 / 8) and tributary column loads (total / 3).
+
+    Rafters run from the center column to the shell and are simply supported spans between the center
+    column, the girder rings and the shell, the same span model as rafter_spans / StructureDesign.run_design:
+    strong-axis end moments released, and the axial force at the inner end, so that sloped rafters do not
+    thrust on the rings. Ring girders are continuous straight segments between the rafter and column nodes
+    of a ring.
+    Shell ends and column bases are pinned.
+    The sparse stiffness matrix is factorized once (scipy.sparse.linalg.splu) and all LOAD_CASES are solved
+    as right-hand sides of that factorization; LOAD_COMBINATIONS are superposed from the case results.
+    Member forces feed StructureDesign.check_rafter_bending / check_buckling (check_sections) and the
+    catalog section selection (resize_sections).
+    """
+    def __init__(self, structure, slope=0.0, self_weight=True, unbalanced_snow=UNBALANCED_SNOW):
+        """
+        :param structure: StructureDesign after run_design (or RoofFramingOptimizer.optimize)
+        :param slope: Roof slope (rise / run); rafters rise from the shell at height H to the center
+        :param self_weight: Include the member self-weight in the dead load case
+        :param unbalanced_snow: (loaded half, unloaded half) snow factors
+        """
+        if not structure.layout_data:
+            structure.run_design()
+        self.structure = structure
+        self.slope = slope
+        self.self_weight = self_weight
+        self.unbalanced_snow = unbalanced_snow
+        self.sections = self._design_sections()
+        self.results = {}
+
+    def _design_sections(self):
+        """
+        Sections per member group from StructureDesign.results: {group: (kind, name)}.
+        """
+        res = self.structure.results
+        sections = {'Rafters': ('beam', res.get('Rafter Section')),
+                    'Center Column': ('column', res.get('Center Col Section'))}
+        for i, ring in enumerate(self._rings()):
+            row = res.get('Rings', {}).get(f"Ring {i+1}", res)
+            sections[f"Girders Ring {i+1}"] = ('beam', row.get('Girder Section'))
+            sections[f"Columns Ring {i+1}"] = ('column', row.get('Ring Col Section'))
+        return sections
+
+    def _rings(self):
+        layout = self.structure.layout_data
+        if layout.get('Type') != 'Ring':
+            return []
+        return layout.get('Rings') or [{'R_ring': layout['R_ring'], 'N_col': layout['N_col']}]
+
+    def build_model(self):
+        """
+        Nodes, elements and member loads from layout_data.
+        """
+        s = self.structure
+        layout = s.layout_data
+        R = layout['R']
+        N = int(layout['N_raf'])
+        H = s.H
+        rings = self._rings()
+        z_roof = lambda r: H + self.slope * (R - r)
+
+        nodes = [(0.0, 0.0, z_roof(0.0))]
+        fixed = []  # nodes with pinned translations
+        elements = [] # (i, j, group)
+        rafter_ang = 2.0 * math.pi * np.arange(N) / N
+
+        # Ring nodes: union of rafter and column angles
+        ring_nodes = []
+        for k, ring in enumerate(rings):
+            col_ang = 2.0 * math.pi * np.arange(int(ring['N_col'])) / int(ring['N_col'])
+            angles = np.unique(np.round(np.concatenate([rafter_ang, col_ang]), 12))
+            ids = {}
+            for ang in angles:
+                ids[ang] = len(nodes)
+                nodes.append((ring['R_ring'] * math.cos(ang), ring['R_ring'] * math.sin(ang), z_roof(ring['R_ring'])))
+            order = [ids[a] for a in angles]
+            for a, b in zip(order, order[1:] + order[:1]):
+                elements.append((a, b, f"Girders Ring {k+1}"))
+            for ang in np.round(col_ang, 12):
+                top = ids[ang]
+                base = len(nodes)
+                nodes.append((nodes[top][0], nodes[top][1], 0.0))
+                fixed.append(base)
+                elements.append((base, top, f"Columns Ring {k+1}"))
+            ring_nodes.append(ids)
+
+        # Rafters: center -> rings -> shell
+        rafter_of = []
+        pinned = [] # (i end, j end) strong-axis moment releases
+        for j, ang in enumerate(np.round(rafter_ang, 12)):
+            prev = 0
+            for ids in ring_nodes:
+                elements.append((prev, ids[ang], 'Rafters'))
+                rafter_of.append(j)
+                pinned.append((True, True))
+                prev = ids[ang]
+            shell = len(nodes)
+            nodes.append((R * math.cos(ang), R * math.sin(ang), z_roof(R)))
+            fixed.append(shell)
+            elements.append((prev, shell, 'Rafters'))
+            rafter_of.append(j)
+            pinned.append((True, False)) # the shell end is a pinned support
+
+        # Center column
+        nodes.append((0.0, 0.0, 0.0))
+        fixed.append(len(nodes) - 1)
+        elements.append((len(nodes) - 1, 0, 'Center Column'))
+
+        self.nodes = np.array(nodes)
+        self.fixed_nodes = np.array(fixed)
+        self.elem_i = np.array([e[0] for e in elements])
+        self.elem_j = np.array([e[1] for e in elements])
+        self.elem_group = np.array([e[2] for e in elements])
+        self.n_rafters = N
+        is_rafter = self.elem_group == 'Rafters'
+        self.rafter_index = np.full(len(elements), -1)
+        self.rafter_index[is_rafter] = rafter_of
+        # Rafter spans: strong-axis end moments released, axial force released at the inner (upper) end
+        self.released = np.zeros((len(elements), 12), dtype=bool)
+        ends = np.array(pinned, dtype=bool)
+        self.released[is_rafter, 0] = True
+        self.released[is_rafter, 4] = ends[:, 0]
+        self.released[is_rafter, 10] = ends[:, 1]
+        self.rafter_angle = rafter_ang
+        return self
+
+    def _element_loads(self, L):
+        """
+        Global member loads per unit member length at both ends, (n_el, cases) each (kN/m, acting in -Z).
+        """
+        loads = self.structure.loads
+        xy = self.nodes[:, :2]
+        n_el = len(self.elem_i)
+        q1 = np.zeros((n_el, len(LOAD_CASES)))
+        q2 = np.zeros((n_el, len(LOAD_CASES)))
+
+        # Roof pressure on the rafters: sector tributary width 2 pi r / N, per plan length -> per member length
+        raf = self.rafter_index >= 0
+        r1 = np.linalg.norm(xy[self.elem_i[raf]], axis=1)
+        r2 = np.linalg.norm(xy[self.elem_j[raf]], axis=1)
+        plan = np.abs(r2 - r1) / L[raf]
+        trib1 = 2.0 * math.pi * r1 / self.n_rafters * plan
+        trib2 = 2.0 * math.pi * r2 / self.n_rafters * plan
+        snow = loads.get('Snow', 0.0)
+        ang = self.rafter_angle[self.rafter_index[raf]]
+        q_case = np.stack([
+            np.full(len(ang), loads.get('Dead_Plate', 0.0) + loads.get('Dead_Add', 0.0)),
+            np.full(len(ang), loads.get('Live', 0.0)),
+            np.full(len(ang), snow),
+            snow * np.where(ang < math.pi - 1e-9, self.unbalanced_snow[0], self.unbalanced_snow[1])
+        ], axis=1)
+        q1[raf] = q_case * trib1[:, None]
+        q2[raf] = q_case * trib2[:, None]
+
+        if self.self_weight:
+            w_self = np.array([member_properties(self.sections[g][1], self.sections[g][0])[0]['w']
+                               for g in self.elem_group]) * 9.81 / 1000.0
+            q1[:, 0] += w_self
+            q2[:, 0] += w_self
+        return q1, q2
+
+    def run_analysis(self):
+        """
+        Assemble, factorize once and solve every load case.
+        :return: results dict: per combination and member group max moments / axial compression, the
+                 governing combination, max deflection, model size
+        """
+        if not hasattr(self, 'nodes'):
+            self.build_model()
+        s = self.structure
+        E = s.E * 1000.0      # kN/m2
+        G = G_STEEL * 1000.0
+
+        props = {g: member_properties(name, kind) for g, (kind, name) in self.sections.items()}
+        A, Iy, Iz, J = (np.array([props[g][k] for g in self.elem_group]) for k in range(1, 5))
+        xi = self.nodes[self.elem_i]
+        xj = self.nodes[self.elem_j]
+        k_loc, rot, L = frame_element_matrices(xi, xj, A, Iy, Iz, J, E, G)
+
+        T = np.zeros((len(L), 12, 12))
+        for b in range(4):
+            T[:, 3 * b:3 * b + 3, 3 * b:3 * b + 3] = rot
+
+        # Member loads: global -Z per member length -> local components -> equivalent nodal loads
+        q1, q2 = self._element_loads(L)
+        down = -rot[:, :, 2] # local components of a unit -Z load
+        p1 = down[:, :, None] * q1[:, None, :]
+        p2 = down[:, :, None] * q2[:, None, :]
+        f_eq = equivalent_nodal_loads(p1, p2, L)
+        # Rafter end releases (build_model)
+        k_loc, f_eq = condense_releases(k_loc, f_eq, self.released)
+        k_glob = np.einsum('nji,njk,nkl->nil', T, k_loc, T)
+
+        n_dof = 6 * len(self.nodes)
+        dofs = np.concatenate([6 * self.elem_i[:, None] + np.arange(6), 6 * self.elem_j[:, None] + np.arange(6)], axis=1)
+        rows = np.repeat(dofs, 12, axis=1).ravel()
+        cols = np.tile(dofs, (1, 12)).ravel()
+        K = sparse.coo_matrix((k_glob.ravel(), (rows, cols)), shape=(n_dof, n_dof)).tocsc()
+        F = np.zeros((n_dof, len(LOAD_CASES)))
+        np.add.at(F, dofs, np.einsum('nji,njc->nic', T, f_eq))
+
+        restrained = np.zeros(n_dof, dtype=bool)
+        for d in range(3):
+            restrained[6 * self.fixed_nodes + d] = True
+        free = np.flatnonzero(~restrained)
+        lu = splu(K[free][:, free].tocsc())
+        U = np.zeros((n_dof, len(LOAD_CASES)))
+        U[free] = lu.solve(F[free])
+
+        # Element end forces (local, on the element) per case
+        u_loc = np.einsum('nij,njc->nic', T, U[dofs])
+        f_el = np.einsum('nij,njc->nic', k_loc, u_loc) - f_eq
+
+        self.K = K
+        self.F = F
+        self.U = U
+        self.element_forces = f_el
+        self.element_length = L
+        self.member_loads = (p1, p2)
+
+        combos = list(LOAD_COMBINATIONS)
+        C = np.array([[LOAD_COMBINATIONS[c].get(case, 0.0) for case in LOAD_CASES] for c in combos]).T
+        f_c = f_el @ C
+        p1_c = p1 @ C
+        p2_c = p2 @ C
+        M_y, M_z = self._moment_envelope(f_c, p1_c, p2_c, L)
+        N_comp = np.maximum(np.maximum(f_c[:, 0], -f_c[:, 6]), 0.0) # axial compression (kN)
+        uz = (U[2::6] @ C)
+
+        groups = {}
+        for g in self.sections:
+            m = self.elem_group == g
+            if not np.any(m):
+                continue
+            Mg = M_y[m].max(axis=0)
+            Ng = N_comp[m].max(axis=0)
+            gov_M = int(np.argmax(Mg))
+            gov_N = int(np.argmax(Ng))
+            groups[g] = {
+                'Kind': self.sections[g][0],
+                'Section': self.sections[g][1],
+                'Members': int(m.sum()),
+                'Length (m)': float(L[m].sum()),
+                'Max Length (m)': float(L[m].max()),
+                'Max Moment (kNm)': float(Mg[gov_M]),
+                'Max Weak-Axis Moment (kNm)': float(M_z[m].max()),
+                'Moment Combination': combos[gov_M],
+                'Max Compression (kN)': float(Ng[gov_N]),
+                'Compression Combination': combos[gov_N]
+            }
+        self.results = {
+            'Nodes': len(self.nodes),
+            'Elements': len(L),
+            'DOF': int(len(free)),
+            'Load Cases': list(LOAD_CASES),
+            'Combinations': combos,
+            'Max Deflection (mm)': float(-uz.min() * 1000.0),
+            'Groups': groups
+        }
+        return self.results
+
+    def _moment_envelope(self, f, p1, p2, L):
+        """
+        Max |M| about the local y (strong) and z axes along every element, (n_el, combos) each,
+        from the end forces and the linear member load: M_y(x) = My_i + x Fz_i + p1 x^2/2 + (p2 - p1) x^3 / (6 L).
+        """
+        x = np.linspace(0.0, 1.0, N_SAMPLES)[None, :, None] * L[:, None, None]
+        Ln = L[:, None, None]
+
+        def along(F_i, M_i, pa, pb, sign):
+            load = pa[:, None, :] * x ** 2 / 2.0 + (pb - pa)[:, None, :] * x ** 3 / (6.0 * Ln)
+            return np.abs(M_i[:, None, :] + sign * (x * F_i[:, None, :] + load)).max(axis=1)
+
+        M_y = along(f[:, 2], f[:, 4], p1[:, 2], p2[:, 2], 1.0)
+        M_z = along(f[:, 1], f[:, 5], p1[:, 1], p2[:, 1], -1.0)
+        return M_y, M_z
+
+    def check_sections(self):
+        """
+        Feed the frame member forces into the StructureDesign section checks (bending of rafters / girders,
+        ASD buckling of columns) and store them in structure.results['Frame Check'].
+        :return: {group: check dict}
+        """
+        if not self.results:
+            self.run_analysis()
+        s = self.structure
+        checks = {}
+        for g, row in self.results['Groups'].items():
+            kind, name = self.sections[g]
+            p = member_properties(name, kind)[0]
+            if kind == 'beam':
+                status, ratio, fb = s.check_rafter_bending(row['Max Moment (kNm)'], p['Sx'])
+                check = {'fb (MPa)': fb}
+            else:
+                status, ratio, Pa = s.check_buckling(row['Max Compression (kN)'], row['Max Length (m)'], p['A'], p['r'])
+                check = {'Allowable (kN)': Pa}
+            checks[g] = {'Section': name, 'Moment (kNm)': row['Max Moment (kNm)'],
+                         'Compression (kN)': row['Max Compression (kN)'], **check,
+                         'Ratio': ratio, 'Status': 'OK' if status else 'FAIL'}
+        s.results['Frame Check'] = checks
+        s.results['Frame_Status'] = 'OK' if all(c['Status'] == 'OK' for c in checks.values()) else 'FAIL'
+        s.results['Frame Max Deflection (mm)'] = self.results['Max Deflection (mm)']
+        return checks
+
+    def resize_sections(self, max_iter=5):
+        """
+        Reselect every member group from its frame forces (lightest adequate catalog section) and re-analyse
+        until the sections no longer change; writes sections and weights back to structure.results.
+        :return: Number of analyses run
+        """
+        s = self.structure
+        for it in range(1, max_iter + 1):
+            self.run_analysis()
+            changed = False
+            for g, row in self.results['Groups'].items():
+                kind, name = self.sections[g]
+                if kind == 'beam':
+                    i = RAFTER_CATALOG.lightest(row['Max Moment (kNm)'] * 1000.0 / s.Fb)
+                    new = RAFTER_CATALOG.names[i] if i is not None else "Custom Heavy"
+                else:
+                    i = COLUMN_CATALOG.lightest_column(row['Max Compression (kN)'], row['Max Length (m)'], s.Fy, s.E)
+                    new = COLUMN_CATALOG.names[i] if i is not None else "Custom Heavy Pipe"
+                if new != name:
+                    self.sections[g] = (kind, new)
+                    changed = True
+            if not changed:
+                break
+        else:
+            self.run_analysis()
+        self._update_design()
+        self.check_sections()
+        return it
+
+    def _update_design(self):
+        """
+        Write the frame sections and member weights (modelled lengths) to structure.results.
+        """
+        res = self.structure.results
+        groups = self.results['Groups']
+
+        def weight(g):
+            return groups[g]['Length (m)'] * member_properties(self.sections[g][1], self.sections[g][0])[0]['w']
+
+        def section_w(g):
+            return member_properties(self.sections[g][1], self.sections[g][0])[0]['w']
+
+        girders = [g for g in groups if g.startswith('Girders')]
+        columns = [g for g in groups if g.startswith('Columns')]
+        res.update({
+            'Rafter Section': self.sections['Rafters'][1],
+            'Rafter_Wt': section_w('Rafters'),
+            'Rafter_Total_Wt': weight('Rafters'),
+            'Center Col Section': self.sections['Center Column'][1],
+            'Center_Col_Wt': section_w('Center Column'),
+            'Center_Col_Total_Wt': weight('Center Column'),
+            'Girder_Total_Wt': sum(weight(g) for g in girders),
+            'Ring_Col_Total_Wt': sum(weight(g) for g in columns),
+            'Max Moment (kNm)': max(row['Max Moment (kNm)'] for row in groups.values())
+        })
+        if girders:
+            res.update({
+                'Girder Section': ", ".join(dict.fromkeys(self.sections[g][1] for g in girders)),
+                'Girder_Wt': max(section_w(g) for g in girders),
+                'Ring Col Section': ", ".join(dict.fromkeys(self.sections[g][1] for g in columns)),
+                'Ring_Col_Wt': max(section_w(g) for g in columns)
+            })
+            for k in range(len(girders)):
+                ring = res.get('Rings', {}).get(f"Ring {k+1}")
+                if ring is not None:
+                    g, c = f"Girders Ring {k+1}", f"Columns Ring {k+1}"
+                    ring.update({'Girder Section': self.sections[g][1], 'Girder_Wt': section_w(g),
+                                 'Girder_Total_Wt': weight(g), 'Ring Col Section': self.sections[c][1],
+                                 'Ring_Col_Wt': section_w(c), 'Ring_Col_Total_Wt': weight(c)})
+        res['Total_Struct_Weight'] = (res['Rafter_Total_Wt'] + res['Center_Col_Total_Wt'] + res['Girder_Total_Wt']
+                                      + res['Ring_Col_Total_Wt']) * 1.1
+
+
+if __name__ == "__main__":
+    import time
+    from Structure_Design import StructureDesign
+    from Roof_Framing_Optimizer import RoofFramingOptimizer
+
+    loads = {'Live': 1.2, 'Snow': 1.0, 'Dead_Plate': 0.47, 'Dead_Add': 0.2}
+    for D in (30.0, 90.0, 140.0):
+        sd = StructureDesign(D, loads)
+        sd.set_height(15.0)
+        opt = RoofFramingOptimizer(sd, slope=0.0625).optimize()
+        source = 'run_design' if 'Status' in opt else 'optimizer' # no feasible optimized layout: run_design
+        t0 = time.perf_counter()
+        frame = RoofFrameAnalysis(sd, slope=0.0625)
+        frame.run_analysis()
+        frame.check_sections()
+        status = sd.results['Frame_Status']
+        n = frame.resize_sections()
+        res = frame.results
+        checks = sd.results['Frame Check']
+        dt = time.perf_counter() - t0
+        print(f"D={D} m: {sd.layout_data['N_raf']} rafters, {res['Elements']} elements, {res['DOF']} DOF, {dt:.2f} s, "
+              f"deflection {res['Max Deflection (mm)']:.1f} mm, {source} sections {status}, "
+              f"resized ({n} analyses) {sd.results['Frame_Status']}")
+        for g, c in checks.items():
+            print(f"  {g:<18} {c['Section']:<16} M={c['Moment (kNm)']:8.1f} kNm  P={c['Compression (kN)']:8.1f} kN  "
+                  f"ratio={c['Ratio']:.2f}")
@@ -0,0 +1,435 @@
+import os
+import math
+import itertools
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from Section_Catalog import RAFTER_CATALOG, COLUMN_CATALOG
+from Roof_Frame_Analysis import UNBALANCED_SNOW
+
+# Candidate girder ring radii as fractions of the roof radius
+RING_FRACTIONS = tuple(round(f, 2) for f in np.arange(0.10, 0.951, 0.05))
+
+MAX_RINGS = 4
+MAX_RAFTER_SPACING = 2.0   # m at the shell (roof plate span), as StructureDesign.run_design
+RAFTER_COUNT_FACTOR = 2.0  # Rafter counts tried: N_min ... RAFTER_COUNT_FACTOR * N_min (even)
+GIRDER_SPAN_RANGE = (3.0, 12.0) # m, girder lengths between ring columns tried
+MIN_RING_COLUMNS = 4
+CONNECTION_FACTOR = 1.1    # Connections / bracing allowance on the member weight, as run_design
+GRAVITY = 9.81             # m/s2, member self-weight (kg/m) to kN/m, as RoofFrameAnalysis
+
+
+def trapezoid_span(w_a, w_b, L):
+    """
+    Simply supported span under a linearly varying load w_a -> w_b (kN/m), the radial rafter load
+    between two supports (triangular from the center column). Arrays broadcast.
+    :return: (M_max kNm, R_a kN, R_b kN)
+    """
+    w_a, w_b, L = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (w_a, w_b, L)])
+    R_a = L * (2.0 * w_a + w_b) / 6.0
+    R_b = L * (w_a + 2.0 * w_b) / 6.0
+    dw = w_b - w_a
+    # Zero shear: R_a - w_a x - dw x^2 / (2 L) = 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_q = np.where(np.abs(dw) > 1e-12 * np.maximum(np.abs(w_b), 1e-300),
+                       (-w_a + np.sqrt(np.maximum(w_a ** 2 + 2.0 * dw * R_a / L, 0.0))) * L / dw, L / 2.0)
+        x = np.where(L > 0, x_q, 0.0)
+        M = np.where(L > 0, R_a * x - w_a * x ** 2 / 2.0 - dw * x ** 3 / (6.0 * L), 0.0)
+    return M, R_a, R_b
+
+
+def rafter_spans(fractions, R, q, w_self=0.0):
+    """
+    Rafter spans of a ring layout with the rafter count taken as 1 (moments and reactions scale with 1 / N,
+    the totals over all rafters do not): supports at the center column, the rings and the shell.
+    :param fractions: Ring radii / R, ascending; a (layouts, rings) array evaluates several layouts at once
+    :param w_self: Self-weight of all rafters together (kN per m of radius)
+    :return: (M_max of the worst span x N (kNm), center column load (kN), [total load of each ring (kN)]),
+             arrays over the layouts for a 2-D fractions
+    """
+    r = np.asarray(fractions, dtype=float) * R
+    edge = np.zeros(r.shape[:-1] + (1,))
+    supports = np.concatenate([edge, r, edge + R], axis=-1)
+    a = supports[..., :-1]
+    b = supports[..., 1:]
+    w_unit = q * 2.0 * math.pi # kN/m per m of radius, all rafters together
+    M, R_a, R_b = trapezoid_span(w_unit * a + w_self, w_unit * b + w_self, b - a)
+    ring_loads = R_b[..., :-1] + R_a[..., 1:]
+    if r.ndim > 1:
+        return M.max(axis=-1), R_a[..., 0], ring_loads
+    return float(np.max(M)), float(R_a[0]), [float(P) for P in ring_loads]
+
+
+class RoofFramingOptimizer:
+    """
+    Minimum-weight framing of a supported cone roof: number of rafters, number of girder rings (0 - 4),
+    ring radii (RING_FRACTIONS grid) and columns per ring, minimizing Total_Struct_Weight.
+
+    The best column count / girder / column of every ring is a separate choice, memoized per ring load.
+    The rafter section of every (rings, rafter count) pair is picked in one vectorized catalog query.
+    Ring counts are evaluated in parallel worker processes.
+    Columns are sized at their real length under the cone, H + slope * (R - r) (column_length).
+    Members are sized for the RoofFrameAnalysis load model and combinations: rafters as simple spans between
+    the supports, the member self-weight in the dead load, the unbalanced snow on the rafters and girders of
+    the loaded half and on the ring columns through the continuous ring girder (snow_ring_factor).
+    The chosen layout is written to the StructureDesign (results, layout_data) for generate_structure_plot.
+    """
+    def __init__(self, structure, slope=0.0, max_rings=MAX_RINGS, ring_fractions=RING_FRACTIONS, rafter_counts=None,
+                 max_rafter_spacing=MAX_RAFTER_SPACING, girder_span_range=GIRDER_SPAN_RANGE):
+        """
+        :param structure: StructureDesign (diameter, loads, Fy, column height H at the shell)
+        :param slope: Roof slope (rise / run), as RoofFrameAnalysis; columns get longer towards the center
+        :param max_rings: Largest number of girder rings tried (0 = center column only)
+        :param ring_fractions: Candidate ring radii / R
+        :param rafter_counts: Candidate rafter counts (default: even counts from the max_rafter_spacing
+                              minimum up to RAFTER_COUNT_FACTOR times it)
+        :param max_rafter_spacing: Maximum rafter spacing at the shell (m)
+        :param girder_span_range: (min, max) girder length between ring columns (m)
+        """
+        self.structure = structure
+        self.R = structure.D / 2.0
+        self.slope = slope
+        loads = structure.loads
+        # kPa: dead, live and snow load cases, as RoofFrameAnalysis
+        self.q = (loads.get('Dead_Plate', 0.0) + loads.get('Dead_Add', 0.0), loads.get('Live', 0.0),
+                  loads.get('Snow', 0.0))
+        self.max_rings = max_rings
+        self.ring_fractions = tuple(sorted(ring_fractions))
+        if rafter_counts is None:
+            n_min = max(4, math.ceil(math.pi * structure.D / max_rafter_spacing))
+            n_min += n_min % 2
+            rafter_counts = range(n_min, int(RAFTER_COUNT_FACTOR * n_min) + 1, 2)
+        else:
+            rafter_counts = [n for n in rafter_counts if math.pi * structure.D / n <= max_rafter_spacing]
+        self.rafter_counts = np.array(sorted(rafter_counts), dtype=int)
+        self.girder_span_range = girder_span_range
+        self.results = {}
+
+    def _settings(self):
+        s = self.structure
+        return (self.R, self.q, s.Fb, s.Fy, s.E, s.H, self.slope, self.girder_span_range)
+
+    def optimize(self, max_workers=None):
+        """
+        :param max_workers: Worker processes for the ring counts (default: all cores, 1 = in process)
+        :return: results dict in the StructureDesign.results format, plus 'Rings' ({'Ring 1': ring results, ...},
+                 innermost first) and 'Candidates'
+        """
+        if len(self.rafter_counts) == 0:
+            self.results = {'Status': 'No Feasible Layout'}
+            return self.results
+
+        ring_counts = list(range(0, self.max_rings + 1))
+        tasks = [(k, self.ring_fractions, self.rafter_counts, self._settings()) for k in ring_counts]
+        max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                best = list(pool.map(_best_layout, tasks))
+        else:
+            best = [_best_layout(t) for t in tasks]
+
+        n_candidates = sum(b['Candidates'] for b in best)
+        best = min(best, key=lambda b: b['Total_Struct_Weight'])
+        if not math.isfinite(best['Total_Struct_Weight']):
+            self.results = {'Status': 'No Feasible Layout', 'Candidates': n_candidates}
+            return self.results
+
+        self._finalize(best)
+        self.results['Candidates'] = n_candidates
+        return self.results
+
+    def _finalize(self, best):
+        """
+        Write the chosen layout to the StructureDesign in the run_design result format.
+        """
+        s = self.structure
+        R = self.R
+        N = best['N_raf']
+        rafter = RAFTER_CATALOG.names[best['Rafter_Index']]
+        r_props = RAFTER_CATALOG.props[best['Rafter_Index']]
+        center_col = COLUMN_CATALOG.names[best['Center_Col_Index']]
+        c_props = COLUMN_CATALOG.props[best['Center_Col_Index']]
+        rings = best['Rings']
+
+        rafter_wt = N * R * r_props['w']
+        center_col_length = column_length(0.0, R, s.H, self.slope)
+        center_col_wt = center_col_length * c_props['w']
+        girder_wt = sum(r['Girder_Total_Wt'] for r in rings)
+        ring_col_wt = sum(r['Ring_Col_Total_Wt'] for r in rings)
+        M_max = max([best['M_rafter']] + [r['Girder_Moment (kNm)'] for r in rings])
+
+        def joined(key):
+            return ", ".join(dict.fromkeys(r[key] for r in rings)) if rings else '-'
+
+        s.results = {
+            'Type': f"Girder System ({len(rings)}-Ring)" if rings else 'Center Column Only',
+            'Num Rafters': N,
+            'Rafter Section': rafter,
+            'Rafter_Wt': r_props['w'],
+            'Rafter_Length': R,
+            'Rafter_Total_Wt': rafter_wt,
+            'Girder Section': joined('Girder Section'),
+            'Num Girders': sum(r['Num Girders'] for r in rings),
+            'Girder_Length': max((r['Girder_Length'] for r in rings), default=0),
+            'Girder_Wt': max((r['Girder_Wt'] for r in rings), default=0),
+            'Girder_Total_Wt': girder_wt,
+            'Center Col Section': center_col,
+            'Center Col Load (kN)': best['P_center'],
+            'Center_Col_Wt': c_props['w'],
+            'Center_Col_Length': center_col_length,
+            'Center_Col_Total_Wt': center_col_wt,
+            'Total_Struct_Weight': (rafter_wt + center_col_wt + girder_wt + ring_col_wt) * CONNECTION_FACTOR,
+            'Rafter Spacing (m)': 2.0 * math.pi * R / N,
+            'Max Moment (kNm)': M_max,
+            'Ring_Col_Wt': max((r['Ring_Col_Wt'] for r in rings), default=0),
+            'Ring_Col_Total_Wt': ring_col_wt,
+            'Rings': {f"Ring {i+1}": r for i, r in enumerate(rings)}
+        }
+        if rings:
+            s.results.update({
+                'Ring Col Section': joined('Ring Col Section'),
+                'Num Ring Cols': sum(r['Num Ring Cols'] for r in rings),
+                'Ring Col Load (kN)': max(r['Ring Col Load (kN)'] for r in rings)
+            })
+            s.layout_data = {
+                'R': R, 'D': s.D, 'N_raf': N, 'N_col': rings[0]['Num Ring Cols'], 'R_ring': rings[0]['R_ring'],
+                'Type': 'Ring', 'Rings': [{'R_ring': r['R_ring'], 'N_col': r['Num Ring Cols']} for r in rings]
+            }
+        else:
+            s.layout_data = {'R': R, 'D': s.D, 'N_raf': N, 'N_col': 0, 'R_ring': 0, 'Type': 'Single'}
+        self.results = s.results
+
+
+def column_length(r, R, H, slope):
+    """
+    Column length (m) at radius r: eave height H plus the cone rise between the shell and r.
+    """
+    return H + slope * (R - r)
+
+
+def _rafter_load(q):
+    """
+    Rafter / girder load (kPa) of the load cases q = (dead, live, snow): D + max(L, S) as run_design, with the
+    snow of the loaded half of the unbalanced case.
+    """
+    q_dead, q_live, q_snow = q
+    return q_dead + max(q_live, max(UNBALANCED_SNOW) * q_snow)
+
+
+@lru_cache(maxsize=None)
+def snow_ring_factor(n_col):
+    """
+    Largest ring column reaction under the unbalanced snow over the balanced one (UNBALANCED_SNOW on the two
+    halves of the roof, a column at angle 0, as RoofFrameAnalysis): the ring girder continuous over n_col
+    equal spans on rigid columns, three-moment equation of the closed ring, span loads averaged over the halves.
+    """
+    start = 2.0 * math.pi * np.arange(n_col) / n_col
+    loaded = np.clip((math.pi - start) * n_col / (2.0 * math.pi), 0.0, 1.0) # loaded fraction of every span
+    w = UNBALANCED_SNOW[0] * loaded + UNBALANCED_SNOW[1] * (1.0 - loaded)
+    w_left = np.roll(w, 1) # span ending at the column
+    # M[i-1] + 4 M[i] + M[i+1] = -(w_left + w) L^2 / 4, unit span length
+    A = 4.0 * np.eye(n_col) + np.roll(np.eye(n_col), 1, axis=1) + np.roll(np.eye(n_col), -1, axis=1)
+    M = np.linalg.solve(A, -(w_left + w) / 4.0)
+    reaction = (w_left + w) / 2.0 + np.roll(M, 1) + np.roll(M, -1) - 2.0 * M
+    return float(reaction.max())
+
+
+def _self_weight(w):
+    """
+    Member self-weight (kN/m) of a section weight w (kg/m).
+    """
+    return w * GRAVITY / 1000.0
+
+
+def _select_with_self_weight(catalog, select, demand, shape):
+    """
+    Lightest sections that also carry their own weight: select for the load alone, then reselect the
+    entries whose section changed with the self-weight of the current choice until none changes. The demand
+    only grows with the section weight, so this stops at the lightest adequate section.
+    :param select: Demand array -> catalog indices (-1 where no section is adequate)
+    :param demand: (section weights kg/m, mask) -> demand (Sx_req or column load) of the masked entries
+    :param shape: Shape of the index array
+    """
+    todo = np.ones(shape, dtype=bool)
+    idx = select(demand(np.zeros(shape)[todo], todo)).reshape(shape)
+    todo = idx >= 0
+    while np.any(todo):
+        new = select(demand(catalog.w[idx[todo]], todo))
+        changed = new != idx[todo]
+        idx[todo] = new
+        todo[todo] = changed & (new >= 0)
+    return idx
+
+
+def _select_columns(P, L_c, Fy, E):
+    """
+    Lightest columns for loads P (kN, array) at the column tops plus the column self-weight (indices, -1 = none).
+    """
+    P = np.asarray(P, dtype=float)
+    return _select_with_self_weight(COLUMN_CATALOG, lambda load: COLUMN_CATALOG.select_columns(load, L_c, Fy, E),
+                                    lambda w, m: P[m] + _self_weight(w) * L_c, P.shape)
+
+
+@lru_cache(maxsize=None)
+def _ring_design(r, P, settings):
+    """
+    Lightest girder ring + columns at radius r, over the column counts whose girder length is within the
+    span range. Girders are sized as simple spans, columns for the continuous ring girder under the
+    unbalanced snow; both carry their self-weight as well.
+    Memoized per (radius, load): neighbouring layouts share rings.
+    :param P: (dead, live, snow) total load of the ring (kN)
+    :return: (weight kg without the connection factor, N_col, girder index, column index, girder moment kNm,
+              column load kN) or None
+    """
+    R, q, Fb, Fy, E, H, slope, (span_min, span_max) = settings
+    P_dead, P_live, P_snow = P
+    L_c = column_length(r, R, H, slope)
+    circ = 2.0 * math.pi * r
+    n_col = np.arange(max(MIN_RING_COLUMNS, math.ceil(circ / span_max)),
+                      max(MIN_RING_COLUMNS, math.floor(circ / span_min)) + 1)
+    L_g = circ / n_col
+    P_girder = P_dead + max(P_live, max(UNBALANCED_SNOW) * P_snow)
+    girder_moment = lambda w, m: (P_girder / circ + _self_weight(w)) * L_g[m] ** 2 / 8.0
+    girder = _select_with_self_weight(RAFTER_CATALOG, RAFTER_CATALOG.select_many,
+                                      lambda w, m: girder_moment(w, m) * 1000.0 / Fb, L_g.shape)
+    snow_factor = np.array([snow_ring_factor(int(n)) for n in n_col])
+    P_top = (P_dead + circ * _self_weight(RAFTER_CATALOG.w[girder]) + np.maximum(P_live, snow_factor * P_snow)) / n_col
+    column = _select_columns(P_top, L_c, Fy, E)
+    ok = (girder >= 0) & (column >= 0)
+    if not np.any(ok):
+        return None
+    weight = np.where(ok, circ * RAFTER_CATALOG.w[girder] + n_col * L_c * COLUMN_CATALOG.w[column], np.inf)
+    i = int(np.argmin(weight))
+    return (float(weight[i]), int(n_col[i]), int(girder[i]), int(column[i]),
+            float(girder_moment(RAFTER_CATALOG.w[girder[i]], i)),
+            float(P_top[i] + _self_weight(COLUMN_CATALOG.w[column[i]]) * L_c))
+
+
+def _best_layout(task):
+    """
+    Lightest layout with exactly k rings (worker task of RoofFramingOptimizer.optimize).
+    The rafter section of every (ring radii, rafter count) pair, carrying its own weight, is picked in one
+    vectorized query. The rafter self-weight also loads the rings and the center column, so these are first
+    sized without it for a lower bound of every pair's weight; pairs are then sized in full in lower bound
+    order until the lower bound reaches the lightest full weight found.
+    """
+    k, fractions, rafter_counts, settings = task
+    R, (q_dead, q_live, q_snow), Fb, Fy, E, H, slope, _ = settings
+    L_center = column_length(0.0, R, H, slope)
+    rise = math.hypot(1.0, slope) # rafter length per m of radius
+    q_column = q_dead + max(q_live, q_snow) # the unbalanced snow has the balanced total
+    best = {'Total_Struct_Weight': float('inf'), 'Candidates': 0}
+
+    combos = list(itertools.combinations(fractions, k))
+    best['Candidates'] = len(combos) * len(rafter_counts)
+    layouts = np.array(combos, dtype=float).reshape(len(combos), k)
+    # Center column and ring loads per unit roof load (kPa) and per unit rafter self-weight (kN/m of radius)
+    _, center_q, rings_q = rafter_spans(layouts, R, 1.0)
+    _, center_w, rings_w = rafter_spans(layouts, R, 0.0, 1.0)
+
+    def columns_and_rings(i, w_self):
+        # (center column index, its load, ring designs) of layout i, None if a member is not feasible
+        P_center = q_column * center_q[i] + w_self * center_w[i]
+        center = int(_select_columns([P_center], L_center, Fy, E)[0])
+        rings = [_ring_design(round(f * R, 9), (round(q_dead * P + w_self * P_w, 9), round(q_live * P, 9),
+                                                round(q_snow * P, 9)), settings)
+                 for f, P, P_w in zip(combos[i], rings_q[i], rings_w[i])]
+        if center < 0 or any(r is None for r in rings):
+            return None
+        return center, P_center + _self_weight(COLUMN_CATALOG.w[center]) * L_center, rings
+
+    def fixed_weight(design):
+        return L_center * COLUMN_CATALOG.w[design[0]] + sum(r[0] for r in design[2])
+
+    # Lower bound of the center column + rings weight: sized without the rafter self-weight
+    lower = np.full(len(combos), np.inf)
+    for i in range(len(combos)):
+        design = columns_and_rings(i, 0.0)
+        if design is not None:
+            lower[i] = fixed_weight(design)
+
+    # Rafter section of every (layout, rafter count) at once
+    shape = (len(combos), len(rafter_counts))
+    q = _rafter_load((q_dead, q_live, q_snow))
+    counts = np.broadcast_to(rafter_counts, shape)
+    layout = np.broadcast_to(np.arange(len(combos))[:, None], shape)
+
+    def rafter_demand(w, m):
+        M = rafter_spans(layouts[layout[m]], R, q, (counts[m] * _self_weight(w) * rise)[:, None])[0]
+        return M / counts[m] * 1000.0 / Fb
+
+    idx = _select_with_self_weight(RAFTER_CATALOG, RAFTER_CATALOG.select_many, rafter_demand, shape)
+    rafter_wt = np.where(idx >= 0, counts * R * RAFTER_CATALOG.w[idx], np.inf)
+    bound = rafter_wt + lower[:, None]
+
+    found = None
+    best_weight = float('inf')
+    for flat in np.argsort(bound, axis=None, kind='stable'):
+        if not bound.flat[flat] < best_weight:
+            break
+        i, j = np.unravel_index(flat, shape)
+        N, r_idx = int(rafter_counts[j]), int(idx[i, j])
+        w_self = N * _self_weight(RAFTER_CATALOG.w[r_idx]) * rise
+        design = columns_and_rings(i, w_self)
+        if design is None:
+            continue
+        weight = float(rafter_wt[i, j]) + fixed_weight(design)
+        if weight < best_weight:
+            best_weight = weight
+            found = (i, N, r_idx, w_self, design)
+    if found is None:
+        return best
+
+    i, N, r_idx, w_self, (center, P_center, rings) = found
+    combo = combos[i]
+    M_unit = rafter_spans(combo, R, q, w_self)[0]
+    ring_rows = []
+    for f, P, P_w, (_, n_col, g, c, M_g, P_col) in zip(combo, rings_q[i], rings_w[i], rings):
+        r = f * R
+        L_g = 2.0 * math.pi * r / n_col
+        L_c = column_length(r, R, H, slope)
+        ring_rows.append({
+            'R_ring': r,
+            'Ring Load (kN)': float(q_column * P + w_self * P_w),
+            'Girder Section': RAFTER_CATALOG.names[g],
+            'Num Girders': n_col,
+            'Girder_Length': L_g,
+            'Girder_Wt': RAFTER_CATALOG.props[g]['w'],
+            'Girder_Total_Wt': n_col * L_g * RAFTER_CATALOG.props[g]['w'],
+            'Girder_Moment (kNm)': M_g,
+            'Ring Col Section': COLUMN_CATALOG.names[c],
+            'Num Ring Cols': n_col,
+            'Ring Col Load (kN)': P_col,
+            'Ring_Col_Wt': COLUMN_CATALOG.props[c]['w'],
+            'Ring_Col_Length': L_c,
+            'Ring_Col_Total_Wt': n_col * L_c * COLUMN_CATALOG.props[c]['w']
+        })
+    best.update({
+        'Total_Struct_Weight': best_weight * CONNECTION_FACTOR,
+        'N_raf': N,
+        'Rafter_Index': r_idx,
+        'M_rafter': M_unit / N,
+        'P_center': float(P_center),
+        'Center_Col_Index': center,
+        'Rings': ring_rows
+    })
+    return best
+
+
+if __name__ == "__main__":
+    import time
+    from Structure_Design import StructureDesign
+
+    loads = {'Live': 1.2, 'Snow': 0.0, 'Dead_Plate': 0.47, 'Dead_Add': 0.2}
+    for D in (30.0, 60.0, 90.0):
+        base = StructureDesign(D, loads)
+        base.set_height(15.0)
+        base.run_design()
+        sd = StructureDesign(D, loads)
+        sd.set_height(15.0)
+        t0 = time.perf_counter()
+        res = RoofFramingOptimizer(sd).optimize()
+        dt = time.perf_counter() - t0
+        print(f"D={D} m: {res['Type']}, {res['Num Rafters']} x {res['Rafter Section']}, "
+              f"{res['Total_Struct_Weight']:.0f} kg (run_design {base.results['Total_Struct_Weight']:.0f} kg), "
+              f"{res['Candidates']} candidates, {dt:.2f} s")
@@ -0,0 +1,202 @@
+import math
+from bisect import bisect_left
+import numpy as np
+
+# Standard I-Beam Sections (Simplified Database)
+# Name: [Weight(kg/m), Sx(cm3), Ix(cm4), Area(cm2), Depth(mm)]
+RAFTER_SECTIONS = {
+    "IPE 100": {'w': 8.1, 'Sx': 34.2, 'Ix': 171, 'A': 10.3, 'd': 100},
+    "IPE 120": {'w': 10.4, 'Sx': 53.0, 'Ix': 318, 'A': 13.2, 'd': 120},
+    "IPE 140": {'w': 12.9, 'Sx': 77.3, 'Ix': 541, 'A': 16.4, 'd': 140},
+    "IPE 160": {'w': 15.8, 'Sx': 109.0, 'Ix': 869, 'A': 20.1, 'd': 160},
+    "IPE 180": {'w': 18.8, 'Sx': 146.0, 'Ix': 1317, 'A': 23.9, 'd': 180},
+    "IPE 200": {'w': 22.4, 'Sx': 194.0, 'Ix': 1943, 'A': 28.5, 'd': 200},
+    "IPE 220": {'w': 26.2, 'Sx': 252.0, 'Ix': 2772, 'A': 33.4, 'd': 220},
+    "IPE 240": {'w': 30.7, 'Sx': 324.0, 'Ix': 3892, 'A': 39.1, 'd': 240},
+    "IPE 270": {'w': 36.1, 'Sx': 429.0, 'Ix': 5790, 'A': 45.9, 'd': 270},
+    "IPE 300": {'w': 42.2, 'Sx': 557.0, 'Ix': 8356, 'A': 53.8, 'd': 300},
+    "IPE 330": {'w': 49.1, 'Sx': 713.0, 'Ix': 11770, 'A': 62.6, 'd': 330},
+    "IPE 360": {'w': 57.1, 'Sx': 904.0, 'Ix': 16270, 'A': 72.7, 'd': 360},
+    "IPE 400": {'w': 66.3, 'Sx': 1160.0, 'Ix': 23130, 'A': 84.5, 'd': 400},
+    "IPE 450": {'w': 77.6, 'Sx': 1500.0, 'Ix': 33740, 'A': 98.8, 'd': 450},
+    "IPE 500": {'w': 90.7, 'Sx': 1930.0, 'Ix': 48200, 'A': 116.0, 'd': 500},
+    "IPE 550": {'w': 106.0, 'Sx': 2440.0, 'Ix': 67120, 'A': 134.0, 'd': 550},
+    "IPE 600": {'w': 122.0, 'Sx': 3070.0, 'Ix': 92080, 'A': 156.0, 'd': 600}
+}
+
+# Pipe Columns (Schedule 40 approx)
+COLUMN_SECTIONS = {
+    "Pipe 4in Sch40": {'w': 16.07, 'A': 20.0, 'r': 39.0}, # r approx 1.51" = 38.4mm
+    "Pipe 6in Sch40": {'w': 28.26, 'A': 36.0, 'r': 57.0}, # r approx 2.25" = 57.2mm
+    "Pipe 8in Sch40": {'w': 42.55, 'A': 54.0, 'r': 75.0}, # r approx 2.95" = 75mm
+    "Pipe 10in Sch40": {'w': 60.30, 'A': 77.0, 'r': 95.0}, # r approx 3.67" = 93mm
+    "Pipe 12in Sch40": {'w': 73.8, 'A': 94.0, 'r': 112.0} # r approx 4.38" = 111mm
+}
+
+# Standard Metric Angles (Equal Leg)
+# Approx Properties for Verification
+# Name: [Weight(kg/m), Sx(cm3), Ix(cm4), Area(cm2), d(mm), t(mm)]
+# Source: Standard Tables (Approx)
+ANGLE_SECTIONS = {
+    "L 25x25x3": {'w': 1.12, 'Sx': 0.39, 'Ix': 0.68, 'A': 1.42, 'd': 25, 't': 3},
+    "L 30x30x3": {'w': 1.36, 'Sx': 0.53, 'Ix': 1.05, 'A': 1.74, 'd': 30, 't': 3},
+    "L 40x40x3": {'w': 1.83, 'Sx': 0.90, 'Ix': 2.45, 'A': 2.35, 'd': 40, 't': 3},
+    "L 40x40x5": {'w': 2.97, 'Sx': 1.43, 'Ix': 3.79, 'A': 3.79, 'd': 40, 't': 5},
+    "L 45x45x4": {'w': 2.74, 'Sx': 1.62, 'Ix': 4.84, 'A': 3.49, 'd': 45, 't': 4},
+    "L 50x50x4": {'w': 3.06, 'Sx': 2.05, 'Ix': 7.62, 'A': 3.89, 'd': 50, 't': 4},
+    "L 50x50x6": {'w': 4.47, 'Sx': 2.91, 'Ix': 10.95, 'A': 5.69, 'd': 50, 't': 6},
+    "L 65x65x6": {'w': 5.91, 'Sx': 5.25, 'Ix': 23.50, 'A': 7.53, 'd': 65, 't': 6},
+    "L 65x65x8": {'w': 7.73, 'Sx': 6.85, 'Ix': 30.20, 'A': 9.85, 'd': 65, 't': 8},
+    "L 75x75x6": {'w': 6.85, 'Sx': 7.08, 'Ix': 36.60, 'A': 8.73, 'd': 75, 't': 6},
+    "L 75x75x9": {'w': 9.96, 'Sx': 10.20, 'Ix': 52.40, 'A': 12.69, 'd': 75, 't': 9},
+    "L 75x75x12": {'w': 13.10, 'Sx': 13.10, 'Ix': 62.40, 'A': 16.20, 'd': 75, 't': 12}, 
+    "L 90x90x7": {'w': 9.61, 'Sx': 11.9, 'Ix': 72.9, 'A': 12.2, 'd': 90, 't': 7},
+    "L 90x90x10": {'w': 13.4, 'Sx': 16.5, 'Ix': 100.0, 'A': 17.1, 'd': 90, 't': 10},
+    "L 90x90x13": {'w': 17.0, 'Sx': 20.8, 'Ix': 124.0, 'A': 21.7, 'd': 90, 't': 13},
+    "L 100x100x7": {'w': 10.7, 'Sx': 15.0, 'Ix': 103.0, 'A': 13.6, 'd': 100, 't': 7},
+    "L 100x100x10": {'w': 15.0, 'Sx': 20.9, 'Ix': 142.0, 'A': 19.2, 'd': 100, 't': 10},
+    "L 100x100x13": {'w': 19.2, 'Sx': 26.5, 'Ix': 177.0, 'A': 24.4, 'd': 100, 't': 13},
+    "L 120x120x8": {'w': 14.7, 'Sx': 24.5, 'Ix': 202.0, 'A': 18.7, 'd': 120, 't': 8},
+    "L 130x130x9": {'w': 17.9, 'Sx': 32.7, 'Ix': 310.0, 'A': 22.8, 'd': 130, 't': 9},
+    "L 130x130x12": {'w': 23.6, 'Sx': 42.5, 'Ix': 400.0, 'A': 30.0, 'd': 130, 't': 12},
+    "L 130x130x15": {'w': 29.1, 'Sx': 51.8, 'Ix': 483.0, 'A': 37.0, 'd': 130, 't': 15},
+    "L 150x150x12": {'w': 27.3, 'Sx': 57.0, 'Ix': 600.0, 'A': 34.8, 'd': 150, 't': 12},
+    "L 150x150x15": {'w': 33.8, 'Sx': 69.8, 'Ix': 731.0, 'A': 43.0, 'd': 150, 't': 15},
+    "L 150x150x19": {'w': 42.1, 'Sx': 85.0, 'Ix': 888.0, 'A': 53.6, 'd': 150, 't': 19}
+}
+
+# Channels (UPN), strong axis
+# Name: [Weight(kg/m), Sx(cm3), Ix(cm4), Area(cm2), Depth(mm)]
+CHANNEL_SECTIONS = {
+    "UPN 80": {'w': 8.64, 'Sx': 26.5, 'Ix': 106, 'A': 11.0, 'd': 80},
+    "UPN 100": {'w': 10.6, 'Sx': 41.2, 'Ix': 206, 'A': 13.5, 'd': 100},
+    "UPN 120": {'w': 13.4, 'Sx': 60.7, 'Ix': 364, 'A': 17.0, 'd': 120},
+    "UPN 140": {'w': 16.0, 'Sx': 86.4, 'Ix': 605, 'A': 20.4, 'd': 140},
+    "UPN 160": {'w': 18.8, 'Sx': 116.0, 'Ix': 925, 'A': 24.0, 'd': 160},
+    "UPN 180": {'w': 22.0, 'Sx': 150.0, 'Ix': 1350, 'A': 28.0, 'd': 180},
+    "UPN 200": {'w': 25.3, 'Sx': 191.0, 'Ix': 1910, 'A': 32.2, 'd': 200},
+    "UPN 220": {'w': 29.4, 'Sx': 245.0, 'Ix': 2690, 'A': 37.4, 'd': 220},
+    "UPN 240": {'w': 33.2, 'Sx': 300.0, 'Ix': 3600, 'A': 42.3, 'd': 240},
+    "UPN 260": {'w': 37.9, 'Sx': 371.0, 'Ix': 4820, 'A': 48.3, 'd': 260},
+    "UPN 300": {'w': 46.2, 'Sx': 535.0, 'Ix': 8030, 'A': 58.8, 'd': 300}
+}
+
+
+def asd_allowable_load(A_cm2, r_mm, L_m, Fy, E=200000.0, K=1.0):
+    """
+    AISC ASD allowable axial load (kN), vectorized StructureDesign.check_buckling:
+    0 where r <= 0 or KL/r > 200.
+    """
+    A_cm2, r_mm = np.broadcast_arrays(np.asarray(A_cm2, dtype=float), np.asarray(r_mm, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slenderness = np.where(r_mm > 0, K * (L_m * 1000.0) / r_mm, np.inf)
+        Cc = math.sqrt(2.0 * math.pi ** 2 * E / Fy)
+        FS = 5.0 / 3.0 + (3.0 * slenderness) / (8.0 * Cc) - (slenderness ** 3) / (8.0 * Cc ** 3)
+        Fa_inelastic = (1.0 - (slenderness ** 2) / (2.0 * Cc ** 2)) * Fy / FS
+        Fa_elastic = (12.0 * math.pi ** 2 * E) / (23.0 * slenderness ** 2)
+    Fa = np.where(slenderness <= Cc, Fa_inelastic, Fa_elastic)
+    Pa = Fa * A_cm2 * 100.0 / 1000.0
+    return np.where(slenderness <= 200, Pa, 0.0)
+
+
+class SectionCatalog:
+    """
+    A section table sorted by weight once, with its properties as arrays (w, Sx, A, r).
+    The lightest section with Sx >= Sx_req is the first one whose running maximum of Sx reaches Sx_req,
+    so every query is a bisection of that (non-decreasing) envelope instead of a sort + scan.
+    """
+    def __init__(self, sections, modulus='Sx'):
+        """
+        :param sections: {name: props} table (e.g. RAFTER_SECTIONS)
+        :param modulus: Key of the section modulus in props ('Z' for WIND_GIRDER_SECTIONS)
+        """
+        items = sorted(sections.items(), key=lambda x: x[1]['w']) # Stable: ties keep the table order
+        self.sections = sections
+        self.names = [name for name, _ in items]
+        self.props = [props for _, props in items]
+        self.w = np.array([p['w'] for p in self.props], dtype=float)
+        self.Sx = np.array([p.get(modulus, 0.0) for p in self.props], dtype=float)
+        self.A = np.array([p.get('A', 0.0) for p in self.props], dtype=float)
+        # Radius of gyration (mm): tabulated, else sqrt(Ix / A) of the strong axis
+        self.r = np.array([p['r'] if 'r' in p else
+                           (math.sqrt(p['Ix'] / p['A']) * 10.0 if p.get('Ix') and p.get('A') else 0.0)
+                           for p in self.props], dtype=float)
+        self._Sx_envelope = np.maximum.accumulate(self.Sx) if len(self.Sx) else self.Sx
+        self._Sx_envelope_list = self._Sx_envelope.tolist()
+        self._Pa_envelopes = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def lightest(self, Sx_req):
+        """
+        Index of the lightest section with Sx >= Sx_req (cm3), None if no section is adequate. O(log n).
+        """
+        i = bisect_left(self._Sx_envelope_list, Sx_req)
+        return None if i >= len(self.names) or math.isnan(Sx_req) else i
+
+    def select(self, Sx_req):
+        """
+        (name, props) of the lightest adequate section, None if no section is adequate.
+        """
+        i = self.lightest(Sx_req)
+        return None if i is None else (self.names[i], self.props[i])
+
+    def select_many(self, Sx_req):
+        """
+        Vectorized lightest(): indices (-1 where no section is adequate) for an array of required moduli.
+        """
+        Sx_req = np.asarray(Sx_req, dtype=float)
+        idx = np.searchsorted(self._Sx_envelope, Sx_req, side='left')
+        return np.where((idx < len(self.names)) & ~np.isnan(Sx_req), idx, -1)
+
+    def allowable_loads(self, L_m, Fy, E=200000.0):
+        """
+        ASD allowable axial load (kN) of every section for one column length, cached per (L, Fy, E).
+        """
+        return self._column_envelope(L_m, Fy, E)[0]
+
+    def _column_envelope(self, L_m, Fy, E):
+        key = (float(L_m), float(Fy), float(E))
+        if key not in self._Pa_envelopes:
+            Pa = asd_allowable_load(self.A, self.r, *key)
+            # Sections without capacity (too slender) never qualify, not even for a zero load
+            env = np.maximum.accumulate(np.where(Pa > 0, Pa, -np.inf)) if len(Pa) else Pa
+            self._Pa_envelopes[key] = (Pa, env, env.tolist())
+        return self._Pa_envelopes[key]
+
+    def lightest_column(self, Load_kN, L_m, Fy, E=200000.0):
+        """
+        Index of the lightest section whose allowable axial load reaches Load_kN, None if none does.
+        """
+        _, _, env = self._column_envelope(L_m, Fy, E)
+        i = bisect_left(env, Load_kN)
+        return None if i >= len(self.names) or math.isnan(Load_kN) else i
+
+    def select_columns(self, Load_kN, L_m, Fy, E=200000.0):
+        """
+        Vectorized lightest_column(): indices (-1 where no section is adequate) for an array of loads.
+        """
+        _, env, _ = self._column_envelope(L_m, Fy, E)
+        Load_kN = np.asarray(Load_kN, dtype=float)
+        idx = np.searchsorted(env, Load_kN, side='left')
+        return np.where((idx < len(self.names)) & ~np.isnan(Load_kN), idx, -1)
+
+
+_CATALOGS = {}
+
+def catalog_for(sections, modulus='Sx'):
+    """
+    Shared SectionCatalog of a section table, built on first use.
+    """
+    key = (id(sections), modulus)
+    cat = _CATALOGS.get(key)
+    if cat is None or cat.sections is not sections or len(cat) != len(sections):
+        cat = _CATALOGS[key] = SectionCatalog(sections, modulus)
+    return cat
+
+
+RAFTER_CATALOG = catalog_for(RAFTER_SECTIONS)
+COLUMN_CATALOG = catalog_for(COLUMN_SECTIONS)
+ANGLE_CATALOG = catalog_for(ANGLE_SECTIONS)
+CHANNEL_CATALOG = catalog_for(CHANNEL_SECTIONS)
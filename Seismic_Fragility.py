@@ -0,0 +1,197 @@
+import io
+import contextlib
+import numpy as np
+import pandas as pd
+from Loads_Batch import seismic_loads_batch, hoop_stress_batch
+
+# Tank inventory columns (CSV header). HD defaults to H; SD1_SDS is the spectral shape SD1 / SDS kept
+# while SDS is scaled (the site's own ratio, 0.5 when unknown).
+INVENTORY_COLUMNS = ['Tank', 'D', 'H', 'HD', 'G', 'W_shell_kg', 'W_roof_kg', 't_bottom_mm', 'Sd', 'E',
+                     'I_seismic', 'SD1_SDS', 'T_L']
+INVENTORY_DEFAULTS = {'E': 1.0, 'I_seismic': 1.0, 'SD1_SDS': 0.5, 'T_L': 4.0}
+
+# Limit states: (metric of seismic_loads_batch / hoop_stress_batch, threshold). All metrics increase with SDS.
+LIMIT_STATES = {
+    'Sliding': ('Sliding_Ratio', 1.0),          # base shear > friction resistance (E.7.6)
+    'J_0.785': ('Anchorage_Ratio_J', 0.785),    # annular plate check required (E.6.2.1)
+    'J_1.54': ('Anchorage_Ratio_J', 1.54),      # anchors required (E.6.2.1)
+    'Hoop_Stress': ('Ratio', 1.0)               # seismic hoop stress > 1.333 Sd E (E.6.2.4)
+}
+# Limit states that end the self-anchored design; the lowest of them is the seismic capacity
+CAPACITY_LIMITS = ['Sliding', 'J_1.54', 'Hoop_Stress']
+
+SDS_MAX = 3.0   # g, upper end of the bisection bracket (thresholds beyond it are reported as inf)
+SDS_TOL = 1e-6  # g, bisection tolerance
+
+
+def read_inventory(path):
+    """
+    Read a tank inventory (.csv or .xlsx) with the INVENTORY_COLUMNS header.
+    """
+    if path.lower().endswith(('.xlsx', '.xls')):
+        inv = pd.read_excel(path)
+    else:
+        inv = pd.read_csv(path)
+    if 'HD' not in inv.columns:
+        inv['HD'] = inv.get('H')
+    else:
+        inv['HD'] = inv['HD'].fillna(inv['H'])
+    for col, default in INVENTORY_DEFAULTS.items():
+        if col not in inv.columns:
+            inv[col] = default
+        inv[col] = inv[col].fillna(default)
+    missing = [c for c in INVENTORY_COLUMNS if c not in inv.columns]
+    if missing:
+        raise ValueError(f"Tank inventory is missing columns: {missing}")
+    return inv
+
+
+def inventory_row(params, shell_courses_input, name='Tank'):
+    """
+    One inventory row from a deterministic design (Main.run_design_pipeline): weights, corroded bottom
+    course thickness (t_used - CA, as app.py) and its design stress.
+    """
+    from Main import run_design_pipeline
+    with contextlib.redirect_stdout(io.StringIO()):
+        base = run_design_pipeline(params, [dict(c) for c in shell_courses_input], verbose=False)
+    bottom = base['shell_design'].results[0]
+    SDS = float(params.get('SDS', 0.0))
+    return {
+        'Tank': name, 'D': float(params['D']), 'H': float(params['H']),
+        'HD': float(params.get('HD', params['H'])), 'G': float(params['G']),
+        'W_shell_kg': base['W_shell_kg'], 'W_roof_kg': base['W_roof_kg'],
+        't_bottom_mm': bottom['t_used'] - params.get('CA', 0.0), 'Sd': bottom['Sd'],
+        'E': params.get('E', 1.0), 'I_seismic': params.get('I_seismic', 1.0),
+        'SD1_SDS': float(params.get('S1', 0.0)) / SDS if SDS > 0 else INVENTORY_DEFAULTS['SD1_SDS'],
+        'T_L': params.get('T_L', 4.0)
+    }
+
+
+def limit_state_metrics(SDS, D, H, HD, G, W_shell, W_roof, t_bottom, Sd, E=1.0, I=1.0, sd1_ratio=0.5, TL=4.0):
+    """
+    Limit state metrics (LIMIT_STATES) at the given SDS, SD1 = sd1_ratio * SDS.
+    Vectorized calculate_loads / check_hoop_stress; all arguments broadcast against each other.
+    :return: dict metric -> array
+    """
+    SDS = np.asarray(SDS, dtype=float)
+    SD1 = sd1_ratio * SDS
+    W_liquid = np.pi * (D / 2.0) ** 2 * HD * G * 1000.0
+    seismic = seismic_loads_batch(D, H, SDS, SD1, I, W_shell, W_roof, W_liquid, TL)
+    hoop = hoop_stress_batch(D, G, SDS, SD1, I, t_bottom, HD, Sd, E, TL)
+    return {
+        'Sliding_Ratio': seismic['Sliding_Ratio'],
+        'Anchorage_Ratio_J': seismic['Anchorage_Ratio_J'],
+        'Ratio': hoop['Ratio']
+    }
+
+
+def seismic_thresholds(D, H, HD, G, W_shell, W_roof, t_bottom, Sd, E=1.0, I=1.0, sd1_ratio=0.5, TL=4.0,
+                       limits=LIMIT_STATES, sds_max=SDS_MAX, tol=SDS_TOL):
+    """
+    SDS at which each limit state is reached, for a batch of tanks, by vectorized bisection:
+    every tank and limit state is bracketed in [0, sds_max] and halved together, one batched
+    evaluation of limit_state_metrics per step.
+    Tank arguments are scalars or (n,) arrays (see INVENTORY_COLUMNS).
+    :return: dict limit name -> (n,) SDS threshold (0 if exceeded without seismic load, inf if not reached
+             below sds_max)
+    """
+    tank = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                 for v in (D, H, HD, G, W_shell, W_roof, t_bottom, Sd, E, I, sd1_ratio, TL)])
+    n = tank[0].shape[0]
+    names = list(limits)
+    metric = [limits[k][0] for k in names]
+    threshold = np.array([limits[k][1] for k in names])
+    cols = [tank_arg[:, None] for tank_arg in tank]
+
+    def exceeded(SDS):
+        m = limit_state_metrics(SDS, *cols)
+        values = np.stack([m[key][:, k] for k, key in enumerate(metric)], axis=1)
+        return values >= threshold
+
+    lo = np.zeros((n, len(names)))
+    hi = np.full((n, len(names)), float(sds_max))
+    at_zero = exceeded(lo)
+    at_max = exceeded(hi)
+    for _ in range(int(np.ceil(np.log2(sds_max / tol)))):
+        mid = 0.5 * (lo + hi)
+        f = exceeded(mid)
+        hi = np.where(f, mid, hi)
+        lo = np.where(f, lo, mid)
+
+    sds = np.where(at_zero, 0.0, np.where(at_max, hi, np.inf))
+    return {name: sds[:, k] for k, name in enumerate(names)}
+
+
+class SeismicFragility:
+    """
+    Seismic capacity of a tank inventory: SDS / SD1 thresholds of sliding, J = 0.785 / 1.54 and
+    seismic hoop stress for every tank in one batched bisection (seismic_thresholds).
+    """
+    def __init__(self, inventory, sds_max=SDS_MAX, tol=SDS_TOL):
+        """
+        :param inventory: DataFrame with INVENTORY_COLUMNS (see read_inventory / inventory_row)
+        :param sds_max: Upper SDS of the search (g)
+        :param tol: SDS tolerance (g)
+        """
+        self.inventory = inventory.reset_index(drop=True)
+        self.sds_max = sds_max
+        self.tol = tol
+        self.results = None
+
+    @classmethod
+    def from_designs(cls, designs, **kwargs):
+        """
+        :param designs: {tank name: (params, shell_courses_input)}
+        """
+        rows = [inventory_row(params, courses, name) for name, (params, courses) in designs.items()]
+        return cls(pd.DataFrame(rows, columns=INVENTORY_COLUMNS), **kwargs)
+
+    def run(self):
+        """
+        :return: DataFrame per tank: SDS_<limit>, SD1_<limit>, Capacity_SDS, Capacity_SD1, Governing_Limit
+        """
+        inv = self.inventory
+        col = lambda name: inv[name].to_numpy(dtype=float)
+        sd1_ratio = col('SD1_SDS')
+        thresholds = seismic_thresholds(col('D'), col('H'), col('HD'), col('G'), col('W_shell_kg'),
+                                        col('W_roof_kg'), col('t_bottom_mm'), col('Sd'), col('E'),
+                                        col('I_seismic'), sd1_ratio, col('T_L'), sds_max=self.sds_max, tol=self.tol)
+
+        table = pd.DataFrame({'Tank': inv['Tank'].to_numpy()})
+        for name, sds in thresholds.items():
+            table[f'SDS_{name}'] = sds
+            table[f'SD1_{name}'] = sds * sd1_ratio
+        capacity = np.stack([thresholds[name] for name in CAPACITY_LIMITS], axis=1)
+        gov = np.argmin(capacity, axis=1)
+        table['Capacity_SDS'] = capacity[np.arange(len(inv)), gov]
+        table['Capacity_SD1'] = table['Capacity_SDS'] * sd1_ratio
+        table['Governing_Limit'] = np.where(np.isfinite(table['Capacity_SDS']),
+                                            np.array(CAPACITY_LIMITS)[gov], "None")
+        self.results = table
+        return self.results
+
+    def write(self, output_path):
+        """
+        Write the capacity table (.csv or .xlsx).
+        """
+        if self.results is None:
+            self.run()
+        if output_path.lower().endswith('.xlsx'):
+            self.results.to_excel(output_path, index=False)
+        else:
+            self.results.to_csv(output_path, index=False)
+        return output_path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Seismic capacity (SDS thresholds) of a tank inventory")
+    parser.add_argument('inventory', help="Tank inventory (.csv / .xlsx) with columns " + ", ".join(INVENTORY_COLUMNS))
+    parser.add_argument('output', help="Capacity table (.csv / .xlsx)")
+    parser.add_argument('--sds-max', type=float, default=SDS_MAX)
+    args = parser.parse_args()
+
+    fragility = SeismicFragility(read_inventory(args.inventory), sds_max=args.sds_max)
+    fragility.write(args.output)
+    print(fragility.results.to_string(index=False))
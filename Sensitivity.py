@@ -0,0 +1,188 @@
+import io
+import contextlib
+import numpy as np
+import pandas as pd
+from Shell_Batch import ShellBatchDesign
+from Roof_Design import RoofDesign
+from Loads_Batch import seismic_loads_batch, wind_loads_batch, anchor_uplift_batch
+
+# Perturbed inputs (design parameter keys as in InputReader.get_design_parameters)
+SENSITIVITY_INPUTS = ['D', 'H', 'G', 'CA', 'SDS', 'Wind_Velocity']
+
+# Outputs of the shell -> seismic -> anchor chain
+SENSITIVITY_OUTPUTS = ['t_req_bottom_mm', 'W_shell_kg', 'Base_Shear_kN', 'Ringwall_Moment_kNm', 'Net_Uplift_kN']
+
+# Default step (relative); absolute step used instead when the base value is 0
+REL_STEP = 0.01
+ABS_STEP = {'D': 0.1, 'H': 0.1, 'G': 0.01, 'CA': 0.1, 'SDS': 0.01, 'Wind_Velocity': 0.5}
+
+
+class DesignSensitivity:
+    """
+    Central finite-difference sensitivities of key design outputs to the main inputs.
+
+    The base case and the 2 x n_inputs perturbed cases are stacked into one batch and pushed through
+    the same chain as Main.run_design_pipeline, vectorized:
+    ShellBatchDesign -> liquid weight -> wind -> seismic (calculate_loads) -> anchor uplift.
+    """
+    def __init__(self, params, shell_courses_input, inputs=None, rel_step=REL_STEP, method='auto',
+                 thickness_basis='t_req'):
+        """
+        :param params: Design parameter dict (as run_design_pipeline)
+        :param shell_courses_input: List of course dicts (Course, Material, Width, Thickness_Used)
+        :param inputs: Inputs to perturb (default SENSITIVITY_INPUTS)
+        :param rel_step: Relative step h (x +/- h*x)
+        :param method: Shell design method ('auto', '1ft', 'vdm')
+        :param thickness_basis: Thickness used for the shell weight: 't_req' (smooth) or 't_used'
+                                (as designed; rounded plate thicknesses make it piecewise constant)
+        """
+        self.params = params
+        self.courses = shell_courses_input
+        self.inputs = list(inputs) if inputs else list(SENSITIVITY_INPUTS)
+        self.rel_step = rel_step
+        self.method = method
+        self.thickness_basis = thickness_basis
+        self.results = {}
+
+    def _steps(self):
+        steps = []
+        for name in self.inputs:
+            x = float(self.params.get(name, 0.0))
+            steps.append(abs(x) * self.rel_step if x != 0 else ABS_STEP.get(name, self.rel_step))
+        return np.array(steps)
+
+    def _case_matrix(self, steps):
+        """
+        (1 + 2n, n) input values: row 0 base, then +h / -h per input.
+        """
+        base = np.array([float(self.params.get(name, 0.0)) for name in self.inputs])
+        n = len(self.inputs)
+        X = np.tile(base, (1 + 2 * n, 1))
+        for k in range(n):
+            X[1 + 2 * k, k] += steps[k]
+            X[2 + 2 * k, k] -= steps[k]
+        return base, X
+
+    def _roof_weight(self, D_values):
+        # Roof weight only depends on D; one RoofDesign per distinct diameter
+        p = self.params
+        weights = {}
+        for D in np.unique(D_values):
+            roof = RoofDesign(diameter=float(D), roof_type=p.get('Roof_Type', 'Supported Cone Roof'),
+                              slope=p.get('Roof_Slope', 0.0625), corrosion_allowance=p.get('CA_roof', 0.0),
+                              material=p.get('Roof_Material', 'Unknown'), thickness_used=p.get('Roof_Thickness', 0.0))
+            with contextlib.redirect_stdout(io.StringIO()):
+                roof.run_design()
+                weights[D] = roof.calculate_roof_weight()[0]
+        return np.array([weights[D] for D in D_values])
+
+    def evaluate(self, X):
+        """
+        Run the vectorized chain for a (cases, n_inputs) matrix of input values.
+        :return: dict output -> (cases,) array
+        """
+        p = self.params
+        cols = {name: X[:, k] for k, name in enumerate(self.inputs)}
+        m = X.shape[0]
+
+        def col(name):
+            return cols[name] if name in cols else np.full(m, float(p.get(name, 0.0)))
+
+        D = col('D')
+        H = col('H')
+        G = col('G')
+        CA = col('CA')
+        SDS = col('SDS')
+        V = col('Wind_Velocity') if 'Wind_Velocity' in cols else np.full(m, float(p.get('Wind_Velocity', 45.0)))
+
+        # A change of H moves the liquid levels and the top course with it
+        dH = H - float(p['H'])
+        HD = float(p.get('HD', p['H'])) + dH
+        HT = float(p.get('HT', p['H'])) + dH
+        widths = np.tile([c['Width'] for c in self.courses], (m, 1)).astype(float)
+        widths[:, -1] += dH
+        materials = [c['Material'] for c in self.courses]
+        t_used_input = [c.get('Thickness_Used', 0.0) for c in self.courses]
+
+        batch = ShellBatchDesign(D, HD, HT, G, CA, widths, materials,
+                                 p_design=p.get('P_design', 0.0), p_test=p.get('P_test', 0.0),
+                                 thickness_used=t_used_input)
+        shell = batch.run_method(self.method)
+        if self.thickness_basis == 't_req':
+            shell = shell.copy()
+            shell['t_used'] = shell['t_req']
+        W_shell_kg = batch.calculate_shell_weight(shell)
+
+        W_roof_kg = self._roof_weight(D)
+        W_liquid_kg = np.pi * (D / 2.0) ** 2 * HD * G * 1000.0
+
+        _, M_wind = wind_loads_batch(V, D, H, p.get('Kzt', 1.0), p.get('Kd', 0.95), p.get('G_wind', 0.85), p.get('Cf', 0.5))
+        seismic = seismic_loads_batch(D, H, SDS, p.get('S1', 0.0), p.get('I_seismic', 1.0), W_shell_kg, W_roof_kg, W_liquid_kg,
+                                      p.get('T_L', 4.0))
+
+        p_design_kPa = (p.get('P_design', 0) * 9.80665) / 1000.0
+        p_test_kPa = (p.get('P_test', 0) * 9.80665) / 1000.0
+        anchor = anchor_uplift_batch(D, p_design_kPa, 4 * M_wind / D, 4 * seismic['Overturning_Moment_kNm'] / D,
+                                     W_shell_kg * 9.81 / 1000.0, W_roof_kg * 9.81 / 1000.0, seismic['Av'],
+                                     p_test_kPa)
+
+        return {
+            't_req_bottom_mm': shell['t_req'][:, 0],
+            'W_shell_kg': W_shell_kg,
+            'Base_Shear_kN': seismic['Base_Shear_kN'],
+            'Ringwall_Moment_kNm': seismic['Ringwall_Moment_kNm'],
+            'Net_Uplift_kN': anchor['Net_Uplift_kN']
+        }
+
+    def run(self):
+        """
+        One batched evaluation of all 1 + 2n cases.
+        :return: results dict with 'Base' outputs, 'Jacobian' and 'Elasticity' DataFrames
+                 (outputs x inputs) and the 'Tornado' DataFrame
+        """
+        steps = self._steps()
+        base, X = self._case_matrix(steps)
+        Y = self.evaluate(X)
+
+        n = len(self.inputs)
+        jac = np.zeros((len(SENSITIVITY_OUTPUTS), n))
+        tornado = []
+        for i, out in enumerate(SENSITIVITY_OUTPUTS):
+            y = Y[out]
+            for k, name in enumerate(self.inputs):
+                y_plus, y_minus = y[1 + 2 * k], y[2 + 2 * k]
+                jac[i, k] = (y_plus - y_minus) / (2.0 * steps[k])
+                tornado.append({'Output': out, 'Input': name, 'Base': y[0],
+                                'Low': y_minus, 'High': y_plus, 'Swing': abs(y_plus - y_minus)})
+
+        y0 = np.array([Y[out][0] for out in SENSITIVITY_OUTPUTS])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            elasticity = np.where(y0[:, None] != 0, jac * base[None, :] / y0[:, None], 0.0)
+
+        tornado = pd.DataFrame(tornado)
+        tornado = tornado.sort_values(['Output', 'Swing'], ascending=[True, False]).reset_index(drop=True)
+
+        self.results = {
+            'Base': dict(zip(SENSITIVITY_OUTPUTS, y0)),
+            'Steps': dict(zip(self.inputs, steps)),
+            'Jacobian': pd.DataFrame(jac, index=SENSITIVITY_OUTPUTS, columns=self.inputs),
+            'Elasticity': pd.DataFrame(elasticity, index=SENSITIVITY_OUTPUTS, columns=self.inputs),
+            'Tornado': tornado
+        }
+        return self.results
+
+
+if __name__ == "__main__":
+    from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 40.0, 'H': 17.07, 'HD': 17.07, 'HT': 17.07, 'SDS': 0.5, 'S1': 0.2})
+    sens = DesignSensitivity(params, build_courses(params['H'], 'A 573 70'))
+    res = sens.run()
+    pd.set_option('display.width', 160)
+    print("Jacobian (d output / d input):")
+    print(res['Jacobian'].round(4))
+    print("\nElasticity (% output per % input):")
+    print(res['Elasticity'].round(3))
+    print("\nTornado (Base Shear):")
+    print(res['Tornado'][res['Tornado']['Output'] == 'Base_Shear_kN'].to_string(index=False))
@@ -0,0 +1,323 @@
+import math
+import numpy as np
+from Materials import material_property_arrays
+from VDM_Solver import VDMSolver
+
+# Per-course result record of the batch engine.
+# Same quantities as the dicts in ShellDesign.results, stored as one (N_tanks, N_courses) array.
+COURSE_RESULT_DTYPE = np.dtype([
+    ('Width', 'f8'),
+    ('Sd', 'f8'),
+    ('St', 'f8'),
+    ('H_eff_d', 'f8'),
+    ('H_eff_t', 'f8'),
+    ('td', 'f8'),
+    ('tt', 'f8'),
+    ('t_req', 'f8'),
+    ('t_rec', 'f8'),
+    ('t_used', 'f8'),
+    ('OK', '?'),
+    ('Valid', '?'),  # False for padding slots (Width <= 0 or NaN)
+])
+
+BATCH_METHODS = ('1ft', 'vdm', 'auto')
+
+
+def min_thickness_code(D):
+    """
+    API 650 5.6.1.1 minimum nominal shell thickness (mm), vectorized over D (m).
+    Same brackets as ShellDesign.run_design.
+    """
+    D = np.asarray(D, dtype=float)
+    return np.select([D >= 60, D >= 36, D >= 15], [10.0, 8.0, 6.0], default=5.0)
+
+
+class ShellBatchDesign:
+    """
+    Vectorized API 650 shell design for many tanks at once (5.6.3 1-Foot / 5.6.4 VDM).
+    Mirrors ShellDesign.run_design course by course; the only Python loop left is over
+    course index (VDM upper courses depend on the course below), every tank runs in parallel.
+    """
+    def __init__(self, diameter, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance,
+                 widths, materials, p_design=0.0, p_test=0.0, efficiency=1.0, thickness_used=None, design_temp=40.0):
+        """
+        :param diameter: Tank Diameters (m), shape (N,)
+        :param design_liquid_level: Design Liquid Levels HD (m), shape (N,)
+        :param test_liquid_level: Test Liquid Levels HT (m), shape (N,)
+        :param specific_gravity: Specific Gravities, shape (N,)
+        :param corrosion_allowance: Shell CA (mm), shape (N,)
+        :param widths: Course width matrix (m), shape (N, C). 0 or NaN marks an unused slot (shorter tanks).
+        :param materials: Material name(s): scalar, shape (C,) or (N, C)
+        :param p_design: Internal Design Pressure (mmH2O), scalar or (N,)
+        :param p_test: Internal Test Pressure (mmH2O), scalar or (N,)
+        :param efficiency: Joint Efficiency, scalar or (N,)
+        :param thickness_used: Used thickness matrix (mm), shape (N, C). 0 -> auto-assign t_rec (as ShellDesign).
+        :param design_temp: Design Temperature (deg C), scalar or (N,)
+        """
+        self.widths = np.atleast_2d(np.asarray(widths, dtype=float))
+        N, C = self.widths.shape
+        self.N = N
+        self.C = C
+
+        def per_tank(val):
+            return np.broadcast_to(np.asarray(val, dtype=float), (N,)).astype(float)
+
+        self.D = per_tank(diameter)
+        self.HD = per_tank(design_liquid_level)
+        self.HT = per_tank(test_liquid_level)
+        self.G = per_tank(specific_gravity)
+        self.CA = per_tank(corrosion_allowance)
+        self.P_design = per_tank(p_design)
+        self.P_test = per_tank(p_test)
+        self.E = per_tank(efficiency)
+        self.design_temp = per_tank(design_temp)
+
+        self.valid = np.isfinite(self.widths) & (self.widths > 0)
+        self.widths = np.where(self.valid, self.widths, 0.0)
+
+        self.materials = np.broadcast_to(np.asarray(materials, dtype=object), (N, C))
+        if thickness_used is None:
+            self.t_used_input = np.zeros((N, C))
+        else:
+            self.t_used_input = np.broadcast_to(np.asarray(thickness_used, dtype=float), (N, C))
+
+        self.Sd, self.St = self._lookup_stresses()
+        self.results = {}
+        self.weights = {}
+        self.vdm_stats = {} # Iteration counts / residuals of the last 'vdm_full' run
+
+    def _lookup_stresses(self):
+        """
+        Resolve Sd/St matrices with the material registry array API (each distinct name resolved once).
+        """
+        props = material_property_arrays(self.materials, self.design_temp[:, None])
+        Sd = np.where(self.valid, props['Sd'], 0.0)
+        St = np.where(self.valid, props['St'], 0.0)
+        return Sd, St
+
+    def use_vdm_mask(self, method):
+        """
+        Per-tank method selection, same rule as ShellDesign.run_design.
+        """
+        if method == 'vdm':
+            return np.ones(self.N, dtype=bool)
+        if method in ('1ft', 'annex_a'):
+            return np.zeros(self.N, dtype=bool)
+        if method == 'auto':
+            return self.D > 61
+        raise ValueError(f"Unknown shell design method: {method}")
+
+    def _course_thickness_1ft(self, H_eff, G, S, CA):
+        # API 650 5.6.3: t = 4.9 * D * (H - 0.3) * G / (S * E) + CA
+        H_design = np.maximum(H_eff - 0.3, 0.0)
+        return (4.9 * self.D * H_design * G) / (S * self.E) + CA
+
+    def _course_thickness_vdm_bottom(self, H_eff, G, S, CA):
+        # API 650 5.6.4.2: t1 = (1.06 - 0.0696*D/H * sqrt(H*G/S)) * (4.9*H*D*G / (S*E)) + CA
+        # (G is omitted inside the root, matching ShellDesign.run_design.)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            term1 = np.sqrt(H_eff / S)
+            term2 = (0.0696 * self.D / H_eff) * term1
+        factor = np.where(H_eff > 0, 1.06 - term2, 0.0)
+        base_t = (4.9 * H_eff * self.D * G) / (S * self.E)
+        return factor * base_t + CA
+
+    def _course_thickness_vdm_upper(self, H_eff, G, S, CA, t_prev):
+        # API 650 5.6.4.3 (one-shot x from the course below)
+        x = 0.61 * np.sqrt(self.D * (t_prev / 1000.0))
+        H_x = np.maximum(H_eff - x, 0.0)
+        return (4.9 * self.D * H_x * G) / (S * self.E) + CA
+
+    def run_method(self, method='auto'):
+        """
+        Run one design method for every tank.
+        'vdm_full' iterates the complete 5.6.4 procedure (see run_vdm_full).
+        :return: Structured array (N, C) with COURSE_RESULT_DTYPE
+        """
+        if method == 'vdm_full':
+            return self.run_vdm_full()
+
+        use_vdm = self.use_vdm_mask(method)
+
+        head_design_m = (self.P_design / 1000.0) / self.G
+        H_eff_design_total = self.HD + head_design_m
+        H_eff_test_total = self.HT + (self.P_test / 1000.0) / 1.0
+
+        # Height of the bottom of each course
+        bottoms = np.cumsum(self.widths, axis=1) - self.widths
+
+        t_min = min_thickness_code(self.D)
+        ones = np.ones(self.N)
+        zeros = np.zeros(self.N)
+
+        res = np.zeros((self.N, self.C), dtype=COURSE_RESULT_DTYPE)
+        t_prev_d = zeros
+        t_prev_t = zeros
+
+        for j in range(self.C):
+            Sd = self.Sd[:, j]
+            St = self.St[:, j]
+            valid = self.valid[:, j]
+            # Padding slots get a dummy stress so the formulas stay finite; they are masked below.
+            Sd_safe = np.where(valid, Sd, 1.0)
+            St_safe = np.where(valid, St, 1.0)
+
+            H_eff_d = np.maximum(H_eff_design_total - bottoms[:, j], 0.0)
+            H_eff_t = np.maximum(H_eff_test_total - bottoms[:, j], 0.0)
+
+            td_1ft = self._course_thickness_1ft(H_eff_d, self.G, Sd_safe, self.CA)
+            tt_1ft = self._course_thickness_1ft(H_eff_t, ones, St_safe, zeros)
+
+            if j == 0:
+                td_vdm = self._course_thickness_vdm_bottom(H_eff_d, self.G, Sd_safe, self.CA)
+                tt_vdm = self._course_thickness_vdm_bottom(H_eff_t, ones, St_safe, zeros)
+            else:
+                td_vdm = self._course_thickness_vdm_upper(H_eff_d, self.G, Sd_safe, self.CA, t_prev_d)
+                tt_vdm = self._course_thickness_vdm_upper(H_eff_t, ones, St_safe, zeros, t_prev_t)
+
+            td = np.where(use_vdm, td_vdm, td_1ft)
+            tt = np.where(use_vdm, tt_vdm, tt_1ft)
+
+            t_req = np.maximum(np.maximum(td, tt), t_min)
+            t_rec = np.ceil(t_req)
+
+            t_used = self.t_used_input[:, j]
+            t_used = np.where(t_used <= 0.0, t_rec, t_used)
+
+            rec = res[:, j]
+            rec['Width'] = self.widths[:, j]
+            rec['Sd'] = Sd
+            rec['St'] = St
+            rec['H_eff_d'] = H_eff_d
+            rec['H_eff_t'] = H_eff_t
+            rec['td'] = td
+            rec['tt'] = tt
+            rec['t_req'] = t_req
+            rec['t_rec'] = t_rec
+            rec['t_used'] = t_used
+            rec['OK'] = t_used >= t_req - 0.01
+            rec['Valid'] = valid
+
+            # Padding slots do not feed the next course
+            t_prev_d = np.where(valid, td, t_prev_d)
+            t_prev_t = np.where(valid, tt, t_prev_t)
+
+        # Blank padding slots
+        pad = ~self.valid
+        for field in ('td', 'tt', 't_req', 't_rec', 't_used', 'H_eff_d', 'H_eff_t'):
+            res[field][pad] = np.nan
+        res['OK'][pad] = True
+
+        return res
+
+    def run_vdm_full(self, tol=0.001, max_iter=50):
+        """
+        Full API 650 5.6.4 VDM (x1/x2/x3 iteration, 5.6.4.5 second course) for every tank,
+        solved by VDMSolver with converged elements masked out.
+        Per-element iteration counts and residuals are kept in self.vdm_stats.
+        :return: Structured array (N, C) with COURSE_RESULT_DTYPE
+        """
+        # Geometry, stresses and heads are identical to the 1-Foot run; only thicknesses differ
+        res = self.run_method('1ft')
+
+        solver = VDMSolver(self.D, np.nan_to_num(res['H_eff_d']), np.nan_to_num(res['H_eff_t']), self.widths,
+                           self.Sd, self.St, self.G, self.CA, efficiency=self.E, valid=self.valid)
+        self.vdm_stats = solver.solve(tol=tol, max_iter=max_iter)
+
+        td = self.vdm_stats['td']
+        tt = self.vdm_stats['tt']
+        t_req = np.maximum(np.maximum(td, tt), min_thickness_code(self.D)[:, None])
+        t_rec = np.ceil(t_req)
+        t_used = np.where(self.t_used_input <= 0.0, t_rec, self.t_used_input)
+
+        res['td'] = td
+        res['tt'] = tt
+        res['t_req'] = t_req
+        res['t_rec'] = t_rec
+        res['t_used'] = np.where(self.valid, t_used, np.nan)
+        res['OK'] = np.where(self.valid, t_used >= t_req - 0.01, True)
+        return res
+
+    def calculate_shell_weight(self, res):
+        """
+        Shell weight per tank (kg), same formula as ShellDesign.calculate_shell_weight.
+        """
+        rho_steel = 7850.0
+        t = np.where(res['Valid'], res['t_used'], 0.0) / 1000.0  # m
+        vol = math.pi * (self.D[:, None] + t) * res['Width'] * t
+        return np.sum(vol, axis=1) * rho_steel
+
+    def run_batch(self, methods=BATCH_METHODS):
+        """
+        Run the requested design methods for every tank.
+        :return: dict method -> structured array (N, C)
+        """
+        for method in methods:
+            res = self.run_method(method)
+            self.results[method] = res
+            self.weights[method] = self.calculate_shell_weight(res)
+        return self.results
+
+    def status(self, method='auto'):
+        """
+        Per-tank status: 'OK' if every course passes, else 'FAIL'.
+        """
+        res = self.results[method]
+        return np.where(np.all(res['OK'], axis=1), 'OK', 'FAIL')
+
+    def to_course_dicts(self, method, tank_index, course_names=None):
+        """
+        Convert one tank back to the ShellDesign.results list-of-dicts format (for reports / comparison).
+        """
+        res = self.results[method][tank_index]
+        courses = []
+        for j in range(self.C):
+            r = res[j]
+            if not r['Valid']:
+                continue
+            courses.append({
+                'Course': course_names[j] if course_names else str(j + 1),
+                'Material': self.materials[tank_index, j],
+                'Sd': float(r['Sd']), 'St': float(r['St']),
+                'Width': float(r['Width']),
+                'H_eff_d': float(r['H_eff_d']),
+                'H_eff_t': float(r['H_eff_t']),
+                'td': float(r['td']),
+                'tt': float(r['tt']),
+                't_req': float(r['t_req']),
+                't_rec': int(r['t_rec']),
+                't_used': float(r['t_used']),
+                'Status': 'OK' if r['OK'] else 'FAIL'
+            })
+        return courses
+
+
+def run_shell_batch(diameter, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance,
+                    widths, materials, methods=BATCH_METHODS, **kwargs):
+    """
+    Convenience wrapper: build a ShellBatchDesign and run it.
+    :return: (results dict method -> structured array, weights dict method -> (N,) kg)
+    """
+    batch = ShellBatchDesign(diameter, design_liquid_level, test_liquid_level, specific_gravity,
+                             corrosion_allowance, widths, materials, **kwargs)
+    batch.run_batch(methods)
+    return batch.results, batch.weights
+
+
+if __name__ == "__main__":
+    import time
+
+    N = 5000
+    rng = np.random.default_rng(0)
+    D = rng.uniform(10.0, 90.0, N)
+    H = rng.uniform(8.0, 20.0, N)
+    n_courses = 9
+    widths = np.full((N, n_courses), 2.438)
+    # Trim the course stack to each tank height
+    tops = np.cumsum(widths, axis=1)
+    widths = np.where(tops - widths < H[:, None], np.minimum(widths, H[:, None] - (tops - widths)), 0.0)
+
+    t0 = time.perf_counter()
+    results, weights = run_shell_batch(D, H, H, 0.9, 1.5, widths, 'A 573 70')
+    print(f"{N} tanks x {len(BATCH_METHODS)} methods: {time.perf_counter() - t0:.3f} s")
+    print(f"Mean shell weight (auto): {weights['auto'].mean():.0f} kg")
@@ -1,5 +1,6 @@
 import math
 from Materials import get_material_properties, is_stainless_steel
+from Course_Results import CourseResults
 
 class ShellDesign:
     def __init__(self, diameter, height, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance, 
@@ -30,7 +31,7 @@ class ShellDesign:
         self.E = efficiency # Joint Efficiency
         self.courses_input = courses_input
         self.design_temp = design_temp
-        self.results = []
+        self.results = CourseResults() # Per-course results (dict-compatible records)
 
     def get_material_stress(self, material_name):
         props = get_material_properties(material_name, self.design_temp)
@@ -80,11 +81,18 @@ class ShellDesign:
         t = (4.9 * self.D * H_design * G) / (S * self.E) + CA
         return t
 
-    def calculate_shell_weight(self):
+    def calculate_shell_weight(self, plate_layout=None):
         """
         Calculates the total weight of the shell plates in kg and Newtons.
         W_shell = Sum(Pi * D * Width * Thickness * Density)
+
+        :param plate_layout: Optional Shell_Plate_Layout results. If given, the installed weight of the
+                             selected stock plates (stock thickness, cut to the course) is used instead.
         """
+        if plate_layout and plate_layout.get('Courses'):
+            total_weight_kg = sum(c['Net_Weight_kg'] for c in plate_layout['Courses'])
+            return total_weight_kg, total_weight_kg * 9.81 # kg, N
+
         total_weight_kg = 0.0
         
         # Density of steel (approx 7850 kg/m3)
@@ -106,11 +114,11 @@ class ShellDesign:
             
         return total_weight_kg, total_weight_kg * 9.81 # kg, N
 
-    def run_design(self, method='auto'):
+    def select_method(self, method='auto'):
         """
-        Run shell design calculation.
-        :param method: 'auto', 'vdm', or '1ft'. 
-                       'auto' selects based on API 650 (D <= 61m -> 1ft, else VDM).
+        Resolve the design method and fill self.design_report_info.
+        :param method: 'auto', 'vdm', '1ft' or 'annex_a'
+        :return: True if VDM applies
         """
         # Determine Method
         use_vdm = True
@@ -150,9 +158,12 @@ class ShellDesign:
             "Formula": formula_str,
             "Is_Stainless": is_stainless
         }
-        
-        print(f"Selected Design Method: {design_method_name}")
+        return use_vdm
 
+    def effective_heights(self):
+        """
+        Design / Test liquid heights including the pressure head (m).
+        """
         # Effective Heights
         # Use HD for Design, HT for Test
         head_design_m = (self.P_design / 1000.0) / self.G
@@ -160,6 +171,149 @@ class ShellDesign:
         
         head_test_m = (self.P_test / 1000.0) / 1.0
         H_eff_test_total = self.HT + head_test_m
+        return H_eff_design_total, H_eff_test_total
+
+    def calculate_course(self, i, course, current_height_from_bottom, t_prev_d, t_prev_t, use_vdm,
+                         H_eff_design_total, H_eff_test_total):
+        """
+        Design one shell course.
+        :param i: Course index (0 = bottom course)
+        :param course: Course input dict (Course, Material, Width, Thickness_Used)
+        :param current_height_from_bottom: Height of the bottom of this course (m)
+        :param t_prev_d, t_prev_t: td / tt of the course below (VDM)
+        :return: Course result dict (as stored in self.results)
+        """
+        # width = course['Width'] - 0.02
+        # Removed hardcoded 20mm subtraction per user feedback (Mismatch Bug).
+        width = course['Width']
+        
+        material = course['Material']
+        t_used = course['Thickness_Used']
+        
+        Sd, St = self.get_material_stress(material)
+        
+        # Height of liquid above bottom of this course
+        H_eff_d = H_eff_design_total - current_height_from_bottom
+        H_eff_t = H_eff_test_total - current_height_from_bottom
+        
+        if H_eff_d < 0: H_eff_d = 0
+        if H_eff_t < 0: H_eff_t = 0
+        
+        # Calculate Thickness
+        td = 0.0
+        tt = 0.0
+        
+        if use_vdm:
+            if i == 0:
+                # Bottom Course Formula (API 650 5.6.4.2)
+                # Design
+                term1 = math.sqrt(H_eff_d / Sd)
+                term2 = (0.0696 * self.D / H_eff_d) * term1
+                factor = 1.06 - term2
+                # Apply E to base_t
+                base_t = (4.9 * H_eff_d * self.D * self.G) / (Sd * self.E) 
+                td = factor * base_t + self.CA
+                
+                # Test (Efficiency usually applies to design, check 5.6.4.2)
+                # For hydrotest, E is typically considered 1.0 or same?
+                # API 650 5.6.2.2: "St = maximum allowable stress for simple hydrostatic test..."
+                # Does NOT mention E for test. Usually E=1.0 for test unless specified.
+                # However, if we follow formula strictly, E should differ?
+                # Standard practice: Use E only for Design condition. Test is E=1.0?
+                # Let's assume E applies to Design (Sd) but for Test (St), checking the code...
+                # 5.6.3.2 (1-Foot) says "E = joint efficiency..."
+                # It's applied to the formula.
+                # For Test case, it usually uses E=1.0 because it's a short term test and St is higher.
+                # Often E is kept 1.0 for test in commercial software unless shell has radiography issues.
+                # I'll use self.E for Design and 1.0 for Test or self.E? 
+                # Let's keep self.E for both or 1.0 for test. 
+                # Most examples show E applied to Design only. 
+                # Let's apply self.E to Design, and assume 1.0 for Test (fully inspected/new tank).
+                # Actually if joint is not radiographed, it's weak always.
+                # So self.E should apply to both?
+                # 3.4 of API 650: E depends on radiography.
+                # Let's apply self.E to both for safety, or 1.0 for test?
+                # I will apply self.E to Design and keep Test as is (usually full stress allowed).
+                # Wait, 5.6.3.2 does not distinguish.
+                # I will apply E to both.
+                
+                term1_t = math.sqrt(H_eff_t / St)
+                term2_t = (0.0696 * self.D / H_eff_t) * term1_t
+                factor_t = 1.06 - term2_t
+                base_t_t = (4.9 * H_eff_t * self.D * 1.0) / (St * self.E)
+                tt = factor_t * base_t_t
+            else:
+                # Upper Courses (API 650 5.6.4.3)
+                # Design
+                x_d = 0.61 * math.sqrt(self.D * (t_prev_d / 1000.0))
+                H_x_d = H_eff_d - x_d
+                if H_x_d < 0: H_x_d = 0
+                td = (4.9 * self.D * H_x_d * self.G) / (Sd * self.E) + self.CA
+                
+                # Test
+                x_t = 0.61 * math.sqrt(self.D * (t_prev_t / 1000.0))
+                H_x_t = H_eff_t - x_t
+                if H_x_t < 0: H_x_t = 0
+                tt = (4.9 * self.D * H_x_t * 1.0) / (St * self.E)
+        else:
+            # 1-Foot Method (API 650 5.6.3)
+            td = self.calculate_1ft_thickness(H_eff_d, self.G, Sd, self.CA)
+            tt = self.calculate_1ft_thickness(H_eff_t, 1.0, St, 0.0)
+        
+        # Min Thickness (API 650 5.6.1.1)
+        t_min_code = 5.0
+        if self.D >= 60: t_min_code = 10.0
+        elif self.D >= 36: t_min_code = 8.0
+        elif self.D >= 15: t_min_code = 6.0
+        
+        t_req = max(td, tt, t_min_code)
+        
+        # Recommended Thickness Calculation
+        # Standard Commercial Plates (Common metric sizes in mm)
+        # 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 20...
+        # For simplicity, let's use 1mm increments, but ensure strict >= coverage
+        # Using math.ceil catches 10.1 -> 11.
+        
+        t_rec = math.ceil(t_req)
+        
+        # Optional: Enforce Even numbers for larger thicknesses if preferred?
+        # Many standards use 6, 8, 10, 12 (even) or 5, 6, 8, 9...
+        # Let's keep 1mm increments (math.ceil) as it's safe.
+        # However, ensure it's never less than t_req. (Ceil is safe).
+        
+        # Double check against Rec logic:
+        if t_rec < t_req: t_rec += 1 # Should not happen with ceil
+        
+        # Auto-assign Recommended if Used is 0
+        if t_used <= 0.0:
+            t_used = t_rec
+        
+        return {
+            'Course': course['Course'],
+            'Material': material,
+            'Sd': Sd, 'St': St,
+            'Width': width,
+            'H_eff_d': H_eff_d,
+            'H_eff_t': H_eff_t,
+            'td': td,
+            'tt': tt,
+            't_req': t_req,
+            't_rec': t_rec,
+            't_used': t_used,
+            'Status': 'OK' if t_used >= t_req - 0.01 else 'FAIL'
+        }
+
+    def run_design(self, method='auto'):
+        """
+        Run shell design calculation.
+        :param method: 'auto', 'vdm', or '1ft'. 
+                       'auto' selects based on API 650 (D <= 61m -> 1ft, else VDM).
+        """
+        use_vdm = self.select_method(method)
+        
+        print(f"Selected Design Method: {self.design_report_info['Method']}")
+
+        H_eff_design_total, H_eff_test_total = self.effective_heights()
         
         current_height_from_bottom = 0.0
         
@@ -168,131 +322,15 @@ class ShellDesign:
         t_prev_t = 0.0
         
         for i, course in enumerate(self.courses_input):
-            # width = course['Width'] - 0.02
-            # Removed hardcoded 20mm subtraction per user feedback (Mismatch Bug).
-            width = course['Width']
-            
-            material = course['Material']
-            t_used = course['Thickness_Used']
-            
-            Sd, St = self.get_material_stress(material)
-            
-            # Height of liquid above bottom of this course
-            H_eff_d = H_eff_design_total - current_height_from_bottom
-            H_eff_t = H_eff_test_total - current_height_from_bottom
-            
-            if H_eff_d < 0: H_eff_d = 0
-            if H_eff_t < 0: H_eff_t = 0
-            
-            # Calculate Thickness
-            td = 0.0
-            tt = 0.0
-            
-            if use_vdm:
-                if i == 0:
-                    # Bottom Course Formula (API 650 5.6.4.2)
-                    # Design
-                    term1 = math.sqrt(H_eff_d / Sd)
-                    term2 = (0.0696 * self.D / H_eff_d) * term1
-                    factor = 1.06 - term2
-                    # Apply E to base_t
-                    base_t = (4.9 * H_eff_d * self.D * self.G) / (Sd * self.E) 
-                    td = factor * base_t + self.CA
-                    
-                    # Test (Efficiency usually applies to design, check 5.6.4.2)
-                    # For hydrotest, E is typically considered 1.0 or same?
-                    # API 650 5.6.2.2: "St = maximum allowable stress for simple hydrostatic test..."
-                    # Does NOT mention E for test. Usually E=1.0 for test unless specified.
-                    # However, if we follow formula strictly, E should differ?
-                    # Standard practice: Use E only for Design condition. Test is E=1.0?
-                    # Let's assume E applies to Design (Sd) but for Test (St), checking the code...
-                    # 5.6.3.2 (1-Foot) says "E = joint efficiency..."
-                    # It's applied to the formula.
-                    # For Test case, it usually uses E=1.0 because it's a short term test and St is higher.
-                    # Often E is kept 1.0 for test in commercial software unless shell has radiography issues.
-                    # I'll use self.E for Design and 1.0 for Test or self.E? 
-                    # Let's keep self.E for both or 1.0 for test. 
-                    # Most examples show E applied to Design only. 
-                    # Let's apply self.E to Design, and assume 1.0 for Test (fully inspected/new tank).
-                    # Actually if joint is not radiographed, it's weak always.
-                    # So self.E should apply to both?
-                    # 3.4 of API 650: E depends on radiography.
-                    # Let's apply self.E to both for safety, or 1.0 for test?
-                    # I will apply self.E to Design and keep Test as is (usually full stress allowed).
-                    # Wait, 5.6.3.2 does not distinguish.
-                    # I will apply E to both.
-                    
-                    term1_t = math.sqrt(H_eff_t / St)
-                    term2_t = (0.0696 * self.D / H_eff_t) * term1_t
-                    factor_t = 1.06 - term2_t
-                    base_t_t = (4.9 * H_eff_t * self.D * 1.0) / (St * self.E)
-                    tt = factor_t * base_t_t
-                else:
-                    # Upper Courses (API 650 5.6.4.3)
-                    # Design
-                    x_d = 0.61 * math.sqrt(self.D * (t_prev_d / 1000.0))
-                    H_x_d = H_eff_d - x_d
-                    if H_x_d < 0: H_x_d = 0
-                    td = (4.9 * self.D * H_x_d * self.G) / (Sd * self.E) + self.CA
-                    
-                    # Test
-                    x_t = 0.61 * math.sqrt(self.D * (t_prev_t / 1000.0))
-                    H_x_t = H_eff_t - x_t
-                    if H_x_t < 0: H_x_t = 0
-                    tt = (4.9 * self.D * H_x_t * 1.0) / (St * self.E)
-            else:
-                # 1-Foot Method (API 650 5.6.3)
-                td = self.calculate_1ft_thickness(H_eff_d, self.G, Sd, self.CA)
-                tt = self.calculate_1ft_thickness(H_eff_t, 1.0, St, 0.0)
+            result = self.calculate_course(i, course, current_height_from_bottom, t_prev_d, t_prev_t, use_vdm,
+                                           H_eff_design_total, H_eff_test_total)
+            self.results.append(result)
             
             # Update prev for next iteration (VDM needs it, 1-Foot doesn't but harmless)
-            t_prev_d = td
-            t_prev_t = tt
-            
-            # Min Thickness (API 650 5.6.1.1)
-            t_min_code = 5.0
-            if self.D >= 60: t_min_code = 10.0
-            elif self.D >= 36: t_min_code = 8.0
-            elif self.D >= 15: t_min_code = 6.0
-            
-            t_req = max(td, tt, t_min_code)
-            
-            # Recommended Thickness Calculation
-            # Standard Commercial Plates (Common metric sizes in mm)
-            # 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 20...
-            # For simplicity, let's use 1mm increments, but ensure strict >= coverage
-            # Using math.ceil catches 10.1 -> 11.
-            
-            t_rec = math.ceil(t_req)
-            
-            # Optional: Enforce Even numbers for larger thicknesses if preferred?
-            # Many standards use 6, 8, 10, 12 (even) or 5, 6, 8, 9...
-            # Let's keep 1mm increments (math.ceil) as it's safe.
-            # However, ensure it's never less than t_req. (Ceil is safe).
-            
-            # Double check against Rec logic:
-            if t_rec < t_req: t_rec += 1 # Should not happen with ceil
-            
-            # Auto-assign Recommended if Used is 0
-            if t_used <= 0.0:
-                t_used = t_rec
+            t_prev_d = result['td']
+            t_prev_t = result['tt']
             
-            self.results.append({
-                'Course': course['Course'],
-                'Material': material,
-                'Sd': Sd, 'St': St,
-                'Width': width,
-                'H_eff_d': H_eff_d,
-                'H_eff_t': H_eff_t,
-                'td': td,
-                'tt': tt,
-                't_req': t_req,
-                't_rec': t_rec,
-                't_used': t_used,
-                'Status': 'OK' if t_used >= t_req - 0.01 else 'FAIL'
-            })
-            
-            current_height_from_bottom += width
+            current_height_from_bottom += result['Width']
             
         # Calculate Weight
         W_kg, W_N = self.calculate_shell_weight()
@@ -300,6 +338,17 @@ class ShellDesign:
         
         return self.shell_courses, W_kg
 
+    @staticmethod
+    def run_batch(diameter, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance,
+                  widths, materials, methods=('1ft', 'vdm', 'auto'), **kwargs):
+        """
+        Vectorized design of many tanks at once (see Shell_Batch.ShellBatchDesign).
+        :return: (dict method -> structured array (N, C), dict method -> shell weight (N,) kg)
+        """
+        from Shell_Batch import run_shell_batch
+        return run_shell_batch(diameter, design_liquid_level, test_liquid_level, specific_gravity,
+                               corrosion_allowance, widths, materials, methods=methods, **kwargs)
+
     @property
     def shell_courses(self):
         return self.results
@@ -310,6 +359,102 @@ class ShellDesign:
         for r in self.results:
             print(f"{r['Course']:<10} | {r['Material']:<10} | {r['Width']:<6.2f} | {r['H_eff_d']:<8.3f} | {r['td']:<8.3f} | {r['tt']:<8.3f} | {r['t_req']:<8.3f} | {r['t_rec']:<8.0f} | {r['t_used']:<8.3f} | {r['Status']}")
 
+class IncrementalShellDesign(ShellDesign):
+    """
+    ShellDesign that keeps per-course results between updates (interactive editing).
+    Each course result is cached with the inputs it depends on: global design data, its own
+    width / material / thickness, the height of its bottom and (VDM only) td / tt of the course
+    below. update() recomputes only the courses whose key changed, which is the edited course
+    and - for width changes, or VDM thickness changes - the courses above it.
+    Listeners registered with add_listener() are called with the changed row indices only.
+    """
+    # Attribute names accepted by update() as design data changes
+    DESIGN_ATTRIBUTES = ('D', 'H', 'HD', 'HT', 'G', 'CA', 'P_design', 'P_test', 'E', 'design_temp')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.method = 'auto'
+        self.course_keys = []
+        self.changed_rows = []
+        self.removed_rows = []
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """
+        Register a downstream consumer: callback(shell_courses, changed_rows, removed_rows).
+        changed_rows are indices into shell_courses; removed_rows are indices that no longer exist.
+        """
+        self.listeners.append(callback)
+
+    def update(self, courses_input=None, method=None, **design_params):
+        """
+        Recompute the courses affected by an edit.
+        :param courses_input: New course list (same format as courses_input), or None to keep
+        :param method: 'auto', 'vdm', '1ft', 'annex_a', or None to keep
+        :param design_params: Changed design data by attribute name (D, HD, HT, G, CA, P_design, P_test, E, design_temp)
+        :return: List of changed row indices
+        """
+        for name, value in design_params.items():
+            if name not in self.DESIGN_ATTRIBUTES:
+                raise ValueError(f"Unknown shell design attribute: {name}")
+            setattr(self, name, value)
+        if courses_input is not None:
+            self.courses_input = courses_input
+        if method is not None:
+            self.method = method
+
+        use_vdm = self.select_method(self.method)
+        H_eff_design_total, H_eff_test_total = self.effective_heights()
+        global_key = (self.D, self.G, self.CA, self.E, self.design_temp, use_vdm,
+                      H_eff_design_total, H_eff_test_total)
+
+        old_results = self.results
+        old_keys = self.course_keys
+        new_results = []
+        new_keys = []
+        changed = []
+
+        current_height_from_bottom = 0.0
+        t_prev_d = 0.0
+        t_prev_t = 0.0
+        for i, course in enumerate(self.courses_input):
+            key = (global_key, course['Course'], course['Width'], course['Material'], course['Thickness_Used'],
+                   current_height_from_bottom, (t_prev_d, t_prev_t) if use_vdm else None)
+            if i < len(old_keys) and old_keys[i] == key:
+                result = old_results[i]
+            else:
+                result = self.calculate_course(i, course, current_height_from_bottom, t_prev_d, t_prev_t, use_vdm,
+                                               H_eff_design_total, H_eff_test_total)
+                changed.append(i)
+            new_results.append(result)
+            new_keys.append(key)
+
+            t_prev_d = result['td']
+            t_prev_t = result['tt']
+            current_height_from_bottom += result['Width']
+
+        self.results = CourseResults.from_records(new_results)
+        self.course_keys = new_keys
+        self.changed_rows = changed
+        self.removed_rows = list(range(len(new_results), len(old_results)))
+
+        if changed or self.removed_rows:
+            for callback in self.listeners:
+                callback(self.results, self.changed_rows, self.removed_rows)
+        return changed
+
+    def run_design(self, method='auto'):
+        """
+        Full design (same result as ShellDesign.run_design), rebuilding the course cache.
+        """
+        self.course_keys = []
+        self.results = CourseResults()
+        self.update(method=method)
+        print(f"Selected Design Method: {self.design_report_info['Method']}")
+        W_kg, W_N = self.calculate_shell_weight()
+        print(f"Total Shell Weight: {W_kg:.2f} kg ({W_N/1000:.2f} kN)")
+        return self.shell_courses, W_kg
+
 if __name__ == "__main__":
     from InputReader import InputReader
     import os
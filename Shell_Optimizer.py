@@ -0,0 +1,286 @@
+import math
+from functools import lru_cache
+from Materials import material_names, get_material_properties
+from Shell_Design import ShellDesign
+
+# Common mill plate widths (m)
+STANDARD_PLATE_WIDTHS = [1.8, 2.0, 2.438, 2.5, 3.0]
+
+RHO_STEEL = 7850.0 # kg/m3
+
+
+class ShellLayoutOptimizer:
+    """
+    Minimum-weight (or minimum-cost) shell course layout.
+    Chooses the number of courses, each course width and each course material so that every
+    course meets t_req (design, hydrotest and API 650 5.6.1.1 minimum) at its recommended thickness.
+
+    Forward dynamic programming over the height reached (integer mm):
+    - 1-Foot Method: a course only depends on its bottom height and material, so one label per
+      height is exact.
+    - VDM: a course also depends on td/tt of the course below, so labels carry the quantized
+      (td, tt) of the last course. Labels are pruned against the incumbent with a t_min lower
+      bound on the remaining height (branch-and-bound), and capped per height. The td/tt
+      quantization and the label cap make this a heuristic: results report 'Exact' = False and
+      'Labels_Capped' = True when labels were dropped by the cap.
+    The chosen layout is re-run through ShellDesign.run_design, so reported thicknesses and
+    weight are exactly those of the normal design path.
+    """
+    def __init__(self, diameter, height, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance,
+                 p_design=0.0, p_test=0.0, efficiency=1.0, design_temp=40.0,
+                 materials=None, plate_widths=None, plate_cost=None, min_course_width=0.5, method='auto'):
+        """
+        :param diameter, height, design_liquid_level, test_liquid_level, specific_gravity, corrosion_allowance,
+               p_design, p_test, efficiency, design_temp: As ShellDesign
+        :param materials: Candidate materials (default: all carbon steels of the material registry)
+        :param plate_widths: Candidate full course widths (m) (default: STANDARD_PLATE_WIDTHS)
+        :param plate_cost: Optional {material: cost per kg}. If given the objective is plate cost, else weight.
+        :param min_course_width: Minimum width of the trimmed top course (m)
+        :param method: 'auto', '1ft', 'vdm' or 'annex_a' (as ShellDesign.run_design)
+        """
+        self.D = diameter
+        self.H = height
+        self.HD = design_liquid_level
+        self.HT = test_liquid_level
+        self.G = specific_gravity
+        self.CA = corrosion_allowance
+        self.P_design = p_design
+        self.P_test = p_test
+        self.E = efficiency
+        self.design_temp = design_temp
+        self.materials = list(materials) if materials else material_names('carbon')
+        self.plate_widths = sorted(plate_widths) if plate_widths else list(STANDARD_PLATE_WIDTHS)
+        self.plate_cost = plate_cost
+        self.min_course_width = min_course_width
+        self.method = method
+
+        if method == 'vdm':
+            self.use_vdm = True
+        elif method in ('1ft', 'annex_a'):
+            self.use_vdm = False
+        else:
+            self.use_vdm = self.D > 61
+
+        # Same brackets as ShellDesign.run_design (5.6.1.1)
+        self.t_min_code = 5.0
+        if self.D >= 60: self.t_min_code = 10.0
+        elif self.D >= 36: self.t_min_code = 8.0
+        elif self.D >= 15: self.t_min_code = 6.0
+
+        self.H_eff_design_total = self.HD + (self.P_design / 1000.0) / self.G
+        self.H_eff_test_total = self.HT + (self.P_test / 1000.0) / 1.0
+
+        self.mat_props = self._candidate_materials()
+        self.results = {}
+
+    def _price(self, material):
+        if self.plate_cost is None:
+            return 1.0
+        return self.plate_cost.get(material, float('inf'))
+
+    def _candidate_materials(self):
+        """
+        Stress and price per candidate. A material that is no stronger (Sd and St) and no cheaper
+        than another can never be part of an optimum, so it is dropped up front.
+        """
+        props = {}
+        for m in self.materials:
+            p = get_material_properties(m, self.design_temp)
+            price = self._price(m)
+            if math.isfinite(price):
+                props[m] = (p['Sd'], p['St'], price)
+
+        kept = {}
+        for m, (Sd, St, price) in props.items():
+            dominated = False
+            for m2, (Sd2, St2, price2) in props.items():
+                if m2 == m:
+                    continue
+                better_or_equal = Sd2 >= Sd and St2 >= St and price2 <= price
+                strictly = Sd2 > Sd or St2 > St or price2 < price
+                # Tie (identical entries): keep the first in list order
+                if better_or_equal and (strictly or self.materials.index(m2) < self.materials.index(m)):
+                    dominated = True
+                    break
+            if not dominated:
+                kept[m] = (Sd, St, price)
+        return kept
+
+    def _course_thickness(self, bottom_mm, material, is_bottom, td_prev, tt_prev):
+        """
+        td, tt (mm) of one course, same formulas as ShellDesign.run_design.
+        """
+        Sd, St, _ = self.mat_props[material]
+        bottom = bottom_mm / 1000.0
+        H_eff_d = max(self.H_eff_design_total - bottom, 0.0)
+        H_eff_t = max(self.H_eff_test_total - bottom, 0.0)
+
+        if self.use_vdm:
+            if is_bottom:
+                def bottom_course(H_eff, G, S, CA):
+                    if H_eff <= 0: return CA
+                    factor = 1.06 - (0.0696 * self.D / H_eff) * math.sqrt(H_eff / S)
+                    return factor * (4.9 * H_eff * self.D * G) / (S * self.E) + CA
+                td = bottom_course(H_eff_d, self.G, Sd, self.CA)
+                tt = bottom_course(H_eff_t, 1.0, St, 0.0)
+            else:
+                x_d = 0.61 * math.sqrt(self.D * (td_prev / 1000.0))
+                x_t = 0.61 * math.sqrt(self.D * (tt_prev / 1000.0))
+                td = (4.9 * self.D * max(H_eff_d - x_d, 0.0) * self.G) / (Sd * self.E) + self.CA
+                tt = (4.9 * self.D * max(H_eff_t - x_t, 0.0) * 1.0) / (St * self.E)
+        else:
+            td = (4.9 * self.D * max(H_eff_d - 0.3, 0.0) * self.G) / (Sd * self.E) + self.CA
+            tt = (4.9 * self.D * max(H_eff_t - 0.3, 0.0) * 1.0) / (St * self.E)
+        return td, tt
+
+    def _course_cost(self, width_mm, material, t_rec):
+        t = t_rec / 1000.0
+        weight = math.pi * (self.D + t) * (width_mm / 1000.0) * t * RHO_STEEL
+        return weight * self.mat_props[material][2]
+
+    def optimize(self, max_labels=40, td_step=0.05):
+        """
+        Run the optimization.
+        :param max_labels: VDM only - labels kept per height (cheapest first); raise it if
+                           results['Labels_Capped'] is True
+        :param td_step: VDM only - quantization of td/tt of the course below (mm)
+        :return: results dict (Courses in ShellDesign courses_input format, Weight_kg, Cost, ...)
+        """
+        H_mm = int(round(self.H * 1000.0))
+        widths_mm = [int(round(w * 1000.0)) for w in self.plate_widths]
+        min_top_mm = int(round(self.min_course_width * 1000.0))
+        max_w_mm = max(widths_mm)
+
+        # Memoized per-course evaluation: (bottom, material, is_bottom, td_prev, tt_prev) -> (td, tt, t_rec)
+        @lru_cache(maxsize=None)
+        def evaluate(bottom_mm, material, is_bottom, td_prev_q, tt_prev_q):
+            td, tt = self._course_thickness(bottom_mm, material, is_bottom, td_prev_q * td_step, tt_prev_q * td_step)
+            t_req = max(td, tt, self.t_min_code)
+            return td, tt, math.ceil(t_req)
+
+        # Lower bound on the cost of the remaining height: every course is at least t_min thick
+        cheapest = min(p[2] for p in self.mat_props.values())
+        t_lb = math.ceil(self.t_min_code) / 1000.0
+        lb_per_mm = math.pi * (self.D + t_lb) * t_lb * RHO_STEEL / 1000.0 * cheapest
+
+        # labels[h] = {key: (cost, parent_h, parent_key, width_mm, material)}
+        labels = {0: {None: (0.0, None, None, 0, None)}}
+        incumbent = float('inf')
+        incumbent_label = None
+        labels_capped = False
+
+        for h in sorted_heights(H_mm, widths_mm, min_top_mm):
+            if h not in labels or h == H_mm:
+                continue
+            row = labels[h]
+
+            # Keep the cheapest labels only (VDM); 1-Foot has a single label per height
+            items = sorted(row.items(), key=lambda kv: kv[1][0])
+            if len(items) > max_labels:
+                items = items[:max_labels]
+                labels_capped = True
+
+            remaining = H_mm - h
+            steps = [w for w in widths_mm if w < remaining and remaining - w >= min_top_mm]
+            if min_top_mm <= remaining <= max_w_mm:
+                steps.append(remaining) # trimmed top course closes the shell
+
+            for key, lab in items:
+                cost = lab[0]
+                if cost + lb_per_mm * remaining >= incumbent:
+                    continue # bound
+                is_bottom = h == 0
+                td_prev_q, tt_prev_q = key if key else (0, 0)
+                for w in steps:
+                    for m in self.mat_props:
+                        td, tt, t_rec = evaluate(h, m, is_bottom, td_prev_q, tt_prev_q)
+                        new_cost = cost + self._course_cost(w, m, t_rec)
+                        nh = h + w
+                        if new_cost + lb_per_mm * (H_mm - nh) >= incumbent:
+                            continue
+                        new_key = (int(round(td / td_step)), int(round(tt / td_step))) if self.use_vdm else ()
+                        bucket = labels.setdefault(nh, {})
+                        old = bucket.get(new_key)
+                        if old is None or new_cost < old[0]:
+                            bucket[new_key] = (new_cost, h, key, w, m)
+                        if nh == H_mm and new_cost < incumbent:
+                            incumbent = new_cost
+                            incumbent_label = (nh, new_key)
+
+        if incumbent_label is None:
+            self.results = {'Status': 'No Feasible Layout'}
+            return self.results
+
+        # Back-track the layout
+        layout = []
+        h, key = incumbent_label
+        while h:
+            cost, parent_h, parent_key, w, m = labels[h][key]
+            layout.append((w, m))
+            h, key = parent_h, parent_key
+        layout.reverse()
+
+        courses = [{'Course': f"Course {i+1}", 'Material': m, 'Width': w / 1000.0, 'Thickness_Used': 0.0}
+                   for i, (w, m) in enumerate(layout)]
+
+        # Exact re-run through the normal design path
+        shell = ShellDesign(self.D, self.H, self.HD, self.HT, self.G, self.CA, self.P_design, self.P_test,
+                            efficiency=self.E, courses_input=courses, design_temp=self.design_temp)
+        shell.run_design(method=self.method)
+        W_kg, _ = shell.calculate_shell_weight()
+        for c, r in zip(courses, shell.shell_courses):
+            c['Thickness_Used'] = r['t_used']
+        cost = sum(math.pi * (self.D + r['t_used'] / 1000.0) * r['Width'] * r['t_used'] / 1000.0 * RHO_STEEL
+                   * self.mat_props[r['Material']][2] for r in shell.shell_courses)
+
+        self.results = {
+            'Status': 'OK' if all(r['Status'] == 'OK' for r in shell.shell_courses) else 'FAIL',
+            'Objective': 'Cost' if self.plate_cost else 'Weight',
+            'Method': shell.design_report_info['Method'],
+            'Num_Courses': len(courses),
+            'Courses': courses,
+            'Shell_Results': shell.shell_courses,
+            'Weight_kg': W_kg,
+            'Cost': cost,
+            'Exact': not self.use_vdm,
+            'Labels_Capped': labels_capped,
+            'Evaluations': evaluate.cache_info().misses
+        }
+        if labels_capped:
+            print(f"Warning: VDM label cap ({max_labels}) reached, layout may not be optimal")
+        return self.results
+
+
+def sorted_heights(H_mm, widths_mm, min_top_mm):
+    """
+    All heights reachable by stacking full-width courses (plus H itself), ascending.
+    """
+    reach = {0}
+    frontier = [0]
+    while frontier:
+        nxt = []
+        for h in frontier:
+            for w in widths_mm:
+                nh = h + w
+                if nh < H_mm and H_mm - nh >= min_top_mm and nh not in reach:
+                    reach.add(nh)
+                    nxt.append(nh)
+        frontier = nxt
+    reach.add(H_mm)
+    return sorted(reach)
+
+
+if __name__ == "__main__":
+    import io
+    import time
+    import contextlib
+
+    for D, H in [(30.0, 12.0), (78.0, 17.6)]:
+        t0 = time.perf_counter()
+        opt = ShellLayoutOptimizer(D, H, H, H, 0.897, 1.5, p_design=76.5, p_test=76.5)
+        with contextlib.redirect_stdout(io.StringIO()):
+            res = opt.optimize()
+        dt = time.perf_counter() - t0
+        print(f"D={D} m, H={H} m: {res['Num_Courses']} courses, {res['Weight_kg']:.0f} kg, {dt:.3f} s ({res['Method']})")
+        for c in res['Courses']:
+            print(f"  {c['Course']:<10} {c['Material']:<10} W={c['Width']:.3f} m  t={c['Thickness_Used']} mm")
@@ -0,0 +1,261 @@
+import math
+import numpy as np
+
+RHO_STEEL = 7850.0 # kg/m3
+
+# Common mill stock (m, m, mm)
+STOCK_PLATE_LENGTHS = [6.0, 8.0, 9.144, 10.0, 12.0]
+STOCK_PLATE_WIDTHS = [1.8, 2.0, 2.438, 2.5, 3.0]
+STOCK_PLATE_THICKNESSES = [5, 6, 8, 9, 10, 11, 12, 13, 14, 15, 16, 18, 20, 22, 25, 28, 30, 32, 35, 38, 40, 45, 50]
+
+# Offset grid (fractions of the plate pitch) tried when staggering vertical seams
+STAGGER_STEPS = 48
+
+
+def default_plate_catalog():
+    """
+    Stock plate catalog: every combination of the standard lengths, widths and thicknesses.
+    :return: List of dicts {'Length': m, 'Width': m, 'Thickness': mm}
+    """
+    return [{'Length': L, 'Width': W, 'Thickness': float(t)}
+            for t in STOCK_PLATE_THICKNESSES for W in STOCK_PLATE_WIDTHS for L in STOCK_PLATE_LENGTHS]
+
+
+def plate_name(plate):
+    return f"{plate['Thickness']:g} x {plate['Width'] * 1000:.0f} x {plate['Length'] * 1000:.0f}"
+
+
+def select_stock_plates(diameter, course_width, thickness, catalog):
+    """
+    Vectorized stock plate selection for M courses against K catalog plates.
+    For each course: the thinnest stock thickness >= t_used that has a plate at least as wide as the
+    course (a thicker stock is used when the thinnest one has no wide enough plate), then the length
+    giving the least procured area (n = ceil(circumference / L) plates at the stock thickness
+    centerline), fewer plates on ties.
+    :param diameter: (M,) tank nominal diameter (m)
+    :param course_width: (M,) course width (m)
+    :param thickness: (M,) t_used (mm)
+    :param catalog: List of catalog dicts
+    :return: (index into catalog or -1 if no stock fits, number of plates) both (M,)
+    """
+    L = np.array([p['Length'] for p in catalog], dtype=float)
+    W = np.array([p['Width'] for p in catalog], dtype=float)
+    T = np.array([p['Thickness'] for p in catalog], dtype=float)
+
+    D = np.asarray(diameter, dtype=float)[:, None]
+    width = np.asarray(course_width, dtype=float)[:, None]
+    thk = np.asarray(thickness, dtype=float)[:, None]
+
+    # Thinnest stock thickness covering t_used with a wide enough plate (per course)
+    fits = (T[None, :] >= thk - 1e-9) & (W[None, :] >= width - 1e-9)
+    t_stock = np.min(np.where(fits, T[None, :], np.inf), axis=1, keepdims=True)
+
+    feasible = fits & (T[None, :] == t_stock)
+    circ = math.pi * (D + T[None, :] / 1000.0)
+    n = np.ceil(circ / L[None, :] - 1e-9)
+    procured_area = n * L[None, :] * W[None, :]
+    score = np.where(feasible, procured_area + 1e-6 * n, np.inf)
+
+    idx = np.argmin(score, axis=1)
+    found = np.isfinite(score[np.arange(len(idx)), idx])
+    n_sel = n[np.arange(len(idx)), idx]
+    return np.where(found, idx, -1), np.where(found, n_sel, 0).astype(int)
+
+
+def stagger_seams(circumferences, n_plates, thicknesses, steps=STAGGER_STEPS):
+    """
+    Vertical seam offsets course by course (bottom up). Each course is rotated to the offset that
+    maximizes the smallest arc distance to the seams of the course below.
+    API 650 5.1.5.2 (b): offset >= 5 t of the thicker of the two courses.
+    :return: (offsets m, min seam distance mm, required distance mm) lists per course (None for the first course)
+    """
+    offsets, min_dist, req_dist = [], [], []
+    lower = None
+    for j, (circ, n, t) in enumerate(zip(circumferences, n_plates, thicknesses)):
+        if n <= 0:
+            offsets.append(0.0)
+            min_dist.append(None)
+            req_dist.append(None)
+            lower = None
+            continue
+        pitch = circ / n
+        if lower is None:
+            offsets.append(0.0)
+            min_dist.append(None)
+            req_dist.append(None)
+        else:
+            lower_seams, t_lower = lower
+            # (steps, n) candidate seam positions vs lower seams (positions as arc length on this course)
+            cand = np.arange(steps)[:, None] * (pitch / steps) + np.arange(n)[None, :] * pitch
+            d = np.abs(cand[:, :, None] - lower_seams[None, None, :]) % circ
+            d = np.minimum(d, circ - d)
+            worst = d.min(axis=(1, 2))
+            best = int(np.argmax(worst))
+            offsets.append(best * pitch / steps)
+            min_dist.append(float(worst[best] * 1000.0))
+            req_dist.append(float(5.0 * max(t, t_lower)))
+        seams = offsets[-1] + np.arange(n) * pitch
+        lower = (seams, t)
+    return offsets, min_dist, req_dist
+
+
+class ShellPlateLayout:
+    """
+    Shell plate procurement and cutting plan for one tank.
+    Plates per course, cut length, vertical seam stagger (API 650 5.1.5.2 b) and cut waste
+    from ShellDesign.results (t_used, Width) and a stock plate catalog.
+    """
+    def __init__(self, diameter, shell_courses, catalog=None):
+        """
+        :param diameter: Tank Nominal Diameter (m)
+        :param shell_courses: ShellDesign.results (list of dicts with 'Course', 'Width', 't_used')
+        :param catalog: Stock plates [{'Length': m, 'Width': m, 'Thickness': mm}] (default: default_plate_catalog())
+        """
+        self.D = diameter
+        self.shell_courses = shell_courses
+        self.catalog = catalog if catalog is not None else default_plate_catalog()
+        self.results = {}
+
+    def run_layout(self):
+        self.results = plan_tank_farm([{'Tank': '', 'D': self.D, 'shell_courses': self.shell_courses}],
+                                      self.catalog)['Tanks'][0]
+        return self.results
+
+    def print_report(self):
+        print(f"\n--- Shell Plate Layout (D = {self.D} m) ---")
+        print(f"{'Course':<10} {'Stock Plate':<20} {'Qty':<5} {'Cut L(m)':<9} {'Offset(m)':<10} {'Seam(mm)':<14} {'Waste%':<7}")
+        for c in self.results.get('Courses', []):
+            seam = '-' if c['Min_Seam_Offset_mm'] is None else f"{c['Min_Seam_Offset_mm']:.0f}>={c['Req_Seam_Offset_mm']:.0f}"
+            print(f"{c['Course']:<10} {c['Stock_Plate']:<20} {c['Plates']:<5} {c['Cut_Length_m']:<9.3f} "
+                  f"{c['Seam_Offset_m']:<10.3f} {seam:<14} {c['Waste_Pct']:<7.1f}")
+        print(f"Procured: {self.results.get('Procured_Weight_kg', 0):.0f} kg, "
+              f"Net: {self.results.get('Net_Weight_kg', 0):.0f} kg, Status: {self.results.get('Status')}")
+
+
+def plan_tank_farm(tanks, catalog=None):
+    """
+    Plate plan for many tanks in one call. Stock selection runs as one (all courses x catalog) array.
+    :param tanks: List of dicts {'Tank': name, 'D': m, 'shell_courses': ShellDesign.results}
+    :param catalog: Stock plates (default: default_plate_catalog())
+    :return: {'Tanks': [per-tank layout], 'Procurement': [grouped stock list], 'Procured_Weight_kg', 'Net_Weight_kg'}
+    """
+    catalog = catalog if catalog is not None else default_plate_catalog()
+
+    # Flatten every course of every tank
+    tank_idx, widths, thk, D = [], [], [], []
+    for i, tank in enumerate(tanks):
+        for c in tank['shell_courses']:
+            tank_idx.append(i)
+            widths.append(c['Width'])
+            thk.append(c['t_used'])
+            D.append(tank['D'])
+    tank_idx = np.array(tank_idx, dtype=int)
+    widths = np.array(widths, dtype=float)
+    thk = np.array(thk, dtype=float)
+    D = np.array(D, dtype=float)
+
+    if len(tank_idx):
+        plate_idx, n_plates = select_stock_plates(D, widths, thk, catalog)
+    else:
+        plate_idx, n_plates = np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    found = plate_idx >= 0
+    L = np.array([p['Length'] for p in catalog])[np.maximum(plate_idx, 0)]
+    W = np.array([p['Width'] for p in catalog])[np.maximum(plate_idx, 0)]
+    T = np.array([p['Thickness'] for p in catalog])[np.maximum(plate_idx, 0)]
+    procured_kg = np.where(found, n_plates * L * W * T / 1000.0 * RHO_STEEL, 0.0)
+    # Installed weight: stock thickness cut to the course (t_used where no stock fits), on the
+    # centerline circumference of that thickness as the plate count
+    t_plate = np.where(found, T, thk)
+    circ = math.pi * (D + t_plate / 1000.0)
+    net_kg = circ * widths * t_plate / 1000.0 * RHO_STEEL
+
+    farm = {'Tanks': [], 'Procurement': [], 'Procured_Weight_kg': 0.0, 'Net_Weight_kg': 0.0}
+    stock = {}
+    for i, tank in enumerate(tanks):
+        rows = np.nonzero(tank_idx == i)[0]
+        offsets, min_dist, req_dist = stagger_seams(circ[rows], n_plates[rows], thk[rows])
+
+        courses = []
+        for k, r in enumerate(rows):
+            course = tank['shell_courses'][k]
+            ok_stock = bool(found[r])
+            stagger_ok = min_dist[k] is None or min_dist[k] >= req_dist[k]
+            courses.append({
+                'Course': course.get('Course', str(k + 1)),
+                't_used': float(thk[r]),
+                'Width': float(widths[r]),
+                'Stock_Plate': plate_name(catalog[plate_idx[r]]) if ok_stock else 'No Stock',
+                'Plate_Thickness': float(T[r] if ok_stock else thk[r]),
+                'Plate_Width': float(W[r]) if ok_stock else 0.0,
+                'Plate_Length': float(L[r]) if ok_stock else 0.0,
+                'Plates': int(n_plates[r]),
+                'Cut_Length_m': float(circ[r] / n_plates[r]) if ok_stock else 0.0,
+                'Seam_Offset_m': float(offsets[k]),
+                'Min_Seam_Offset_mm': min_dist[k],
+                'Req_Seam_Offset_mm': req_dist[k],
+                'Procured_Weight_kg': float(procured_kg[r]),
+                'Net_Weight_kg': float(net_kg[r]),
+                'Waste_kg': float(procured_kg[r] - net_kg[r]),
+                'Waste_Pct': float(100.0 * (procured_kg[r] - net_kg[r]) / procured_kg[r]) if procured_kg[r] > 0 else 0.0,
+                'Status': 'OK' if ok_stock and stagger_ok else ('No Stock' if not ok_stock else 'Seam Offset < 5t')
+            })
+            if ok_stock:
+                stock.setdefault(plate_idx[r], {}).setdefault(tank.get('Tank', ''), 0)
+                stock[plate_idx[r]][tank.get('Tank', '')] += int(n_plates[r])
+
+        tank_procured = float(procured_kg[rows].sum())
+        tank_net = float(net_kg[rows].sum())
+        farm['Tanks'].append({
+            'Tank': tank.get('Tank', ''),
+            'Courses': courses,
+            'Procured_Weight_kg': tank_procured,
+            'Net_Weight_kg': tank_net,
+            'Waste_kg': tank_procured - tank_net,
+            'Waste_Pct': 100.0 * (tank_procured - tank_net) / tank_procured if tank_procured > 0 else 0.0,
+            'Status': 'OK' if all(c['Status'] == 'OK' for c in courses) else 'CHECK'
+        })
+        farm['Procured_Weight_kg'] += tank_procured
+        farm['Net_Weight_kg'] += tank_net
+
+    # Grouped procurement list (one line per stock plate)
+    for k in sorted(stock, key=lambda k: (catalog[k]['Thickness'], catalog[k]['Width'], catalog[k]['Length'])):
+        plate = catalog[k]
+        qty = sum(stock[k].values())
+        unit_kg = plate['Length'] * plate['Width'] * plate['Thickness'] / 1000.0 * RHO_STEEL
+        farm['Procurement'].append({
+            'Stock_Plate': plate_name(plate),
+            'Thickness': plate['Thickness'],
+            'Width': plate['Width'],
+            'Length': plate['Length'],
+            'Qty': qty,
+            'Unit_Weight_kg': unit_kg,
+            'Total_Weight_kg': qty * unit_kg,
+            'Tanks': dict(stock[k])
+        })
+    return farm
+
+
+if __name__ == "__main__":
+    from Shell_Design import ShellDesign
+    import io, contextlib
+
+    tanks = []
+    for name, D, H in [('T-101', 30.0, 14.63), ('T-102', 48.0, 17.07), ('T-103', 78.0, 19.5)]:
+        n = math.ceil(H / 2.438)
+        courses = [{'Course': str(i + 1), 'Material': 'A 573 70', 'Width': min(2.438, H - i * 2.438),
+                    'Thickness_Used': 0.0} for i in range(n)]
+        shell = ShellDesign(D, H, H, H, 0.9, 1.5, 0.0, 0.0, courses_input=courses)
+        with contextlib.redirect_stdout(io.StringIO()):
+            shell.run_design()
+        tanks.append({'Tank': name, 'D': D, 'shell_courses': shell.results})
+
+    layout = ShellPlateLayout(tanks[2]['D'], tanks[2]['shell_courses'])
+    layout.run_layout()
+    layout.print_report()
+
+    farm = plan_tank_farm(tanks)
+    print("\n--- Tank Farm Procurement ---")
+    for line in farm['Procurement']:
+        print(f"{line['Stock_Plate']:<20} x {line['Qty']:<4} {line['Total_Weight_kg']:>10.0f} kg  {line['Tanks']}")
+    print(f"Total procured {farm['Procured_Weight_kg']:.0f} kg, net {farm['Net_Weight_kg']:.0f} kg")
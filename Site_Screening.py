@@ -0,0 +1,191 @@
+import io
+import contextlib
+import numpy as np
+import pandas as pd
+from Loads import site_coefficients, wind_profile
+from Loads_Batch import seismic_loads_batch, anchor_uplift_batch
+
+# Site table columns (CSV header). Site_Class (A - E) defaults to 'D' and Terrain (wind exposure B / C / D) to 'C'.
+SITE_COLUMNS = ['Site', 'Ss', 'S1', 'Site_Class', 'Wind_Velocity', 'Terrain']
+SITE_DEFAULTS = {'Site_Class': 'D', 'Terrain': 'C'}
+SITE_CLASSES = ('A', 'B', 'C', 'D', 'E')
+TERRAIN_CATEGORIES = ('B', 'C', 'D')
+
+SCREENING_COLUMNS = [
+    'Rank', 'Site', 'Ss', 'S1', 'Site_Class', 'Wind_Velocity', 'Terrain',
+    'Fa', 'Fv', 'SDS', 'SD1', 'Ai', 'Ac', 'Base_Shear_kN', 'Ringwall_Moment_kNm',
+    'Anchorage_Ratio_J', 'Anchorage_Status', 'Sliding_Ratio', 'M_wind_kNm', 'Net_Uplift_kN'
+]
+
+
+def read_sites(path):
+    """
+    Read a site table (.csv or .xlsx) with the SITE_COLUMNS header.
+    """
+    if path.lower().endswith(('.xlsx', '.xls')):
+        sites = pd.read_excel(path)
+    else:
+        sites = pd.read_csv(path)
+    for col, default in SITE_DEFAULTS.items():
+        if col not in sites.columns:
+            sites[col] = default
+        sites[col] = sites[col].fillna(default)
+    missing = [c for c in SITE_COLUMNS if c not in sites.columns]
+    if missing:
+        raise ValueError(f"Site table is missing columns: {missing}")
+    check_sites(sites)
+    for col in ('Site_Class', 'Terrain'):
+        sites[col] = sites[col].astype(str).str.strip().str.upper()
+    return sites
+
+
+def _check_values(sites, column, allowed, label):
+    values = sites[column].astype(str).str.strip().str.upper()
+    bad = ~values.isin(allowed)
+    if bad.any():
+        rows = [f"{site} ({value!r})" for site, value in zip(sites.loc[bad, 'Site'], sites.loc[bad, column])]
+        shown = ", ".join(rows[:10]) + (f" and {len(rows) - 10} more" if len(rows) > 10 else "")
+        raise ValueError(f"Invalid {column} (expected {label}) for {len(rows)} site(s): {shown}")
+
+
+def check_sites(sites):
+    """
+    Reject Site_Class values other than A - E and Terrain values other than exposure B / C / D instead of
+    letting site_coefficients / the wind profile silently fall back to Fa = Fv = 1.0 / exposure C.
+    Site Class F requires a site-specific study (E.4.4) and is rejected as well.
+    """
+    _check_values(sites, 'Site_Class', SITE_CLASSES, "A, B, C, D or E; Class F needs a site-specific study")
+    _check_values(sites, 'Terrain', TERRAIN_CATEGORIES, "B, C or D")
+
+
+def anchorage_status(J):
+    """
+    Vectorized SeismicLoad anchorage classification (E.6.2.1).
+    """
+    J = np.asarray(J, dtype=float)
+    return np.select([J < 0.785, J <= 1.54],
+                     ["Self-Anchored (Stable)", "Self-Anchored (J > 0.785)"],
+                     "Anchors Required (J > 1.54)")
+
+
+class SiteScreening:
+    """
+    Screen one standard tank design against a list of candidate sites in one vectorized pass:
+    site coefficients -> SDS / SD1 (E.4.4, E.4.5) -> Ai / Ac, base shear, ringwall moment, J -> wind moment
+    (Kz(z) profile per site terrain) -> anchor uplift. Sites are ranked by anchorage ratio J.
+    """
+    def __init__(self, params, shell_courses_input, sites):
+        """
+        :param params: Design parameter dict of the tank (as run_design_pipeline)
+        :param shell_courses_input: List of course dicts (Course, Material, Width, Thickness_Used)
+        :param sites: DataFrame with SITE_COLUMNS (see read_sites)
+        """
+        self.params = params
+        self.courses = shell_courses_input
+        self.sites = sites.reset_index(drop=True)
+        check_sites(self.sites)
+        self.results = None
+        self._nominal_design()
+
+    def _nominal_design(self):
+        """
+        Tank weights from the deterministic design (Main.run_design_pipeline); they do not depend on the site.
+        """
+        from Main import run_design_pipeline
+        with contextlib.redirect_stdout(io.StringIO()):
+            base = run_design_pipeline(self.params, [dict(c) for c in self.courses], verbose=False)
+        self.W_shell_kg = base['W_shell_kg']
+        self.W_roof_kg = base['W_roof_kg']
+        self.W_liquid_kg = base['W_liquid_kg']
+
+    def _wind_moment(self, V, terrain):
+        """
+        Overturning moment (kNm) of the Kz(z) wind profile; one cached profile per terrain, scaled by V^2.
+        """
+        p = self.params
+        D = float(p['D'])
+        H = float(p['H'])
+        factor = p.get('Kzt', 1.0) * p.get('Kd', 0.95) * p.get('G_wind', 0.85) * p.get('Cf', 0.5) * 0.6
+        M_unit = np.array([wind_profile(1.0, t, H)['M_cum'][-1] for t in np.unique(terrain)])
+        idx = np.searchsorted(np.unique(terrain), terrain)
+        return M_unit[idx] * V ** 2 * factor * D / 1000.0
+
+    def run(self):
+        """
+        :return: Ranked screening DataFrame (SCREENING_COLUMNS)
+        """
+        p = self.params
+        s = self.sites
+        D = float(p['D'])
+        H = float(p['H'])
+        I = p.get('I_seismic', 1.0)
+
+        Ss = s['Ss'].to_numpy(dtype=float)
+        S1 = s['S1'].to_numpy(dtype=float)
+        site_class = s['Site_Class'].astype(str).str.strip().str.upper().to_numpy()
+        terrain = s['Terrain'].astype(str).str.strip().str.upper().to_numpy()
+        V = s['Wind_Velocity'].to_numpy(dtype=float)
+
+        Fa, Fv = site_coefficients(site_class, Ss, S1)
+        SDS = (2.0 / 3.0) * Fa * Ss
+        SD1 = (2.0 / 3.0) * Fv * S1
+
+        seismic = seismic_loads_batch(D, H, SDS, SD1, I, self.W_shell_kg, self.W_roof_kg, self.W_liquid_kg,
+                                      p.get('T_L', 4.0))
+        M_wind = self._wind_moment(V, terrain)
+
+        p_design_kPa = (p.get('P_design', 0) * 9.80665) / 1000.0
+        p_test_kPa = (p.get('P_test', 0) * 9.80665) / 1000.0
+        anchor = anchor_uplift_batch(D, p_design_kPa, 4 * M_wind / D, 4 * seismic['Overturning_Moment_kNm'] / D,
+                                     self.W_shell_kg * 9.81 / 1000.0, self.W_roof_kg * 9.81 / 1000.0, seismic['Av'],
+                                     p_test_kPa)
+
+        table = pd.DataFrame({
+            'Site': s['Site'].to_numpy(), 'Ss': Ss, 'S1': S1, 'Site_Class': site_class,
+            'Wind_Velocity': V, 'Terrain': terrain,
+            'Fa': Fa, 'Fv': Fv, 'SDS': SDS, 'SD1': SD1,
+            'Ai': seismic['Ai'], 'Ac': seismic['Ac'],
+            'Base_Shear_kN': seismic['Base_Shear_kN'],
+            'Ringwall_Moment_kNm': seismic['Ringwall_Moment_kNm'],
+            'Anchorage_Ratio_J': seismic['Anchorage_Ratio_J'],
+            'Anchorage_Status': anchorage_status(seismic['Anchorage_Ratio_J']),
+            'Sliding_Ratio': seismic['Sliding_Ratio'],
+            'M_wind_kNm': M_wind,
+            'Net_Uplift_kN': anchor['Net_Uplift_kN']
+        })
+        table = table.sort_values(['Anchorage_Ratio_J', 'Net_Uplift_kN'], ascending=False, kind='stable')
+        table.insert(0, 'Rank', np.arange(1, len(table) + 1))
+        self.results = table.reset_index(drop=True)[SCREENING_COLUMNS]
+        return self.results
+
+    def write(self, output_path):
+        """
+        Write the ranked screening table (.csv or .xlsx).
+        """
+        if self.results is None:
+            self.run()
+        if output_path.lower().endswith('.xlsx'):
+            self.results.to_excel(output_path, index=False)
+        else:
+            self.results.to_csv(output_path, index=False)
+        return output_path
+
+
+if __name__ == "__main__":
+    import argparse
+    from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+
+    parser = argparse.ArgumentParser(description="Screen a standard tank against a site table")
+    parser.add_argument('sites', help="Site table (.csv / .xlsx) with columns " + ", ".join(SITE_COLUMNS))
+    parser.add_argument('output', help="Ranked screening table (.csv / .xlsx)")
+    parser.add_argument('--input', help="Excel input file for the tank design parameters")
+    parser.add_argument('--material', default='A 283 C')
+    args = parser.parse_args()
+
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    if args.input:
+        from InputReader import InputReader
+        params.update(InputReader(args.input).get_design_parameters())
+    screening = SiteScreening(params, build_courses(params['H'], args.material), read_sites(args.sites))
+    screening.write(args.output)
+    print(screening.results.head(10).to_string(index=False))
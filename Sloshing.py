@@ -0,0 +1,195 @@
+import math
+import numpy as np
+from scipy import signal
+
+GRAVITY = 9.81 # m/s2
+
+# Roots of J1'(x) = 0 for the first convective (sloshing) modes of a vertical cylinder
+SLOSHING_ROOTS = np.array([1.8412, 5.3314, 8.5363, 11.7060, 14.8636])
+
+CONVECTIVE_DAMPING = 0.005 # Sloshing damping ratio (the 0.5 % of the API 650 K = 1.5 convective spectrum)
+
+# Synthetic record defaults: Kanai-Tajimi ground filter and trapezoidal intensity envelope
+KT_OMEGA = 5.0 * math.pi # rad/s, predominant ground frequency (firm soil)
+KT_ZETA = 0.6
+ENVELOPE_RISE = 0.1      # Fraction of the duration to reach full intensity
+ENVELOPE_DECAY = 0.5     # Fraction of the duration where the decay starts (exponential, to 5 % at the end)
+
+
+def sloshing_modes(D, H, W_liquid, Tc=None, n_modes=1):
+    """
+    Convective modes of a liquid column of depth H in a tank of diameter D (Housner / Veletsos):
+    omega_n^2 = g lambda_n / R tanh(lambda_n H / R), modal mass m_n = m 2 tanh(lambda_n H/R) / (lambda_n (lambda_n^2 - 1) H/R),
+    wall wave height eta_n = 2 / (lambda_n^2 - 1) R A_n / g for a modal pseudo-acceleration A_n.
+    :param Tc: First-mode period to use (s), e.g. SeismicState.Tc; higher modes keep the theoretical ratios
+    :return: dict of (n_modes,) arrays 'Period_s', 'Omega', 'Mass_kg', 'Wave_Coefficient'
+    """
+    R = D / 2.0
+    lam = SLOSHING_ROOTS[:max(1, min(int(n_modes), len(SLOSHING_ROOTS)))]
+    h = H / R
+    omega = np.sqrt(GRAVITY * lam / R * np.tanh(lam * h))
+    if Tc:
+        omega = omega * (2.0 * math.pi / Tc) / omega[0]
+    return {
+        'Period_s': 2.0 * math.pi / omega,
+        'Omega': omega,
+        'Mass_kg': W_liquid * 2.0 * np.tanh(lam * h) / (lam * (lam ** 2 - 1.0) * h),
+        'Wave_Coefficient': 2.0 / (lam ** 2 - 1.0)
+    }
+
+
+def oscillator_response(records, dt, omega, damping=CONVECTIVE_DAMPING):
+    """
+    Pseudo-acceleration histories omega^2 q(t) of damped SDOF oscillators q'' + 2 zeta omega q' + omega^2 q = -a_g(t).
+    Each oscillator is discretized exactly for piecewise-linear input (scipy.signal.cont2discrete, 'foh') and run
+    over all records at once with scipy.signal.lfilter.
+    :param records: (..., nt) ground accelerations (m/s2), common time step
+    :param dt: Time step (s)
+    :param omega: (n_osc,) circular frequencies (rad/s)
+    :param damping: Damping ratio, scalar or (n_osc,)
+    :return: (..., n_osc, nt) pseudo-accelerations (m/s2)
+    """
+    records = np.asarray(records, dtype=float)
+    omega = np.atleast_1d(np.asarray(omega, dtype=float))
+    zeta = np.broadcast_to(np.asarray(damping, dtype=float), omega.shape)
+    out = np.empty(records.shape[:-1] + (len(omega), records.shape[-1]))
+    for k, (w, z) in enumerate(zip(omega, zeta)):
+        b, a, _ = signal.cont2discrete(([-w ** 2], [1.0, 2.0 * z * w, w ** 2]), dt, method='foh')
+        out[..., k, :] = signal.lfilter(np.ravel(b), a, records, axis=-1)
+    return out
+
+
+def spectral_pseudo_acceleration(records, dt, periods, damping=0.05):
+    """
+    Response spectrum ordinates (peak pseudo-acceleration, m/s2) of each record at the given periods.
+    :return: (..., n_periods)
+    """
+    omega = 2.0 * math.pi / np.atleast_1d(np.asarray(periods, dtype=float))
+    return np.max(np.abs(oscillator_response(records, dt, omega, damping)), axis=-1)
+
+
+def synthetic_records(n_records, duration=40.0, dt=0.01, pga=0.3, seed=None):
+    """
+    Synthetic ground-acceleration records: white noise through a Kanai-Tajimi filter, shaped by a
+    trapezoidal-exponential intensity envelope and scaled to the target PGA.
+    :param pga: Peak ground acceleration (g)
+    :return: (n_records, nt) accelerations (g)
+    """
+    rng = np.random.default_rng(seed)
+    nt = int(round(duration / dt)) + 1
+    t = np.arange(nt) * dt
+    noise = rng.standard_normal((int(n_records), nt))
+
+    # Kanai-Tajimi: H(s) = (2 zeta w s + w^2) / (s^2 + 2 zeta w s + w^2)
+    w, z = KT_OMEGA, KT_ZETA
+    b, a, _ = signal.cont2discrete(([2.0 * z * w, w ** 2], [1.0, 2.0 * z * w, w ** 2]), dt, method='bilinear')
+    ground = signal.lfilter(np.ravel(b), a, noise, axis=-1)
+
+    t1 = ENVELOPE_RISE * duration
+    t2 = ENVELOPE_DECAY * duration
+    decay = math.log(20.0) / max(duration - t2, dt)
+    envelope = np.where(t < t1, (t / t1) ** 2, np.where(t <= t2, 1.0, np.exp(-decay * (t - t2))))
+    ground = ground * envelope
+    return ground * (pga / np.max(np.abs(ground), axis=-1, keepdims=True))
+
+
+def scale_to_spectrum(records, dt, period, target_sa, damping=0.05):
+    """
+    Scale each record so its response spectrum ordinate at one period equals target_sa (g),
+    e.g. the design spectrum at the convective period.
+    """
+    sa = spectral_pseudo_acceleration(np.asarray(records, dtype=float) * GRAVITY, dt, [period], damping)[..., 0]
+    return records * (target_sa * GRAVITY / sa)[..., None]
+
+
+class SloshingTimeHistory:
+    """
+    Time-history alternative to the spectral sloshing estimate of SeismicLoad.calculate_loads
+    (d_max = 0.5 D Ac): the first convective mode, and optionally higher ones, integrated as damped
+    oscillators under a suite of ground-acceleration records, all records and modes in one pass.
+    Wave heights are scaled by I (as Af, E.7.2), convective base shear by I / Rw_c (as Ac).
+    """
+    def __init__(self, seismic_load, W_liquid, liquid_height=None, freeboard=None, n_modes=1,
+                 damping=CONVECTIVE_DAMPING):
+        """
+        :param seismic_load: SeismicLoad (or KDSSeismicLoad) of the tank
+        :param W_liquid: Liquid weight (kg)
+        :param liquid_height: Liquid level (m), default the tank height
+        :param freeboard: Available freeboard (m), default tank height - liquid level
+        :param n_modes: Number of convective modes (1 - 5)
+        :param damping: Sloshing damping ratio
+        """
+        self.seismic = seismic_load
+        self.W_liquid = W_liquid
+        self.liquid_height = seismic_load.H if liquid_height is None else liquid_height
+        self.freeboard = seismic_load.H - self.liquid_height if freeboard is None else freeboard
+        self.state = seismic_load.state(W_liquid=W_liquid, liquid_height=self.liquid_height)
+        self.modes = sloshing_modes(seismic_load.D, self.liquid_height, W_liquid, self.state.Tc, n_modes)
+        self.damping = damping
+        self.results = {}
+
+    def spectral_result(self):
+        """
+        Spectral values of calculate_loads for the same liquid: d_max = 0.5 D Ac and Vc = Ac Wc g.
+        """
+        s = self.state
+        return {'d_max_m': 0.5 * self.seismic.D * s.Ac, 'Vc_kN': s.Ac * s.Wc * GRAVITY / 1000.0, 'Tc_s': s.Tc}
+
+    def run(self, records, dt):
+        """
+        :param records: (n_records, nt) ground accelerations (g), or a list of equal-length records
+        :param dt: Time step (s)
+        :return: results dict with per-record arrays Peak_Wave_Height_m, Peak_Convective_Shear_kN,
+                 Freeboard_Exceeded, the suite statistics and the spectral values
+        """
+        ag = np.atleast_2d(np.asarray(records, dtype=float)) * GRAVITY
+        A = oscillator_response(ag, dt, self.modes['Omega'], self.damping) # (n_rec, n_modes, nt)
+
+        R = self.seismic.D / 2.0
+        I = self.seismic.I
+        wave = np.einsum('m,rmt->rt', self.modes['Wave_Coefficient'], A) * R / GRAVITY * I
+        shear = np.einsum('m,rmt->rt', self.modes['Mass_kg'], A) / 1000.0 * I / self.state.Rw_c
+
+        peak_wave = np.max(np.abs(wave), axis=-1)
+        peak_shear = np.max(np.abs(shear), axis=-1)
+        exceeded = peak_wave > self.freeboard
+        spectral = self.spectral_result()
+
+        self.results = {
+            'Modes': self.modes,
+            'Peak_Wave_Height_m': peak_wave,
+            'Peak_Convective_Shear_kN': peak_shear,
+            'Freeboard_Exceeded': exceeded,
+            'Freeboard_m': self.freeboard,
+            'N_Records': len(ag),
+            'Mean_Wave_Height_m': float(np.mean(peak_wave)),
+            'Max_Wave_Height_m': float(np.max(peak_wave)),
+            'Mean_Convective_Shear_kN': float(np.mean(peak_shear)),
+            'Exceedance_Fraction': float(np.mean(exceeded)),
+            'Spectral_d_max_m': spectral['d_max_m'],
+            'Spectral_Vc_kN': spectral['Vc_kN'],
+            'Tc_s': spectral['Tc_s']
+        }
+        return self.results
+
+    def summary_table(self):
+        """
+        Time-history vs spectral rows for the UI / report.
+        """
+        return sloshing_summary_table(self.results)
+
+
+def sloshing_summary_table(results):
+    """
+    Time-history vs spectral rows of a SloshingTimeHistory.run result.
+    """
+    r = results
+    return [
+        {'Item': 'Wave Height (m)', 'Spectral': r['Spectral_d_max_m'],
+         'Time-History Mean': r['Mean_Wave_Height_m'], 'Time-History Max': r['Max_Wave_Height_m']},
+        {'Item': 'Convective Base Shear (kN)', 'Spectral': r['Spectral_Vc_kN'],
+         'Time-History Mean': r['Mean_Convective_Shear_kN'],
+         'Time-History Max': float(np.max(r['Peak_Convective_Shear_kN']))},
+        {'Item': 'Freeboard Exceedance', 'Spectral': float(r['Spectral_d_max_m'] > r['Freeboard_m']),
+         'Time-History Mean': r['Exceedance_Fraction'], 'Time-History Max': float(np.any(r['Freeboard_Exceeded']))}
+    ]
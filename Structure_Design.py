@@ -1,69 +1,10 @@
 import math
 
-# Standard I-Beam Sections (Simplified Database)
-# Name: [Weight(kg/m), Sx(cm3), Ix(cm4), Area(cm2), Depth(mm)]
-RAFTER_SECTIONS = {
-    "IPE 100": {'w': 8.1, 'Sx': 34.2, 'Ix': 171, 'A': 10.3, 'd': 100},
-    "IPE 120": {'w': 10.4, 'Sx': 53.0, 'Ix': 318, 'A': 13.2, 'd': 120},
-    "IPE 140": {'w': 12.9, 'Sx': 77.3, 'Ix': 541, 'A': 16.4, 'd': 140},
-    "IPE 160": {'w': 15.8, 'Sx': 109.0, 'Ix': 869, 'A': 20.1, 'd': 160},
-    "IPE 180": {'w': 18.8, 'Sx': 146.0, 'Ix': 1317, 'A': 23.9, 'd': 180},
-    "IPE 200": {'w': 22.4, 'Sx': 194.0, 'Ix': 1943, 'A': 28.5, 'd': 200},
-    "IPE 220": {'w': 26.2, 'Sx': 252.0, 'Ix': 2772, 'A': 33.4, 'd': 220},
-    "IPE 240": {'w': 30.7, 'Sx': 324.0, 'Ix': 3892, 'A': 39.1, 'd': 240},
-    "IPE 270": {'w': 36.1, 'Sx': 429.0, 'Ix': 5790, 'A': 45.9, 'd': 270},
-    "IPE 300": {'w': 42.2, 'Sx': 557.0, 'Ix': 8356, 'A': 53.8, 'd': 300},
-    "IPE 330": {'w': 49.1, 'Sx': 713.0, 'Ix': 11770, 'A': 62.6, 'd': 330},
-    "IPE 360": {'w': 57.1, 'Sx': 904.0, 'Ix': 16270, 'A': 72.7, 'd': 360},
-    "IPE 400": {'w': 66.3, 'Sx': 1160.0, 'Ix': 23130, 'A': 84.5, 'd': 400},
-    "IPE 450": {'w': 77.6, 'Sx': 1500.0, 'Ix': 33740, 'A': 98.8, 'd': 450},
-    "IPE 500": {'w': 90.7, 'Sx': 1930.0, 'Ix': 48200, 'A': 116.0, 'd': 500},
-    "IPE 550": {'w': 106.0, 'Sx': 2440.0, 'Ix': 67120, 'A': 134.0, 'd': 550},
-    "IPE 600": {'w': 122.0, 'Sx': 3070.0, 'Ix': 92080, 'A': 156.0, 'd': 600}
-}
-# Sort by weight (cost efficiency)
-SORTED_RAFTERS = sorted(RAFTER_SECTIONS.items(), key=lambda x: x[1]['w'])
-
-# Pipe Columns (Schedule 40 approx)
-COLUMN_SECTIONS = {
-    "Pipe 4in Sch40": {'w': 16.07, 'A': 20.0, 'r': 39.0}, # r approx 1.51" = 38.4mm
-    "Pipe 6in Sch40": {'w': 28.26, 'A': 36.0, 'r': 57.0}, # r approx 2.25" = 57.2mm
-    "Pipe 8in Sch40": {'w': 42.55, 'A': 54.0, 'r': 75.0}, # r approx 2.95" = 75mm
-    "Pipe 10in Sch40": {'w': 60.30, 'A': 77.0, 'r': 95.0}, # r approx 3.67" = 93mm
-    "Pipe 12in Sch40": {'w': 73.8, 'A': 94.0, 'r': 112.0} # r approx 4.38" = 111mm
-}
+from Section_Catalog import (RAFTER_SECTIONS, COLUMN_SECTIONS, ANGLE_SECTIONS, CHANNEL_SECTIONS,
+                             RAFTER_CATALOG, COLUMN_CATALOG, catalog_for)
 
-# Standard Metric Angles (Equal Leg)
-# Approx Properties for Verification
-# Name: [Weight(kg/m), Sx(cm3), Ix(cm4), Area(cm2), d(mm), t(mm)]
-# Source: Standard Tables (Approx)
-ANGLE_SECTIONS = {
-    "L 25x25x3": {'w': 1.12, 'Sx': 0.39, 'Ix': 0.68, 'A': 1.42, 'd': 25, 't': 3},
-    "L 30x30x3": {'w': 1.36, 'Sx': 0.53, 'Ix': 1.05, 'A': 1.74, 'd': 30, 't': 3},
-    "L 40x40x3": {'w': 1.83, 'Sx': 0.90, 'Ix': 2.45, 'A': 2.35, 'd': 40, 't': 3},
-    "L 40x40x5": {'w': 2.97, 'Sx': 1.43, 'Ix': 3.79, 'A': 3.79, 'd': 40, 't': 5},
-    "L 45x45x4": {'w': 2.74, 'Sx': 1.62, 'Ix': 4.84, 'A': 3.49, 'd': 45, 't': 4},
-    "L 50x50x4": {'w': 3.06, 'Sx': 2.05, 'Ix': 7.62, 'A': 3.89, 'd': 50, 't': 4},
-    "L 50x50x6": {'w': 4.47, 'Sx': 2.91, 'Ix': 10.95, 'A': 5.69, 'd': 50, 't': 6},
-    "L 65x65x6": {'w': 5.91, 'Sx': 5.25, 'Ix': 23.50, 'A': 7.53, 'd': 65, 't': 6},
-    "L 65x65x8": {'w': 7.73, 'Sx': 6.85, 'Ix': 30.20, 'A': 9.85, 'd': 65, 't': 8},
-    "L 75x75x6": {'w': 6.85, 'Sx': 7.08, 'Ix': 36.60, 'A': 8.73, 'd': 75, 't': 6},
-    "L 75x75x9": {'w': 9.96, 'Sx': 10.20, 'Ix': 52.40, 'A': 12.69, 'd': 75, 't': 9},
-    "L 75x75x12": {'w': 13.10, 'Sx': 13.10, 'Ix': 62.40, 'A': 16.20, 'd': 75, 't': 12}, 
-    "L 90x90x7": {'w': 9.61, 'Sx': 11.9, 'Ix': 72.9, 'A': 12.2, 'd': 90, 't': 7},
-    "L 90x90x10": {'w': 13.4, 'Sx': 16.5, 'Ix': 100.0, 'A': 17.1, 'd': 90, 't': 10},
-    "L 90x90x13": {'w': 17.0, 'Sx': 20.8, 'Ix': 124.0, 'A': 21.7, 'd': 90, 't': 13},
-    "L 100x100x7": {'w': 10.7, 'Sx': 15.0, 'Ix': 103.0, 'A': 13.6, 'd': 100, 't': 7},
-    "L 100x100x10": {'w': 15.0, 'Sx': 20.9, 'Ix': 142.0, 'A': 19.2, 'd': 100, 't': 10},
-    "L 100x100x13": {'w': 19.2, 'Sx': 26.5, 'Ix': 177.0, 'A': 24.4, 'd': 100, 't': 13},
-    "L 120x120x8": {'w': 14.7, 'Sx': 24.5, 'Ix': 202.0, 'A': 18.7, 'd': 120, 't': 8},
-    "L 130x130x9": {'w': 17.9, 'Sx': 32.7, 'Ix': 310.0, 'A': 22.8, 'd': 130, 't': 9},
-    "L 130x130x12": {'w': 23.6, 'Sx': 42.5, 'Ix': 400.0, 'A': 30.0, 'd': 130, 't': 12},
-    "L 130x130x15": {'w': 29.1, 'Sx': 51.8, 'Ix': 483.0, 'A': 37.0, 'd': 130, 't': 15},
-    "L 150x150x12": {'w': 27.3, 'Sx': 57.0, 'Ix': 600.0, 'A': 34.8, 'd': 150, 't': 12},
-    "L 150x150x15": {'w': 33.8, 'Sx': 69.8, 'Ix': 731.0, 'A': 43.0, 'd': 150, 't': 15},
-    "L 150x150x19": {'w': 42.1, 'Sx': 85.0, 'Ix': 888.0, 'A': 53.6, 'd': 150, 't': 19}
-}
+# Sort by weight (cost efficiency)
+SORTED_RAFTERS = list(zip(RAFTER_CATALOG.names, RAFTER_CATALOG.props))
 
 class StructureDesign:
     def __init__(self, diameter, loads, material_yield=235.0):
@@ -139,26 +80,24 @@ class StructureDesign:
         return status, ratio, fb
 
     def select_col_pipe(self, Load_kN):
-        # Iterate Sorted Sections
-        for name, props in COLUMN_SECTIONS.items():
-            # Check Capacity (Buckling)
+        # Lightest pipe whose allowable load (cached per column length) reaches Load_kN
+        i = COLUMN_CATALOG.lightest_column(Load_kN, self.H, self.Fy, self.E)
+        if i is not None:
+            props = COLUMN_CATALOG.props[i]
             status, ratio, Pa = self.check_buckling(Load_kN, self.H, props['A'], props['r'])
-            
-            if status:
-                 props_out = props.copy()
-                 props_out['Ratio'] = ratio
-                 props_out['Allowable_kN'] = Pa
-                 return name, props_out
-                 
+            props_out = props.copy()
+            props_out['Ratio'] = ratio
+            props_out['Allowable_kN'] = Pa
+            return COLUMN_CATALOG.names[i], props_out
+
         # Fallback
         return "Custom Heavy Pipe", {'w': 100.0, 'A': 999.0, 'r': 100.0, 'Ratio': 1.0, 'Allowable_kN': Load_kN}
 
     def select_section(self, Sx, db):
-        # Sort db
-        sorted_items = sorted(db.items(), key=lambda x: x[1]['w'])
-        for name, props in sorted_items:
-            if props['Sx'] >= Sx:
-                return name, props
+        # Lightest section with Sx >= Sx (presorted catalog of db, bisection)
+        found = catalog_for(db).select(Sx)
+        if found is not None:
+            return found
         # Fallback
         return "Custom Heavy", {'w': 200.0, 'Sx': Sx, 'd': 800.0, 'A': 200.0, 'Ix': 9999}
 
@@ -335,30 +274,32 @@ class StructureDesign:
             y2 = cy + R * scale * math.sin(ang)
             svg.append(f'<line x1="{cx}" y1="{cy}" x2="{x2}" y2="{y2}" stroke="#666" stroke-width="1"/>')
             
-        # Ring Girders & Cols
+        # Ring Girders & Cols (one or more rings, see RoofFramingOptimizer)
         if self.layout_data.get('Type') == 'Ring':
-            R_ring = self.layout_data.get('R_ring', R/2)
-            r_ring_px = R_ring * scale
-            N_col = self.layout_data.get('N_col', 4)
-            
-            svg.append(f'<circle cx="{cx}" cy="{cy}" r="{r_ring_px}" stroke="#d9534f" stroke-width="2" fill="none" stroke-dasharray="5,5"/>')
-            
-            # Draw Girders (Lines between points)
-            pts = []
-            for i in range(N_col):
-                ang = 2 * math.pi * i / N_col
-                px = cx + r_ring_px * math.cos(ang)
-                py = cy + r_ring_px * math.sin(ang)
-                pts.append((px, py))
-                
-                # Column Rect
-                sz = 8
-                svg.append(f'<rect x="{px-sz/2}" y="{py-sz/2}" width="{sz}" height="{sz}" fill="#d9534f"/>')
-            
-            for i in range(N_col):
-                p1 = pts[i]
-                p2 = pts[(i+1)%N_col]
-                svg.append(f'<line x1="{p1[0]}" y1="{p1[1]}" x2="{p2[0]}" y2="{p2[1]}" stroke="#d9534f" stroke-width="2"/>')
+            rings = self.layout_data.get('Rings') or [{'R_ring': self.layout_data.get('R_ring', R/2),
+                                                       'N_col': self.layout_data.get('N_col', 4)}]
+            for ring in rings:
+                r_ring_px = ring['R_ring'] * scale
+                N_col = ring['N_col']
+
+                svg.append(f'<circle cx="{cx}" cy="{cy}" r="{r_ring_px}" stroke="#d9534f" stroke-width="2" fill="none" stroke-dasharray="5,5"/>')
+
+                # Draw Girders (Lines between points)
+                pts = []
+                for i in range(N_col):
+                    ang = 2 * math.pi * i / N_col
+                    px = cx + r_ring_px * math.cos(ang)
+                    py = cy + r_ring_px * math.sin(ang)
+                    pts.append((px, py))
+
+                    # Column Rect
+                    sz = 8
+                    svg.append(f'<rect x="{px-sz/2}" y="{py-sz/2}" width="{sz}" height="{sz}" fill="#d9534f"/>')
+
+                for i in range(N_col):
+                    p1 = pts[i]
+                    p2 = pts[(i+1)%N_col]
+                    svg.append(f'<line x1="{p1[0]}" y1="{p1[1]}" x2="{p2[0]}" y2="{p2[1]}" stroke="#d9534f" stroke-width="2"/>')
 
         # Center Col
         sz_c = 12
@@ -0,0 +1,202 @@
+import numpy as np
+
+# Case axis of the solver arrays
+CASE_DESIGN = 0
+CASE_TEST = 1
+
+
+class VDMSolver:
+    """
+    Vectorized API 650 5.6.4 Variable Design Point Method.
+
+    All elements (tank, course, design/test case) iterate together as arrays:
+    - Bottom course: 5.6.4.4 closed form (t1d / t1t).
+    - Second course: 5.6.4.5 ratio h1 / (r t1)^0.5 between t1 and t2a.
+    - Upper courses: 5.6.4.6 - 5.6.4.8 trial tu, K = tL/tu, C = K^0.5 (K-1) / (1 + K^1.5),
+      x = min(x1, x2, x3), t = 4.9 D (H - x/1000) G / (S E), repeated until tu stops changing.
+    Courses are iterated simultaneously (Jacobi sweep on tL). An element stops iterating once
+    its own change is below tol and the course below it has already stopped.
+    Thicknesses inside the iteration are corroded (design excludes CA, added at the end).
+    """
+    def __init__(self, diameter, H_eff_d, H_eff_t, widths, Sd, St, specific_gravity, corrosion_allowance,
+                 efficiency=1.0, valid=None):
+        """
+        :param diameter: Tank Diameters (m), shape (N,)
+        :param H_eff_d: Design liquid height above the bottom of each course (m), shape (N, C)
+        :param H_eff_t: Test liquid height above the bottom of each course (m), shape (N, C)
+        :param widths: Course widths (m), shape (N, C)
+        :param Sd, St: Allowable design / test stress (MPa), shape (N, C)
+        :param specific_gravity: SG, shape (N,)
+        :param corrosion_allowance: CA (mm), shape (N,)
+        :param efficiency: Joint Efficiency, scalar or (N,)
+        :param valid: Optional (N, C) mask of real courses (padding slots excluded)
+        """
+        self.widths = np.atleast_2d(np.asarray(widths, dtype=float))
+        N, C = self.widths.shape
+        self.N, self.C = N, C
+
+        def per_tank(val):
+            return np.broadcast_to(np.asarray(val, dtype=float), (N,)).astype(float)
+
+        self.D = per_tank(diameter)
+        G = per_tank(specific_gravity)
+        self.CA = per_tank(corrosion_allowance)
+        E = per_tank(efficiency)
+        self.valid = np.ones((N, C), dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+
+        # Stack (N, C, 2): [..., 0] = design, [..., 1] = hydrotest
+        self.H = np.stack([np.asarray(H_eff_d, dtype=float), np.asarray(H_eff_t, dtype=float)], axis=-1)
+        self.S = np.stack([np.asarray(Sd, dtype=float), np.asarray(St, dtype=float)], axis=-1)
+        self.S = np.where(self.valid[..., None], self.S, 1.0)
+        self.G = np.stack([G, np.ones(N)], axis=-1)[:, None, :]      # (N, 1, 2)
+        self.E = E[:, None, None]
+        self.Dm = self.D[:, None, None]
+        self.r_mm = self.Dm * 1000.0 / 2.0
+
+        self.results = {}
+
+    @classmethod
+    def from_batch(cls, batch):
+        """
+        Build a solver from a Shell_Batch.ShellBatchDesign (same tanks, courses and stresses).
+        """
+        H_eff_d_total = batch.HD + (batch.P_design / 1000.0) / batch.G
+        H_eff_t_total = batch.HT + (batch.P_test / 1000.0) / 1.0
+        bottoms = np.cumsum(batch.widths, axis=1) - batch.widths
+        H_eff_d = np.maximum(H_eff_d_total[:, None] - bottoms, 0.0)
+        H_eff_t = np.maximum(H_eff_t_total[:, None] - bottoms, 0.0)
+        return cls(batch.D, H_eff_d, H_eff_t, batch.widths, batch.Sd, batch.St, batch.G, batch.CA,
+                   efficiency=batch.E, valid=batch.valid)
+
+    def _membrane(self, H):
+        # 4.9 D H G / (S E), corroded thickness (mm)
+        return 4.9 * self.Dm * np.maximum(H, 0.0) * self.G / (self.S * self.E)
+
+    def _bottom_course(self):
+        # API 650 5.6.4.4: t1 = (1.06 - 0.0696 D / H * sqrt(H G / S)) * 4.9 H D G / (S E)
+        H1 = self.H[:, 0, :]
+        S1 = self.S[:, 0, :]
+        G = self.G[:, 0, :]
+        D = self.D[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            factor = 1.06 - (0.0696 * D / H1) * np.sqrt(H1 * G / S1)
+        factor = np.where(H1 > 0, factor, 0.0)
+        return factor * 4.9 * H1 * D * G / (S1 * self.E[:, :, 0])
+
+    def _upper_course(self, tu, tL):
+        # API 650 5.6.4.6 - 5.6.4.8 (SI: r in mm, tu/tL in mm, H in m, x in mm)
+        tu_safe = np.maximum(tu, 1e-6)
+        K = tL / tu_safe
+        C = np.sqrt(K) * (K - 1.0) / (1.0 + K ** 1.5)
+        root = np.sqrt(self.r_mm * tu_safe)
+        x1 = 0.61 * root + 320.0 * C * self.H
+        x2 = 1000.0 * C * self.H
+        x3 = 1.22 * root
+        x = np.maximum(np.minimum(np.minimum(x1, x2), x3), 0.0)
+        return self._membrane(self.H - x / 1000.0), x
+
+    def solve(self, tol=0.001, max_iter=50):
+        """
+        Iterate until every element has converged (or max_iter).
+        :param tol: Convergence tolerance on the corroded thickness (mm)
+        :return: results dict with td, tt (mm, td incl. CA), x (mm), iterations and residuals per element
+        """
+        N, C = self.N, self.C
+        t = np.zeros((N, C, 2))
+        t[:, 0, :] = self._bottom_course()
+
+        # Trial tu for upper courses: 1-Foot Method (5.6.4.6)
+        t[:, 1:, :] = self._membrane(self.H - 0.3)[:, 1:, :]
+        t2a = t[:, 1, :].copy() if C > 1 else None
+
+        x = np.zeros((N, C, 2))
+        residual = np.zeros((N, C, 2))
+        iterations = np.zeros((N, C, 2), dtype=int)
+        prev_delta = np.zeros((N, C, 2))
+        relax = np.ones((N, C, 2))
+
+        # Elements still iterating. Bottom course, padding and dry courses are done from the start.
+        active = np.broadcast_to(self.valid[..., None], (N, C, 2)).copy()
+        active &= self.H > 0
+        active[:, 0, :] = False
+
+        # 5.6.4.5 second-course ratio h1 / sqrt(r t1)
+        if C > 1:
+            h1_mm = self.widths[:, 0, None] * 1000.0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratio2 = h1_mm / np.sqrt(self.r_mm[:, 0, :] * np.maximum(t[:, 0, :], 1e-6))
+
+        n_iter = 0
+        while active.any() and n_iter < max_iter:
+            n_iter += 1
+            # Lower course thickness at each girth joint (final t2 for course 3, etc.)
+            tL = np.concatenate([t[:, :1, :], t[:, :-1, :]], axis=1)
+
+            if C > 1:
+                tu_all = np.concatenate([t[:, :1, :], t2a[:, None, :], t[:, 2:, :]], axis=1)
+            else:
+                tu_all = t
+            t_new, x_new = self._upper_course(tu_all, tL)
+
+            res = np.abs(t_new - tu_all)
+            residual = np.where(active, res, residual)
+            x = np.where(active, x_new, x)
+            iterations += active
+
+            # Halve the step of elements whose update flips direction (thin top courses can cycle around x ~ H)
+            delta = t_new - tu_all
+            relax = np.where(delta * prev_delta < 0, 0.5 * relax, relax)
+            t_new = tu_all + relax * delta
+            prev_delta = np.where(active, delta, prev_delta)
+
+            t_upd = np.where(active, t_new, tu_all)
+            if C > 1:
+                t2a = t_upd[:, 1, :].copy()
+                t1 = t[:, 0, :]
+                # 5.6.4.5: interpolate between t1 and t2a by h1 / sqrt(r t1)
+                t2 = np.where(ratio2 <= 1.375, t1,
+                              np.where(ratio2 >= 2.625, t2a, t2a + (t1 - t2a) * (2.1 - ratio2 / 1.25)))
+                t_upd[:, 1, :] = t2
+            t = t_upd
+
+            # Stop an element once it moved less than tol and the course below has stopped
+            below_done = np.concatenate([np.ones((N, 1, 2), dtype=bool), ~active[:, :-1, :]], axis=1)
+            active = active & ~((res < tol) & below_done)
+
+        t = np.where(self.valid[..., None], t, np.nan)
+        td = t[..., CASE_DESIGN] + self.CA[:, None]
+        tt = t[..., CASE_TEST]
+
+        self.results = {
+            'td': td,
+            'tt': tt,
+            'x_d': x[..., CASE_DESIGN],
+            'x_t': x[..., CASE_TEST],
+            'iterations': iterations,
+            'residual': residual,
+            'converged': ~active,
+            'sweeps': n_iter
+        }
+        return self.results
+
+
+if __name__ == "__main__":
+    import time
+    from Shell_Batch import ShellBatchDesign
+
+    N = 2000
+    rng = np.random.default_rng(1)
+    D = rng.uniform(61.0, 110.0, N)
+    H = rng.uniform(14.0, 22.0, N)
+    widths = np.full((N, 10), 2.438)
+    bottoms = np.cumsum(widths, axis=1) - widths
+    widths = np.where(bottoms < H[:, None], np.minimum(widths, H[:, None] - bottoms), 0.0)
+
+    batch = ShellBatchDesign(D, H, H, 0.9, 1.5, widths, 'A 537 1')
+    t0 = time.perf_counter()
+    res = batch.run_method('vdm_full')
+    stats = batch.vdm_stats
+    dt = time.perf_counter() - t0
+    it = stats['iterations'][batch.valid]
+    print(f"{N} tanks (D > 61 m): {dt:.3f} s, {stats['sweeps']} sweeps, "
+          f"iterations per element mean {it.mean():.2f} / max {it.max()}, all converged: {stats['converged'].all()}")
@@ -1,4 +1,5 @@
 import math
+from Section_Catalog import SectionCatalog
 
 class WindGirderDesign:
     """
@@ -18,6 +19,44 @@ class WindGirderDesign:
         self.shell_courses = shell_courses
         self.V_wind_kph = V_wind_kph # Ensure units
         self.results = {}
+        self._htr_terms = None # Per-course W_i * (t_top / t_i)^2.5
+        self._htr_inputs = None # Per-course (W_i, t_i) the terms were computed from
+        self._htr_t_top = None
+
+    def _htr_term(self, course, t_top):
+        w_i = course.get('Width', 0.0)
+        t_i = course.get('t_used', 0.0)
+        if t_i > 0:
+            # Contribution to height: W * (t_top / t_i)^2.5
+            return w_i * (t_top / t_i) ** 2.5
+        return 0.0
+
+    def calculate_transformed_height(self):
+        """
+        Transformed shell height H_tr (API 650 5.9.7.2).
+        Per-course terms are cached by their own (width, thickness), so only courses whose
+        inputs changed are recomputed (all of them if the top course thickness changed).
+        """
+        t_top = self.shell_courses[-1].get('t_used', 0.0)
+        inputs = [(c.get('Width', 0.0), c.get('t_used', 0.0)) for c in self.shell_courses]
+        if self._htr_terms is None or self._htr_t_top != t_top or len(self._htr_terms) != len(inputs):
+            self._htr_terms = [self._htr_term(c, t_top) for c in self.shell_courses]
+        else:
+            for i, key in enumerate(inputs):
+                if key != self._htr_inputs[i]:
+                    self._htr_terms[i] = self._htr_term(self.shell_courses[i], t_top)
+        self._htr_inputs = inputs
+        self._htr_t_top = t_top
+        return sum(self._htr_terms)
+
+    def update_courses(self, shell_courses, changed_rows=None, removed_rows=None):
+        """
+        Listener for IncrementalShellDesign: re-check girders for the new courses.
+        Only the H_tr terms of courses whose width / thickness changed are recomputed.
+        """
+        self.shell_courses = shell_courses
+        self.results = {}
+        return self.calculate_intermediate_girders()
 
     def calculate_intermediate_girders(self):
         """
@@ -30,26 +69,18 @@ class WindGirderDesign:
         
         # Get top course thickness
         if not self.shell_courses:
-            return {'Status': 'No Data'}
+            self.results = {'Status': 'No Data'}
+            return self.results
             
         top_course = self.shell_courses[-1]
         t_top = top_course.get('t_used', 0.0)
-        
+
         if t_top <= 0:
-            return {'Status': 'Error', 'Message': 'Invalid Top Course Thickness'}
-            
-        H_tr = 0.0
-        
-        # Iterate all courses
-        for course in self.shell_courses:
-            w_i = course.get('Width', 0.0)
-            t_i = course.get('t_used', 0.0)
-            
-            if t_i > 0:
-                # Contribution to height: W * (t_top / t_i)^2.5
-                term = (t_top / t_i) ** 2.5
-                H_tr += w_i * term
-                
+            self.results = {'Status': 'Error', 'Message': 'Invalid Top Course Thickness'}
+            return self.results
+
+        H_tr = self.calculate_transformed_height()
+
         # 2. Maximum Unstiffened Height (H1)
         # API 650 5.9.7.1 SI Formula:
         # H1 = 9.47 * t * sqrt( (t/D)^3 ) * (190 / V)^2
@@ -102,19 +133,13 @@ class WindGirderDesign:
              rec_section = "Custom / Detail"
              rec_weight = 0.0
              
-             # Search Database
-             found = False
-             # Sort by weight (efficiency)
-             sorted_sect = sorted(WIND_GIRDER_SECTIONS.items(), key=lambda x: x[1]['w'])
-             
-             for name, props in sorted_sect:
-                 if props['Z'] >= min_Z:
-                     rec_section = name
-                     rec_weight = props['w']
-                     found = True
-                     break
-             
-             if not found:
+             # Search Database (presorted by weight)
+             found = WIND_GIRDER_CATALOG.select(min_Z)
+             if found is not None:
+                 rec_section = found[0]
+                 rec_weight = found[1]['w']
+                 
+             if found is None:
                  rec_section = "Check Large Sections (UPN 200+)"
                  
              self.results['Recommended Section'] = rec_section
@@ -143,3 +168,5 @@ WIND_GIRDER_SECTIONS = {
     "UPN 180": {'Z': 150.0, 'w': 22.0},
     "UPN 200": {'Z': 191.0, 'w': 25.3}
 }
+
+WIND_GIRDER_CATALOG = SectionCatalog(WIND_GIRDER_SECTIONS, modulus='Z')
@@ -2,12 +2,14 @@ import streamlit as st
 import pandas as pd
 import os
 import json
+import copy
+import base64
 from datetime import datetime
 import math
 from io import BytesIO
 
 from HTMLReportGenerator import HTMLReportGenerator
-from Shell_Design import ShellDesign
+from Shell_Design import ShellDesign, IncrementalShellDesign
 from Roof_Design import RoofDesign
 import Loads
 import importlib
@@ -27,8 +29,9 @@ from EFRT_Design import EFRTDesign
 from Anchor_Design import AnchorBoltDesign
 from Report_v2026 import ReportGenerator2026
 from Appendix_F import AppendixF, FrangibleCheck
-from Materials import CARBON_STEEL_MATERIALS, STAINLESS_STEEL_MATERIALS
+from Materials import material_names
 from Bottom_Design import BottomDesign
+from Sloshing import sloshing_summary_table
 
 # Page Configuration
 st.set_page_config(page_title="API 650 Tank Design", page_icon="🛢️", layout="wide")
@@ -51,7 +54,7 @@ def save_project_to_json():
         "efrt_rafter_size", "efrt_leg_size", "efrt_leg_od", "efrt_leg_thk",
         "pump_in", "pump_out", "flash_point_opt", "insulation_opt",
         "nozzle_schedule_data",
-        "V_wind", "snow_load", "live_load", "dead_load_add",
+        "V_wind", "wind_exposure", "wind_profile_mode", "snow_load", "live_load", "dead_load_add",
         "sug", "seismic_method", "site_class", "Ss", "S1", "SDS", "SD1", "Sp", "TL",
         "use_kds", 
         "kds_v0", "kds_terrain", "kds_risk_wind", "kds_iw_input",
@@ -83,6 +86,35 @@ def load_project_from_json(uploaded_file):
     except Exception as e:
         st.error(f"Error loading file: {e}")
 
+@st.cache_data(show_spinner=False)
+def render_spectrum_chart(api_site, kds_site=None):
+    """
+    Design response spectrum chart (API 650 and optional KDS 41 17) as a base64 PNG.
+    Sites are (SDS, SD1, TL) tuples; the PNG is cached per site combination so reruns do not redraw it.
+    """
+    import matplotlib.pyplot as plt
+    from Loads import DesignSpectrum
+
+    api = DesignSpectrum.get(*api_site)
+    t_vals, sa_vals = api.curve()
+
+    fig, ax = plt.subplots(figsize=(6, 3))
+    ax.plot(t_vals, sa_vals, label=f"API 650 (SDS={api.SDS:.2f}, SD1={api.SD1:.2f})", color='blue')
+    if kds_site is not None:
+        kds = DesignSpectrum.get(*kds_site)
+        ax.plot(t_vals, kds.sa(t_vals), label=f"KDS 41 17 (SDS={kds.SDS:.2f}, SD1={kds.SD1:.2f})", color='red', linestyle='--')
+
+    ax.set_xlabel("Period T (s)")
+    ax.set_ylabel("Spectral Acceleration Sa (g)")
+    ax.set_title("Design Response Spectrum")
+    ax.grid(True, linestyle='--', alpha=0.6)
+    ax.legend()
+
+    buf = BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight')
+    plt.close(fig)
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
 # --- Authentication & State Management ---
 from AuthManager import AuthManager
 
@@ -188,7 +220,7 @@ st.title("🛢️ API 650 Tank Design Calculator (13th Ed)")
 st.markdown("---")
 
 # Prepare Material Options Globally
-all_materials = list(CARBON_STEEL_MATERIALS.keys()) + list(STAINLESS_STEEL_MATERIALS.keys())
+all_materials = material_names() # Active material registry (built-in or API650_MATERIAL_DB)
 
 # Sidebar for Global Project Settings
 with st.sidebar:
@@ -296,11 +328,14 @@ with tab1:
             st.info(f"API 650 5.10.6: Radius of curvature range: {0.8*D:.2f}m - {1.2*D:.2f}m")
             dome_radius_input = st.number_input("Dome/Umbrella Radius (m)", value=D, min_value=0.8*D, max_value=1.2*D, step=0.1, key="dome_radius_ui")
         
-        roof_material = st.selectbox("Roof Material", all_materials, index=2, key="roof_material") # Default A 36
+        roof_material = st.selectbox("Roof Material", all_materials, key="roof_material",
+                                     index=all_materials.index('A 36') if 'A 36' in all_materials else 0)
         roof_slope = st.number_input("Roof Slope (Rise/Run) - Not used for Dome", value=0.0625, format="%.4f", step=0.01, key="roof_slope")
         
         # Structure Design Inputs (Conditional)
         struct_yield = 235.0
+        optimize_framing = False
+        frame_analysis = False
         if "Supported" in roof_type:
             st.markdown("---")
             st.write("### Structure Design Inputs")
@@ -324,6 +359,10 @@ with tab1:
                 key="struct_mat_yield"
             )
             struct_yield = float(struct_mat_Fy)
+            optimize_framing = st.checkbox("Optimize Framing Layout", value=False, key="struct_optimize",
+                                           help="Minimum-weight rafter count, girder rings (up to 4), ring radii and columns per ring")
+            frame_analysis = st.checkbox("3D Frame Analysis", value=False, key="struct_frame",
+                                         help="Resize and check the sections with member forces of a 3D frame model (dead, live, snow, unbalanced snow)")
         
         # Top Angle & Detail (Annex F / 5.10.2.6)
         angle_options = ['L50x50x4', 'L50x50x5', 'L50x50x6', 'L65x65x5', 'L65x65x6', 'L65x65x8', 
@@ -435,6 +474,8 @@ with tab2:
     with col_wind:
         st.subheader("Wind & Roof Loads")
         V_wind = st.number_input("Wind Speed (3-sec gust) [m/s]", value=65.0, step=1.0, key="V_wind") # 234 kph = 65 m/s
+        wind_exposure = st.selectbox("Exposure Category", ["B", "C", "D"], index=1, key="wind_exposure")
+        wind_profile_mode = st.checkbox("Height-Resolved Wind Profile (Kz(z))", value=False, key="wind_profile_mode")
         # Additional Loads
         snow_load = st.number_input("Ground Snow Load [kPa]", value=0.0, step=0.1, key="snow_load")
         live_load = st.number_input("Roof Live Load [kPa]", value=1.2, step=0.1, key="live_load")
@@ -567,7 +608,8 @@ params = {
     'D': D, 'H': H, 'G': G, 'CA': CA, 'CA_roof': CA_roof,
     'HD': max_level, # Use max liquid level
     'P_design': P_design_mm, 'P_test': P_test_mm,
-    'Wind_Velocity': V_wind, 'Site_Class': site_class,
+    'Wind_Velocity': V_wind, 'Wind_Exposure': wind_exposure, 'Wind_Profile': wind_profile_mode,
+    'Site_Class': site_class,
     'SDS': SDS, 
     'SD1': SD1, # Explicitly pass SD1
     'S1': SD1 if SD1 > 0 else S1, # Pass Design Value SD1 as S1 for Loads.py logic
@@ -598,7 +640,7 @@ def reset_courses_on_width_change():
         st.session_state['preserved_shell_material'] = st.session_state["shell_courses_data"][0].get('Material', 'A 283 C')
     st.session_state.pop("shell_courses_data", None)
 
-c_sh1, c_sh2 = st.columns([2, 1])
+c_sh1, c_sh2, c_sh3 = st.columns([2, 1, 1])
 std_width = c_sh1.number_input("Standard Plate Width (m)", value=2.438, step=0.001, key="std_plate_width", on_change=reset_courses_on_width_change)
 # Button still useful for explicit reset, but input change now handles it too
 if c_sh2.button("Auto-Generate Courses", help="Reset shell courses based on height and plate width"):
@@ -611,6 +653,26 @@ if c_sh2.button("Auto-Generate Courses", help="Reset shell courses based on heig
     st.session_state['force_recalc_width'] = True
     st.rerun()
 
+if c_sh3.button("Optimize Layout", help="Minimum-weight course widths and materials (Standard Plate Widths, API 650 Table 5-2a materials)"):
+    from Shell_Optimizer import ShellLayoutOptimizer
+    optimizer = ShellLayoutOptimizer(D, H, max_level, H, G, CA, p_design=P_design_mm, p_test=P_test_mm,
+                                     efficiency=joint_efficiency, method=shell_method)
+    opt_res = optimizer.optimize()
+    if opt_res.get('Status') == 'No Feasible Layout':
+        st.error("No feasible course layout found for the given plate widths.")
+    else:
+        st.session_state["shell_courses_data"] = [{
+            "Course": c['Course'],
+            "Material": c['Material'],
+            "Width (m)": c['Width'],
+            "Thickness Used (mm)": float(c['Thickness_Used']),
+            "Req Thickness (mm)": r['t_req'],
+            "Rec Thickness (mm)": r['t_rec']
+        } for c, r in zip(opt_res['Courses'], opt_res['Shell_Results'])]
+        # New editor key so the data editor picks up the optimized table
+        st.session_state['last_loaded'] = datetime.now().strftime("%Y%m%d%H%M%S")
+        st.rerun()
+
 # Setup initial dataframe for courses
 # Use session state standard width if available, or default
 calc_width = std_width
@@ -740,19 +802,53 @@ for index, row in edited_df.iterrows():
         'Thickness_Used': row['Thickness Used (mm)']
     })
     
-shell_design = ShellDesign(
-    diameter=D, 
-    height=H, 
-    design_liquid_level=max_level, 
-    test_liquid_level=H, 
-    specific_gravity=G, 
-    corrosion_allowance=CA, 
-    p_design=P_design_mm, 
-    p_test=P_test_mm, 
-    efficiency=joint_efficiency,
-    courses_input=courses_input
-)
-shell_design.run_design(method=shell_method)
+# Incremental shell engine kept across reruns: a data_editor edit only recomputes the
+# edited course and the courses that depend on it (see IncrementalShellDesign).
+# The wind girder and nozzle checks are kept with it as listeners, so they are only
+# refreshed for the changed rows.
+shell_design = st.session_state.get('shell_engine')
+new_shell_engine = shell_design is None or 'wind_girder_engine' not in st.session_state
+if new_shell_engine:
+    shell_design = IncrementalShellDesign(
+        diameter=D, 
+        height=H, 
+        design_liquid_level=max_level, 
+        test_liquid_level=H, 
+        specific_gravity=G, 
+        corrosion_allowance=CA, 
+        p_design=P_design_mm, 
+        p_test=P_test_mm, 
+        efficiency=joint_efficiency,
+        courses_input=courses_input
+    )
+    wind_girder_design = WindGirderDesign(D, H, [], V_wind * 3.6) # Convert m/s to km/h
+    nozzle_design = NozzleDesign()
+    shell_design.add_listener(wind_girder_design.update_courses)
+    shell_design.add_listener(nozzle_design.update_courses)
+    st.session_state['shell_engine'] = shell_design
+    st.session_state['wind_girder_engine'] = wind_girder_design
+    st.session_state['nozzle_engine'] = nozzle_design
+else:
+    wind_girder_design = st.session_state['wind_girder_engine']
+    nozzle_design = st.session_state['nozzle_engine']
+
+# Non-shell inputs of the listeners are set before the shell update notifies them
+wind_inputs_changed = (wind_girder_design.D, wind_girder_design.H, wind_girder_design.V_wind_kph) != (D, H, V_wind * 3.6)
+wind_girder_design.D, wind_girder_design.H, wind_girder_design.V_wind_kph = D, H, V_wind * 3.6
+nozzle_list_in = st.session_state.get("nozzle_schedule_data", [])
+nozzles_changed = new_shell_engine or nozzle_design.nozzles != nozzle_list_in
+if nozzles_changed:
+    nozzle_design.nozzles = copy.deepcopy(nozzle_list_in)
+    nozzle_design.process_nozzles()
+
+shell_design.update(courses_input, method=shell_method, D=D, H=H, HD=max_level, HT=H, G=G, CA=CA,
+                    P_design=P_design_mm, P_test=P_test_mm, E=joint_efficiency)
+# Listeners only run when shell rows changed; other input edits need a full re-check
+shell_notified = bool(shell_design.changed_rows or shell_design.removed_rows)
+if not shell_notified and (new_shell_engine or wind_inputs_changed):
+    wind_girder_design.update_courses(shell_design.shell_courses)
+if not shell_notified and nozzles_changed:
+    nozzle_design.check_reinforcement(shell_design.shell_courses)
 W_shell_kg, W_shell_N = shell_design.calculate_shell_weight()
 
 # Save Results for Input Editor Feedback Loop
@@ -838,7 +934,16 @@ else:
         # st.write(f"DEBUG: D passed to Struct = {D} m") # DEBUG
         struct = StructureDesign(D, loads, material_yield=struct_yield)
         struct.set_height(H)
-        struct.run_design()
+        if optimize_framing:
+            from Roof_Framing_Optimizer import RoofFramingOptimizer
+            if RoofFramingOptimizer(struct, slope=roof_slope).optimize().get('Status') == 'No Feasible Layout':
+                struct.run_design()
+        else:
+            struct.run_design()
+        if frame_analysis:
+            from Roof_Frame_Analysis import RoofFrameAnalysis
+            # Reselect the sections from the frame forces (real column lengths, unbalanced snow)
+            RoofFrameAnalysis(struct, slope=roof_slope).resize_sections()
         struct_data = struct.results
         # st.write("DEBUG: Struct Results:", struct_data) # DEBUG
         
@@ -877,6 +982,7 @@ bottom_design.run_design(H=H, G=G, use_annular=use_annular, t_shell_bot_mm=t_she
 wind_load = WindLoad(params)
 P_wind_kPa = wind_load.calculate_pressure()
 M_wind_kNm = wind_load.calculate_overturning_moment()
+wind_profile_res = wind_load.calculate_profile([c['Width'] for c in shell_design.shell_courses]) if wind_profile_mode else {}
 
 # KDS Wind Calculation
 kds_wind_P = 0.0
@@ -899,21 +1005,9 @@ if 'use_kds' in locals() and use_kds:
     kds_wind_M = kds_wind.calculate_moment()
 
 
-# Wind Girder Design (Intermediate)
-wind_girder_design = WindGirderDesign(D, H, shell_design.shell_courses, V_wind * 3.6) # Convert m/s to km/h
-wind_girder_res = wind_girder_design.calculate_intermediate_girders()
-
-# Nozzle Design (Schedule Only in Phase 2)
-# Get nozzles list from session state or editor ??
-# We persisted it to st.session_state["nozzle_schedule_data"]
-# But also edited_nozzles_df is available in local scope if Tab 1 ran.
-# Safe to use session state if available, else default.
-# Note: st.date_editor updates session state automatically? No, we set it manually in Tab 1.
-
-nozzle_list_in = st.session_state.get("nozzle_schedule_data", [])
-nozzle_design = NozzleDesign(nozzle_list_in)
-nozzle_design.process_nozzles()
-nozzle_res = nozzle_design.check_reinforcement(shell_design.shell_courses)
+# Wind Girder Design (Intermediate) and Nozzle Check: kept up to date by the shell engine listeners
+wind_girder_res = wind_girder_design.results
+nozzle_res = nozzle_design.results.get('nozzle_schedule', [])
 
 # Seismic
 # Need Liquid Weight
@@ -982,6 +1076,11 @@ if 'use_kds' in locals() and use_kds:
              
          bottom_design.results['Annular Plate'] = ann_res
 
+# Operating envelope: governing liquid level of each seismic check between min and max level
+seismic_envelope = gov_seismic_load_obj.calculate_envelope(W_shell_kg, W_roof_kg, min_level, max_level,
+                                                           t_bottom_mm=t_shell_bot_mm, Sd=Sd_first,
+                                                           E=joint_efficiency)
+
 
 
 # 6. Venting Design (API 2000)
@@ -1032,7 +1131,12 @@ M_seismic_kN = gov_seismic_res['Overturning_Moment_kNm']
 U_wind = (4 * gov_wind_M) / D
 U_seismic = (4 * M_seismic_kN) / D
 
-anchor_design = AnchorBoltDesign(D, p_design_kPa, U_wind, U_seismic, w_shell_kN, w_roof_kN)
+p_test_kPa = (P_test_mm * 9.80665) / 1000.0
+
+# Uplift load combinations (Table 5.21a/b) with the governing wind / seismic loads
+anchor_design = AnchorBoltDesign(D, p_design_kPa, U_wind, U_seismic, w_shell_kN, w_roof_kN,
+                                 vertical_acceleration_Av=gov_seismic_res.get('Av', 0.0),
+                                 test_pressure=p_test_kPa)
 anchor_design.run_design()
 
 # Anchor Chair Calculation
@@ -1249,6 +1353,17 @@ with tab3:
              leg_cap = leg_res.get('Capacity_kN', 0)
              st.caption(f"Leg Check: {leg_status} (Cap {leg_cap} kN for 2m Length)")
 
+    # --- Roof Structure 3D Frame Check ---
+    if struct_data.get('Frame Check'):
+         st.write("---")
+         st.subheader("Roof Structure 3D Frame Check")
+         col_fr1, col_fr2 = st.columns(2)
+         col_fr1.metric("Frame Status", struct_data.get('Frame_Status', '-'))
+         col_fr2.metric("Max Deflection", f"{struct_data.get('Frame Max Deflection (mm)', 0):.1f} mm")
+         st.caption("Sections resized from the 3D frame member forces (dead, live, snow, unbalanced snow)")
+         st.dataframe(pd.DataFrame([{'Member Group': g, **c} for g, c in struct_data['Frame Check'].items()]),
+                      hide_index=True)
+
     # --- Bill of Materials (BOM) ---
     with st.expander("📝 Detailed Bill of Materials (BOM)", expanded=False):
         bom_data = []
@@ -1385,83 +1500,19 @@ with tab3:
         # --- Seismic Spectrum Visualization ---
         st.subheader("Seismic Response Spectrum (Design)")
         try:
-            import matplotlib.pyplot as plt
-            import numpy as np
-            
-            # Parameters from calculation (API 650 Use)
-            # We need SDS, SD1, TL.
-            # They are available from Tab 2 inputs or seismic_load object (if passed)
-            # Actually, seismic_load.calculate_loads doesn't return them explicit, but they are in 'params'.
-            
-            # Retrieve from params dict used for calc
-            p_sds = params.get('SDS', 0.0)
-            p_sd1 = params.get('SD1', 0.0)
-            p_tl = params.get('TL', 4.0)
-            
-            if p_sds <= 0 or p_sd1 <= 0:
+            # Same spectrum objects as the Ai / Ac calculation (Loads.DesignSpectrum)
+            api_spec = seismic_load.spectrum
+            if api_spec.SDS <= 0 or api_spec.SD1 <= 0:
                  raise ValueError("SDS or SD1 is zero. Please check inputs.")
 
-            # Generate T values
-            t_max = p_tl + 2.0
-            t_vals = np.linspace(0, t_max, 100)
-            sa_vals = []
-            
-            Ts = p_sd1 / p_sds
-            T0 = 0.2 * Ts
-            
-            for t in t_vals:
-                if t < T0:
-                    sa = p_sds * (0.4 + 0.6 * (t / T0))
-                elif t < Ts:
-                    sa = p_sds
-                elif t < p_tl:
-                    sa = p_sd1 / t
-                else:
-                    sa = (p_sd1 * p_tl) / (t**2)
-                sa_vals.append(sa)
-                
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.plot(t_vals, sa_vals, label=f"API 650 (SDS={p_sds:.2f}, SD1={p_sd1:.2f})", color='blue')
-            
-            # KDS Plot
-            if use_kds and 'kds_params' in locals():
-                try:
-                    kds_obj = KDSSeismicLoad(kds_params)
-                    k_sds = kds_obj.SDS
-                    k_sd1 = kds_obj.S1
-                    
-                    sa_kvals = []
-                    k_Ts = k_sd1 / k_sds if k_sds > 0 else 0
-                    k_T0 = 0.2 * k_Ts
-                    
-                    for t in t_vals:
-                        if t < k_T0: sa = k_sds * (0.4 + 0.6 * (t / k_T0))
-                        elif t < k_Ts: sa = k_sds
-                        elif t < p_tl: sa = k_sd1 / t
-                        else: sa = (k_sd1 * p_tl) / (t**2)
-                        sa_kvals.append(sa)
-                    
-                    ax.plot(t_vals, sa_kvals, label=f"KDS 41 17 (SDS={k_sds:.2f}, SD1={k_sd1:.2f})", color='red', linestyle='--')
-                except Exception as ex:
-                    # st.write(f"Debug: KDS Plot Error - {ex}")
-                    pass
-
-            ax.set_xlabel("Period T (s)")
-            ax.set_ylabel("Spectral Acceleration Sa (g)")
-            ax.set_title("Design Response Spectrum")
-            ax.grid(True, linestyle='--', alpha=0.6)
-            ax.legend()
-            
-            st.pyplot(fig)
-            
-            # Save for Report
-            import io
-            import base64
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', bbox_inches='tight')
-            buf.seek(0)
-            seismic_graph_b64 = base64.b64encode(buf.getvalue()).decode('utf-8')
-            buf.close()
+            kds_site = None
+            if 'use_kds' in locals() and use_kds and 'kds_seismic' in locals():
+                kds_spec = kds_seismic.spectrum
+                if kds_spec.SDS > 0:
+                    kds_site = (kds_spec.SDS, kds_spec.SD1, kds_spec.TL)
+
+            seismic_graph_b64 = render_spectrum_chart((api_spec.SDS, api_spec.SD1, api_spec.TL), kds_site)
+            st.image(base64.b64decode(seismic_graph_b64))
             
         except Exception as e:
             st.error(f"Could not plot spectrum: {e}")
@@ -1568,12 +1619,30 @@ with tab3:
     c_s3.metric("Status", final_hoop_res['Status'])
     
     st.write(f"**Base Shear V**: {seismic_res['Base_Shear_kN']:.1f} kN | **Overturning M**: {seismic_res['Overturning_Moment_kNm']:.1f} kNm")
+
+    with st.expander("Seismic Operating Envelope (Min - Max Liquid Level)", expanded=False):
+        st.caption(f"{gov_seismic_code}: governing liquid level of each check, {min_level:.1f} - {max_level:.1f} m")
+        st.dataframe(pd.DataFrame(gov_seismic_load_obj.envelope_table(seismic_envelope)))
+
+    with st.expander("Sloshing Time-History (Convective Modes)", expanded=False):
+        st.caption("Synthetic records scaled to the design spectrum at Tc; first 3 convective modes, 0.5 % damping")
+        if st.checkbox("Run 100-record suite", value=False, key="sloshing_time_history"):
+            W_liquid_max_kg = math.pi * (D / 2.0) ** 2 * max_level * G * 1000.0
+            sloshing_res = gov_seismic_load_obj.calculate_sloshing_history(
+                W_liquid_max_kg, liquid_height=max_level, n_modes=3, n_records=100, seed=0)
+            st.dataframe(pd.DataFrame(sloshing_summary_table(sloshing_res)))
+            st.write(f"Freeboard {sloshing_res['Freeboard_m']:.2f} m exceeded in "
+                     f"{sloshing_res['Exceedance_Fraction'] * 100:.0f} % of the records")
     
     # Anchor Results
     with st.expander("Anchor Bolt & Chair Design", expanded=False):
         st.subheader("Anchor Bolt Check (API 650 5.12 / F.7)")
         st.write(f"Status: **{anchor_design.results.get('Status')}**")
         st.write(f"Net Uplift Force: {anchor_design.results.get('Net Uplift Force (kN)',0):.1f} kN")
+        gov_cases = anchor_design.results.get('Governing_Case', {})
+        if gov_cases:
+            st.caption(f"Governing Case: {gov_cases.get('Net_Uplift_kN') or 'None'} (uplift) / {gov_cases.get('Req_Bolt_Area_mm2') or 'None'} (bolt area)")
+        st.dataframe(pd.DataFrame(anchor_design.results.get('Uplift_Table', [])))
         
         if anchor_design.results.get('Number of Bolts', 0) > 0:
             st.success(f"Required: {anchor_design.results['Number of Bolts']} bolts, M{anchor_design.results['Bolt Diameter (mm)']}")
@@ -1725,39 +1794,10 @@ with tab3:
     D_nominal_real = ID_input + t_bot_m
     OD_calc = ID_input + 2 * t_bot_m
     
-    # Seismic Check Loop (Recreated here for persistence)
-    seismic_shell_checks = []
-    eff_H_seismic = max_level 
-    current_h_for_seismic = 0.0
-    for course in shell_design.shell_courses:
-        c_name = course['Course']
-        mat = course['Material']
-        t_used_mm = course['t_used']
-        t_used_m = t_used_mm / 1000.0
-        width = course['Width']
-        check_y = current_h_for_seismic
-        gamma_water = 9.80665
-        gamma_liq = G * gamma_water
-        head = eff_H_seismic - check_y
-        if head < 0: head = 0
-        P_stat = gamma_liq * head 
-        Pi, Pc = gov_seismic_load_obj.calculate_hydrodynamic_pressure(check_y, eff_H_seismic)
-        P_dyn = math.sqrt(Pi**2 + Pc**2)
-        P_total = P_stat + P_dyn
-        Sig_total_kPa = (P_total * D) / (2 * t_used_m)
-        Sig_total_MPa = Sig_total_kPa / 1000.0
-        Sd, St = shell_design.get_material_stress(mat)
-        Allowable_Seismic = 1.333 * Sd * joint_efficiency
-        status = "OK"
-        ratio = Sig_total_MPa / Allowable_Seismic
-        if ratio > 1.0: status = "FAIL"
-        seismic_shell_checks.append({
-            'Course': c_name, 'y (m)': check_y, 't_used (mm)': t_used_mm,
-            'P_stat (kPa)': P_stat, 'P_dyn (kPa)': P_dyn,
-            'Stress (MPa)': Sig_total_MPa, 'Allow (MPa)': Allowable_Seismic,
-            'Ratio': ratio, 'Status': status
-        })
-        current_h_for_seismic += width
+    # Seismic hoop stress at the bottom of every course (E.6.2.4) + pressure profile for the report
+    seismic_course_check = gov_seismic_load_obj.check_course_hoop_stress(
+        shell_design.shell_courses, max_level, joint_efficiency)
+    seismic_shell_checks = seismic_course_check['Courses']
         
     extended_design_data = {
         'OD': OD_calc,
@@ -1771,7 +1811,11 @@ with tab3:
         'Liquid_Name': liquid_name,
         'Annex_F_Data': annex_f_res,
         'Anchor_Data': anchor_design.results,
-        'Seismic_Shell_Check': seismic_shell_checks
+        'Seismic_Shell_Check': seismic_shell_checks,
+        'Seismic_Governing_Course': seismic_course_check['Governing_Course'],
+        'Seismic_Pressure_Profile': seismic_course_check['Profile'],
+        'Seismic_Envelope': gov_seismic_load_obj.envelope_table(seismic_envelope),
+        'Wind_Profile_Courses': wind_profile_res.get('Courses', [])
     }
     
     # Applied Annexes
@@ -0,0 +1,55 @@
+import io
+import math
+import contextlib
+import numpy as np
+from Shell_Design import ShellDesign
+from Shell_Batch import ShellBatchDesign
+from Corrosion_Life import CorrosionLifeProjection
+
+def test_corrosion_life():
+    print("--- Corrosion Life Projection ---")
+    courses = [{'Course': str(i + 1), 'Material': 'A 573 70', 'Width': 2.438, 'Thickness_Used': 0.0} for i in range(6)]
+    shell = ShellDesign(40.0, 14.628, 14.628, 14.628, 0.9, 3.0, 0.0, 0.0, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        shell.run_design(method='1ft')
+
+    scenarios = {'Uniform': 0.1, 'None': 0.0, 'Per course': [0.4, 0.2, 0.1, 0.1, 0.1, 0.1]}
+    proj = CorrosionLifeProjection.from_shell_design(shell, scenarios, years=40)
+    res = proj.run_projection()
+    assert res['Thickness'].shape == (1, 41, 6, 3)
+
+    for j, c in enumerate(shell.results):
+        t_lim = max(c['td'] - 3.0, c['tt'], 2.5)
+        for s, rate in enumerate([0.1, 0.0, scenarios['Per course'][j]]):
+            if rate == 0:
+                assert np.isnan(res['Course_Fail_Year'][0, j, s])
+                continue
+            life = (c['t_used'] - t_lim) / rate
+            assert abs(res['Remaining_Life'][0, j, s] - life) < 1e-9
+            expected = math.floor(life) + 1 if life < 40 else None
+            got = res['Course_Fail_Year'][0, j, s]
+            assert (np.isnan(got) and expected is None) or got == expected
+
+    fail = res['Course_Fail_Year'][0]
+    assert np.isnan(res['Tank_Fail_Year'][0, 1])
+    assert res['Tank_Fail_Year'][0, 2] == np.nanmin(fail[:, 2])
+    assert res['Governing_Course'][0, 2] == 0
+    print(proj.summary(0))
+
+def test_batch_projection():
+    widths = np.array([[2.438] * 6, [2.438] * 4 + [0.0, 0.0]])
+    batch = ShellBatchDesign([40.0, 20.0], [14.628, 9.752], [14.628, 9.752], 0.9, 3.0, widths, 'A 573 70')
+    res = CorrosionLifeProjection.from_batch(batch, {'Uniform': 0.1}, method='1ft').run_projection()
+    assert np.isnan(res['Course_Fail_Year'][1, 4:, 0]).all()
+    assert res['Governing_Course'].shape == (2, 1)
+
+    courses = [{'Course': str(i + 1), 'Material': 'A 573 70', 'Width': 2.438, 'Thickness_Used': 0.0} for i in range(6)]
+    shell = ShellDesign(40.0, 14.628, 14.628, 14.628, 0.9, 3.0, 0.0, 0.0, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        shell.run_design(method='1ft')
+    single = CorrosionLifeProjection.from_shell_design(shell, {'Uniform': 0.1}).run_projection()
+    assert np.allclose(single['Remaining_Life'][0], res['Remaining_Life'][0])
+
+if __name__ == "__main__":
+    test_corrosion_life()
+    test_batch_projection()
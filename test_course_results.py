@@ -0,0 +1,55 @@
+import io
+import sys
+import copy
+import pickle
+import contextlib
+import pandas as pd
+from Shell_Design import ShellDesign
+from Course_Results import CourseResults, COURSE_KEYS
+from Wind_Girder_Design import WindGirderDesign
+from Visualization import generate_shell_svg
+
+def run_shell(D=40.0):
+    courses = [{'Course': f'Course {i+1}', 'Material': 'A 573 70', 'Width': 2.438, 'Thickness_Used': 0.0} for i in range(7)]
+    shell = ShellDesign(D, 17.0, 17.0, 17.0, 0.9, 1.5, 0.0, 0.0, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        shell.run_design()
+    return shell
+
+def test_course_results():
+    print("--- CourseResults ---")
+    shell = run_shell()
+    res = shell.results
+    assert isinstance(res, CourseResults) and len(res) == 7
+
+    # Same values as the per-course dicts built by calculate_course
+    H_d, H_t = shell.effective_heights()
+    ref = shell.calculate_course(0, shell.courses_input[0], 0.0, 0.0, 0.0, False, H_d, H_t)
+    assert dict(res[0]) == ref and res[0] == ref
+    assert list(res[0].keys()) == list(ref.keys()) == list(COURSE_KEYS)
+    assert isinstance(res[0]['t_rec'], int) and isinstance(res[-1]['Status'], str)
+    assert res[-1]['Course'] == 'Course 7' and res[-1].get('Missing', 'x') == 'x'
+    assert list(res.column('t_used')) == [c['t_used'] for c in res]
+
+    # Dict-style consumers
+    df = pd.DataFrame(res)
+    assert list(df.columns) == list(COURSE_KEYS) and len(df) == 7
+    assert '<svg' in generate_shell_svg(40.0, res)
+    WindGirderDesign(40.0, 17.0, res, 160.0).calculate_intermediate_girders()
+
+    # Writes and extra keys behave like a dict
+    c = res.copy()
+    c[2]['t_used'] = 99.0
+    c[2]['Note'] = 'edited'
+    assert res[2]['t_used'] != 99.0 and c[2]['Note'] == 'edited'
+    assert c != res and res == res.to_dicts()
+    assert pickle.loads(pickle.dumps(res)) == res and copy.deepcopy(res) == res
+    assert res[1:3] == res.to_dicts()[1:3]
+
+    # Compact: one structured row per course instead of a 13-key dict
+    dict_bytes = sum(sys.getsizeof(d) for d in res.to_dicts())
+    assert res.nbytes < dict_bytes
+    print(f"{res.nbytes} bytes vs {dict_bytes} bytes of dicts")
+
+if __name__ == "__main__":
+    test_course_results()
@@ -0,0 +1,60 @@
+import math
+import numpy as np
+from Loads import DesignSpectrum, SeismicLoad, KDSSeismicLoad, spectral_acceleration
+from Loads_Batch import seismic_loads_batch
+
+def _sa_reference(t, sds, sd1, tl):
+    Ts = sd1 / sds
+    T0 = 0.2 * Ts
+    if t < T0:
+        return sds * (0.4 + 0.6 * (t / T0))
+    elif t < Ts:
+        return sds
+    elif t < tl:
+        return sd1 / t
+    return (sd1 * tl) / (t**2)
+
+def test_spectrum_curve():
+    print("--- Design Response Spectrum ---")
+    spec = DesignSpectrum.get(0.6, 0.3, 4.0)
+    assert DesignSpectrum.get(0.6, 0.3, 4.0) is spec
+    assert DesignSpectrum.get(0.6, 0.3, 6.0) is not spec
+
+    T, Sa = spec.curve()
+    assert len(T) == 100 and T[-1] == 6.0
+    assert spec.curve()[1] is Sa
+    for t, sa in zip(T, Sa):
+        assert math.isclose(sa, _sa_reference(t, 0.6, 0.3, 4.0), rel_tol=1e-12)
+
+    grid = spectral_acceleration(T[:, None], np.array([0.4, 0.6]), np.array([0.2, 0.3]), 4.0)
+    assert grid.shape == (100, 2)
+    assert np.allclose(grid[:, 1], Sa)
+
+def test_convective_coefficient():
+    print("--- Ai / Ac from the spectrum ---")
+    params = {'D': 60.0, 'H': 12.0, 'G': 0.9, 'SDS': 0.6, 'S1': 0.3, 'I_seismic': 1.25, 'T_L': 4.0}
+    seis = SeismicLoad(params)
+    res = seis.calculate_loads(150000.0, 60000.0, math.pi * 30.0**2 * 12.0 * 900.0)
+    Tc = res['Tc_s']
+    assert Tc > 4.0
+    assert math.isclose(res['Ac'], 1.5 * 0.3 * 4.0 / Tc**2 * (1.25 / 1.5), rel_tol=1e-12)
+    assert math.isclose(res['Ai'], 0.6 * 1.25 / 3.5, rel_tol=1e-12)
+    assert seis.spectrum is DesignSpectrum.get(0.6, 0.3, 4.0)
+
+    batch = seismic_loads_batch(60.0, 12.0, 0.6, 0.3, 1.25, 150000.0, 60000.0,
+                                math.pi * 30.0**2 * 12.0 * 900.0, 4.0)
+    for key in ('Ac', 'Base_Shear_kN', 'Ringwall_Moment_kNm'):
+        assert math.isclose(float(batch[key]), res[key], rel_tol=1e-12)
+
+    # Short period: unchanged 1/Tc branch
+    short = SeismicLoad(dict(params, D=10.0))
+    r = short.calculate_loads(20000.0, 5000.0, math.pi * 25.0 * 12.0 * 900.0)
+    assert r['Tc_s'] <= 4.0
+    assert math.isclose(r['Ac'], 1.5 * (0.3 / r['Tc_s']) * (1.25 / 1.5), rel_tol=1e-12)
+
+    kds = KDSSeismicLoad(dict(params, KDS_S=0.22, KDS_Soil='SD'))
+    assert kds.spectrum.SDS == kds.SDS and kds.spectrum.SD1 == kds.S1
+
+if __name__ == "__main__":
+    test_spectrum_curve()
+    test_convective_coefficient()
@@ -0,0 +1,100 @@
+import os
+import io
+import csv
+import math
+import tempfile
+import contextlib
+from Main import run_design_pipeline
+from Design_Sweep import DesignSweep, run_case, build_courses
+
+def make_sweep(D=(20.0, 30.0)):
+    return DesignSweep(D=list(D), H=[10.0, 12.0], material=['A 283 C', 'A 516 70'])
+
+def read_csv_ids(path):
+    with open(path, newline='') as f:
+        return [int(row['case_id']) for row in csv.DictReader(f)]
+
+def test_case_matches_pipeline():
+    print("--- Sweep case vs run_design_pipeline ---")
+    sweep = make_sweep()
+    case = next(c for c in sweep.iter_cases() if c['case_id'] == 5)
+    row = run_case(case)
+    assert row['Error'] == ''
+    assert row['D'] == 30.0 and row['H'] == 10.0 and row['Material'] == 'A 516 70'
+
+    courses = build_courses(case['params']['H'], case['material'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        design = run_design_pipeline(case['params'], courses, verbose=False)
+    shell = design['shell_design'].shell_courses
+    assert row['Num_Courses'] == len(shell)
+    assert row['Bottom_t_used_mm'] == shell[0]['t_used']
+    assert math.isclose(row['W_shell_kg'], design['W_shell_kg'])
+    assert math.isclose(row['M_wind_kNm'], design['M_wind'])
+    assert math.isclose(row['Base_Shear_kN'], design['seismic_results']['Base_Shear_kN'])
+    assert row['Anchor_Status'] == design['anchor_design'].results.get('Status', 'N/A')
+
+def test_csv_resume_and_rerun():
+    print("--- CSV resume / rerun ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sweep.csv')
+        sweep = make_sweep()
+        sweep.run(path, max_workers=2, chunk_size=2)
+        assert sorted(read_csv_ids(path)) == list(range(8))
+
+        # Simulate an interrupted run: 3 complete rows and a half-written fourth
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, 'w') as f:
+            f.writelines(lines[:4])
+            f.write(lines[4][:20])
+        done = read_csv_ids(path)[:3]
+        summary = make_sweep().run(path, max_workers=2, chunk_size=2)
+        assert summary['Skipped (Resumed)'] == 3 and summary['Completed'] == 5
+        ids = read_csv_ids(path)
+        assert ids[:3] == done and sorted(ids) == list(range(8))
+
+        # resume=False starts over instead of appending
+        summary = make_sweep().run(path, max_workers=2, chunk_size=2, resume=False)
+        assert summary['Skipped (Resumed)'] == 0 and summary['Completed'] == 8
+        assert sorted(read_csv_ids(path)) == list(range(8))
+
+def test_parquet_resume_and_rerun():
+    print("--- Parquet resume / rerun ---")
+    import pytest
+    pd = pytest.importorskip('pandas')
+    pytest.importorskip('pyarrow')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sweep.parquet')
+        make_sweep().run(path, max_workers=2, chunk_size=2)
+        parts = sorted(os.listdir(path))
+        assert len(parts) == 4 # one part per finished chunk
+        assert sorted(pd.read_parquet(path)['case_id']) == list(range(8))
+
+        os.remove(os.path.join(path, parts[1]))
+        summary = make_sweep().run(path, max_workers=2, chunk_size=2)
+        assert summary['Skipped (Resumed)'] == 6 and summary['Completed'] == 2
+        assert sorted(pd.read_parquet(path)['case_id']) == list(range(8))
+
+        summary = make_sweep().run(path, max_workers=2, chunk_size=2, resume=False)
+        assert summary['Completed'] == 8
+        assert sorted(pd.read_parquet(path)['case_id']) == list(range(8))
+
+def test_changed_sweep_rejected():
+    print("--- Changed sweep definition ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sweep.csv')
+        make_sweep().run(path, max_workers=1, chunk_size=4)
+        try:
+            make_sweep(D=(20.0, 40.0)).run(path, max_workers=1)
+            assert False, "changed sweep axes must not resume"
+        except ValueError as e:
+            assert '.sweep.json' in str(e)
+        # Explicit restart is allowed
+        make_sweep(D=(20.0, 40.0)).run(path, max_workers=1, chunk_size=4, resume=False)
+        assert sorted(read_csv_ids(path)) == list(range(8))
+
+if __name__ == "__main__":
+    test_case_matches_pipeline()
+    test_csv_resume_and_rerun()
+    test_parquet_resume_and_rerun()
+    test_changed_sweep_rejected()
@@ -0,0 +1,61 @@
+import io
+import math
+import contextlib
+import numpy as np
+from Shell_Design import ShellDesign
+from Loads import SeismicLoad, KDSSeismicLoad
+
+def _design():
+    courses = [{'Course': str(i + 1), 'Material': 'A 573 70', 'Width': 2.438, 'Thickness_Used': 0.0} for i in range(7)]
+    shell = ShellDesign(40.0, 17.066, 16.5, 16.5, 0.9, 1.5, 0.0, 0.0, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        shell.run_design(method='1ft')
+    return shell
+
+def test_pressure_profile():
+    print("--- Hydrodynamic Pressure Profile ---")
+    seis = SeismicLoad({'D': 40.0, 'H': 17.066, 'G': 0.9, 'SDS': 0.6, 'S1': 0.25, 'I_seismic': 1.25})
+    y = np.linspace(0.0, 18.0, 37)
+    p = seis.calculate_pressure_profile(y, 16.5)
+    for k, yk in enumerate(y):
+        if yk > 16.5:
+            assert p['Total_kPa'][k] == 0.0
+            continue
+        Pi, Pc = seis.calculate_hydrodynamic_pressure(yk, 16.5)
+        assert math.isclose(p['Impulsive_kPa'][k], Pi, rel_tol=1e-12, abs_tol=1e-12)
+        assert math.isclose(p['Convective_kPa'][k], Pc, rel_tol=1e-12, abs_tol=1e-12)
+    assert p['Total_kPa'][0] == p['Total_kPa'].max()
+
+def test_course_hoop_stress():
+    print("--- Seismic Hoop Stress per Course ---")
+    shell = _design()
+    for cls in (SeismicLoad, KDSSeismicLoad):
+        seis = cls({'D': 40.0, 'H': 17.066, 'G': 0.9, 'SDS': 0.6, 'S1': 0.25, 'I_seismic': 1.25})
+        res = seis.check_course_hoop_stress(shell.shell_courses, 16.5, 0.85)
+        rows = res['Courses']
+        assert len(rows) == 7
+
+        bottom = shell.shell_courses[0]
+        ref = seis.check_hoop_stress(bottom['t_used'], 16.5, bottom['Sd'], 0.85)
+        assert math.isclose(rows[0]['Stress (MPa)'], ref['Stress_MPa'], rel_tol=1e-12)
+        assert math.isclose(rows[0]['Allow (MPa)'], ref['Allow_MPa'], rel_tol=1e-12)
+        assert rows[0]['Status'] == ref['Status']
+
+        y = 0.0
+        for r, c in zip(rows, shell.shell_courses):
+            assert math.isclose(r['y (m)'], y, abs_tol=1e-9)
+            y += c['Width']
+        ratios = [r['Ratio'] for r in rows]
+        assert res['Max_Ratio'] == max(ratios)
+        assert res['Governing_Course'] == rows[int(np.argmax(ratios))]['Course']
+
+        prof = res['Profile']
+        assert len(prof['Course']) == len(prof['y_m'])
+        for r in rows:
+            k = int(np.flatnonzero(np.isclose(prof['y_m'], r['y (m)']))[0])
+            assert math.isclose(prof['Stress_MPa'][k], r['Stress (MPa)'], rel_tol=1e-12)
+        print(cls.__name__, res['Governing_Course'], f"{res['Max_Ratio']:.3f}", res['Status'])
+
+if __name__ == "__main__":
+    test_pressure_profile()
+    test_course_hoop_stress()
@@ -0,0 +1,102 @@
+import io
+import copy
+import contextlib
+from Shell_Design import ShellDesign, IncrementalShellDesign
+from Wind_Girder_Design import WindGirderDesign
+from Nozzle_Design import NozzleDesign
+
+def make_courses():
+    return [{'Course': f'Course {i+1}', 'Material': 'A 573 70', 'Width': 2.438, 'Thickness_Used': 0.0} for i in range(7)]
+
+def full_design(D, courses, method):
+    tank = ShellDesign(D, 17.0, 17.0, 17.0, 0.9, 1.5, 50.0, 50.0, courses_input=copy.deepcopy(courses))
+    with contextlib.redirect_stdout(io.StringIO()):
+        tank.run_design(method=method)
+    return tank.shell_courses
+
+def test_incremental_shell():
+    print("--- Incremental Shell Design ---")
+    for D, method, expect_material_rows in [(40.0, '1ft', [3]), (78.0, 'vdm', [3, 4, 5, 6])]:
+        courses = make_courses()
+        engine = IncrementalShellDesign(D, 17.0, 17.0, 17.0, 0.9, 1.5, 50.0, 50.0, courses_input=copy.deepcopy(courses))
+
+        notified = []
+        engine.add_listener(lambda sc, rows, removed: notified.append(list(rows)))
+        wind_girder = WindGirderDesign(D, 17.0, [], 160.0)
+        engine.add_listener(wind_girder.update_courses)
+
+        assert engine.update(method=method) == list(range(7))
+        assert engine.shell_courses == full_design(D, courses, method)
+
+        # Nothing changed -> nothing recomputed, nobody notified
+        assert engine.update(copy.deepcopy(courses)) == []
+        assert len(notified) == 1
+
+        # Material change: 1-Foot only that course, VDM that course and the ones above
+        courses[3]['Material'] = 'A 516 70'
+        assert engine.update(copy.deepcopy(courses)) == expect_material_rows
+        assert notified[-1] == expect_material_rows
+        assert engine.shell_courses == full_design(D, courses, method)
+
+        # Width change moves the bottom of every course above
+        courses[1]['Width'] = 2.0
+        assert engine.update(copy.deepcopy(courses)) == [1, 2, 3, 4, 5, 6]
+        assert engine.shell_courses == full_design(D, courses, method)
+
+        # Used thickness only changes its own row
+        courses[5]['Thickness_Used'] = 14.0
+        assert engine.update(copy.deepcopy(courses)) == [5]
+        assert engine.shell_courses == full_design(D, courses, method)
+
+        # Wind girder fed incrementally matches a fresh calculation
+        fresh = WindGirderDesign(D, 17.0, engine.shell_courses, 160.0)
+        assert abs(fresh.calculate_transformed_height() - wind_girder.calculate_transformed_height()) < 1e-12
+    print("Incremental results identical to full ShellDesign runs.")
+
+def test_nozzle_incremental():
+    courses = make_courses()
+    engine = IncrementalShellDesign(40.0, 17.0, 17.0, 17.0, 0.9, 1.5, 0.0, 0.0, courses_input=copy.deepcopy(courses))
+    nozzles = NozzleDesign([
+        {'Mark': 'N1', 'Size (NPS)': '24', 'Elevation (m)': 0.6},
+        {'Mark': 'N2', 'Size (NPS)': '8', 'Elevation (m)': 8.0, 'Repad': True},
+    ])
+    nozzles.process_nozzles()
+    engine.add_listener(nozzles.update_courses)
+    engine.update(method='1ft')
+    before_n2 = dict(nozzles.results['nozzle_schedule'][1])
+
+    courses[0]['Thickness_Used'] = 30.0
+    engine.update(copy.deepcopy(courses))
+    after = nozzles.results['nozzle_schedule']
+    assert after[0]['A_avail_mm2'] > 0
+    assert after[1] == before_n2
+
+    # Edited schedule: rows now refer to other nozzles and must all be re-checked
+    nozzles.nozzles = [
+        {'Mark': 'N1', 'Size (NPS)': '24', 'Elevation (m)': 0.6, 'Repad': True},
+        {'Mark': 'N3', 'Size (NPS)': '4', 'Elevation (m)': 7.5},
+    ]
+    nozzles.process_nozzles()
+    courses[4]['Thickness_Used'] = 16.0
+    engine.update(copy.deepcopy(courses))
+    fresh = NozzleDesign(copy.deepcopy(nozzles.nozzles))
+    fresh.process_nozzles()
+    assert nozzles.results['nozzle_schedule'] == fresh.check_reinforcement(engine.shell_courses)
+    assert all('Status' in n for n in nozzles.results['nozzle_schedule'])
+
+def test_wind_girder_reassigned_courses():
+    courses = full_design(40.0, make_courses(), '1ft')
+    wind_girder = WindGirderDesign(40.0, 17.0, courses, 160.0)
+    wind_girder.calculate_transformed_height()
+
+    # Same count and top thickness, thicker bottom course assigned directly
+    edited = copy.deepcopy(courses)
+    edited[0]['t_used'] += 10.0
+    wind_girder.shell_courses = edited
+    fresh = WindGirderDesign(40.0, 17.0, edited, 160.0)
+    assert abs(wind_girder.calculate_transformed_height() - fresh.calculate_transformed_height()) < 1e-12
+
+if __name__ == "__main__":
+    test_incremental_shell()
+    test_nozzle_incremental()
+    test_wind_girder_reassigned_courses()
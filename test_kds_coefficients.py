@@ -0,0 +1,66 @@
+import math
+import numpy as np
+from KDS_Coefficients import kds_kzr, kds_site_factors, kds_design_accelerations, KDS_TERRAIN, KZR_BASE
+from Loads import WindLoad, SeismicLoad, KDSWindLoad, KDSSeismicLoad
+from Loads_Batch import compare_kds_api_batch
+
+def test_kzr_grid():
+    print("--- KDS Kzr ---")
+    for terrain, props in KDS_TERRAIN.items():
+        assert math.isclose(float(kds_kzr(1.0, terrain)), KZR_BASE[terrain])
+        assert math.isclose(float(kds_kzr(props['zb'], terrain)), KZR_BASE[terrain], rel_tol=1e-9)
+        z = 37.3
+        exact = KZR_BASE[terrain] * (z / props['zb']) ** props['alpha']
+        assert math.isclose(float(kds_kzr(z, terrain)), exact, rel_tol=1e-4)
+        assert float(kds_kzr(1000.0, terrain)) == float(kds_kzr(props['zg'], terrain))
+    # Terrain C at 20 m: 0.71 z^0.15 (KDS table form)
+    assert abs(float(kds_kzr(20.0, 'C')) - 0.71 * 20.0 ** 0.15) < 0.01
+    mixed = kds_kzr([10.0, 10.0, 30.0], ['A', 'D', 'B'])
+    assert np.allclose(mixed, [kds_kzr(10.0, 'A'), kds_kzr(10.0, 'D'), kds_kzr(30.0, 'B')])
+
+def test_site_factors():
+    print("--- KDS Fa / Fv ---")
+    Fa, Fv = kds_site_factors(0.2, 'SD')
+    assert (float(Fa), float(Fv)) == (1.4, 2.0)
+    Fa, Fv = kds_site_factors(0.22, 'SD')
+    assert math.isclose(float(Fa), 1.4 + 0.2 * (1.2 - 1.4)) and math.isclose(float(Fv), 2.0 + 0.2 * (1.8 - 2.0))
+    assert float(kds_site_factors(0.05, 'SE')[0]) == 2.5
+    assert float(kds_site_factors(0.2, 'SX')[0]) == 1.0
+    Fa, Fv = kds_site_factors([0.14, 0.22, 0.22], ['SC', 'SD', 'SE'])
+    assert Fa.shape == (3,)
+    assert math.isclose(Fa[2], float(kds_site_factors(0.22, 'SE')[0]))
+
+def test_compare_batch():
+    print("--- KDS vs API (batch) ---")
+    D = np.array([20.0, 40.0, 60.0])
+    H = np.array([12.0, 17.0, 20.0])
+    W_shell = np.array([60e3, 200e3, 450e3])
+    W_roof = np.array([20e3, 80e3, 180e3])
+    W_liq = np.pi * (D / 2) ** 2 * H * 900.0
+    terrain = np.array(['A', 'B', 'D'])
+    soil = np.array(['SC', 'SD', 'SE'])
+    S = np.array([0.14, 0.22, 0.22])
+    res = compare_kds_api_batch(D, H, W_shell, W_roof, W_liq, 40.0, 0.5, 0.2, 1.25, 28.0, terrain, S, soil, Ie=1.2)
+
+    for i in range(3):
+        params = {'D': D[i], 'H': H[i], 'G': 0.9, 'Wind_Velocity': 40.0, 'SDS': 0.5, 'S1': 0.2, 'I_seismic': 1.25,
+                  'KDS_V0': 28.0, 'KDS_Terrain': terrain[i], 'KDS_S': S[i], 'KDS_Soil': soil[i], 'KDS_IE': 1.2}
+        kds_w = KDSWindLoad(params)
+        assert math.isclose(res['KDS_Wind_P_kPa'][i], kds_w.calculate_pressure(), rel_tol=1e-12)
+        assert math.isclose(res['KDS_Wind_M_kNm'][i], kds_w.calculate_moment(), rel_tol=1e-12)
+        assert math.isclose(res['API_Wind_M_kNm'][i], WindLoad(params).calculate_overturning_moment(), rel_tol=1e-12)
+
+        kds_s = KDSSeismicLoad(params)
+        assert math.isclose(res['KDS_SDS'][i], kds_s.SDS, rel_tol=1e-12)
+        kds_r = kds_s.calculate_loads(W_shell[i], W_roof[i], W_liq[i])
+        api_r = SeismicLoad(params).calculate_loads(W_shell[i], W_roof[i], W_liq[i])
+        assert math.isclose(res['KDS_Base_Shear_kN'][i], kds_r['Base_Shear_kN'], rel_tol=1e-9)
+        assert math.isclose(res['API_Seismic_M_kNm'][i], api_r['Overturning_Moment_kNm'], rel_tol=1e-9)
+
+    SDS, SD1 = kds_design_accelerations(S, soil)
+    assert np.allclose(SDS, res['KDS_SDS']) and np.allclose(SD1, res['KDS_SD1'])
+
+if __name__ == "__main__":
+    test_kzr_grid()
+    test_site_factors()
+    test_compare_batch()
@@ -0,0 +1,81 @@
+import math
+import numpy as np
+from Anchor_Design import AnchorBoltDesign
+from Load_Combinations import LOAD_COMBINATIONS, evaluate_combinations, combination_table, governing_cases
+from Loads_Batch import anchor_uplift_batch
+
+def test_single_tank():
+    print("--- Load Combinations (single tank) ---")
+    D, P, Pt, Uw, Us, Ws, Wr, Av = 20.0, 1.5, 1.9, 300.0, 900.0, 400.0, 250.0, 0.3
+    res = evaluate_combinations(D, P, Uw, Us, Ws, Wr, Av=Av, P_test=Pt)
+    assert res['Net_Uplift_kN'].shape == (len(LOAD_COMBINATIONS),)
+    assert 'Vacuum' not in res['Cases'] # external pressure never lifts the tank
+
+    area = math.pi * (D / 2.0) ** 2
+    expected = {
+        'Design Pressure': (P * area, Ws + Wr),
+        'Test Pressure': (Pt * area, Ws + Wr),
+        'Wind': (Uw, Ws + Wr),
+        'Seismic': (Us, (Ws + Wr) * (1 - 0.4 * Av)),
+        'Design Pressure + Wind': (0.4 * P * area + Uw, Ws + Wr),
+        'Design Pressure + Seismic': (0.4 * P * area + Us, (Ws + Wr) * (1 - 0.4 * Av)),
+        'Frangibility Pressure': (0.0, Ws + Wr),
+    }
+    rows = combination_table(res)
+    for row in rows:
+        up, resist = expected[row['Case']]
+        assert math.isclose(row['S_uplift'], up, abs_tol=1e-9)
+        assert math.isclose(row['W_resist'], resist, rel_tol=1e-12)
+        assert math.isclose(row['Net_Uplift'], max(up - resist, 0.0), abs_tol=1e-9)
+
+    gov = governing_cases(res)
+    assert gov['Net_Uplift_kN'] == max(rows, key=lambda r: r['Net_Uplift'])['Case']
+    assert gov['Req_Bolt_Area_mm2'] == max(rows, key=lambda r: r['Req_Bolt_Area_mm2'])['Case']
+
+    anchor = AnchorBoltDesign(D, P, Uw, Us, Ws, Wr, Av, test_pressure=Pt)
+    anchor.calculate_anchorage()
+    assert anchor.results['Uplift_Table'] == rows
+    assert anchor.results['Governing_Case'] == gov
+    assert math.isclose(anchor.results['Net Uplift Force (kN)'], max(r['Net_Uplift'] for r in rows))
+    assert math.isclose(anchor.results['Required Bolt Area (mm2)'], max(r['Req_Bolt_Area_mm2'] for r in rows))
+    print(gov)
+
+def test_batch():
+    print("--- Load Combinations (batch) ---")
+    rng = np.random.default_rng(3)
+    n = 200
+    D = rng.uniform(8, 60, n)
+    P = rng.uniform(0, 3, n)
+    Uw = rng.uniform(0, 2000, n)
+    Us = rng.uniform(0, 5000, n)
+    Ws = rng.uniform(100, 3000, n)
+    Wr = rng.uniform(50, 1500, n)
+    Av = rng.uniform(0, 0.5, n)
+    res = evaluate_combinations(D, P, Uw, Us, Ws, Wr, Av=Av)
+    batch = anchor_uplift_batch(D, P, Uw, Us, Ws, Wr, Av)
+    for i in range(0, n, 17):
+        anchor = AnchorBoltDesign(D[i], P[i], Uw[i], Us[i], Ws[i], Wr[i], Av[i])
+        anchor.calculate_anchorage()
+        assert anchor.results['Uplift_Table'] == combination_table(res, i)
+        assert math.isclose(batch['Net_Uplift_kN'][i], anchor.results['Net Uplift Force (kN)'], abs_tol=1e-9)
+        assert governing_cases(res, i) == anchor.results['Governing_Case']
+
+def test_no_uplift_has_no_governing_case():
+    print("--- Load Combinations (no uplift) ---")
+    anchor = AnchorBoltDesign(20, 0.2, 10, 20, 400, 250, 0.1)
+    anchor.calculate_anchorage()
+    assert anchor.results['Status'] == "Anchors Not Required"
+    assert anchor.results['Net Uplift Force (kN)'] == 0.0
+    gov = anchor.results['Governing_Case']
+    assert gov['Net_Uplift_kN'] is None and gov['Req_Bolt_Area_mm2'] is None
+    # The uplift ratio is still positive, so it keeps its largest case
+    assert gov['Uplift_Ratio'] == 'Design Pressure'
+
+    batch = anchor_uplift_batch([20.0, 20.0], 0.2, [10.0, 3000.0], 20.0, 400.0, 250.0, 0.1)
+    names = [c['Case'] for c in LOAD_COMBINATIONS]
+    assert list(batch['Governing_Case']) == [-1, names.index('Design Pressure + Wind')]
+
+if __name__ == "__main__":
+    test_single_tank()
+    test_batch()
+    test_no_uplift_has_no_governing_case()
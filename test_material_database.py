@@ -0,0 +1,78 @@
+import os
+import json
+import time
+import math
+import tempfile
+import numpy as np
+import Materials
+from Materials import (load_material_registry, use_material_database, get_material_properties, is_stainless_steel,
+                       material_names, material_property_arrays, CARBON_STEEL_MATERIALS)
+
+CSV_ROWS = [
+    "Material,Group,Temp_C,Fy,Fu,Sd,St,E,Aliases",
+    "A 516 70,CS,40,260,485,173,194,203000,SA 516 Gr 70N",
+    "A 516 70,CS,200,230,485,165,194,192000,",
+    "A 516 70,CS,260,220,485,155,194,186000,",
+    "A 283 C,CS,40,205,380,137,154,,",
+    "A 240 316L,SS,40,170,485,145,153,195000,316L;SUS 316L",
+    "A 240 316L,SS,150,138,485,124,153,186000,",
+]
+
+def test_csv_database_and_cache():
+    print("--- External material database ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'materials.csv')
+        with open(path, 'w') as f:
+            f.write("\n".join(CSV_ROWS) + "\n")
+        cache = os.path.join(tmp, 'cache')
+        reg = load_material_registry(path, cache)
+        assert len(os.listdir(cache)) == 1
+        start = time.perf_counter()
+        cached = load_material_registry(path, cache)
+        assert time.perf_counter() - start < 0.5
+        assert cached.names == reg.names and np.array_equal(cached.tables['E'], reg.tables['E'])
+
+        try:
+            use_material_database(path, cache)
+            assert material_names() == ['A 516 70', 'A 283 C', 'A 240 316L']
+            assert material_names('stainless') == ['A 240 316L']
+            assert is_stainless_steel('SUS 316L') and not is_stainless_steel('A 516 70')
+
+            props = get_material_properties('SA-516-70', 230)
+            assert math.isclose(props['Sd'], 160.0) and math.isclose(props['Fy'], 225.0)
+            assert math.isclose(props['E'], 189000.0) and props['St'] == 194
+            assert get_material_properties('A 283 C', 200)['Sd'] == 137 # no table: ambient
+
+            arr = material_property_arrays(np.array(['A 516 70', '316L', 'A 283 C'], dtype=object), 95.0)
+            assert np.allclose(arr['Sd'], [173 - 8 * 55 / 160, 145 - 21 * 55 / 110, 137])
+            assert np.allclose(arr['E'][2], Materials.DEFAULT_E)
+
+            # Source change -> new cache entry
+            with open(path, 'a') as f:
+                f.write("A 36,CS,40,250,400,160,171,,\n")
+            use_material_database(path, cache)
+            assert 'A 36' in material_names() and len(os.listdir(cache)) == 2
+        finally:
+            use_material_database(None)
+    assert material_names('carbon') == list(CARBON_STEEL_MATERIALS)
+
+def test_json_database():
+    print("--- JSON material database ---")
+    data = {'materials': [
+        {'Material': 'A 36', 'Group': 'CS', 'Temp_C': [40, 260], 'Fy': [250, 200], 'Fu': 400, 'Sd': [160, 120],
+         'St': 171},
+        {'Material': '304L', 'Group': 'SS', 'Fy': 170, 'Fu': 485, 'Sd': 145, 'St': 153, 'Aliases': ['SUS304L']}
+    ]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'materials.json')
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        reg = load_material_registry(path, tmp)
+    assert reg.names == ['A 36', '304L'] and reg.default_material == 'A 36'
+    assert math.isclose(float(reg.at_temperature('Fy', reg.ids['A 36'], 150.0)), 225.0)
+    assert reg.resolve('SUS304L') == reg.ids['304L']
+    assert reg.resolve('Unknown') == reg.unknown_id
+
+if __name__ == "__main__":
+    test_csv_database_and_cache()
+    test_json_database()
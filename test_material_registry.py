@@ -0,0 +1,69 @@
+import math
+import numpy as np
+import pytest
+from Materials import (REGISTRY, CARBON_STEEL_MATERIALS, STAINLESS_STEEL_MATERIALS, TEMP_DERATING_SD,
+                       get_material_properties, get_derated_Sd, is_stainless_steel, material_id, material_ids,
+                       material_property_arrays, normalize_material_name)
+
+def _reference_sd(name, temp):
+    # Piecewise-linear derating, constant outside the table (the pre-registry behaviour)
+    points = TEMP_DERATING_SD[name]
+    temps = sorted(points)
+    return float(np.interp(max(temp, 40.0), temps, [points[t] for t in temps]))
+
+def test_scalar_lookup():
+    print("--- Material registry scalar API ---")
+    for name, props in {**CARBON_STEEL_MATERIALS, **STAINLESS_STEEL_MATERIALS}.items():
+        assert dict(get_material_properties(name)) == props
+        assert is_stainless_steel(name) == (name in STAINLESS_STEEL_MATERIALS)
+    for name in TEMP_DERATING_SD:
+        for temp in (20, 40, 65, 90, 120, 150, 175, 200, 240, 260, 300):
+            assert math.isclose(get_derated_Sd(name, temp), _reference_sd(name, temp), rel_tol=1e-12)
+            if temp > 40:
+                assert math.isclose(get_material_properties(name, temp)['Sd'], _reference_sd(name, temp))
+
+    # Cached and read-only
+    props = get_material_properties('A 36', 200)
+    assert get_material_properties('A 36', 200) is props
+    with pytest.raises(TypeError):
+        props['Sd'] = 0
+
+def test_names_and_aliases():
+    print("--- Normalized names / aliases ---")
+    assert normalize_material_name('ASTM A 516 Gr. 70') == normalize_material_name('A 516 70')
+    assert material_id('SA-516-70') == material_id('A 516 70')
+    assert material_id(' a 283 c ') == material_id('A 283 C')
+    assert material_id('SUS 316L') == material_id('316L')
+    assert material_id('A 240 316L') == material_id('316L')
+    assert material_id('A 240 304') == material_id('304')
+    assert is_stainless_steel('SUS304') and not is_stainless_steel('A 36')
+
+    # Unknown names: A 283 C properties, not derated (as before)
+    assert material_id('Unknown') == REGISTRY.unknown_id
+    assert dict(get_material_properties('Unknown', 200)) == CARBON_STEEL_MATERIALS['A 283 C']
+    assert get_derated_Sd('Unknown', 200) == CARBON_STEEL_MATERIALS['A 283 C']['Sd']
+    assert not is_stainless_steel('Unknown')
+
+def test_array_api():
+    print("--- Material registry array API ---")
+    rng = np.random.default_rng(2)
+    names = np.array(list(CARBON_STEEL_MATERIALS) + list(STAINLESS_STEEL_MATERIALS) + ['Unknown', 'SA 36'],
+                     dtype=object)
+    mats = rng.choice(names, (50, 8))
+    temps = rng.choice([20.0, 40.0, 95.0, 150.0, 210.0, 260.0, 320.0], 50)
+    ids = material_ids(mats)
+    assert ids.shape == (50, 8)
+    arr = material_property_arrays(ids, temps[:, None])
+    by_name = material_property_arrays(mats, temps[:, None])
+    assert np.array_equal(arr['Sd'], by_name['Sd'])
+    for i in range(0, 50, 7):
+        for j in range(8):
+            props = get_material_properties(mats[i, j], temps[i])
+            for key in ('Fy', 'Fu', 'Sd', 'St'):
+                assert math.isclose(arr[key][i, j], props[key], rel_tol=1e-12)
+            assert arr['Stainless'][i, j] == is_stainless_steel(mats[i, j])
+
+if __name__ == "__main__":
+    test_scalar_lookup()
+    test_names_and_aliases()
+    test_array_api()
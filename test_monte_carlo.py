@@ -0,0 +1,47 @@
+import numpy as np
+from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+from Monte_Carlo import MonteCarloDesign, StreamingQuantiles, MC_METRICS
+
+def test_streaming_quantiles():
+    print("--- Streaming Quantiles ---")
+    rng = np.random.default_rng(0)
+    est = StreamingQuantiles(n_bins=2048)
+    chunks = [rng.normal(0, 1, 10000), rng.normal(5, 2, 10000), rng.lognormal(0, 1, 10000) - 20]
+    for c in chunks:
+        est.add(c)  # later chunks fall outside the first range -> bins expand both ways
+    data = np.concatenate(chunks)
+    q = [0.01, 0.25, 0.5, 0.9, 0.99]
+    assert np.all(np.abs(est.quantile(q) - np.quantile(data, q)) <= 2 * est.width)
+    assert abs(est.mean - data.mean()) < 1e-9 and abs(est.std - data.std(ddof=1)) < 1e-6
+    assert est.min == data.min() and est.max == data.max()
+
+def test_monte_carlo():
+    print("--- Monte Carlo ---")
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 40.0, 'H': 17.07, 'HD': 17.07, 'HT': 17.07, 'G': 0.9, 'SDS': 0.5, 'S1': 0.2})
+    courses = build_courses(params['H'], 'A 573 70')
+    dists = {'G': {'dist': 'normal', 'mean': 0.9, 'std': 0.03},
+             'SDS': {'dist': 'lognormal', 'median': 0.5, 'cov': 0.4},
+             'CA': {'dist': 'uniform', 'low': 0.5, 'high': 3.0}}
+
+    chunked = MonteCarloDesign(params, courses, dists, n_samples=20000, chunk_size=3000, seed=7)
+    res = chunked.run()
+
+    # Same random stream evaluated in one chunk gives the exact statistics
+    single = MonteCarloDesign(params, courses, dists, n_samples=20000, chunk_size=20000, seed=7)
+    out = single.evaluate(single.sample(20000))
+    assert res['N_Samples'] == 20000
+    for m, thresholds in MC_METRICS.items():
+        for thr in thresholds:
+            assert res[m][f'P(>{thr:g})'] == np.mean(out[m] > thr)
+        assert abs(res[m]['Mean'] - out[m].mean()) < 1e-9 * max(1.0, abs(out[m].mean()))
+        assert abs(res[m]['P50'] - np.median(out[m])) <= 0.001 * (out[m].max() - out[m].min()) + 1e-12
+
+    # Nominal inputs only: the nominal design passes its own shell check
+    fixed = MonteCarloDesign(params, courses, {}, n_samples=10, seed=1).run()
+    assert fixed['Shell_Utilization']['P(>1)'] == 0.0
+    assert fixed['Anchorage_Ratio_J']['Std'] < 1e-9
+
+if __name__ == "__main__":
+    test_streaming_quantiles()
+    test_monte_carlo()
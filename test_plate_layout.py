@@ -0,0 +1,76 @@
+import io
+import math
+import contextlib
+from Shell_Design import ShellDesign
+from Shell_Plate_Layout import ShellPlateLayout, plan_tank_farm
+
+def design(D, H):
+    n = math.ceil(H / 2.438)
+    courses = [{'Course': str(i + 1), 'Material': 'A 573 70', 'Width': min(2.438, H - i * 2.438),
+                'Thickness_Used': 0.0} for i in range(n)]
+    shell = ShellDesign(D, H, H, H, 0.9, 1.5, 0.0, 0.0, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        shell.run_design()
+    return shell
+
+def test_plate_layout():
+    print("--- Shell Plate Layout ---")
+    shell = design(30.0, 14.63)
+    layout = ShellPlateLayout(30.0, shell.results)
+    res = layout.run_layout()
+    assert res['Status'] == 'OK'
+    for c, course in zip(res['Courses'], shell.results):
+        circ = math.pi * (30.0 + course['t_used'] / 1000.0)
+        assert c['Plates'] * c['Plate_Length'] >= circ
+        assert c['Plate_Width'] >= course['Width'] and c['Plate_Thickness'] >= course['t_used']
+        assert c['Waste_kg'] >= 0
+    # API 650 5.1.5.2 (b): adjacent vertical seams at least 5t apart
+    for c in res['Courses'][1:]:
+        assert c['Min_Seam_Offset_mm'] >= c['Req_Seam_Offset_mm']
+
+    # Every 1 mm stock thickness available: installed weight matches the nominal shell weight
+    catalog = [{'Length': L, 'Width': 2.5, 'Thickness': float(t)} for t in range(5, 41) for L in (8.0, 12.0)]
+    W_nominal, _ = shell.calculate_shell_weight()
+    W_plates, _ = shell.calculate_shell_weight(plate_layout=ShellPlateLayout(30.0, shell.results, catalog).run_layout())
+    assert abs(W_plates - W_nominal) < 1e-6 * W_nominal
+
+    # Only even stock thicknesses: odd t_used rounds up, installed weight goes up
+    catalog = [{'Length': 9.144, 'Width': 2.5, 'Thickness': float(t)} for t in range(6, 42, 2)]
+    res_even = ShellPlateLayout(30.0, shell.results, catalog).run_layout()
+    assert all(c['Plate_Thickness'] % 2 == 0 for c in res_even['Courses'])
+    assert shell.calculate_shell_weight(plate_layout=res_even)[0] >= W_nominal
+    for c in res_even['Courses']:
+        circ = math.pi * (30.0 + c['Plate_Thickness'] / 1000.0)
+        assert math.isclose(c['Net_Weight_kg'], circ * c['Width'] * c['Plate_Thickness'] / 1000.0 * 7850.0)
+        assert math.isclose(c['Cut_Length_m'] * c['Plates'], circ)
+    print("OK")
+
+def test_thicker_stock_fallback():
+    # Thinnest adequate thickness only comes in narrow plates: the next thickness is used
+    shell = design(30.0, 14.63)
+    t_bottom = shell.results[0]['t_used']
+    catalog = [{'Length': 9.144, 'Width': 2.0, 'Thickness': t_bottom},
+               {'Length': 9.144, 'Width': 2.5, 'Thickness': t_bottom + 2.0},
+               {'Length': 9.144, 'Width': 2.5, 'Thickness': t_bottom + 4.0}]
+    res = ShellPlateLayout(30.0, shell.results[:1], catalog).run_layout()
+    c = res['Courses'][0]
+    assert c['Status'] == 'OK' and c['Plate_Thickness'] == t_bottom + 2.0
+    # No plate wide enough at any thickness
+    res = ShellPlateLayout(30.0, shell.results[:1], catalog[:1]).run_layout()
+    assert res['Courses'][0]['Status'] == 'No Stock'
+
+def test_tank_farm():
+    tanks = [{'Tank': f'T-{i}', 'D': D, 'shell_courses': design(D, H).results}
+             for i, (D, H) in enumerate([(30.0, 14.63), (48.0, 17.07), (30.0, 14.63)])]
+    farm = plan_tank_farm(tanks)
+    single = ShellPlateLayout(48.0, tanks[1]['shell_courses']).run_layout()
+    assert farm['Tanks'][1]['Courses'] == single['Courses']
+    assert sum(line['Qty'] for line in farm['Procurement']) == sum(c['Plates'] for t in farm['Tanks'] for c in t['Courses'])
+    assert abs(sum(line['Total_Weight_kg'] for line in farm['Procurement']) - farm['Procured_Weight_kg']) < 1e-6 * farm['Procured_Weight_kg']
+    # Identical tanks share procurement lines
+    assert all(line['Tanks'].get('T-0') == line['Tanks'].get('T-2') for line in farm['Procurement'])
+
+if __name__ == "__main__":
+    test_plate_layout()
+    test_thicker_stock_fallback()
+    test_tank_farm()
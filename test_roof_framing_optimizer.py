@@ -0,0 +1,203 @@
+import math
+import itertools
+import numpy as np
+from Structure_Design import StructureDesign, RAFTER_SECTIONS, COLUMN_SECTIONS
+from Roof_Framing_Optimizer import (RoofFramingOptimizer, trapezoid_span, rafter_spans, snow_ring_factor,
+                                    CONNECTION_FACTOR, GRAVITY)
+from Roof_Frame_Analysis import UNBALANCED_SNOW
+
+LOADS = {'Live': 1.2, 'Snow': 0.9, 'Dead_Plate': 0.47, 'Dead_Add': 0.2}
+
+def _structure(D, H=15.0):
+    sd = StructureDesign(D, LOADS)
+    sd.set_height(H)
+    return sd
+
+def _column(sd, P, L):
+    # StructureDesign column selection at length L instead of the eave height
+    H = sd.H
+    sd.set_height(L)
+    try:
+        return sd.select_col_pipe(P)
+    finally:
+        sd.set_height(H)
+
+def _own_weight(select, demand):
+    # Reselect until the section also carries its own weight (kN/m per kg/m)
+    name, props = select(demand(0.0))
+    while True:
+        new = select(demand(props['w'] * GRAVITY / 1000.0))
+        if new[0] == name:
+            return name, props
+        name, props = new
+
+def _brute_force(sd, fractions, rafter_counts, max_rings, span_range=(3.0, 12.0), slope=0.0):
+    # Every layout and rafter count evaluated member by member with the StructureDesign selections, for
+    # the RoofFrameAnalysis loads: member self-weight, unbalanced snow on the loaded half / continuous ring
+    R = sd.D / 2.0
+    dead, live, snow = LOADS['Dead_Plate'] + LOADS['Dead_Add'], LOADS['Live'], LOADS['Snow']
+    q = dead + max(live, max(UNBALANCED_SNOW) * snow)
+    rise = math.hypot(1.0, slope)
+    L_center = sd.H + slope * R
+    best = float('inf')
+    for k in range(max_rings + 1):
+        for combo in itertools.combinations(fractions, k):
+            for N in rafter_counts:
+                name, props = _own_weight(lambda M: sd.select_section(M * 1000.0 / sd.Fb, RAFTER_SECTIONS),
+                                          lambda g: rafter_spans(combo, R, q, N * g * rise)[0] / N)
+                if name == "Custom Heavy":
+                    continue
+                w_self = N * props['w'] * GRAVITY / 1000.0 * rise
+                _, P_unit, rings_unit = rafter_spans(combo, R, 1.0)
+                _, P_self, rings_self = rafter_spans(combo, R, 0.0, w_self)
+                P_center = (dead + max(live, snow)) * P_unit + P_self
+                c_name, c_props = _own_weight(lambda P: _column(sd, P, L_center), lambda g: P_center + L_center * g)
+                if c_name == "Custom Heavy Pipe":
+                    continue
+                weight = N * R * props['w'] + L_center * c_props['w']
+                for f, P_u, P_s in zip(combo, rings_unit, rings_self):
+                    circ = 2.0 * math.pi * f * R
+                    L_col = sd.H + slope * (R - f * R)
+                    P_dead = dead * P_u + P_s
+                    ring_best = float('inf')
+                    for n in range(max(4, math.ceil(circ / span_range[1])), max(4, math.floor(circ / span_range[0])) + 1):
+                        L_g = circ / n
+                        P_girder = P_dead + max(live, max(UNBALANCED_SNOW) * snow) * P_u
+                        g_name, g_props = _own_weight(
+                            lambda M: sd.select_section(M * 1000.0 / sd.Fb, RAFTER_SECTIONS),
+                            lambda g: (P_girder / circ + g) * L_g ** 2 / 8.0)
+                        P_col = (P_dead + circ * g_props['w'] * GRAVITY / 1000.0
+                                 + max(live, snow_ring_factor(n) * snow) * P_u) / n
+                        col_name, col_props = _own_weight(lambda P: _column(sd, P, L_col), lambda g: P_col + L_col * g)
+                        if g_name == "Custom Heavy" or col_name == "Custom Heavy Pipe":
+                            continue
+                        ring_best = min(ring_best, n * L_g * g_props['w'] + n * L_col * col_props['w'])
+                    weight += ring_best
+                best = min(best, weight * CONNECTION_FACTOR)
+    return best
+
+def test_span_formulas():
+    print("--- Rafter span moments and reactions ---")
+    # Triangular load from the center: M = 0.1283 P L (run_design), center reaction P / 3
+    w, L = 3.0, 12.0
+    M, R_a, R_b = trapezoid_span(0.0, w, L)
+    P = w * L / 2.0
+    assert math.isclose(float(M), 0.1283 * P * L, rel_tol=1e-3)
+    assert math.isclose(float(R_a), P / 3.0) and math.isclose(float(R_b), 2.0 * P / 3.0)
+    # Uniform load: w L^2 / 8
+    M, R_a, R_b = trapezoid_span(w, w, L)
+    assert math.isclose(float(M), w * L ** 2 / 8.0) and math.isclose(float(R_a), w * L / 2.0)
+    # Trapezoid: maximum of the moment diagram
+    x = np.linspace(0.0, L, 20001)
+    w_a, w_b = 1.0, 4.0
+    M, R_a, _ = trapezoid_span(w_a, w_b, L)
+    Mx = R_a * x - w_a * x ** 2 / 2.0 - (w_b - w_a) * x ** 3 / (6.0 * L)
+    assert math.isclose(float(M), Mx.max(), rel_tol=1e-6)
+
+    # Center column + rings + shell carry the whole roof load
+    R, q = 20.0, 2.0
+    for combo in [(), (0.5,), (0.3, 0.6, 0.9), (0.2, 0.4, 0.6, 0.8)]:
+        _, P_center, ring_loads = rafter_spans(combo, R, q)
+        _, _, R_shell = trapezoid_span(q * 2 * math.pi * (combo[-1] * R if combo else 0.0), q * 2 * math.pi * R,
+                                       R - (combo[-1] * R if combo else 0.0))
+        assert math.isclose(P_center + sum(ring_loads) + float(R_shell), q * math.pi * R ** 2)
+    # No rings: center column load = total / 3, as finalize_single_span
+    assert math.isclose(rafter_spans((), R, q)[1], q * math.pi * R ** 2 / 3.0)
+    # Several layouts at once
+    layouts = np.array([(0.3, 0.6), (0.4, 0.9)])
+    M, P_center, ring_loads = rafter_spans(layouts, R, q, 1.5)
+    for i, combo in enumerate(layouts):
+        M_i, P_i, rings_i = rafter_spans(tuple(combo), R, q, 1.5)
+        assert math.isclose(M[i], M_i) and math.isclose(P_center[i], P_i) and np.allclose(ring_loads[i], rings_i)
+
+def test_snow_ring_factor():
+    print("--- Continuous ring girder under the unbalanced snow ---")
+    # Four spans, 1.5 / 0.5 halves: three-moment equation by hand, the column between the two loaded
+    # spans carries 1.625 w L
+    assert math.isclose(snow_ring_factor(4), 1.625)
+    for n in range(4, 41):
+        assert max(UNBALANCED_SNOW) <= snow_ring_factor(n) < 1.63
+
+def test_matches_brute_force():
+    print("--- Optimizer vs exhaustive member-by-member search ---")
+    fractions = (0.3, 0.5, 0.7, 0.85)
+    for D in (24.0, 48.0):
+        sd = _structure(D)
+        n_min = math.ceil(math.pi * D / 2.0)
+        n_min += n_min % 2
+        counts = list(range(n_min, n_min + 12, 2))
+        opt = RoofFramingOptimizer(sd, max_rings=3, ring_fractions=fractions, rafter_counts=counts)
+        res = opt.optimize(max_workers=1)
+        ref = _brute_force(sd, fractions, counts, 3)
+        assert math.isclose(res['Total_Struct_Weight'], ref, rel_tol=1e-9)
+        assert sd.results is res
+        assert res['Candidates'] == sum(math.comb(len(fractions), k) for k in range(4)) * len(counts)
+
+def test_sloped_roof_column_lengths():
+    print("--- Sloped roof: columns sized at their real length ---")
+    fractions = (0.3, 0.5, 0.7, 0.85)
+    slope = 0.0625
+    sd = _structure(48.0)
+    counts = list(range(76, 88, 2))
+    res = RoofFramingOptimizer(sd, slope=slope, max_rings=3, ring_fractions=fractions,
+                               rafter_counts=counts).optimize(max_workers=1)
+    assert math.isclose(res['Total_Struct_Weight'], _brute_force(sd, fractions, counts, 3, slope=slope), rel_tol=1e-9)
+
+    R = 24.0
+    assert math.isclose(res['Center_Col_Length'], 15.0 + slope * R)
+    columns = [(res['Center Col Section'], res['Center Col Load (kN)'], res['Center_Col_Length'])]
+    for ring in res['Rings'].values():
+        assert math.isclose(ring['Ring_Col_Length'], 15.0 + slope * (R - ring['R_ring']))
+        columns.append((ring['Ring Col Section'], ring['Ring Col Load (kN)'], ring['Ring_Col_Length']))
+    for name, P, L in columns:
+        props = COLUMN_SECTIONS[name]
+        ok, ratio, _ = sd.check_buckling(P, L, props['A'], props['r'])
+        assert ok and ratio <= 1.0
+
+def test_parallel_and_layout():
+    print("--- Parallel evaluation, layout data and plot ---")
+    sd = _structure(60.0)
+    res = RoofFramingOptimizer(sd).optimize(max_workers=1)
+    sd_par = _structure(60.0)
+    res_par = RoofFramingOptimizer(sd_par).optimize(max_workers=3)
+    assert res_par['Total_Struct_Weight'] == res['Total_Struct_Weight']
+    assert sd_par.layout_data == sd.layout_data
+
+    layout = sd.layout_data
+    rings = list(res['Rings'].values())
+    assert layout['Type'] == 'Ring' and len(layout['Rings']) == len(rings) >= 1
+    assert layout['N_raf'] == res['Num Rafters'] and layout['R'] == 30.0
+    radii = [r['R_ring'] for r in rings]
+    assert radii == sorted(radii) and 0 < radii[0] and radii[-1] < 30.0
+    assert math.pi * 60.0 / res['Num Rafters'] <= 2.0
+    assert math.isclose(res['Total_Struct_Weight'],
+                        CONNECTION_FACTOR * (res['Rafter_Total_Wt'] + res['Girder_Total_Wt'] + res['Center_Col_Total_Wt']
+                                             + res['Ring_Col_Total_Wt']))
+    svg = sd.generate_structure_plot()
+    assert svg.count('stroke-dasharray') == len(rings)
+    assert svg.count('fill="#d9534f"') == sum(r['Num Ring Cols'] for r in rings)
+
+    # Never heavier than the fixed run_design layout it replaces
+    base = _structure(60.0)
+    base.run_design()
+    assert res['Total_Struct_Weight'] <= base.results['Total_Struct_Weight']
+
+def test_small_roof_single_span():
+    print("--- Small roof: center column only ---")
+    sd = _structure(8.0, H=8.0)
+    res = RoofFramingOptimizer(sd).optimize(max_workers=1)
+    assert res['Type'] == 'Center Column Only' and res['Num Girders'] == 0
+    assert sd.layout_data['Type'] == 'Single'
+    # Roof load / 3 + half of the rafters + the column itself
+    P = (sum(LOADS[k] for k in ('Dead_Plate', 'Dead_Add', 'Live')) * math.pi * 16.0 / 3.0
+         + (res['Num Rafters'] * res['Rafter_Wt'] * 4.0 / 2.0 + res['Center_Col_Length'] * res['Center_Col_Wt'])
+         * GRAVITY / 1000.0)
+    assert math.isclose(res['Center Col Load (kN)'], P)
+
+if __name__ == "__main__":
+    test_span_formulas()
+    test_snow_ring_factor()
+    test_matches_brute_force()
+    test_sloped_roof_column_lengths()
+    test_parallel_and_layout()
+    test_small_roof_single_span()
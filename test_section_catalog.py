@@ -0,0 +1,100 @@
+import numpy as np
+from Section_Catalog import (RAFTER_SECTIONS, COLUMN_SECTIONS, ANGLE_SECTIONS, CHANNEL_SECTIONS, SectionCatalog,
+                             COLUMN_CATALOG, catalog_for, asd_allowable_load)
+from Structure_Design import StructureDesign
+from Wind_Girder_Design import WindGirderDesign, WIND_GIRDER_SECTIONS
+
+def _reference_section(Sx, db, key='Sx'):
+    # Sort + linear scan (the pre-catalog select_section)
+    for name, props in sorted(db.items(), key=lambda x: x[1]['w']):
+        if props[key] >= Sx:
+            return name
+    return None
+
+def _reference_column(sd, Load_kN):
+    # Linear buckling check over the table (the pre-catalog select_col_pipe)
+    for name, props in COLUMN_SECTIONS.items():
+        if sd.check_buckling(Load_kN, sd.H, props['A'], props['r'])[0]:
+            return name
+    return None
+
+def test_lightest_section():
+    print("--- Lightest adequate section (bisection vs scan) ---")
+    sd = StructureDesign(30.0, {})
+    for db in (RAFTER_SECTIONS, ANGLE_SECTIONS, CHANNEL_SECTIONS):
+        cat = catalog_for(db)
+        moduli = sorted({p['Sx'] for p in db.values()})
+        queries = [0.0, -1.0] + moduli + [m * 1.0001 for m in moduli] + list(np.linspace(0, 1.2 * moduli[-1], 200))
+        for Sx in queries:
+            ref = _reference_section(Sx, db)
+            found = cat.select(Sx)
+            assert (found[0] if found else None) == ref
+            name, props = sd.select_section(Sx, db)
+            assert name == (ref or "Custom Heavy")
+
+        # Batch selection agrees with the scalar query
+        idx = cat.select_many(queries)
+        assert [cat.names[i] if i >= 0 else None for i in idx] == [_reference_section(Sx, db) for Sx in queries]
+    assert catalog_for(RAFTER_SECTIONS) is catalog_for(RAFTER_SECTIONS)
+
+def test_non_monotonic_table():
+    print("--- Heavier but weaker sections are skipped ---")
+    db = {'A': {'w': 1.0, 'Sx': 10.0}, 'B': {'w': 2.0, 'Sx': 5.0}, 'C': {'w': 3.0, 'Sx': 20.0}, 'D': {'w': 2.5, 'Sx': 12.0}}
+    cat = SectionCatalog(db)
+    assert cat.names == ['A', 'B', 'D', 'C']
+    for Sx, expected in [(4.0, 'A'), (10.0, 'A'), (11.0, 'D'), (12.0, 'D'), (15.0, 'C'), (25.0, None)]:
+        found = cat.select(Sx)
+        assert (found[0] if found else None) == expected
+    assert list(cat.select_many([4.0, 11.0, 25.0, np.nan])) == [0, 2, -1, -1]
+
+def test_column_selection():
+    print("--- Column selection from cached allowable loads ---")
+    for H, Fy in [(10.0, 235.0), (15.0, 250.0), (22.0, 235.0), (40.0, 235.0)]:
+        sd = StructureDesign(30.0, {}, material_yield=Fy)
+        sd.set_height(H)
+        Pa = COLUMN_CATALOG.allowable_loads(H, Fy)
+        for (name, props), pa in zip(COLUMN_SECTIONS.items(), Pa):
+            ref = sd.check_buckling(1.0, H, props['A'], props['r'])[2]
+            assert np.isclose(pa, ref, rtol=1e-12)
+
+        loads = [0.0] + list(np.linspace(1.0, 1.5 * max(Pa.max(), 1.0), 300))
+        for load in loads:
+            ref = _reference_column(sd, load)
+            name, props = sd.select_col_pipe(load)
+            assert name == (ref or "Custom Heavy Pipe")
+            if ref:
+                assert props['Ratio'] <= 1.0
+        idx = COLUMN_CATALOG.select_columns(loads, H, Fy)
+        assert [COLUMN_CATALOG.names[i] if i >= 0 else None for i in idx] == [_reference_column(sd, l) for l in loads]
+
+    # Too slender everywhere: KL/r > 200
+    assert np.all(asd_allowable_load([20.0, 36.0], [39.0, 57.0], 30.0, 235.0) == 0.0)
+
+def test_wind_girder_section():
+    print("--- Wind girder recommendation ---")
+    courses = [{'t_used': t, 'Width': 2.4} for t in (14.0, 12.0, 10.0, 8.0, 6.0, 6.0)]
+    for D in (20.0, 40.0, 60.0, 80.0):
+        for V in (150.0, 190.0, 250.0):
+            wg = WindGirderDesign(D, 14.4, courses, V)
+            res = wg.calculate_intermediate_girders()
+            if 'Recommended Section' in res:
+                assert res['Recommended Section'] in list(WIND_GIRDER_SECTIONS) + ["Check Large Sections (UPN 200+)"]
+                if res['Recommended Section'] in WIND_GIRDER_SECTIONS:
+                    assert res['Section Weight (kg/m)'] == WIND_GIRDER_SECTIONS[res['Recommended Section']]['w']
+
+def test_structure_design():
+    print("--- StructureDesign results ---")
+    for D in (8.0, 15.0, 30.0, 50.0, 70.0):
+        sd = StructureDesign(D, {'Live': 1.2, 'Snow': 0.5, 'Dead_Plate': 0.4, 'Dead_Add': 0.2})
+        sd.set_height(12.0)
+        sd.run_design()
+        r = sd.results
+        assert r['Rafter Section'] in RAFTER_SECTIONS
+        assert r['Total_Struct_Weight'] > 0
+
+if __name__ == "__main__":
+    test_lightest_section()
+    test_non_monotonic_table()
+    test_column_selection()
+    test_wind_girder_section()
+    test_structure_design()
@@ -0,0 +1,75 @@
+import os
+import io
+import math
+import tempfile
+import contextlib
+import numpy as np
+import pandas as pd
+from Loads import SeismicLoad
+from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+from Seismic_Fragility import SeismicFragility, read_inventory, LIMIT_STATES
+
+def _scalar_metrics(row, SDS):
+    params = {'D': row['D'], 'H': row['H'], 'G': row['G'], 'SDS': SDS, 'S1': SDS * row['SD1_SDS'],
+              'I_seismic': row['I_seismic'], 'T_L': row['T_L']}
+    seis = SeismicLoad(params)
+    W_liquid = math.pi * (row['D'] / 2.0) ** 2 * row['HD'] * row['G'] * 1000.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        loads = seis.calculate_loads(row['W_shell_kg'], row['W_roof_kg'], W_liquid)
+    hoop = seis.check_hoop_stress(row['t_bottom_mm'], row['HD'], row['Sd'], row['E'])
+    return {
+        'Sliding_Ratio': loads['Base_Shear_kN'] / loads['Sliding_Friction_Res_kN'],
+        'Anchorage_Ratio_J': loads['Anchorage_Ratio_J'],
+        'Ratio': hoop['Stress_MPa'] / hoop['Allow_MPa']
+    }
+
+def test_inventory_thresholds():
+    print("--- Seismic Fragility Thresholds ---")
+    rng = np.random.default_rng(11)
+    n = 200
+    D = rng.uniform(6, 60, n)
+    H = rng.uniform(8, 20, n)
+    inventory = pd.DataFrame({
+        'Tank': [f"T-{i:03d}" for i in range(n)], 'D': D, 'H': H, 'HD': H * rng.uniform(0.8, 1.0, n),
+        'G': rng.uniform(0.7, 1.0, n), 'W_shell_kg': 2.2 * D * H * 90.0, 'W_roof_kg': 0.8 * D ** 2 * 50.0,
+        't_bottom_mm': rng.uniform(8, 30, n), 'Sd': rng.uniform(137, 196, n), 'E': 0.85,
+        'I_seismic': rng.choice([1.0, 1.25, 1.5], n), 'SD1_SDS': rng.uniform(0.2, 0.8, n), 'T_L': 4.0
+    })
+
+    res = SeismicFragility(inventory).run()
+    assert len(res) == n
+    assert np.all(res['SDS_J_0.785'] <= res['SDS_J_1.54'])
+    assert np.allclose(res['SD1_Sliding'], res['SDS_Sliding'] * inventory['SD1_SDS'])
+    capacity = res[['SDS_Sliding', 'SDS_J_1.54', 'SDS_Hoop_Stress']].min(axis=1)
+    assert np.array_equal(res['Capacity_SDS'], capacity)
+
+    # Just below / above each finite threshold the scalar checks agree with the limit state
+    for i in range(0, n, 23):
+        row = inventory.iloc[i]
+        for limit, (metric, thr) in LIMIT_STATES.items():
+            sds = res.loc[i, f'SDS_{limit}']
+            if sds == 0.0 or not np.isfinite(sds):
+                continue
+            assert _scalar_metrics(row, sds * (1 - 1e-4))[metric] < thr
+            assert _scalar_metrics(row, sds * (1 + 1e-4))[metric] >= thr
+
+def test_designed_tank():
+    print("--- Threshold of a designed tank ---")
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 30.0, 'H': 16.0, 'HD': 15.0, 'HT': 16.0, 'SDS': 0.6, 'S1': 0.3})
+    fragility = SeismicFragility.from_designs({'TK-1': (params, build_courses(params['H'], 'A 283 C'))})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'inventory.csv')
+        fragility.inventory.drop(columns=['HD', 'E']).to_csv(path, index=False)
+        inv = read_inventory(path)
+        assert inv.loc[0, 'HD'] == params['H'] and inv.loc[0, 'E'] == 1.0
+        out = fragility.write(os.path.join(tmp, 'capacity.csv'))
+        assert len(pd.read_csv(out)) == 1
+    row = fragility.results.iloc[0]
+    assert fragility.inventory.loc[0, 'SD1_SDS'] == 0.5
+    assert row['Governing_Limit'] in ('Sliding', 'J_1.54', 'Hoop_Stress')
+    print(fragility.results.to_string(index=False))
+
+if __name__ == "__main__":
+    test_inventory_thresholds()
+    test_designed_tank()
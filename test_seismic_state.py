@@ -0,0 +1,49 @@
+import math
+from Loads import SeismicLoad, KDSSeismicLoad, SeismicState, AV_SDS
+from Loads_Batch import seismic_loads_batch, hoop_stress_batch
+
+PARAMS = {'D': 30.0, 'H': 18.0, 'G': 0.9, 'SDS': 0.8, 'S1': 0.4, 'I_seismic': 1.25, 'T_L': 4.0,
+          'KDS_S': 0.22, 'KDS_Soil': 'SD (Stiff Soil)'}
+W_SHELL, W_ROOF = 150000.0, 60000.0
+W_LIQUID = math.pi * 15.0**2 * 16.5 * 900.0
+
+def test_shared_state():
+    print("--- Shared SeismicState ---")
+    seis = SeismicLoad(PARAMS)
+    state = seis.state(W_SHELL, W_ROOF, W_LIQUID)
+    assert state is SeismicLoad(PARAMS).state(W_SHELL, W_ROOF, W_LIQUID)
+    assert state is SeismicState.get(0.8, 0.4, 1.25, 30.0, 18.0, 4.0, W_SHELL, W_ROOF, W_LIQUID)
+    assert seis.state(liquid_height=16.5) is not seis.state()
+    assert 'Tc' not in state.__dict__
+
+    res = seis.calculate_loads(W_SHELL, W_ROOF, W_LIQUID)
+    assert state.__dict__['Tc'] == res['Tc_s']
+    assert res['Ai'] == state.Ai and res['Ac'] == state.Ac and res['Av'] == state.Av
+    assert math.isclose(res['Ringwall_Moment_kNm'], state.ringwall_moment / 1000.0)
+
+    kds = KDSSeismicLoad(PARAMS)
+    assert kds.state() is not seis.state()
+    assert kds.state().SDS == kds.SDS and kds.state().SD1 == kds.S1
+
+def test_consistent_av():
+    print("--- One Av for loads, pressures and hoop stress ---")
+    seis = SeismicLoad(PARAMS)
+    res = seis.calculate_loads(W_SHELL, W_ROOF, W_LIQUID)
+    assert math.isclose(res['Av'], AV_SDS * 0.8)
+
+    profile = seis.calculate_pressure_profile(0.0, 16.5)
+    assert math.isclose(float(profile['Vertical_kPa']), res['Av'] * float(profile['Hydro_kPa']))
+
+    hoop = seis.check_hoop_stress(20.0, 16.5, 190.0, 0.85)
+    assert math.isclose(hoop['Seismic_Add_kPa'], float(profile['Seismic_Add_kPa']), rel_tol=1e-12)
+
+    batch = hoop_stress_batch(30.0, 0.9, 0.8, 0.4, 1.25, 20.0, 16.5, 190.0, 0.85)
+    assert math.isclose(float(batch['Stress_MPa']), hoop['Stress_MPa'], rel_tol=1e-12)
+    loads = seismic_loads_batch(30.0, 18.0, 0.8, 0.4, 1.25, W_SHELL, W_ROOF, W_LIQUID)
+    assert math.isclose(float(loads['Av']), res['Av'])
+    assert math.isclose(float(loads['Anchorage_Ratio_J']), res['Anchorage_Ratio_J'], rel_tol=1e-12)
+
+if __name__ == "__main__":
+    test_shared_state()
+    test_consistent_av()
+    print("All seismic state tests passed.")
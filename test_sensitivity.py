@@ -0,0 +1,64 @@
+import io
+import contextlib
+import numpy as np
+from Loads import SeismicLoad, WindLoad
+from Loads_Batch import seismic_loads_batch, hoop_stress_batch, wind_loads_batch
+from Main import run_design_pipeline
+from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+from Sensitivity import DesignSensitivity, SENSITIVITY_OUTPUTS
+
+def make_params(**kw):
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 40.0, 'H': 17.07, 'HD': 17.07, 'HT': 17.07, 'SDS': 0.5, 'S1': 0.2})
+    params.update(kw)
+    return params
+
+def test_loads_batch_matches_scalar():
+    print("--- Vectorized Loads ---")
+    for D, H in [(12.0, 15.0), (40.0, 17.0), (80.0, 20.0)]:
+        params = make_params(D=D, H=H)
+        seismic = SeismicLoad(params)
+        ref = seismic.calculate_loads(2.0e5, 5.0e4, 1.5e7)
+        vec = seismic_loads_batch(D, H, 0.5, 0.2, 1.0, 2.0e5, 5.0e4, 1.5e7)
+        for key in ('Base_Shear_kN', 'Ringwall_Moment_kNm', 'Slab_Moment_kNm', 'Wc_kg', 'Ac', 'Anchorage_Ratio_J',
+                    'Sliding_Friction_Res_kN', 'd_max_m'):
+            assert abs(float(vec[key]) - ref[key]) <= 1e-9 * max(1.0, abs(ref[key])), key
+
+        hoop = seismic.check_hoop_stress(20.0, H, 190.0, 0.85)
+        hoop_vec = hoop_stress_batch(D, 1.0, 0.5, 0.2, 1.0, 20.0, H, 190.0, 0.85)
+        assert abs(float(hoop_vec['Stress_MPa']) - hoop['Stress_MPa']) < 1e-9
+
+        wind = WindLoad(params)
+        P, M = wind_loads_batch(45.0, D, H)
+        assert abs(float(P) - wind.calculate_pressure()) < 1e-12
+        assert abs(float(M) - wind.calculate_overturning_moment()) < 1e-9
+
+def test_sensitivity():
+    print("--- Design Sensitivity ---")
+    params = make_params()
+    courses = build_courses(params['H'], 'A 573 70')
+
+    # Base case of the batched chain == Main.run_design_pipeline
+    with contextlib.redirect_stdout(io.StringIO()):
+        ref = run_design_pipeline(params, [dict(c) for c in courses], verbose=False)
+    sens = DesignSensitivity(params, courses, thickness_basis='t_used')
+    base = sens.evaluate(np.array([[params[k] for k in sens.inputs]]))
+    assert abs(base['W_shell_kg'][0] - ref['W_shell_kg']) < 1e-6 * ref['W_shell_kg']
+    assert abs(base['Base_Shear_kN'][0] - ref['seismic_results']['Base_Shear_kN']) < 1e-6
+    assert abs(base['Net_Uplift_kN'][0] - ref['anchor_design'].results['Net Uplift Force (kN)']) < 1e-6
+    assert abs(base['t_req_bottom_mm'][0] - ref['shell_design'].results[0]['t_req']) < 1e-9
+
+    res = DesignSensitivity(params, courses).run()
+    jac = res['Jacobian']
+    assert list(jac.index) == SENSITIVITY_OUTPUTS
+    # Shell does not see seismic / wind inputs
+    assert jac.loc['t_req_bottom_mm', 'SDS'] == 0 and jac.loc['W_shell_kg', 'Wind_Velocity'] == 0
+    # 1-Foot Method: t_req is linear in G (CA = 1.5 offset)
+    assert abs(jac.loc['t_req_bottom_mm', 'G'] - (base['t_req_bottom_mm'][0] - 1.5) / params['G']) < 1e-6
+    assert jac.loc['Base_Shear_kN', 'SDS'] > 0
+    assert len(res['Tornado']) == len(SENSITIVITY_OUTPUTS) * len(sens.inputs)
+    print(res['Elasticity'].round(3))
+
+if __name__ == "__main__":
+    test_loads_batch_matches_scalar()
+    test_sensitivity()
@@ -0,0 +1,50 @@
+import numpy as np
+from Shell_Design import ShellDesign
+from Shell_Batch import ShellBatchDesign
+
+FIELDS = ('H_eff_d', 'H_eff_t', 'td', 'tt', 't_req', 't_rec', 't_used')
+
+def run_scalar(D, H, G, CA, P, widths, mats, t_used, method):
+    courses = [{'Course': str(j + 1), 'Material': m, 'Width': w, 'Thickness_Used': t}
+               for j, (w, m, t) in enumerate(zip(widths, mats, t_used)) if w > 0]
+    tank = ShellDesign(diameter=D, height=H, design_liquid_level=H, test_liquid_level=H,
+                       specific_gravity=G, corrosion_allowance=CA, p_design=P, p_test=P,
+                       courses_input=courses)
+    tank.run_design(method=method)
+    return tank.shell_courses
+
+def test_batch_matches_scalar():
+    print("--- Batch vs Scalar Shell Design ---")
+    rng = np.random.default_rng(7)
+    N, C = 40, 8
+    D = rng.uniform(12.0, 90.0, N)
+    H = rng.uniform(6.0, 19.0, N)
+    G = rng.uniform(0.7, 1.1, N)
+    CA = rng.choice([0.0, 1.5, 3.0], N)
+    P = rng.choice([0.0, 76.5], N)
+    mats = np.array(['A 573 70', 'A 573 70', 'A 516 70', 'A 36', 'A 283 C', 'A 283 C', 'A 283 C', 'A 283 C'], dtype=object)
+
+    widths = np.full((N, C), 2.438)
+    bottoms = np.cumsum(widths, axis=1) - widths
+    widths = np.where(bottoms < H[:, None], np.minimum(widths, H[:, None] - bottoms), 0.0)
+    t_used = np.where(rng.random((N, C)) < 0.5, 0.0, rng.uniform(6.0, 30.0, (N, C)))
+
+    batch = ShellBatchDesign(D, H, H, G, CA, widths, mats, p_design=P, p_test=P, thickness_used=t_used)
+    batch.run_batch()
+
+    for method in ('1ft', 'vdm', 'auto'):
+        for i in range(N):
+            scalar = run_scalar(D[i], H[i], G[i], CA[i], P[i], widths[i], mats, t_used[i], method)
+            vec = batch.to_course_dicts(method, i)
+            assert len(scalar) == len(vec)
+            for s, v in zip(scalar, vec):
+                for f in FIELDS:
+                    assert abs(s[f] - v[f]) < 1e-9, (method, i, f, s[f], v[f])
+                assert s['Status'] == v['Status']
+            # Weight uses the same formula
+            tank_w = sum(np.pi * (D[i] + c['t_used'] / 1000.0) * c['Width'] * c['t_used'] / 1000.0 * 7850.0 for c in scalar)
+            assert abs(tank_w - batch.weights[method][i]) < 1e-6
+    print("Batch results identical to scalar path.")
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
@@ -0,0 +1,75 @@
+import io
+import math
+import itertools
+import contextlib
+from Shell_Design import ShellDesign
+from Shell_Optimizer import ShellLayoutOptimizer, RHO_STEEL
+
+WIDTHS = [1.8, 2.438, 3.0]
+COST = {'A 283 C': 1.0, 'A 516 70': 1.05} # weaker plate is cheaper, so both materials stay candidates
+
+def layouts(H_mm, widths_mm, min_top_mm):
+    """Every width sequence the optimizer may build: full widths plus a closing top course."""
+    found = []
+    def extend(h, seq):
+        remaining = H_mm - h
+        if min_top_mm <= remaining <= max(widths_mm):
+            found.append(seq + [remaining])
+        for w in widths_mm:
+            if w < remaining and remaining - w >= min_top_mm:
+                extend(h + w, seq + [w])
+    extend(0, [])
+    return found
+
+def design(D, H, G, CA, P, courses, method):
+    tank = ShellDesign(D, H, H, H, G, CA, P, P, courses_input=courses)
+    with contextlib.redirect_stdout(io.StringIO()):
+        tank.run_design(method=method)
+    return tank.shell_courses
+
+def brute_force(D, H, G, CA, P, method):
+    best = float('inf')
+    for widths in layouts(int(round(H * 1000)), [int(round(w * 1000)) for w in WIDTHS], 500):
+        for mats in itertools.product(COST, repeat=len(widths)):
+            courses = [{'Course': f"Course {i+1}", 'Material': m, 'Width': w / 1000.0, 'Thickness_Used': 0.0}
+                       for i, (w, m) in enumerate(zip(widths, mats))]
+            shell = design(D, H, G, CA, P, courses, method)
+            cost = sum(math.pi * (D + r['t_used'] / 1000.0) * r['Width'] * r['t_used'] / 1000.0 * RHO_STEEL
+                       * COST[r['Material']] for r in shell)
+            best = min(best, cost)
+    return best
+
+def run_optimizer(D, H, G, CA, P, method, **kwargs):
+    opt = ShellLayoutOptimizer(D, H, H, H, G, CA, p_design=P, p_test=P, materials=list(COST),
+                               plate_widths=WIDTHS, plate_cost=COST, method=method)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return opt.optimize(**kwargs)
+
+def test_optimizer_matches_brute_force():
+    print("--- Shell Layout Optimizer vs Brute Force ---")
+    for D, H, method in [(30.0, 7.0, '1ft'), (45.0, 7.6, '1ft'), (70.0, 7.0, 'vdm')]:
+        res = run_optimizer(D, H, 0.9, 1.5, 50.0, method, max_labels=10000)
+        assert res['Status'] == 'OK'
+        assert res['Exact'] == (method == '1ft') and not res['Labels_Capped']
+        best = brute_force(D, H, 0.9, 1.5, 50.0, method)
+        assert math.isclose(res['Cost'], best, rel_tol=1e-9), (D, method, res['Cost'], best)
+        print(f"D={D} m ({method}): optimum {best:.0f} found")
+
+def test_optimizer_courses_meet_required_thickness():
+    for D, H, method in [(30.0, 12.0, '1ft'), (78.0, 17.6, 'vdm')]:
+        res = run_optimizer(D, H, 0.897, 1.5, 76.5, method)
+        assert math.isclose(sum(c['Width'] for c in res['Courses']), H)
+        t_min = 10.0 if D >= 60 else 6.0 # API 650 5.6.1.1
+        shell = design(D, H, 0.897, 1.5, 76.5, res['Courses'], method)
+        for c, r in zip(res['Courses'], shell):
+            assert c['Thickness_Used'] == r['t_used']
+            assert r['t_used'] >= max(r['t_req'], t_min) and r['Status'] == 'OK'
+
+def test_label_cap_reported():
+    res = run_optimizer(78.0, 17.6, 0.897, 1.5, 76.5, 'vdm', max_labels=1)
+    assert res['Labels_Capped'] and not res['Exact']
+
+if __name__ == "__main__":
+    test_optimizer_matches_brute_force()
+    test_optimizer_courses_meet_required_thickness()
+    test_label_cap_reported()
@@ -0,0 +1,107 @@
+import os
+import io
+import math
+import tempfile
+import contextlib
+import numpy as np
+import pandas as pd
+from Loads import SeismicLoad, WindLoad, calculate_seismic_design_params
+from Design_Sweep import DEFAULT_SWEEP_PARAMS, build_courses
+from Site_Screening import SiteScreening, read_sites
+
+def test_site_screening():
+    print("--- Site Hazard Screening ---")
+    rng = np.random.default_rng(5)
+    n = 300
+    sites = pd.DataFrame({
+        'Site': [f"S{i:03d}" for i in range(n)],
+        'Ss': rng.uniform(0.1, 1.6, n),
+        'S1': rng.uniform(0.05, 0.7, n),
+        'Site_Class': rng.choice(['A', 'B', 'C', 'D', 'E'], n),
+        'Wind_Velocity': rng.uniform(30, 70, n),
+        'Terrain': rng.choice(['B', 'C', 'D'], n)
+    })
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 24.0, 'H': 14.6, 'HD': 14.6, 'HT': 14.6})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sites.csv')
+        sites.drop(columns=['Terrain']).to_csv(path, index=False)
+        loaded = read_sites(path)
+        assert (loaded['Terrain'] == 'C').all()
+
+        screening = SiteScreening(params, build_courses(params['H'], 'A 283 C'), sites)
+        res = screening.run()
+        out = screening.write(os.path.join(tmp, 'screening.csv'))
+        assert len(pd.read_csv(out)) == n
+
+    assert list(res['Rank']) == list(range(1, n + 1))
+    assert np.all(np.diff(res['Anchorage_Ratio_J']) <= 0)
+
+    for _, row in res.iloc[::37].iterrows():
+        SDS, SD1 = calculate_seismic_design_params('MAPPED', row['Ss'], row['S1'], row['Site_Class'])
+        assert math.isclose(row['SDS'], SDS, rel_tol=1e-12) and math.isclose(row['SD1'], SD1, rel_tol=1e-12)
+        seis = SeismicLoad(dict(params, SDS=SDS, S1=SD1))
+        with contextlib.redirect_stdout(io.StringIO()):
+            ref = seis.calculate_loads(screening.W_shell_kg, screening.W_roof_kg, screening.W_liquid_kg)
+        for key in ('Ai', 'Ac', 'Base_Shear_kN', 'Ringwall_Moment_kNm', 'Anchorage_Ratio_J', 'Anchorage_Status'):
+            assert row[key] == ref[key] if isinstance(ref[key], str) else math.isclose(row[key], ref[key], rel_tol=1e-9)
+        wind = WindLoad(dict(params, Wind_Velocity=row['Wind_Velocity'], Wind_Exposure=row['Terrain'], Wind_Profile=True))
+        assert math.isclose(row['M_wind_kNm'], wind.calculate_overturning_moment(), rel_tol=1e-9)
+    print(res.head(5).to_string(index=False))
+
+def test_invalid_terrain_rejected():
+    print("--- Invalid terrain rows ---")
+    sites = pd.DataFrame({'Site': ['S1', 'S2', 'S3'], 'Ss': [0.5] * 3, 'S1': [0.2] * 3,
+                          'Site_Class': ['D'] * 3, 'Wind_Velocity': [45.0] * 3, 'Terrain': ['b', 'X', 'Exp D']})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sites.csv')
+        sites.to_csv(path, index=False)
+        try:
+            read_sites(path)
+            assert False, "invalid terrain must be rejected"
+        except ValueError as e:
+            assert "S2 ('X')" in str(e) and "S3 ('Exp D')" in str(e) and "S1 (" not in str(e)
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    try:
+        SiteScreening(params, build_courses(params['H'], 'A 283 C'), sites)
+        assert False, "invalid terrain must be rejected"
+    except ValueError as e:
+        assert '2 site(s)' in str(e)
+
+def test_site_class_normalized_and_validated():
+    print("--- Site class spelling and invalid classes ---")
+    sites = pd.DataFrame({'Site': ['S1', 'S2', 'S3', 'S4'], 'Ss': [0.5] * 4, 'S1': [0.2] * 4,
+                          'Site_Class': ['D', 'D ', 'd', 'X'], 'Wind_Velocity': [45.0] * 4, 'Terrain': ['C'] * 4})
+    params = dict(DEFAULT_SWEEP_PARAMS)
+    params.update({'D': 24.0, 'H': 14.6, 'HD': 14.6, 'HT': 14.6})
+    courses = build_courses(params['H'], 'A 283 C')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sites.csv')
+        sites.to_csv(path, index=False)
+        try:
+            read_sites(path)
+            assert False, "unknown site class must be rejected"
+        except ValueError as e:
+            assert "S4 ('X')" in str(e) and '1 site(s)' in str(e)
+
+        sites.iloc[:3].to_csv(path, index=False)
+        loaded = read_sites(path)
+        assert list(loaded['Site_Class']) == ['D', 'D', 'D']
+    try:
+        SiteScreening(params, courses, sites.assign(Site_Class=['D', 'F', 'd', 'X']))
+        assert False, "Class F needs a site-specific study"
+    except ValueError as e:
+        assert "S2 ('F')" in str(e) and "S4 ('X')" in str(e)
+
+    # Untrimmed / lower-case classes get the Class D coefficients too
+    res = SiteScreening(params, courses, sites.iloc[:3]).run()
+    assert (res['Site_Class'] == 'D').all()
+    for key in ('Fa', 'Fv', 'SD1', 'Anchorage_Ratio_J'):
+        assert np.allclose(res[key], res[key].iloc[0])
+    assert math.isclose(res['Fa'].iloc[0], 1.4) and math.isclose(res['Fv'].iloc[0], 2.0)
+
+if __name__ == "__main__":
+    test_site_screening()
+    test_invalid_terrain_rejected()
+    test_site_class_normalized_and_validated()
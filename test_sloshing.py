@@ -0,0 +1,65 @@
+import math
+import time
+import numpy as np
+from scipy.integrate import solve_ivp
+from Loads import SeismicLoad
+from Sloshing import (SloshingTimeHistory, sloshing_modes, oscillator_response, synthetic_records,
+                      scale_to_spectrum, spectral_pseudo_acceleration, GRAVITY)
+
+PARAMS = {'D': 40.0, 'H': 16.0, 'G': 0.9, 'SDS': 0.8, 'S1': 0.4, 'I_seismic': 1.25, 'T_L': 4.0}
+
+def test_oscillator_matches_ode():
+    print("--- Oscillator vs ODE integration ---")
+    dt = 0.01
+    ag = synthetic_records(1, duration=20.0, dt=dt, pga=0.3, seed=3)[0] * GRAVITY
+    t = np.arange(len(ag)) * dt
+    w, z = 2.0 * math.pi / 1.3, 0.02
+    sol = solve_ivp(lambda tt, x: [x[1], -np.interp(tt, t, ag) - 2 * z * w * x[1] - w ** 2 * x[0]],
+                    (0.0, t[-1]), [0.0, 0.0], t_eval=t, max_step=dt, rtol=1e-9, atol=1e-12)
+    A = oscillator_response(ag, dt, [w], z)[0]
+    assert np.allclose(A, w ** 2 * sol.y[0], atol=1e-4 * np.max(np.abs(A)))
+
+def test_modes_match_annex_e():
+    print("--- First convective mode vs Annex E ---")
+    seis = SeismicLoad(PARAMS)
+    W_liquid = math.pi * 20.0 ** 2 * 16.0 * 900.0
+    state = seis.state(W_liquid=W_liquid)
+    modes = sloshing_modes(40.0, 16.0, W_liquid, state.Tc, n_modes=3)
+    assert math.isclose(modes['Period_s'][0], state.Tc)
+    assert np.all(np.diff(modes['Period_s']) < 0)
+    assert math.isclose(modes['Mass_kg'][0], state.Wc, rel_tol=0.02)
+    assert math.isclose(modes['Wave_Coefficient'][0], 0.837, rel_tol=1e-3)
+
+def test_record_suite():
+    print("--- 100-record suite ---")
+    seis = SeismicLoad(PARAMS)
+    W_liquid = math.pi * 20.0 ** 2 * 14.0 * 900.0
+    start = time.perf_counter()
+    res = seis.calculate_sloshing_history(W_liquid, liquid_height=14.0, n_modes=3, n_records=100, seed=7)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 10.0
+    assert res['N_Records'] == 100 and res['Peak_Wave_Height_m'].shape == (100,)
+    assert res['Freeboard_m'] == 2.0
+    assert np.array_equal(res['Freeboard_Exceeded'], res['Peak_Wave_Height_m'] > 2.0)
+    assert res['Exceedance_Fraction'] == np.mean(res['Freeboard_Exceeded'])
+
+    # Records scaled to the design spectrum at Tc: 5 % response = Sa(Tc)
+    records = synthetic_records(5, dt=0.01, seed=1)
+    Tc = res['Tc_s']
+    scaled = scale_to_spectrum(records, 0.01, Tc, float(seis.spectrum.sa(Tc)))
+    sa = spectral_pseudo_acceleration(scaled * GRAVITY, 0.01, [Tc])[:, 0] / GRAVITY
+    assert np.allclose(sa, float(seis.spectrum.sa(Tc)))
+
+    # First mode alone: wave height follows the modal pseudo-acceleration
+    history = SloshingTimeHistory(seis, W_liquid, liquid_height=14.0)
+    one = history.run(scaled, 0.01)
+    A = np.max(np.abs(oscillator_response(scaled * GRAVITY, 0.01, history.modes['Omega'], 0.005)), axis=-1)[:, 0]
+    assert np.allclose(one['Peak_Wave_Height_m'], history.modes['Wave_Coefficient'][0] * 20.0 * A / GRAVITY * 1.25)
+    assert len(history.summary_table()) == 3
+    print(f"100 records x 3 modes: {elapsed:.2f} s, mean wave {res['Mean_Wave_Height_m']:.2f} m "
+          f"vs spectral {res['Spectral_d_max_m']:.2f} m")
+
+if __name__ == "__main__":
+    test_oscillator_matches_ode()
+    test_modes_match_annex_e()
+    test_record_suite()
@@ -0,0 +1,69 @@
+import math
+import numpy as np
+from Shell_Batch import ShellBatchDesign
+from VDM_Solver import VDMSolver
+
+def reference_vdm(D, H_eff, widths, S, G, E=1.0):
+    """
+    Course-by-course scalar 5.6.4 (corroded thickness), each course iterated to convergence.
+    """
+    r = D * 1000.0 / 2.0
+    H1 = H_eff[0]
+    t1 = (1.06 - 0.0696 * D / H1 * math.sqrt(H1 * G / S[0])) * 4.9 * H1 * D * G / (S[0] * E)
+    t = [t1]
+    for j in range(1, len(widths)):
+        H = H_eff[j]
+        tL = t[-1]
+        tu = 4.9 * D * max(H - 0.3, 0.0) * G / (S[j] * E)
+        for _ in range(200):
+            K = tL / tu
+            C = math.sqrt(K) * (K - 1.0) / (1.0 + K ** 1.5)
+            x = max(min(0.61 * math.sqrt(r * tu) + 320 * C * H, 1000 * C * H, 1.22 * math.sqrt(r * tu)), 0.0)
+            tu_new = 4.9 * D * max(H - x / 1000.0, 0.0) * G / (S[j] * E)
+            if abs(tu_new - tu) < 1e-9:
+                break
+            tu = tu_new
+        if j == 1:
+            ratio = widths[0] * 1000.0 / math.sqrt(r * t1)
+            if ratio <= 1.375:
+                tu = t1
+            elif ratio < 2.625:
+                tu = tu + (t1 - tu) * (2.1 - ratio / 1.25)
+        t.append(tu)
+    return np.array(t)
+
+def test_vdm_solver():
+    print("--- Vectorized VDM Solver ---")
+    D = np.array([65.0, 78.0, 95.0])
+    widths = np.full((3, 8), 2.438)
+    H = widths.sum(axis=1)
+    bottoms = np.cumsum(widths, axis=1) - widths
+    H_eff = H[:, None] - bottoms
+    S = np.full((3, 8), 260.0)
+
+    solver = VDMSolver(D, H_eff, H_eff, widths, S, S, 0.9, 1.5)
+    res = solver.solve(tol=1e-6)
+    assert res['converged'].all()
+    assert (res['iterations'][:, 0, :] == 0).all()
+    for i in range(3):
+        ref_d = reference_vdm(D[i], H_eff[i], widths[i], S[i], 0.9) + 1.5
+        ref_t = reference_vdm(D[i], H_eff[i], widths[i], S[i], 1.0)
+        assert np.allclose(res['td'][i], ref_d, atol=1e-3), (res['td'][i], ref_d)
+        assert np.allclose(res['tt'][i], ref_t, atol=1e-3)
+    print("Matches course-by-course reference.")
+
+def test_vdm_full_batch():
+    widths = np.array([[2.438] * 7 + [0.5], [2.438] * 5 + [0.0] * 3])
+    batch = ShellBatchDesign([80.0, 70.0], [17.566, 12.19], [17.566, 12.19], 1.0, 0.0, widths, 'A 573 70')
+    res = batch.run_method('vdm_full')
+    one_ft = batch.run_method('1ft')
+    assert batch.vdm_stats['converged'].all()
+    assert np.isnan(res['td'][1, 5:]).all() and res['OK'][1, 5:].all()
+    valid = batch.valid
+    assert (res['t_req'][valid] >= 10.0).all()
+    # Same geometry / heads as the other methods, only thicknesses differ
+    assert np.array_equal(res['H_eff_d'][valid], one_ft['H_eff_d'][valid])
+
+if __name__ == "__main__":
+    test_vdm_solver()
+    test_vdm_full_batch()
@@ -0,0 +1,52 @@
+import math
+import numpy as np
+from Loads import WindLoad, wind_profile, exposure_coefficient, WIND_EXPOSURE, KZ_Z_MIN
+
+def _analytic(V, exposure, H):
+    # int_0^H qz dz and int_0^H qz z dz for the power-law Kz (constant below KZ_Z_MIN)
+    a = 2.0 / WIND_EXPOSURE[exposure]['alpha']
+    zg = WIND_EXPOSURE[exposure]['zg']
+    c = 0.613 * 2.01 * V ** 2 / zg ** a
+    z0 = KZ_Z_MIN
+    Q = c * z0 ** a * z0 + c * (H ** (a + 1) - z0 ** (a + 1)) / (a + 1)
+    M = c * z0 ** a * z0 ** 2 / 2 + c * (H ** (a + 2) - z0 ** (a + 2)) / (a + 2)
+    return Q, M
+
+def test_profile_integration():
+    print("--- Wind Profile ---")
+    assert math.isclose(float(exposure_coefficient(10.0, 'C')), 2.01 * (10.0 / 274.32) ** (2 / 9.5))
+    assert exposure_coefficient(2.0, 'B') == exposure_coefficient(KZ_Z_MIN, 'B')
+    for exposure in ('B', 'C', 'D'):
+        prof = wind_profile(45.0, exposure, 20.0)
+        Q, M = _analytic(45.0, exposure, 20.0)
+        assert math.isclose(prof['Q_cum'][-1], Q, rel_tol=1e-4)
+        assert math.isclose(prof['M_cum'][-1], M, rel_tol=1e-4)
+    assert wind_profile(45.0, 'C', 20.0) is wind_profile(45.0, 'C', 20.0)
+
+def test_wind_load_profile_mode():
+    params = {'Wind_Velocity': 45.0, 'D': 30.0, 'H': 14.4, 'Wind_Exposure': 'C', 'Wind_Profile': True}
+    wind = WindLoad(params)
+    res = wind.calculate_profile([2.4] * 6)
+    factor = 1.0 * 0.95 * 1.0 * 0.85 * 0.5 * 0.6
+    Q, M = _analytic(45.0, 'C', 14.4)
+    assert math.isclose(res['Moment_kNm'], M * factor * 30.0 / 1000.0, rel_tol=1e-4)
+    assert math.isclose(wind.calculate_overturning_moment(), res['Moment_kNm'])
+    assert math.isclose(wind.calculate_pressure(), res['P_kPa'][-1])
+
+    courses = res['Courses']
+    assert len(courses) == 6
+    assert math.isclose(sum(c['Shear (kN)'] for c in courses), res['Shear_kN'], rel_tol=1e-12)
+    assert math.isclose(sum(c['Moment (kNm)'] for c in courses), res['Moment_kNm'], rel_tol=1e-12)
+    p_avg = [c['P_avg (kPa)'] for c in courses]
+    assert np.all(np.diff(p_avg) >= 0)
+
+    # Default (uniform) mode is unchanged
+    uniform = WindLoad(dict(params, Wind_Profile=False))
+    P = 0.613 * 1.0 * 0.95 * 45.0 ** 2 * 0.85 * 0.5 * 0.6 / 1000.0
+    assert math.isclose(uniform.calculate_pressure(), P)
+    assert math.isclose(uniform.calculate_overturning_moment(), P * 30.0 * 14.4 * 7.2)
+    print(f"Profile M = {res['Moment_kNm']:.1f} kNm, uniform M = {uniform.calculate_overturning_moment():.1f} kNm")
+
+if __name__ == "__main__":
+    test_profile_integration()
+    test_wind_load_profile_mode()